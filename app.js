@@ -151,95 +151,460 @@ const LS_OVERRIDES_PREFIX = "hookeOverrides::v1::";
 const LS_VISITED = "hookeVisited::v1";
 const SS_ADMIN = "hookeAdminUnlocked::v1";
 const ADMIN_PASSWORD = "h00kewilding";
+const MAP_MAX_ZOOM = 8;
+const MAP_DRAG_THRESHOLD = 5; // px of movement before a press on the map becomes a pan
+const MAP_PIN_CLUSTER_PX = 28; // pins closer than this on screen merge into one cluster marker
+
+// --- Local edits store ---
+// Admin edits (overrides, tag overrides, custom features) and visited pins live in
+// localStorage, and every render reads them several times per feature. They're parsed once
+// into memory on first use; writes update memory at once and reach localStorage in one batch
+// per task. Other tabs' writes arrive through the `storage` event (see watchLocalStore()).
+const localStore = {
+  values: null, // key -> parsed JSON
+  pending: new Map(), // key -> JSON text to write, or null to remove
+  flushTimer: null,
+};
+
+function isLocalStoreKey(key) {
+  return (
+    typeof key === "string" &&
+    (key.startsWith(LS_TAGS_PREFIX) || key.startsWith(LS_OVERRIDES_PREFIX) || key === LS_CUSTOM_FEATURES || key === LS_VISITED)
+  );
+}
 
-function loadTagOverrides(featureId) {
+function parseStored(raw) {
+  if (raw === null || raw === undefined) return undefined;
   try {
-    const raw = window.localStorage.getItem(`${LS_TAGS_PREFIX}${featureId}`);
-    if (!raw) return null;
-    const arr = JSON.parse(raw);
-    if (!Array.isArray(arr)) return null;
-    return arr.map((t) => String(t)).filter((t) => t.trim() !== "");
+    return JSON.parse(raw);
   } catch {
-    return null;
+    return undefined;
   }
 }
 
-function saveTagOverrides(featureId, tags) {
+function hydrateLocalStore() {
+  const values = new Map();
   try {
-    window.localStorage.setItem(`${LS_TAGS_PREFIX}${featureId}`, JSON.stringify(tags));
+    const ls = window.localStorage;
+    for (let i = 0; i < ls.length; i++) {
+      const key = ls.key(i);
+      if (!isLocalStoreKey(key)) continue;
+      const value = parseStored(ls.getItem(key));
+      if (value !== undefined) values.set(key, value);
+    }
   } catch {
-    // ignore
+    // storage unavailable (e.g. blocked): edits only last for this page
+  }
+  // Writes not flushed yet are newer than what storage holds.
+  for (const [key, raw] of localStore.pending) {
+    if (raw === null) values.delete(key);
+    else values.set(key, JSON.parse(raw));
   }
+  localStore.values = values;
 }
 
-function loadOverrides(featureId) {
-  try {
-    const raw = window.localStorage.getItem(`${LS_OVERRIDES_PREFIX}${featureId}`);
-    if (!raw) return null;
-    const obj = JSON.parse(raw);
-    if (!obj || typeof obj !== "object") return null;
-    return obj;
-  } catch {
-    return null;
+function storeGet(key) {
+  if (!localStore.values) hydrateLocalStore();
+  return localStore.values.get(key);
+}
+
+function storeSet(key, value) {
+  if (!localStore.values) hydrateLocalStore();
+  if (value === undefined) localStore.values.delete(key);
+  localStore.pending.set(key, value === undefined ? null : JSON.stringify(value));
+  // Keep our own copy, as a storage round trip would: later changes to `value` don't leak in.
+  if (value !== undefined) localStore.values.set(key, JSON.parse(localStore.pending.get(key)));
+  if (!localStore.flushTimer) localStore.flushTimer = window.setTimeout(flushLocalStore, 0);
+}
+
+function flushLocalStore() {
+  if (localStore.flushTimer) window.clearTimeout(localStore.flushTimer);
+  localStore.flushTimer = null;
+  for (const [key, raw] of localStore.pending) {
+    try {
+      if (raw === null) window.localStorage.removeItem(key);
+      else window.localStorage.setItem(key, raw);
+    } catch {
+      // ignore (quota / blocked storage): the in-memory value still applies to this page
+    }
   }
+  localStore.pending.clear();
+}
+
+function watchLocalStore(onChange) {
+  // Another tab changed our keys: update memory and let the page re-render.
+  window.addEventListener("storage", (e) => {
+    if (e.storageArea && e.storageArea !== window.localStorage) return;
+    if (e.key !== null && !isLocalStoreKey(e.key)) return;
+    if (e.key === null || !localStore.values) {
+      hydrateLocalStore(); // storage was cleared (or never read yet)
+    } else if (!localStore.pending.has(e.key)) {
+      const value = parseStored(e.newValue);
+      if (value === undefined) localStore.values.delete(e.key);
+      else localStore.values.set(e.key, value);
+    }
+    onChange(e.key);
+  });
+  // Don't lose a batch when the page goes away before its timer runs.
+  window.addEventListener("pagehide", flushLocalStore);
+  document.addEventListener("visibilitychange", () => {
+    if (document.visibilityState === "hidden") flushLocalStore();
+  });
+}
+
+function loadTagOverrides(featureId) {
+  const arr = storeGet(`${LS_TAGS_PREFIX}${featureId}`);
+  if (!Array.isArray(arr)) return null;
+  return arr.map((t) => String(t)).filter((t) => t.trim() !== "");
+}
+
+function saveTagOverrides(featureId, tags) {
+  storeSet(`${LS_TAGS_PREFIX}${featureId}`, tags);
+}
+
+function clearTagOverrides(featureId) {
+  storeSet(`${LS_TAGS_PREFIX}${featureId}`, undefined);
+}
+
+function loadOverrides(featureId) {
+  // Shared in-memory object: callers copy (`{ ...o }`) before changing it.
+  const obj = storeGet(`${LS_OVERRIDES_PREFIX}${featureId}`);
+  if (!obj || typeof obj !== "object") return null;
+  return obj;
 }
 
 function saveOverrides(featureId, overrides) {
-  try {
-    window.localStorage.setItem(`${LS_OVERRIDES_PREFIX}${featureId}`, JSON.stringify(overrides || {}));
-  } catch {
-    // ignore
-  }
+  storeSet(`${LS_OVERRIDES_PREFIX}${featureId}`, overrides || {});
 }
 
 function clearOverrides(featureId) {
-  try {
-    window.localStorage.removeItem(`${LS_OVERRIDES_PREFIX}${featureId}`);
-  } catch {
-    // ignore
-  }
+  storeSet(`${LS_OVERRIDES_PREFIX}${featureId}`, undefined);
 }
 
 function loadCustomFeatures() {
+  const arr = storeGet(LS_CUSTOM_FEATURES);
+  if (!Array.isArray(arr)) return [];
+  return arr.filter((x) => x && typeof x === "object" && typeof x.id === "string");
+}
+
+function saveCustomFeatures(arr) {
+  storeSet(LS_CUSTOM_FEATURES, arr || []);
+}
+
+function loadVisited() {
+  const arr = storeGet(LS_VISITED);
+  if (!Array.isArray(arr)) return new Set();
+  return new Set(arr.map((x) => String(x)));
+}
+
+function saveVisited(set) {
+  storeSet(LS_VISITED, Array.from(set));
+}
+
+// --- Uploaded images ---
+// Photos added in Admin are downscaled (in image-worker.js, off the main thread), stored as
+// Blobs in IndexedDB keyed by feature, and referenced from the local edits store as
+// `idb:<key>`, so localStorage only ever holds short references. Pages show them through
+// object URLs, loaded by loadUploads() before the first render that needs them.
+const IDB_UPLOADS = "hookeUploads";
+const IDB_UPLOADS_STORE = "images";
+const UPLOAD_REF_PREFIX = "idb:";
+const UPLOAD_MAX_EDGE = 1600; // px; the widest responsive derivative the build makes
+const UPLOAD_QUALITY = 0.82;
+const UPLOAD_PRUNE_GRACE_MS = 60 * 1000; // newer blobs may belong to another tab's save in progress
+const UPLOAD_KEEP_TYPES = new Set(["image/jpeg", "image/png", "image/webp", "image/gif"]);
+
+const uploads = {
+  db: null, // Promise<IDBDatabase | null>
+  urls: new Map(), // key -> object URL ("" if the blob is missing)
+  worker: undefined, // Worker once started, null if unavailable
+  jobs: new Map(), // worker job id -> { resolve, reject }
+  nextJob: 1,
+  queue: Promise.resolve(), // one photo decoded at a time, however many are added at once
+};
+
+function isUploadRef(url) {
+  return typeof url === "string" && url.startsWith(UPLOAD_REF_PREFIX);
+}
+
+function uploadUrl(ref) {
+  return uploads.urls.get(ref.slice(UPLOAD_REF_PREFIX.length)) || "";
+}
+
+function openUploadDb() {
+  if (!uploads.db) {
+    uploads.db = new Promise((resolve) => {
+      let req;
+      try {
+        req = window.indexedDB.open(IDB_UPLOADS, 1);
+      } catch {
+        resolve(null); // no IndexedDB (or blocked)
+        return;
+      }
+      req.onupgradeneeded = () => {
+        const store = req.result.createObjectStore(IDB_UPLOADS_STORE, { keyPath: "key" });
+        store.createIndex("featureId", "featureId");
+      };
+      req.onsuccess = () => resolve(req.result);
+      req.onerror = () => resolve(null);
+    });
+  }
+  return uploads.db;
+}
+
+async function uploadTx(mode, fn) {
+  // Run `fn(store)` in one transaction; resolves to what it returned once the transaction completes.
+  const db = await openUploadDb();
+  if (!db) throw new Error("IndexedDB unavailable");
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction(IDB_UPLOADS_STORE, mode);
+    const result = fn(tx.objectStore(IDB_UPLOADS_STORE));
+    tx.oncomplete = () => resolve(result);
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+function fitWithin(width, height, maxEdge) {
+  const scale = Math.min(1, maxEdge / Math.max(width, height));
+  return { width: Math.max(1, Math.round(width * scale)), height: Math.max(1, Math.round(height * scale)), scaled: scale < 1 };
+}
+
+function imageWorker() {
+  if (uploads.worker !== undefined) return uploads.worker;
+  const failAll = (err) => {
+    uploads.jobs.forEach((job) => job.reject(err));
+    uploads.jobs.clear();
+  };
   try {
-    const raw = window.localStorage.getItem(LS_CUSTOM_FEATURES);
-    if (!raw) return [];
-    const arr = JSON.parse(raw);
-    if (!Array.isArray(arr)) return [];
-    return arr.filter((x) => x && typeof x === "object" && typeof x.id === "string");
+    const worker = new window.Worker("./image-worker.js");
+    worker.onmessage = (e) => {
+      const res = e.data || {};
+      const job = uploads.jobs.get(res.id);
+      if (!job) return;
+      uploads.jobs.delete(res.id);
+      if (res.unsupported) {
+        worker.terminate();
+        uploads.worker = null;
+      }
+      if (res.error) job.reject(new Error(res.error));
+      else job.resolve(res);
+    };
+    worker.onerror = (e) => {
+      // The script couldn't load (e.g. pages opened from file://): decode on the main thread from now on.
+      if (e && typeof e.preventDefault === "function") e.preventDefault();
+      worker.terminate();
+      uploads.worker = null;
+      failAll(new Error("Image worker failed"));
+    };
+    uploads.worker = worker;
   } catch {
-    return [];
+    uploads.worker = null;
   }
+  return uploads.worker;
 }
 
-function saveCustomFeatures(arr) {
+function downscaleInWorker(file) {
+  const worker = imageWorker();
+  if (!worker) return Promise.reject(new Error("No image worker"));
+  return new Promise((resolve, reject) => {
+    const id = uploads.nextJob++;
+    uploads.jobs.set(id, { resolve, reject });
+    worker.postMessage({ id, file, maxEdge: UPLOAD_MAX_EDGE, quality: UPLOAD_QUALITY });
+  });
+}
+
+function decodeImage(file) {
+  if (typeof window.createImageBitmap === "function") return window.createImageBitmap(file, { imageOrientation: "from-image" });
+  return new Promise((resolve, reject) => {
+    const url = URL.createObjectURL(file);
+    const img = new Image();
+    img.onload = () => {
+      URL.revokeObjectURL(url);
+      resolve(img);
+    };
+    img.onerror = () => {
+      URL.revokeObjectURL(url);
+      reject(new Error("Could not decode image"));
+    };
+    img.src = url;
+  });
+}
+
+function canvasToBlob(canvas, type) {
+  return new Promise((resolve, reject) => {
+    canvas.toBlob((blob) => (blob ? resolve(blob) : reject(new Error("Could not encode image"))), type, UPLOAD_QUALITY);
+  });
+}
+
+async function downscaleOnMainThread(file) {
+  const source = await decodeImage(file);
+  const size = fitWithin(source.naturalWidth || source.width, source.naturalHeight || source.height, UPLOAD_MAX_EDGE);
+  const canvas = document.createElement("canvas");
+  canvas.width = size.width;
+  canvas.height = size.height;
+  const ctx = canvas.getContext("2d");
+  ctx.imageSmoothingQuality = "high";
+  ctx.drawImage(source, 0, 0, size.width, size.height);
+  if (typeof source.close === "function") source.close();
+  let blob = await canvasToBlob(canvas, "image/webp");
+  if (blob.type !== "image/webp") blob = await canvasToBlob(canvas, "image/jpeg");
+  return { blob, ...size };
+}
+
+function downscaleImage(file) {
+  // Resolves to { blob, width, height }: at most UPLOAD_MAX_EDGE px, re-encoded as WebP (or JPEG).
+  // Never rejects; a photo that can't be decoded here is kept as it is.
+  const run = () =>
+    downscaleInWorker(file)
+      .catch(() => downscaleOnMainThread(file))
+      .then((res) =>
+        // Already small and well compressed: re-encoding would only cost quality.
+        !res.scaled && res.blob.size >= file.size && UPLOAD_KEEP_TYPES.has(file.type) ? { ...res, blob: file } : res
+      )
+      .catch(() => ({ blob: file, width: 0, height: 0 }));
+  const p = uploads.queue.then(run);
+  uploads.queue = p;
+  return p;
+}
+
+function blobToDataUrl(blob) {
+  return new Promise((resolve, reject) => {
+    const reader = new FileReader();
+    reader.onload = () => resolve(String(reader.result || ""));
+    reader.onerror = () => reject(reader.error || new Error("Failed to read file"));
+    reader.readAsDataURL(blob);
+  });
+}
+
+async function saveUpload(featureId, file) {
+  // Store one photo for a feature. Resolves to { url, width, height }, where `url` is the
+  // `idb:` reference to save in the edits (a data URL if IndexedDB isn't available).
+  const { blob, width, height } = await downscaleImage(file);
+  const key = `${featureId}/${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 8)}`;
   try {
-    window.localStorage.setItem(LS_CUSTOM_FEATURES, JSON.stringify(arr || []));
+    await uploadTx("readwrite", (store) => {
+      store.put({ key, featureId, blob, type: blob.type, width, height, size: blob.size, added: Date.now() });
+    });
   } catch {
-    // ignore
+    return { url: await blobToDataUrl(blob), width, height };
   }
+  uploads.urls.set(key, URL.createObjectURL(blob));
+  // Ask the browser not to evict the photos under storage pressure (best effort).
+  if (navigator.storage && typeof navigator.storage.persist === "function") navigator.storage.persist().catch(() => {});
+  return { url: `${UPLOAD_REF_PREFIX}${key}`, width, height };
 }
 
-function loadVisited() {
+function storedUploadRefs() {
+  // Every `idb:` reference in the local edits store.
+  if (!localStore.values) hydrateLocalStore();
+  const refs = new Set();
+  const walk = (v) => {
+    if (isUploadRef(v)) refs.add(v);
+    else if (v && typeof v === "object") Object.values(v).forEach(walk);
+  };
+  localStore.values.forEach(walk);
+  return refs;
+}
+
+async function loadUploads(refs) {
+  // Create object URLs for the referenced blobs not loaded yet. Resolves to true if any were.
+  const keys = Array.from(refs, (ref) => ref.slice(UPLOAD_REF_PREFIX.length)).filter((key) => !uploads.urls.has(key));
+  if (keys.length === 0) return false;
+  let records;
   try {
-    const raw = window.localStorage.getItem(LS_VISITED);
-    if (!raw) return new Set();
-    const arr = JSON.parse(raw);
-    if (!Array.isArray(arr)) return new Set();
-    return new Set(arr.map((x) => String(x)));
+    records = await uploadTx("readonly", (store) => {
+      const out = new Map();
+      keys.forEach((key) => {
+        const req = store.get(key);
+        req.onsuccess = () => out.set(key, req.result);
+      });
+      return out;
+    });
   } catch {
-    return new Set();
+    records = new Map();
   }
+  keys.forEach((key) => {
+    if (uploads.urls.has(key)) return; // loaded meanwhile
+    const rec = records.get(key);
+    uploads.urls.set(key, rec && rec.blob ? URL.createObjectURL(rec.blob) : "");
+  });
+  return true;
 }
 
-function saveVisited(set) {
+async function pruneUploads(featureId) {
+  // Delete a feature's blobs that no edit references any more (replaced, removed or reset photos).
+  const inUse = storedUploadRefs();
+  const cutoff = Date.now() - UPLOAD_PRUNE_GRACE_MS;
   try {
-    window.localStorage.setItem(LS_VISITED, JSON.stringify(Array.from(set)));
+    const removed = await uploadTx("readwrite", (store) => {
+      const out = [];
+      const req = store.index("featureId").openCursor(window.IDBKeyRange.only(featureId));
+      req.onsuccess = () => {
+        const cursor = req.result;
+        if (!cursor) return;
+        const rec = cursor.value;
+        if (!inUse.has(`${UPLOAD_REF_PREFIX}${rec.key}`) && !(rec.added > cutoff)) {
+          cursor.delete();
+          out.push(rec.key);
+        }
+        cursor.continue();
+      };
+      return out;
+    });
+    removed.forEach((key) => {
+      const url = uploads.urls.get(key);
+      if (url) URL.revokeObjectURL(url);
+      uploads.urls.delete(key);
+    });
   } catch {
-    // ignore
+    // ignore: leftovers are pruned on the next save for this feature
   }
 }
 
+async function migrateInlineImages() {
+  // Edits saved before uploads moved to IndexedDB hold base64 data URLs; move those over once.
+  // Resolves to true if the store changed.
+  if (!localStore.values) hydrateLocalStore();
+  if (!(await openUploadDb())) return false;
+  const inline = (v) => typeof v === "string" && v.startsWith("data:image/");
+  const hasInline = (v) => inline(v) || (!!v && typeof v === "object" && Object.values(v).some(hasInline));
+  const convert = async (v, featureId, memo) => {
+    if (inline(v)) {
+      // The same photo is usually stored 2-3 times (imageDataUrl, thumb, pages[0].image).
+      if (!memo.has(v)) memo.set(v, fetch(v).then((r) => r.blob()).then((blob) => saveUpload(featureId, blob)));
+      return (await memo.get(v)).url;
+    }
+    if (!v || typeof v !== "object") return v;
+    const out = Array.isArray(v) ? [] : {};
+    for (const [k, x] of Object.entries(v)) out[k] = await convert(x, featureId, memo);
+    return out;
+  };
+
+  let changed = false;
+  for (const [key, value] of Array.from(localStore.values)) {
+    if (!hasInline(value)) continue;
+    let next;
+    try {
+      if (key === LS_CUSTOM_FEATURES && Array.isArray(value)) {
+        next = [];
+        for (const f of value) next.push(f && typeof f === "object" ? await convert(f, String(f.id), new Map()) : f);
+      } else if (key.startsWith(LS_OVERRIDES_PREFIX)) {
+        next = await convert(value, key.slice(LS_OVERRIDES_PREFIX.length), new Map());
+      } else {
+        continue;
+      }
+    } catch {
+      continue; // keep the inline copy; the next page load tries again
+    }
+    // Only replace what nobody edited while the photos were being stored.
+    if (storeGet(key) !== value) continue;
+    storeSet(key, next);
+    changed = true;
+  }
+  return changed;
+}
+
 function getEffectiveTags(feature) {
   const base = Array.isArray(feature.tags) ? feature.tags : [];
   const overrides = loadTagOverrides(feature.id);
@@ -324,6 +689,88 @@ function highlightPlain(text, query) {
   return out;
 }
 
+// --- Search ---
+// Tokenization and scoring must match tools/search_index.py (the build-time index).
+const SEARCH_WEIGHTS = [8, 5, 2, 1]; // title, tags, sourcePdf, text
+const SEARCH_TF_CAP = 3;
+
+function searchTokens(s) {
+  return String(s || "")
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .replace(/['’]/g, "")
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean);
+}
+
+function lowerBound(sorted, key) {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (sorted[mid] < key) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function searchScore(lookup, qTokens) {
+  // Every query token must match a term (the whole term, or a prefix at half weight);
+  // `lookup(token)` returns the [term, scoreByDoc] pairs starting with `token`.
+  let result = null;
+  for (const tok of qTokens) {
+    const hits = new Map();
+    for (const [term, scores] of lookup(tok)) {
+      const factor = term === tok ? 1 : 0.5;
+      scores.forEach((score, doc) => hits.set(doc, (hits.get(doc) || 0) + score * factor));
+    }
+    if (!result) {
+      result = hits;
+    } else {
+      for (const [doc, score] of result) {
+        if (hits.has(doc)) result.set(doc, score + hits.get(doc));
+        else result.delete(doc);
+      }
+    }
+    if (result.size === 0) break;
+  }
+  return result || new Map();
+}
+
+function createSearchIndex(raw) {
+  // Wrap the bundle's prebuilt `searchIndex`; returns null if it's missing or malformed.
+  if (!raw || !Array.isArray(raw.terms) || !Array.isArray(raw.postings) || !Array.isArray(raw.docs)) return null;
+  const { terms, postings, docs } = raw;
+  return {
+    ids: new Set(docs),
+    weights: Array.isArray(raw.weights) ? raw.weights : SEARCH_WEIGHTS,
+    query(qTokens) {
+      return searchScore((tok) => {
+        const out = [];
+        for (let i = lowerBound(terms, tok); i < terms.length && terms[i].startsWith(tok); i++) {
+          const p = postings[i] || [];
+          const scores = new Map();
+          for (let j = 0; j + 1 < p.length; j += 2) scores.set(docs[p[j]], p[j + 1]);
+          out.push([terms[i], scores]);
+        }
+        return out;
+      }, qTokens);
+    },
+  };
+}
+
+function docTermScores(fieldTexts, weights) {
+  // Same scoring as the build-time index, for one document that isn't in it.
+  const scores = new Map();
+  fieldTexts.forEach((text, i) => {
+    const counts = new Map();
+    searchTokens(text).forEach((t) => counts.set(t, (counts.get(t) || 0) + 1));
+    counts.forEach((n, t) => scores.set(t, (scores.get(t) || 0) + (weights[i] || 1) * Math.min(n, SEARCH_TF_CAP)));
+  });
+  return scores;
+}
+
 function isHidden(feature) {
   const o = loadOverrides(feature.id);
   if (o && o.hidden === true) return true;
@@ -336,10 +783,117 @@ function isDeleted(feature) {
   return feature && feature.deleted === true;
 }
 
+function pictureHtml(srcset, sizes, imgHtml) {
+  // Wrap an <img> in <picture> with AVIF/WebP sources from the build's `responsive` data.
+  if (!srcset) return imgHtml;
+  const sources = ["avif", "webp"]
+    .filter((fmt) => srcset[fmt])
+    .map((fmt) => `<source type="image/${fmt}" srcset="${escapeHtml(srcset[fmt])}" sizes="${escapeHtml(sizes || "100vw")}" />`)
+    .join("");
+  return `<picture class="pic">${sources}${imgHtml}</picture>`;
+}
+
+function sizeAttrs(item) {
+  // Intrinsic width/height from the build (header-probed) so the browser can reserve the box before load.
+  const w = item && Number(item.width);
+  const h = item && Number(item.height);
+  return w > 0 && h > 0 ? ` width="${w}" height="${h}"` : "";
+}
+
+function placeholderCss(ph) {
+  // Dominant colour + tiny preview from the build, painted under the <img> until the real image covers it.
+  if (!ph || typeof ph.color !== "string") return "";
+  return ph.preview ? `${ph.color} url(${ph.preview}) center / cover no-repeat` : ph.color;
+}
+
+function placeholderStyle(ph) {
+  const css = placeholderCss(ph);
+  return css ? ` style="background:${escapeHtml(css)}"` : "";
+}
+
+function setSizeAttrs(img, item) {
+  const w = item && Number(item.width);
+  const h = item && Number(item.height);
+  if (w > 0 && h > 0) {
+    img.width = w;
+    img.height = h;
+  } else {
+    img.removeAttribute("width");
+    img.removeAttribute("height");
+  }
+}
+
+function loadScript(src) {
+  // JSONP-style loading for generated data chunks: works over http(s) and file:// alike.
+  return new Promise((resolve) => {
+    const s = document.createElement("script");
+    s.src = src;
+    s.async = true;
+    s.onload = () => {
+      s.remove();
+      resolve(true);
+    };
+    s.onerror = () => {
+      s.remove();
+      resolve(false);
+    };
+    document.head.appendChild(s);
+  });
+}
+
 function getDefaultPin(featureId, fallbacks) {
   return (fallbacks || []).find((p) => p.featureId === featureId) || null;
 }
 
+// --- Map pin clustering ---
+// Pins are indexed once per data change in a uniform grid over xPct/yPct; clustering at the
+// current map scale then only compares pins in neighbouring cells.
+const PIN_GRID_CELLS = 20; // per side, so a cell is 5% of the map
+
+function buildPinGrid(pins) {
+  const cells = new Map(); // "col,row" -> indices into `pins`
+  pins.forEach((p, i) => {
+    const col = Math.min(PIN_GRID_CELLS - 1, Math.max(0, Math.floor((p.xPct / 100) * PIN_GRID_CELLS)));
+    const row = Math.min(PIN_GRID_CELLS - 1, Math.max(0, Math.floor((p.yPct / 100) * PIN_GRID_CELLS)));
+    const key = `${col},${row}`;
+    if (!cells.has(key)) cells.set(key, []);
+    cells.get(key).push(i);
+  });
+  return cells;
+}
+
+function clusterPins(pins, grid, width, height, radius) {
+  // Greedy, in `pins` order: each pin not yet taken collects the free pins within `radius` px
+  // (at a map drawn `width` x `height` px). Returns [{ members: [indices], xPct, yPct }].
+  const cellPx = { x: width / PIN_GRID_CELLS, y: height / PIN_GRID_CELLS };
+  const reach = { x: Math.ceil(radius / cellPx.x), y: Math.ceil(radius / cellPx.y) };
+  const taken = new Uint8Array(pins.length);
+  const out = [];
+  pins.forEach((p, i) => {
+    if (taken[i]) return;
+    taken[i] = 1;
+    const members = [i];
+    const col = Math.floor((p.xPct / 100) * PIN_GRID_CELLS);
+    const row = Math.floor((p.yPct / 100) * PIN_GRID_CELLS);
+    for (let c = col - reach.x; c <= col + reach.x; c++) {
+      for (let r = row - reach.y; r <= row + reach.y; r++) {
+        for (const j of grid.get(`${c},${r}`) || []) {
+          if (taken[j]) continue;
+          const dx = ((pins[j].xPct - p.xPct) / 100) * width;
+          const dy = ((pins[j].yPct - p.yPct) / 100) * height;
+          if (dx * dx + dy * dy > radius * radius) continue;
+          taken[j] = 1;
+          members.push(j);
+        }
+      }
+    }
+    const xPct = members.reduce((sum, j) => sum + pins[j].xPct, 0) / members.length;
+    const yPct = members.reduce((sum, j) => sum + pins[j].yPct, 0) / members.length;
+    out.push({ members, xPct, yPct });
+  });
+  return out;
+}
+
 function main() {
   const data = window.__HOOKE_DATA__;
   if (!data || !Array.isArray(data.features)) {
@@ -348,6 +902,15 @@ function main() {
     return;
   }
 
+  const responsive = data.responsive && typeof data.responsive === "object" ? data.responsive : {};
+  const responsiveSizes = data.responsiveSizes && typeof data.responsiveSizes === "object" ? data.responsiveSizes : {};
+  const placeholders = data.placeholders && typeof data.placeholders === "object" ? data.placeholders : {};
+  const detailChunks = data.detailChunks && typeof data.detailChunks === "object" ? data.detailChunks : {};
+  const detailLoads = new Map(); // feature id -> Promise (in flight or done)
+  const loadedDetails = new Set();
+  let searchIndex = createSearchIndex(data.searchIndex);
+  let searchIndexLoad = null;
+  let searchMemo = { q: null, indexed: new Map() };
   const baseFeatures = data.features.map((f) => ({ ...f, isCustom: false }));
   let features = [...baseFeatures, ...loadCustomFeatures().map((f) => ({ ...f, isCustom: true }))];
   const visited = loadVisited();
@@ -398,6 +961,12 @@ function main() {
   const $btnRandom = el("btnRandom");
 
   // Map / HUD (keep existing map features working even if pins are not used)
+  const $mapFrame = el("mapFrame");
+  const $mapStage = el("mapStage");
+  const $mapTiles = el("mapTiles");
+  const $mapZoom = el("mapZoom");
+  const $mapZoomIn = el("mapZoomIn");
+  const $mapZoomOut = el("mapZoomOut");
   const $mapPins = el("mapPins");
   const $mapHud = el("mapHud");
   const $hudX = el("hudX");
@@ -509,30 +1078,149 @@ function main() {
     return { featureId: feature.id, label, xPct, yPct };
   }
 
+  // Pin layer: one DOM node per pin or cluster, keyed and patched in place, so visits, edits
+  // and zooming only touch the markers that changed.
+  const pinLayer = {
+    pins: [], // effective pins (features order), rebuilt by renderMapPins()
+    grid: new Map(), // spatial index over `pins` (buildPinGrid)
+    nodes: new Map(), // "f:<featureId>" | "c:<first member id>" -> { el, label, count, state }
+    spread: new Set(), // clusters fanned out in place (clicked where the map can't zoom further)
+    tourId: "",
+    size: "", // "<w>x<h>" the last layout was made for
+    dirty: true, // pins, visits or the tour stop changed since then
+  };
+
   function renderMapPins() {
-    const pins = features
+    pinLayer.pins = features
       .filter((f) => !isDeleted(f))
       .filter((f) => !isHidden(f))
       .map((f) => getEffectivePin(f))
       .filter(Boolean);
-    $mapPins.innerHTML = pins
-      .map((p) => {
-        const left = `${p.xPct}%`;
-        const top = `${p.yPct}%`;
-        const visitedClass = visited.has(p.featureId) ? " is-visited" : "";
-        return `
-          <button class="pin${visitedClass}" type="button" data-feature-id="${escapeHtml(p.featureId)}" style="left:${left};top:${top}">
-            <div class="pin__bubble">
-              <span class="pin__dot" aria-hidden="true"></span>
-              <span class="pin__label">${escapeHtml(p.label)}</span>
-            </div>
-            <div class="pin__stem" aria-hidden="true"></div>
-          </button>
-        `;
-      })
-      .join("");
+    pinLayer.grid = buildPinGrid(pinLayer.pins);
+    pinLayer.dirty = true;
+    layoutMapPins();
+  }
+
+  function createPinNode(isCluster) {
+    const btn = document.createElement("button");
+    btn.type = "button";
+    btn.className = isCluster ? "pin pin--cluster" : "pin";
+    const bubble = document.createElement("div");
+    bubble.className = "pin__bubble";
+    const mark = document.createElement("span");
+    mark.className = isCluster ? "pin__count" : "pin__dot";
+    mark.setAttribute("aria-hidden", "true");
+    const label = document.createElement("span");
+    label.className = "pin__label";
+    const stem = document.createElement("div");
+    stem.className = "pin__stem";
+    stem.setAttribute("aria-hidden", "true");
+    bubble.append(mark, label);
+    btn.append(bubble, stem);
+    return { el: btn, label, count: isCluster ? mark : null, state: {} };
+  }
+
+  function patchPinNode(node, next) {
+    const cur = node.state;
+    if (cur.xPct !== next.xPct) node.el.style.left = `${next.xPct}%`;
+    if (cur.yPct !== next.yPct) node.el.style.top = `${next.yPct}%`;
+    if (cur.label !== next.label) node.label.textContent = next.label;
+    if (cur.visited !== next.visited) node.el.classList.toggle("is-visited", next.visited);
+    if (cur.tour !== next.tour) node.el.classList.toggle("is-tour-current", next.tour);
+    if (node.count && cur.count !== next.count) {
+      node.count.textContent = String(next.count);
+      node.el.setAttribute("aria-label", `${next.count} features here: ${next.names}`);
+    }
+    node.state = next;
+  }
+
+  function layoutMapPins() {
+    const w = $mapPins.clientWidth || $mapPins.getBoundingClientRect().width || 1;
+    const h = $mapPins.clientHeight || $mapPins.getBoundingClientRect().height || 1;
+    const size = `${w}x${h}`;
+    if (size === pinLayer.size && !pinLayer.dirty) return; // e.g. a pan
+    if (size !== pinLayer.size) pinLayer.spread.clear(); // zoomed or resized: cluster afresh
+    pinLayer.size = size;
+    pinLayer.dirty = false;
+    const { pins } = pinLayer;
+
+    const wanted = new Map(); // key -> next state
+    clusterPins(pins, pinLayer.grid, w, h, MAP_PIN_CLUSTER_PX).forEach((c) => {
+      const members = c.members.map((i) => pins[i]);
+      const anchor = members[0];
+      if (members.length === 1 || pinLayer.spread.has(anchor.featureId)) {
+        // Fanned-out clusters put their pins on a ring around the cluster's centre.
+        const ring = members.length > 1 ? MAP_PIN_CLUSTER_PX * Math.max(1.2, members.length / 5) : 0;
+        members.forEach((p, k) => {
+          const angle = (2 * Math.PI * k) / members.length - Math.PI / 2;
+          wanted.set(`f:${p.featureId}`, {
+            featureId: p.featureId,
+            xPct: ring ? c.xPct + ((ring * Math.cos(angle)) / w) * 100 : p.xPct,
+            yPct: ring ? c.yPct + ((ring * Math.sin(angle)) / h) * 100 : p.yPct,
+            label: p.label,
+            visited: visited.has(p.featureId),
+            tour: p.featureId === pinLayer.tourId,
+          });
+        });
+        return;
+      }
+      wanted.set(`c:${anchor.featureId}`, {
+        cluster: anchor.featureId,
+        xPct: c.xPct,
+        yPct: c.yPct,
+        label: `${anchor.label} +${members.length - 1}`,
+        names: members.map((p) => p.label).join(", "),
+        count: members.length,
+        visited: members.every((p) => visited.has(p.featureId)),
+        tour: members.some((p) => p.featureId === pinLayer.tourId),
+      });
+    });
+
+    for (const [key, node] of pinLayer.nodes) {
+      if (wanted.has(key)) continue;
+      node.el.remove();
+      pinLayer.nodes.delete(key);
+    }
+    const added = document.createDocumentFragment();
+    for (const [key, next] of wanted) {
+      let node = pinLayer.nodes.get(key);
+      if (!node) {
+        node = createPinNode(!!next.cluster);
+        if (next.cluster) node.el.dataset.cluster = next.cluster;
+        else node.el.dataset.featureId = next.featureId;
+        pinLayer.nodes.set(key, node);
+        added.appendChild(node.el);
+      }
+      patchPinNode(node, next);
+    }
+    $mapPins.appendChild(added);
   }
 
+  function openPinCluster(anchorId) {
+    // Zoom in on the cluster while the map can; past that, fan its pins out in place.
+    const key = `c:${anchorId}`;
+    const node = pinLayer.nodes.get(key);
+    if (!node) return;
+    if (mapTiles && mapView.zoom < mapMaxZoom() - 0.001) {
+      mapView.zoom = Math.min(mapMaxZoom(), mapView.zoom * 2);
+      centerMapOn(node.state.xPct, node.state.yPct);
+      return;
+    }
+    pinLayer.spread.add(anchorId);
+    pinLayer.dirty = true;
+    layoutMapPins();
+  }
+
+  let pinLayoutQueued = false;
+  window.addEventListener("resize", () => {
+    if (pinLayoutQueued) return;
+    pinLayoutQueued = true;
+    window.requestAnimationFrame(() => {
+      pinLayoutQueued = false;
+      layoutMapPins();
+    });
+  });
+
   // --- Admin mode (session unlock) ---
   let isAdmin = false;
   let adminActiveTab = "edit"; // "edit" | "new"
@@ -595,13 +1283,21 @@ function main() {
     if (d && typeof d.close === "function") d.close();
   }
 
-  function fileToDataUrl(file) {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader();
-      reader.onload = () => resolve(String(reader.result || ""));
-      reader.onerror = () => reject(reader.error || new Error("Failed to read file"));
-      reader.readAsDataURL(file);
-    });
+  const filePreviews = new Map(); // <img> -> { file, url } it currently previews
+
+  function showFilePreview(img, file) {
+    // Preview a picked file through an object URL, without reading it into memory.
+    const cur = filePreviews.get(img);
+    if (cur && cur.file === file) return;
+    if (cur) URL.revokeObjectURL(cur.url);
+    filePreviews.delete(img);
+    if (!file) {
+      img.removeAttribute("src");
+      return;
+    }
+    const url = URL.createObjectURL(file);
+    filePreviews.set(img, { file, url });
+    img.src = url;
   }
 
   function parseTagsCsv(s) {
@@ -635,11 +1331,11 @@ function main() {
     const effTitle = getEffectiveTitle(f);
     const overrideImg = getEffectiveImage(f);
     const img = overrideImg || (f.pages && f.pages[0] && f.pages[0].image) || f.thumb || "";
+    showFilePreview($adminPreviewImg, null);
     if (!img) {
-      $adminPreviewImg.removeAttribute("src");
       $adminPreviewImg.alt = "";
     } else {
-      $adminPreviewImg.src = img.startsWith("data:") ? img : `./${img}`;
+      $adminPreviewImg.src = resolveImg(img);
       $adminPreviewImg.alt = effTitle;
     }
     const pin = getEffectivePin(f);
@@ -649,17 +1345,11 @@ function main() {
   function updateNewPreview() {
     const imgFile = ($newImage.files && $newImage.files[0]) || null;
     if (!imgFile) {
-      $newPreviewImg.removeAttribute("src");
+      showFilePreview($newPreviewImg, null);
       $newPreviewImg.alt = "";
     } else {
-      fileToDataUrl(imgFile)
-        .then((url) => {
-          $newPreviewImg.src = url;
-          $newPreviewImg.alt = ($newTitle.value || "New feature").trim();
-        })
-        .catch(() => {
-          // ignore
-        });
+      showFilePreview($newPreviewImg, imgFile);
+      $newPreviewImg.alt = ($newTitle.value || "New feature").trim();
     }
     const x = String($newPinX.value || "").trim();
     const y = String($newPinY.value || "").trim();
@@ -670,6 +1360,14 @@ function main() {
     const id = $adminFeatureSelect.value;
     const f = features.find((x) => x.id === id);
     if (!f) return;
+    if (!hasDetail(f)) {
+      // The story/gallery editors need the full feature; refill once its chunk arrives.
+      $adminSaveStatus.textContent = "Loading…";
+      loadFeatureDetail(f).then(() => {
+        if ($adminFeatureSelect.value === id && hasDetail(f)) loadAdminFormFromSelected();
+      });
+      return;
+    }
 
     const o = loadOverrides(id) || {};
     const effPin = getEffectivePin(f);
@@ -715,8 +1413,32 @@ function main() {
     if (isAdmin) {
       hydrateAdminSelect();
     }
+    showStoredUploads();
   }
 
+  function showStoredUploads() {
+    // Edits reference uploaded photos by IndexedDB key: load any not loaded yet, then show them.
+    loadUploads(storedUploadRefs()).then((loaded) => {
+      if (!loaded) return;
+      renderGrid();
+      if ($modal.open && state.activeFeatureId) openFeature(state.activeFeatureId);
+      const f = isAdmin && features.find((x) => x.id === $adminFeatureSelect.value);
+      if (f) {
+        updateAdminPreviewForFeature(f);
+        renderAdminGallery(f);
+      }
+    });
+  }
+
+  // Edits (or visits) made in another tab.
+  watchLocalStore((key) => {
+    if (key === null || key === LS_VISITED) {
+      visited.clear();
+      loadVisited().forEach((id) => visited.add(id));
+    }
+    refreshFromStorage();
+  });
+
   function renderAdminGallery(feature) {
     const items = getEffectiveGallery(feature);
     $adminGalleryList.innerHTML = items
@@ -756,26 +1478,81 @@ function main() {
     return unique(features.flatMap((f) => getEffectiveTags(f))).sort((a, b) => a.localeCompare(b));
   }
 
-  function matches(f) {
-    const q = normalize(state.q);
+  function hasSearchOverrides(f) {
+    const o = loadOverrides(f.id);
+    if (o && typeof o.title === "string" && o.title.trim()) return true;
+    return !!loadTagOverrides(f.id);
+  }
+
+  function usesSearchIndex(f) {
+    // Custom features and ones with a local title/tag edit aren't in the prebuilt index.
+    return !!searchIndex && !f.isCustom && searchIndex.ids.has(f.id) && !hasSearchOverrides(f);
+  }
+
+  function ensureSearchIndex() {
+    // The index ships as its own chunk; until it arrives, search falls back to titles/tags.
+    if (searchIndex || !data.searchChunk) return Promise.resolve();
+    if (!searchIndexLoad) {
+      searchIndexLoad = loadScript(`./${data.searchChunk}`).then((ok) => {
+        searchIndex = createSearchIndex(window.__HOOKE_SEARCH__);
+        searchMemo = { q: null, indexed: new Map() };
+        if (!ok || !searchIndex) searchIndexLoad = null;
+      });
+    }
+    return searchIndexLoad;
+  }
+
+  function searchScores() {
+    // Map of feature id -> relevance for the current query, or null when there's no query.
+    const qTokens = searchTokens(state.q);
+    if (qTokens.length === 0) return null;
+    if (searchMemo.q !== state.q) {
+      searchMemo = { q: state.q, indexed: searchIndex ? searchIndex.query(qTokens) : new Map() };
+    }
+    const scores = new Map();
+    features.forEach((f) => {
+      let score = 0;
+      if (usesSearchIndex(f)) {
+        score = searchMemo.indexed.get(f.id) || 0;
+      } else {
+        const fields = [getEffectiveTitle(f), getEffectiveTags(f).join(" "), f.sourcePdf, f.text];
+        const terms = docTermScores(fields, searchIndex ? searchIndex.weights : SEARCH_WEIGHTS);
+        const lookup = (tok) =>
+          Array.from(terms)
+            .filter(([term]) => term.startsWith(tok))
+            .map(([term, s]) => [term, new Map([[f.id, s]])]);
+        score = searchScore(lookup, qTokens).get(f.id) || 0;
+      }
+      if (score > 0) scores.set(f.id, score);
+    });
+    return scores;
+  }
+
+  function matches(f, scores) {
     const tags = state.tags;
-    const effTags = getEffectiveTags(f);
-    const hay = normalize([getEffectiveTitle(f), f.text, effTags.join(" "), f.sourcePdf].join(" "));
-    const qOk = !q || hay.includes(q);
-    const tagOk = tags.size === 0 || effTags.some((t) => tags.has(t));
+    const qOk = !scores || scores.has(f.id);
+    const tagOk = tags.size === 0 || getEffectiveTags(f).some((t) => tags.has(t));
     return qOk && tagOk;
   }
 
+  function byRelevance(scores) {
+    // Best match first when searching; alphabetical otherwise (and for ties).
+    return (a, b) =>
+      (scores ? (scores.get(b.id) || 0) - (scores.get(a.id) || 0) : 0) ||
+      getEffectiveTitle(a).localeCompare(getEffectiveTitle(b));
+  }
+
   function setModalOpenState(open) {
     document.body.classList.toggle("is-modal-open", !!open);
   }
 
   function filteredFeatureIds() {
+    const scores = searchScores();
     return features
       .filter((f) => !isDeleted(f))
       .filter((f) => !isHidden(f))
-      .filter(matches)
-      .sort((a, b) => getEffectiveTitle(a).localeCompare(getEffectiveTitle(b)))
+      .filter((f) => matches(f, scores))
+      .sort(byRelevance(scores))
       .map((f) => f.id);
   }
 
@@ -810,7 +1587,10 @@ function main() {
   }
 
   function renderGrid() {
-    const filtered = features.filter((f) => !isDeleted(f)).filter((f) => !isHidden(f)).filter(matches);
+    const scores = searchScores();
+    const filtered = features.filter((f) => !isDeleted(f)).filter((f) => !isHidden(f)).filter((f) => matches(f, scores));
+    // Keep the curated order when browsing; rank by relevance when searching.
+    if (scores) filtered.sort(byRelevance(scores));
     $resultMeta.textContent = `${filtered.length} feature${filtered.length === 1 ? "" : "s"} showing`;
 
     if (filtered.length === 0) {
@@ -828,13 +1608,16 @@ function main() {
         const title = getEffectiveTitle(f);
         const overrideImg = getEffectiveImage(f);
         const cardImg = overrideImg || f.thumb;
+        const page0 = (f.pages && f.pages[0]) || null;
+        const cardSize = page0 && page0.image === cardImg ? page0 : null;
         const titleHtml = highlightPlain(title, state.q);
         const previewHtml = highlightPlain(preview || "Open to read more…", state.q);
+        const imgHtml = `<img class="card__img" src="${escapeHtml(resolveImg(cardImg))}" alt="" loading="lazy"${sizeAttrs(cardSize)}${placeholderStyle(placeholders[cardImg])} />`;
         return `
           <article class="card" role="button" tabindex="0" data-id="${escapeHtml(f.id)}" aria-label="Open ${escapeHtml(
           title
         )}">
-            <img class="card__img" src="${cardImg.startsWith("data:") ? cardImg : `./${escapeHtml(cardImg)}`}" alt="" loading="lazy" />
+            ${pictureHtml(responsive[cardImg], responsiveSizes.card, imgHtml)}
             <div class="card__body">
               <div class="card__title">${titleHtml}</div>
               <div class="card__sub">${previewHtml}</div>
@@ -850,9 +1633,28 @@ function main() {
 
   function resolveImg(url) {
     if (!url) return "";
+    if (isUploadRef(url)) return uploadUrl(url); // "" until loadUploads() has run for it
     return url.startsWith("data:") ? url : `./${url}`;
   }
 
+  function setResponsiveImg(img, url, sizes, size) {
+    // Dynamic <img> elements only get the WebP srcset (AVIF needs a <picture> wrapper).
+    const srcset = responsive[url];
+    if (srcset && srcset.webp) {
+      img.srcset = srcset.webp;
+      img.sizes = sizes || "100vw";
+    } else {
+      img.removeAttribute("srcset");
+      img.removeAttribute("sizes");
+    }
+    setSizeAttrs(img, size);
+    const ph = placeholderCss(placeholders[url]);
+    img.style.background = ph;
+    // Modal images are letterboxed (object-fit: contain), so drop the preview once the photo is in.
+    if (ph) img.addEventListener("load", () => (img.style.background = ""), { once: true });
+    img.src = resolveImg(url);
+  }
+
   function renderSeasonal(feature) {
     const seasonalNotes =
       feature &&
@@ -905,8 +1707,7 @@ function main() {
     const idx = ((nextIdx % len) + len) % len;
     galleryState.idx = idx;
 
-    const src = items[idx].src;
-    $modalBoardImg.src = src;
+    setResponsiveImg($modalBoardImg, items[idx].url, responsiveSizes.board, items[idx]);
     $modalBoardImg.alt = galleryState.title ? `${galleryState.title} photo ${idx + 1} of ${len}` : `Photo ${idx + 1} of ${len}`;
 
     // Thumbnails
@@ -930,8 +1731,16 @@ function main() {
   function renderGallery(feature, activeUrl) {
     const baseImg = (feature.pages && feature.pages[0] && feature.pages[0].image) || feature.thumb || "";
     const gallery = getEffectiveGallery(feature);
-    const rawItems = [{ id: "board", url: baseImg }, ...gallery].filter((it) => it && it.url);
-    const items = rawItems.map((it) => ({ id: it.id || "", src: resolveImg(it.url) }));
+    const page0 = (feature.pages && feature.pages[0]) || {};
+    const board = { id: "board", url: baseImg, width: page0.width, height: page0.height };
+    const rawItems = [board, ...gallery].filter((it) => it && it.url);
+    const items = rawItems.map((it) => ({
+      id: it.id || "",
+      url: it.url,
+      src: resolveImg(it.url),
+      width: it.width,
+      height: it.height,
+    }));
     const active = activeUrl || resolveImg(baseImg);
     const activeIdx = Math.max(0, items.findIndex((it) => it.src === active));
 
@@ -945,7 +1754,7 @@ function main() {
         return `<button class="thumb ${isActive ? "is-active" : ""}" type="button" data-idx="${escapeHtml(String(idx))}" data-src="${escapeHtml(
           it.src
         )}" aria-label="Open photo ${escapeHtml(String(idx + 1))}">
-          <img src="${it.src}" alt="" loading="lazy" />
+          ${pictureHtml(responsive[it.url], responsiveSizes.thumb, `<img src="${it.src}" alt="" loading="lazy"${sizeAttrs(it)}${placeholderStyle(placeholders[it.url])} />`)}
         </button>`;
       })
       .join("");
@@ -1010,9 +1819,9 @@ function main() {
   }
 
   function setTourCurrentPin(featureId) {
-    Array.from($mapPins.querySelectorAll(".pin")).forEach((p) => {
-      p.classList.toggle("is-tour-current", p.dataset.featureId === featureId);
-    });
+    pinLayer.tourId = featureId;
+    pinLayer.dirty = true;
+    layoutMapPins();
   }
 
   function openTourStep(nextIdx, fromId) {
@@ -1034,6 +1843,8 @@ function main() {
       "";
     $tourPanelText.textContent = snippet ? snippet.replace(/\s+/g, " ").trim() : "Click “Open details” to read more.";
     setTourCurrentPin(id);
+    const stop = pinPointForFeatureId(id);
+    if (stop) centerMapOn(stop.xPct, stop.yPct);
 
     // Animate path from previous to current
     if (fromId && fromId !== id) animatePath(fromId, id);
@@ -1062,16 +1873,71 @@ function main() {
       .join("");
   }
 
+  // --- Feature details (story, text, seasonal notes, gallery) load on demand ---
+  function hasDetail(f) {
+    return f.isCustom || !detailChunks[f.id] || loadedDetails.has(f.id);
+  }
+
+  function loadFeatureDetail(f) {
+    // Resolves once the feature's detail chunk is merged in (or failed to load).
+    if (!f || hasDetail(f)) return Promise.resolve(f);
+    if (!detailLoads.has(f.id)) {
+      const p = loadScript(`./${detailChunks[f.id]}`).then(() => {
+        const details = window.__HOOKE_DETAILS__ || {};
+        const detail = details[f.id];
+        if (detail && typeof detail === "object") {
+          const { responsive: chunkResponsive, placeholders: chunkPlaceholders, ...fields } = detail;
+          // `f` is the shared base feature object, so this survives refreshFromStorage().
+          Object.assign(f, fields);
+          Object.assign(responsive, chunkResponsive || {});
+          Object.assign(placeholders, chunkPlaceholders || {});
+          loadedDetails.add(f.id);
+          delete details[f.id];
+        } else {
+          detailLoads.delete(f.id); // allow a retry next time
+        }
+        return f;
+      });
+      detailLoads.set(f.id, p);
+    }
+    return detailLoads.get(f.id);
+  }
+
+  let pendingOpenId = null;
+
   function openFeature(featureId) {
     const f = features.find((x) => x.id === featureId);
     if (!f) return;
+    pendingOpenId = featureId;
+    if (hasDetail(f)) {
+      showFeature(f);
+      return;
+    }
+    loadFeatureDetail(f).then(() => {
+      // Ignore stale loads if another feature was opened in the meantime.
+      if (pendingOpenId === featureId) showFeature(f);
+    });
+  }
+
+  function prefetchNeighbours(featureId) {
+    const ids = filteredFeatureIds();
+    const idx = ids.indexOf(featureId);
+    if (idx < 0 || ids.length < 2) return;
+    [ids[(idx + 1) % ids.length], ids[(idx - 1 + ids.length) % ids.length]].forEach((id) =>
+      loadFeatureDetail(features.find((x) => x.id === id))
+    );
+  }
+
+  function showFeature(f) {
+    const featureId = f.id;
     state.activeFeatureId = featureId;
 
     const effTitle = getEffectiveTitle(f);
     $modalTitle.textContent = effTitle;
     const overrideImg = getEffectiveImage(f);
-    const boardImg = overrideImg || (f.pages && f.pages[0] && f.pages[0].image) || f.thumb;
-    $modalBoardImg.src = resolveImg(boardImg);
+    const page0 = (f.pages && f.pages[0]) || null;
+    const boardImg = overrideImg || (page0 && page0.image) || f.thumb;
+    setResponsiveImg($modalBoardImg, boardImg, responsiveSizes.board, page0 && page0.image === boardImg ? page0 : null);
     $modalBoardImg.alt = `${effTitle} image`;
 
     // Short description (shown separately from the Story)
@@ -1106,6 +1972,7 @@ function main() {
     if (!$modal.open) $modal.showModal();
     setModalOpenState(true);
     updateModalPrevNextButtons();
+    prefetchNeighbours(featureId);
   }
 
   // --- Map HUD hover + click-to-copy (kept, since the DOM is present) ---
@@ -1204,6 +2071,17 @@ function main() {
       openFeature(pin.dataset.featureId);
       return;
     }
+    const cluster = e.target.closest(".pin[data-cluster]");
+    if (cluster) {
+      openPinCluster(cluster.dataset.cluster);
+      return;
+    }
+    if (pinLayer.spread.size) {
+      // Clicking the map folds fanned-out clusters back up.
+      pinLayer.spread.clear();
+      pinLayer.dirty = true;
+      layoutMapPins();
+    }
 
     // Non-admin: no coordinate tools
     if (!isAdmin) return;
@@ -1226,11 +2104,253 @@ function main() {
     setPinsHidden(pinsHidden);
   });
 
+  // --- Map view: deep-zoom tiles (tools/build_map_tiles.py) ---
+  // The stage (map, tiles, tour path, pins) is sized zoom x the frame and translated to pan,
+  // so pins and the tour path keep their xPct/yPct placement. Only the tiles covering the
+  // frame are loaded, from the smallest level that is sharp at the current zoom.
+  let mapTiles = null; // window.__HOOKE_MAP_TILES__, loaded after first paint
+  const mapView = { zoom: 1, x: 0, y: 0, level: -1, wanted: new Set() };
+  const mapTileEls = new Map(); // "level/col/row" -> { img, level, loaded }
+  let mapRenderQueued = false;
+
+  function mapFrameSize() {
+    const w = $mapFrame.clientWidth || 1;
+    return { w, h: (w * mapTiles.height) / mapTiles.width };
+  }
+
+  function mapMaxZoom() {
+    // Up to one map pixel per CSS pixel (no point zooming into upscaled tiles).
+    return Math.max(1, Math.min(MAP_MAX_ZOOM, mapTiles.width / mapFrameSize().w));
+  }
+
+  function applyMapView() {
+    const { w, h } = mapFrameSize();
+    mapView.zoom = Math.max(1, Math.min(mapMaxZoom(), mapView.zoom));
+    const sw = w * mapView.zoom;
+    const sh = h * mapView.zoom;
+    mapView.x = Math.min(0, Math.max(w - sw, mapView.x));
+    mapView.y = Math.min(0, Math.max(h - sh, mapView.y));
+    const zoomed = mapView.zoom > 1.001;
+    $mapFrame.classList.toggle("is-zoomed", zoomed);
+    $mapFrame.style.setProperty("--map-zoom", String(mapView.zoom));
+    $mapFrame.style.height = zoomed ? `${h}px` : "";
+    $mapStage.style.width = zoomed ? `${sw}px` : "";
+    $mapStage.style.height = zoomed ? `${sh}px` : "";
+    $mapStage.style.transform = zoomed ? `translate3d(${mapView.x}px, ${mapView.y}px, 0)` : "";
+    $mapZoomIn.disabled = mapView.zoom >= mapMaxZoom() - 0.001;
+    $mapZoomOut.disabled = !zoomed;
+    if (!mapRenderQueued) {
+      mapRenderQueued = true;
+      window.requestAnimationFrame(() => {
+        mapRenderQueued = false;
+        renderMapTiles();
+        layoutMapPins(); // only reclusters when the zoom (i.e. the stage size) changed
+      });
+    }
+  }
+
+  function zoomMapAt(zoom, cx, cy) {
+    // Keep the map point under (cx, cy) (frame coordinates) in place.
+    const prev = mapView.zoom;
+    mapView.zoom = Math.max(1, Math.min(mapMaxZoom(), zoom));
+    const k = mapView.zoom / prev;
+    mapView.x = cx - (cx - mapView.x) * k;
+    mapView.y = cy - (cy - mapView.y) * k;
+    applyMapView();
+  }
+
+  function centerMapOn(xPct, yPct) {
+    if (!mapTiles || mapView.zoom <= 1.001) return;
+    const { w, h } = mapFrameSize();
+    mapView.x = w / 2 - (xPct / 100) * w * mapView.zoom;
+    mapView.y = h / 2 - (yPct / 100) * h * mapView.zoom;
+    applyMapView();
+  }
+
+  function mapTileUrl(level, col, row) {
+    return `./${mapTiles.tiles.replace("{z}", level).replace("{x}", col).replace("{y}", row)}`;
+  }
+
+  function sweepMapTiles(wanted) {
+    // Other levels stay up until the visible tiles of this one have loaded, so a zoom step
+    // never flashes back to the blurry base layer.
+    const ready = Array.from(wanted).every((key) => mapTileEls.get(key).loaded);
+    for (const [key, t] of mapTileEls) {
+      if (wanted.has(key) || (!ready && t.level !== mapView.level)) continue;
+      t.img.remove();
+      mapTileEls.delete(key);
+    }
+  }
+
+  function renderMapTiles() {
+    const { w, h } = mapFrameSize();
+    const levels = mapTiles.levels;
+    const ts = mapTiles.tileSize;
+    const need = w * mapView.zoom * (window.devicePixelRatio || 1);
+    let idx = levels.findIndex(([lw]) => lw >= need);
+    if (idx < 0) idx = levels.length - 1;
+    const [lw, lh] = levels[idx];
+    const level = mapTiles.minLevel + idx;
+    mapView.level = level;
+
+    // Visible part of the stage, in this level's pixels.
+    const scale = lw / (w * mapView.zoom);
+    const cols = Math.ceil(lw / ts);
+    const rows = Math.ceil(lh / ts);
+    const c0 = Math.max(0, Math.floor((-mapView.x * scale) / ts));
+    const c1 = Math.min(cols - 1, Math.floor(((w - mapView.x) * scale - 1) / ts));
+    const r0 = Math.max(0, Math.floor((-mapView.y * scale) / ts));
+    const r1 = Math.min(rows - 1, Math.floor(((h - mapView.y) * scale - 1) / ts));
+
+    const wanted = new Set();
+    for (let row = r0; row <= r1; row++) {
+      for (let col = c0; col <= c1; col++) {
+        const key = `${level}/${col}/${row}`;
+        wanted.add(key);
+        if (mapTileEls.has(key)) continue;
+        const img = document.createElement("img");
+        const t = { img, level, loaded: false };
+        img.className = "map-tile";
+        img.alt = "";
+        img.decoding = "async";
+        // Percentages of the stage, so panning and resizing never need to touch the tiles.
+        // The extra pixel hides hairline seams between neighbours.
+        const tw = Math.min(ts, lw - col * ts);
+        const th = Math.min(ts, lh - row * ts);
+        img.style.left = `${((col * ts) / lw) * 100}%`;
+        img.style.top = `${((row * ts) / lh) * 100}%`;
+        img.style.width = `calc(${(tw / lw) * 100}% + 1px)`;
+        img.style.height = `calc(${(th / lh) * 100}% + 1px)`;
+        const done = () => {
+          t.loaded = true;
+          img.classList.add("is-loaded");
+          if (mapTileEls.get(key) === t) sweepMapTiles(mapView.wanted);
+        };
+        img.addEventListener("load", done);
+        img.addEventListener("error", done);
+        img.src = mapTileUrl(level, col, row);
+        mapTileEls.set(key, t);
+        $mapTiles.appendChild(img);
+      }
+    }
+    mapView.wanted = wanted;
+    sweepMapTiles(wanted);
+  }
+
+  // Gestures: drag to pan (when zoomed), pinch or ctrl+wheel (trackpad pinch) to zoom.
+  // A drag must not end in a click, or it would open a pin / copy coordinates.
+  const mapPointers = new Map();
+  let mapGesture = null;
+  let mapDragged = false;
+
+  function framePoint(e) {
+    const rect = $mapFrame.getBoundingClientRect();
+    return { x: e.clientX - rect.left, y: e.clientY - rect.top };
+  }
+
+  async function initMapView() {
+    // Without built tiles the page keeps the plain map image (no zoom). build_map_tiles.py sets data-tiles.
+    const manifest = $mapStage && $mapStage.querySelector(".hero__img[data-tiles]");
+    if (!manifest || !(await loadScript(manifest.dataset.tiles))) return;
+    const m = window.__HOOKE_MAP_TILES__;
+    if (!m || !Array.isArray(m.levels) || !m.levels.length) return;
+    mapTiles = m;
+    $mapZoom.hidden = false;
+    $mapZoomIn.addEventListener("click", () => {
+      const { w, h } = mapFrameSize();
+      zoomMapAt(mapView.zoom * 2, w / 2, h / 2);
+    });
+    $mapZoomOut.addEventListener("click", () => {
+      const { w, h } = mapFrameSize();
+      zoomMapAt(mapView.zoom / 2, w / 2, h / 2);
+    });
+    $mapPins.addEventListener(
+      "wheel",
+      (e) => {
+        if (!e.ctrlKey) return; // plain wheel keeps scrolling the page
+        e.preventDefault();
+        const p = framePoint(e);
+        zoomMapAt(mapView.zoom * Math.exp(-e.deltaY / 200), p.x, p.y);
+      },
+      { passive: false }
+    );
+    $mapPins.addEventListener("pointerdown", (e) => {
+      mapPointers.set(e.pointerId, framePoint(e));
+      mapDragged = false;
+      if (mapPointers.size === 2) {
+        const [a, b] = Array.from(mapPointers.values());
+        mapGesture = { pinch: Math.hypot(a.x - b.x, a.y - b.y) || 1, zoom: mapView.zoom };
+      } else if (mapPointers.size === 1) {
+        mapGesture = { start: framePoint(e), x: mapView.x, y: mapView.y };
+      }
+    });
+    $mapPins.addEventListener("pointermove", (e) => {
+      if (!mapGesture || !mapPointers.has(e.pointerId)) return;
+      mapPointers.set(e.pointerId, framePoint(e));
+      if (mapGesture.pinch && mapPointers.size >= 2) {
+        const [a, b] = Array.from(mapPointers.values());
+        mapDragged = true;
+        zoomMapAt((mapGesture.zoom * Math.hypot(a.x - b.x, a.y - b.y)) / mapGesture.pinch, (a.x + b.x) / 2, (a.y + b.y) / 2);
+        return;
+      }
+      if (!mapGesture.start || mapView.zoom <= 1.001) return;
+      const p = mapPointers.get(e.pointerId);
+      const dx = p.x - mapGesture.start.x;
+      const dy = p.y - mapGesture.start.y;
+      if (!mapDragged && Math.hypot(dx, dy) < MAP_DRAG_THRESHOLD) return;
+      if (!mapDragged) {
+        mapDragged = true;
+        $mapFrame.classList.add("is-panning");
+        $mapPins.setPointerCapture(e.pointerId);
+      }
+      mapView.x = mapGesture.x + dx;
+      mapView.y = mapGesture.y + dy;
+      applyMapView();
+    });
+    const endPointer = (e) => {
+      mapPointers.delete(e.pointerId);
+      $mapFrame.classList.remove("is-panning");
+      if (mapPointers.size === 0) mapGesture = null;
+      else if (mapPointers.size === 1) {
+        // Pinch -> pan with the remaining finger.
+        const [p] = Array.from(mapPointers.values());
+        mapGesture = { start: p, x: mapView.x, y: mapView.y };
+      }
+    };
+    $mapPins.addEventListener("pointerup", endPointer);
+    $mapPins.addEventListener("pointercancel", endPointer);
+    $mapPins.addEventListener(
+      "click",
+      (e) => {
+        if (!mapDragged) return;
+        mapDragged = false;
+        e.stopImmediatePropagation();
+        e.preventDefault();
+      },
+      true
+    );
+    window.addEventListener("resize", applyMapView);
+    applyMapView();
+  }
+
   // Initial render
+  initMapView();
   renderMapPins();
   setPinsHidden(false);
   renderTagButtons();
   renderGrid();
+  showStoredUploads();
+  migrateInlineImages().then((changed) => {
+    if (changed) refreshFromStorage();
+  });
+  // Locally edited features are searched from their live fields (incl. text), so fetch those details now.
+  features
+    .filter((f) => !f.isCustom && hasSearchOverrides(f))
+    .forEach((f) =>
+      loadFeatureDetail(f).then(() => {
+        if (state.q) renderGrid();
+      })
+    );
 
   // Admin boot (session-based)
   setAdminMode(readAdminPersisted());
@@ -1326,14 +2446,8 @@ function main() {
       updateAdminPreviewForFeature(f);
       return;
     }
-    fileToDataUrl(file)
-      .then((url) => {
-        $adminPreviewImg.src = url;
-        $adminPreviewImg.alt = getEffectiveTitle(f);
-      })
-      .catch(() => {
-        // ignore
-      });
+    showFilePreview($adminPreviewImg, file);
+    $adminPreviewImg.alt = getEffectiveTitle(f);
   });
 
   $adminGalleryAdd.addEventListener("change", () => {
@@ -1343,11 +2457,12 @@ function main() {
     const files = Array.from(($adminGalleryAdd.files && $adminGalleryAdd.files) || []);
     if (!f || files.length === 0) return;
 
-    Promise.all(files.map((file) => fileToDataUrl(file)))
-      .then((urls) => {
-        const additions = urls
-          .filter(Boolean)
-          .map((url) => ({ id: `g-${Date.now()}-${Math.random().toString(16).slice(2)}`, url }));
+    $adminSaveStatus.textContent = `Adding ${files.length} photo${files.length === 1 ? "" : "s"}…`;
+    Promise.all(files.map((file) => saveUpload(id, file)))
+      .then((stored) => {
+        const additions = stored
+          .filter((it) => it.url)
+          .map((it) => ({ id: `g-${Date.now()}-${Math.random().toString(16).slice(2)}`, ...it }));
 
         if (f.isCustom) {
           const list = loadCustomFeatures();
@@ -1364,6 +2479,7 @@ function main() {
         }
 
         $adminGalleryAdd.value = "";
+        $adminSaveStatus.textContent = "";
         refreshFromStorage();
         const nextF = features.find((x) => x.id === id);
         if (nextF) renderAdminGallery(nextF);
@@ -1396,6 +2512,7 @@ function main() {
       const cur = Array.isArray(o.gallery) ? o.gallery : [];
       saveOverrides(id, { ...o, gallery: cur.filter((_, i) => i !== idx) });
     }
+    pruneUploads(id);
 
     refreshFromStorage();
     const nextF = features.find((x) => x.id === id);
@@ -1435,7 +2552,10 @@ function main() {
     const tags = parseTagsCsv($adminTags.value || "");
 
     const imgFile = ($adminImage.files && $adminImage.files[0]) || null;
-    const imageDataUrl = imgFile ? await fileToDataUrl(imgFile) : "";
+    if (imgFile) $adminSaveStatus.textContent = "Saving photo…";
+    const upload = imgFile ? await saveUpload(id, imgFile) : null;
+    // Field names predate IndexedDB storage: these now hold an `idb:` reference (see saveUpload()).
+    const imageDataUrl = upload ? upload.url : "";
 
     if (f.isCustom) {
       const list = loadCustomFeatures();
@@ -1457,8 +2577,8 @@ function main() {
             {
               pageNumber: 1,
               image: imageDataUrl || list[idx].imageDataUrl || (list[idx].pages && list[idx].pages[0] && list[idx].pages[0].image) || list[idx].thumb,
-              width: 0,
-              height: 0,
+              width: upload ? upload.width : (list[idx].pages && list[idx].pages[0] && list[idx].pages[0].width) || 0,
+              height: upload ? upload.height : (list[idx].pages && list[idx].pages[0] && list[idx].pages[0].height) || 0,
               textPreview: "",
             },
           ],
@@ -1468,7 +2588,7 @@ function main() {
       }
       // keep overrides cleared for custom
       clearOverrides(id);
-      window.localStorage.removeItem(`${LS_TAGS_PREFIX}${id}`);
+      clearTagOverrides(id);
     } else {
       const o = loadOverrides(id) || {};
       const next = { ...o };
@@ -1483,8 +2603,9 @@ function main() {
       saveOverrides(id, next);
 
       if (tags.length) saveTagOverrides(id, tags);
-      else window.localStorage.removeItem(`${LS_TAGS_PREFIX}${id}`);
+      else clearTagOverrides(id);
     }
+    pruneUploads(id);
 
     $adminSaveStatus.textContent = "Saved.";
     refreshFromStorage();
@@ -1499,14 +2620,15 @@ function main() {
     if (f.isCustom) {
       // Reset for custom means clear per-feature overrides and reload the stored custom data.
       clearOverrides(id);
-      window.localStorage.removeItem(`${LS_TAGS_PREFIX}${id}`);
+      clearTagOverrides(id);
       $adminSaveStatus.textContent = "Reset (custom features keep their saved base values).";
       refreshFromStorage();
       loadAdminFormFromSelected();
       return;
     }
     clearOverrides(id);
-    window.localStorage.removeItem(`${LS_TAGS_PREFIX}${id}`);
+    clearTagOverrides(id);
+    pruneUploads(id);
     $adminSaveStatus.textContent = "Reset.";
     refreshFromStorage();
     loadAdminFormFromSelected();
@@ -1536,10 +2658,6 @@ function main() {
     const label = ($newPinLabel.value || "").trim() || title;
     const tags = parseTagsCsv($newTags.value || "");
     const story = ($newStory.value || "").trim();
-    const imageDataUrl = await fileToDataUrl(imgFile);
-    const galleryFiles = Array.from(($newGallery.files && $newGallery.files) || []);
-    const galleryUrls = await Promise.all(galleryFiles.map((f) => fileToDataUrl(f)));
-    const gallery = galleryUrls.filter(Boolean).map((url) => ({ id: `g-${Date.now()}-${Math.random().toString(16).slice(2)}`, url }));
 
     const usedIds = new Set(features.map((f) => f.id));
     let id = slugify(title);
@@ -1549,6 +2667,15 @@ function main() {
       n += 1;
     }
 
+    const galleryFiles = Array.from(($newGallery.files && $newGallery.files) || []);
+    $adminCreateStatus.textContent = `Saving ${galleryFiles.length + 1} photo${galleryFiles.length ? "s" : ""}…`;
+    const headline = await saveUpload(id, imgFile);
+    const imageDataUrl = headline.url;
+    const galleryUploads = await Promise.all(galleryFiles.map((f) => saveUpload(id, f)));
+    const gallery = galleryUploads
+      .filter((it) => it.url)
+      .map((it) => ({ id: `g-${Date.now()}-${Math.random().toString(16).slice(2)}`, ...it }));
+
     const newFeature = {
       id,
       title,
@@ -1558,7 +2685,7 @@ function main() {
       sourcePdf: "Custom",
       imageDataUrl,
       thumb: imageDataUrl,
-      pages: [{ pageNumber: 1, image: imageDataUrl, width: 0, height: 0, textPreview: "" }],
+      pages: [{ pageNumber: 1, image: imageDataUrl, width: headline.width, height: headline.height, textPreview: "" }],
       pin: { label, xPct, yPct },
       hidden: false,
       gallery,
@@ -1648,12 +2775,13 @@ function main() {
       saveCustomFeatures(list);
       // cleanup any overrides/tags if present
       clearOverrides(id);
-      window.localStorage.removeItem(`${LS_TAGS_PREFIX}${id}`);
+      clearTagOverrides(id);
     } else {
       const o = loadOverrides(id) || {};
       saveOverrides(id, { ...o, deleted: true, hidden: true });
-      window.localStorage.removeItem(`${LS_TAGS_PREFIX}${id}`);
+      clearTagOverrides(id);
     }
+    pruneUploads(id);
 
     // If the feature modal is open for this feature, close it.
     if (state.activeFeatureId === id) {
@@ -1681,9 +2809,15 @@ function main() {
   });
 
   // Search
+  $search.addEventListener("focus", () => ensureSearchIndex());
   $search.addEventListener("input", (e) => {
     state.q = e.target.value || "";
     renderGrid();
+    if (!searchIndex) {
+      ensureSearchIndex().then(() => {
+        if (state.q) renderGrid();
+      });
+    }
   });
 
   // Tag toggle (sidebar + hero chips share data-tag)
@@ -1721,6 +2855,12 @@ function main() {
     }
   });
 
+  // Warm the detail chunk while the pointer is on its way to a card.
+  $grid.addEventListener("pointerover", (e) => {
+    const card = e.target.closest(".card[data-id]");
+    if (card) loadFeatureDetail(features.find((x) => x.id === card.dataset.id));
+  });
+
   document.addEventListener("keydown", (e) => {
     if (e.key !== "Enter") return;
     const card =
@@ -1841,7 +2981,8 @@ function main() {
 
   // Random feature
   $btnRandom.addEventListener("click", () => {
-    const filtered = features.filter(matches);
+    const scores = searchScores();
+    const filtered = features.filter((f) => matches(f, scores));
     const pick = filtered[Math.floor(Math.random() * filtered.length)] || features[0];
     if (pick) openFeature(pick.id);
   });
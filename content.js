@@ -107,6 +107,27 @@ function saveBlogMetaCache(cache) {
   }
 }
 
+function sizeAttrs(it) {
+  // Baked thumbnail dimensions (tools/build_content_oembed.py) so cards reserve their box before load.
+  const w = it && Number(it.thumbnailWidth);
+  const h = it && Number(it.thumbnailHeight);
+  return w > 0 && h > 0 ? ` width="${w}" height="${h}"` : "";
+}
+
+// Fill in fields from runtime oEmbed metadata. Values already in the item (curated, or baked in by
+// tools/build_content_oembed.py) win.
+function mergeMeta(it, meta, keys) {
+  if (!meta || typeof meta !== "object") return;
+  keys.forEach((k) => {
+    if (!it[k] && typeof meta[k] === "string" && meta[k]) it[k] = meta[k];
+  });
+}
+
+// Items with a baked title + thumbnail need no runtime oEmbed call.
+function needsOEmbed(it) {
+  return !(it.title && it.thumbnail);
+}
+
 async function fetchYouTubeOEmbed(url) {
   const endpoint = new URL("https://www.youtube.com/oembed");
   endpoint.searchParams.set("format", "json");
@@ -157,24 +178,8 @@ function main() {
   const cache = loadMetaCache();
   const blogCache = loadBlogMetaCache();
   all.forEach((it) => {
-    if (it.type !== "youtube") return;
-    if (!it.youtubeId) return;
-    const meta = cache[it.youtubeId];
-    if (!meta || typeof meta !== "object") return;
-    it.title = typeof meta.title === "string" ? meta.title : it.title;
-    it.author = typeof meta.author === "string" ? meta.author : it.author;
-    it.thumbnail = typeof meta.thumbnail === "string" ? meta.thumbnail : it.thumbnail;
-  });
-  all.forEach((it) => {
-    if (it.type !== "blog") return;
-    const key = it.url;
-    if (!key) return;
-    const meta = blogCache[key];
-    if (!meta || typeof meta !== "object") return;
-    it.title = typeof meta.title === "string" ? meta.title : it.title;
-    it.publisher = typeof meta.publisher === "string" ? meta.publisher : it.publisher;
-    it.thumbnail = typeof meta.thumbnail === "string" ? meta.thumbnail : it.thumbnail;
-    it.author = typeof meta.author === "string" ? meta.author : it.author;
+    if (it.type === "youtube" && it.youtubeId) mergeMeta(it, cache[it.youtubeId], ["title", "author", "thumbnail"]);
+    if (it.type === "blog" && it.url) mergeMeta(it, blogCache[it.url], ["title", "publisher", "thumbnail", "author"]);
   });
 
   const $featuredCard = el("featuredCard");
@@ -267,9 +272,14 @@ function main() {
 
   function renderFeatured() {
     const it = all[0];
+    if (it.youtubeId) mergeMeta(it, cache[it.youtubeId], ["title", "author", "thumbnail"]);
     const vid = it.youtubeId || youtubeIdFromUrl(it.url);
     const thumb = it.thumbnail || (vid ? youtubeThumbById(vid) : "./assets/sunflower.webp");
     $featuredThumb.src = thumb;
+    if (sizeAttrs(it)) {
+      $featuredThumb.width = Number(it.thumbnailWidth);
+      $featuredThumb.height = Number(it.thumbnailHeight);
+    }
     $featuredThumb.alt = it.title ? it.title : "Featured video thumbnail";
 
     $featuredTitle.textContent = it.title || "Featured video";
@@ -311,23 +321,8 @@ function main() {
     const list = items.map((it, idx) => normalizeItem(it, idx));
     // Merge any loaded/cached meta back in
     list.forEach((it) => {
-      if (it.type !== "youtube" || !it.youtubeId) return;
-      const meta = cache[it.youtubeId];
-      if (meta && typeof meta === "object") {
-        it.title = typeof meta.title === "string" ? meta.title : it.title;
-        it.author = typeof meta.author === "string" ? meta.author : it.author;
-        it.thumbnail = typeof meta.thumbnail === "string" ? meta.thumbnail : it.thumbnail;
-      }
-    });
-    list.forEach((it) => {
-      if (it.type !== "blog") return;
-      const meta = blogCache[it.url];
-      if (meta && typeof meta === "object") {
-        it.title = typeof meta.title === "string" ? meta.title : it.title;
-        it.publisher = typeof meta.publisher === "string" ? meta.publisher : it.publisher;
-        it.thumbnail = typeof meta.thumbnail === "string" ? meta.thumbnail : it.thumbnail;
-        it.author = typeof meta.author === "string" ? meta.author : it.author;
-      }
+      if (it.type === "youtube" && it.youtubeId) mergeMeta(it, cache[it.youtubeId], ["title", "author", "thumbnail"]);
+      if (it.type === "blog") mergeMeta(it, blogCache[it.url], ["title", "publisher", "thumbnail", "author"]);
     });
 
     const filtered = list.filter(matches).sort(compareItems);
@@ -352,7 +347,7 @@ function main() {
           return `<a class="card" href="${escapeHtml(it.url)}" target="_blank" rel="noopener noreferrer" aria-label="Open article ${escapeHtml(
             title
           )}">
-            <img class="card__img" src="${escapeHtml(thumb)}" alt="" loading="lazy" onerror="this.src='./assets/sunflower.webp'" />
+            <img class="card__img" src="${escapeHtml(thumb)}" alt="" loading="lazy"${sizeAttrs(it)} onerror="this.src='./assets/sunflower.webp'" />
             <div class="card__body">
               <div class="card__title">${escapeHtml(title)}</div>
               <div class="card__sub">${escapeHtml(sub)}</div>
@@ -369,7 +364,7 @@ function main() {
         return `<article class="card" role="button" tabindex="0" data-youtube-id="${escapeHtml(vid || "")}" data-url="${escapeHtml(
           it.url
         )}" aria-label="Play video ${escapeHtml(title)}">
-          <img class="card__img" src="${escapeHtml(thumb)}" alt="" loading="lazy" />
+          <img class="card__img" src="${escapeHtml(thumb)}" alt="" loading="lazy"${sizeAttrs(it)} />
           <div class="card__body">
             <div class="card__title">${escapeHtml(title)}</div>
             <div class="card__sub">${escapeHtml(sub)}</div>
@@ -530,7 +525,7 @@ function main() {
   // Fetch missing YouTube meta (best-effort; offline-safe).
   const youtubeToFetch = unique(
     all
-      .filter((it) => it.type === "youtube" && it.youtubeId)
+      .filter((it) => it.type === "youtube" && it.youtubeId && needsOEmbed(it))
       .map((it) => it.youtubeId)
       .filter((id) => !cache[id])
   );
@@ -563,7 +558,7 @@ function main() {
   // Fetch missing blog meta (WordPress oEmbed) to get a thumbnail (often the featured/SEO image).
   const blogToFetch = unique(
     all
-      .filter((it) => it.type === "blog" && it.url)
+      .filter((it) => it.type === "blog" && it.url && needsOEmbed(it))
       .map((it) => it.url)
       .filter((url) => !blogCache[url])
   );
@@ -2,7 +2,8 @@
 
 // Curated content for the Watch & Read library.
 // Notes:
-// - YouTube items: we fetch title/author/thumbnail at runtime via oEmbed (with offline-safe fallbacks).
+// - YouTube/blog items: title/author/thumbnail are baked in by tools/build_content_oembed.py; items without them
+//   are looked up at runtime via oEmbed (with offline-safe fallbacks).
 // - Dates: YouTube oEmbed does not expose publish dates; leave `date` null unless you want to curate it manually.
 
 window.__HOOKE_CONTENT__ = {
@@ -1,439 +1,32 @@
-// Offline starter dataset for the Dorset Living Field Guide.
-// This is intentionally curated/small and designed to be extended later.
+// Auto-generated by tools/build_field_guide.py from data/dorset-field-guide.json (edit that, then re-run the tool).
+// Offline dataset for the Dorset Living Field Guide, with its search index and filter bitsets.
 window.__DORSET_GUIDE__ = {
-  generatedAt: new Date().toISOString(),
   region: "Dorset (UK)",
   habitats: [
-    {
-      id: "lowland-heath",
-      name: "Lowland heath",
-      blurb:
-        "Heathers, gorse, and sandy soils—one of Dorset’s signature habitats, alive with specialist reptiles, birds, and invertebrates.",
-      keywords: ["heather", "gorse", "sandy", "heath"],
-    },
-    {
-      id: "chalk-grassland",
-      name: "Chalk grassland",
-      blurb:
-        "Thin soils over chalk create flower-rich turf—orchids, butterflies, and warm south-facing slopes.",
-      keywords: ["chalk", "orchid", "butterfly", "downs"],
-    },
-    {
-      id: "woodland",
-      name: "Woodland & hedgerows",
-      blurb:
-        "Ancient woods, copses, and hedgerows—spring ephemerals, bats, nesting birds, and woodland butterflies.",
-      keywords: ["wood", "hedge", "canopy", "spring"],
-    },
-    {
-      id: "wetlands",
-      name: "Rivers, ponds & wetlands",
-      blurb:
-        "Slow rivers, ponds, reedbeds, and wet meadows—dragonflies, amphibians, waterbirds, and rich marginal plants.",
-      keywords: ["river", "pond", "reed", "wet meadow"],
-    },
-    {
-      id: "coast",
-      name: "Coast, dunes & cliffs",
-      blurb:
-        "Salt wind and shifting sands—clifftop plants, coastal birds, and hardy specialists on the edge of land and sea.",
-      keywords: ["coast", "dune", "cliff", "salt"],
-    },
-    {
-      id: "farmland",
-      name: "Farmland & field margins",
-      blurb:
-        "Pasture, arable edges, and wildflower strips—where hedges, margins, and ‘messy’ corners do the biodiversity heavy-lifting.",
-      keywords: ["field margin", "pasture", "meadow"],
-    },
-  ],
-  groups: [
-    "Birds",
-    "Mammals",
-    "Amphibians & Reptiles",
-    "Insects",
-    "Plants & Wildflowers",
-    "Fungi & Lichens",
-    "Marine & Coastal",
+    {"id": "lowland-heath", "name": "Lowland heath", "blurb": "Heathers, gorse, and sandy soils—one of Dorset’s signature habitats, alive with specialist reptiles, birds, and invertebrates.", "keywords": ["heather", "gorse", "sandy", "heath"]},
+    {"id": "chalk-grassland", "name": "Chalk grassland", "blurb": "Thin soils over chalk create flower-rich turf—orchids, butterflies, and warm south-facing slopes.", "keywords": ["chalk", "orchid", "butterfly", "downs"]},
+    {"id": "woodland", "name": "Woodland & hedgerows", "blurb": "Ancient woods, copses, and hedgerows—spring ephemerals, bats, nesting birds, and woodland butterflies.", "keywords": ["wood", "hedge", "canopy", "spring"]},
+    {"id": "wetlands", "name": "Rivers, ponds & wetlands", "blurb": "Slow rivers, ponds, reedbeds, and wet meadows—dragonflies, amphibians, waterbirds, and rich marginal plants.", "keywords": ["river", "pond", "reed", "wet meadow"]},
+    {"id": "coast", "name": "Coast, dunes & cliffs", "blurb": "Salt wind and shifting sands—clifftop plants, coastal birds, and hardy specialists on the edge of land and sea.", "keywords": ["coast", "dune", "cliff", "salt"]},
+    {"id": "farmland", "name": "Farmland & field margins", "blurb": "Pasture, arable edges, and wildflower strips—where hedges, margins, and ‘messy’ corners do the biodiversity heavy-lifting.", "keywords": ["field margin", "pasture", "meadow"]},
   ],
+  groups: ["Birds", "Mammals", "Amphibians & Reptiles", "Insects", "Plants & Wildflowers", "Fungi & Lichens", "Marine & Coastal"],
   seasons: ["Spring", "Summer", "Autumn", "Winter"],
   species: [
-    {
-      id: "dartford-warbler",
-      commonName: "Dartford warbler",
-      scientificName: "Sylvia undata",
-      cover: {
-        src: "assets/field-guide/dartford-warbler.jpg",
-        artist: "El Golli Mohamed",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Fauvette pitchou Ichkeul064.jpg",
-        sourceUrl: "https://commons.wikimedia.org/wiki/File%3AFauvette_pitchou_Ichkeul064.jpg",
-      },
-      group: "Birds",
-      habitats: ["lowland-heath"],
-      seasonality: { Spring: "Singing males in gorse/heather", Summer: "Breeding on heathland", Autumn: "Often skulking; listen for calls", Winter: "Local movements; survives mild winters" },
-      notes: "A classic heathland bird—small, restless, and often heard before it’s seen.",
-      watchFor: ["gorse tops", "heather mosaics", "calm sunny mornings"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add UK/GB conservation category, priority listing, and any specific legal protections once confirmed.",
-      },
-      sources: [
-        { title: "BTO: Dartford Warbler", url: "https://www.bto.org/understanding-birds/birdfacts/dartford-warbler", note: "Species profile and ecology." },
-        { title: "RSPB: Dartford warbler", url: "https://www.rspb.org.uk/birds-and-wildlife/dartford-warbler/", note: "Overview, ID and habitat." },
-        { title: "Wikipedia: Dartford warbler", url: "https://en.wikipedia.org/wiki/Dartford_warbler", note: "General reference; cross-check conservation details." },
-      ],
-    },
-    {
-      id: "nightjar",
-      commonName: "Nightjar",
-      scientificName: "Caprimulgus europaeus",
-      cover: {
-        src: "assets/field-guide/nightjar.jpg",
-        artist: "Derek Keats",
-        license: "CC BY 2.0",
-        licenseUrl: "https://creativecommons.org/licenses/by/2.0",
-        sourceTitle:
-          "File:European nightjar, Caprimulgus europaeus, at Mapungubwe National Park, Limpopo, South Africa.jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3AEuropean_nightjar%2C_Caprimulgus_europaeus%2C_at_Mapungubwe_National_Park%2C_Limpopo%2C_South_Africa.jpg",
-      },
-      group: "Birds",
-      habitats: ["lowland-heath", "woodland"],
-      seasonality: { Spring: "Arrives; churring begins", Summer: "Best time—dusk ‘churr’", Autumn: "Departs south", Winter: "Absent (migratory)" },
-      notes: "A dusk specialist—listen for the distinctive churring call over open heath.",
-      watchFor: ["dusk edges", "open rides", "moth-rich evenings"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add BoCC category and any priority/protection notes once confirmed.",
-      },
-      sources: [
-        { title: "BTO: Nightjar", url: "https://www.bto.org/understanding-birds/birdfacts/nightjar", note: "Species profile and ecology." },
-        { title: "RSPB: Nightjar", url: "https://www.rspb.org.uk/birds-and-wildlife/nightjar/", note: "ID, habitat, and behaviour." },
-        { title: "Wikipedia: European nightjar", url: "https://en.wikipedia.org/wiki/European_nightjar", note: "General reference; cross-check conservation details." },
-      ],
-    },
-    {
-      id: "sand-lizard",
-      commonName: "Sand lizard",
-      scientificName: "Lacerta agilis",
-      cover: {
-        src: "assets/field-guide/sand-lizard.jpg",
-        artist: "Сергій Мірошник",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Ящірка прудка скрутилась.jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3A%D0%AF%D1%89%D1%96%D1%80%D0%BA%D0%B0_%D0%BF%D1%80%D1%83%D0%B4%D0%BA%D0%B0_%D1%81%D0%BA%D1%80%D1%83%D1%82%D0%B8%D0%BB%D0%B0%D1%81%D1%8C.jpg",
-      },
-      group: "Amphibians & Reptiles",
-      habitats: ["lowland-heath", "coast"],
-      seasonality: { Spring: "Basking as temperatures rise", Summer: "Most active; females lay eggs in warm sand", Autumn: "Last basking days", Winter: "Hibernates" },
-      notes: "A heathland reptile that relies on sunny sandy patches for egg-laying.",
-      watchFor: ["warm sand banks", "heather edges", "still sunny mornings"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Confirm EPS/UK legal protection wording and any priority listing via ARC/official sources.",
-      },
-      sources: [
-        { title: "Amphibian and Reptile Conservation: Sand Lizard", url: "https://www.arc-trust.org/sand-lizard", note: "UK ecology and conservation context." },
-        { title: "Wikipedia: Sand lizard", url: "https://en.wikipedia.org/wiki/Sand_lizard", note: "General reference; cross-check protection details." },
-      ],
-    },
-    {
-      id: "smooth-snake",
-      commonName: "Smooth snake",
-      scientificName: "Coronella austriaca",
-      cover: {
-        src: "assets/field-guide/smooth-snake.jpg",
-        artist: "Bernard DUPONT from FRANCE",
-        license: "CC BY-SA 2.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/2.0",
-        sourceTitle: "File:Smooth Snake (Coronella austriaca) (36381334186).jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3ASmooth_Snake_%28Coronella_austriaca%29_%2836381334186%29.jpg",
-      },
-      group: "Amphibians & Reptiles",
-      habitats: ["lowland-heath"],
-      seasonality: { Spring: "Basking and emerging", Summer: "Secretive—rarely seen", Autumn: "Occasional basking", Winter: "Hibernates" },
-      notes: "Shy and elusive; one of the UK’s rarest snakes, strongly tied to heathland.",
-      watchFor: ["heather mosaics", "south-facing slopes", "quiet, undisturbed areas"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Confirm UK legal protection and any priority listings via ARC/official sources.",
-      },
-      sources: [
-        { title: "Amphibian and Reptile Conservation: Smooth Snake", url: "https://www.arc-trust.org/smooth-snake", note: "UK ecology and conservation context." },
-        { title: "Wikipedia: Smooth snake", url: "https://en.wikipedia.org/wiki/Smooth_snake", note: "General reference; cross-check protection details." },
-      ],
-    },
-    {
-      id: "pipistrelle",
-      commonName: "Pipistrelle bats",
-      scientificName: "Pipistrellus spp.",
-      cover: {
-        src: "assets/field-guide/pipistrelle.jpg",
-        artist: "U. S. Fish and Wildlife Service - Northeast Region",
-        license: "Public domain",
-        licenseUrl: "",
-        sourceTitle: "File:Eastern pipistrelle (8002800529).jpg",
-        sourceUrl: "https://commons.wikimedia.org/wiki/File%3AEastern_pipistrelle_%288002800529%29.jpg",
-      },
-      group: "Mammals",
-      habitats: ["woodland", "farmland", "wetlands"],
-      seasonality: { Spring: "First evening flights", Summer: "Peak feeding over hedges/ponds", Autumn: "Swarming near roosts", Winter: "Mostly hibernating" },
-      notes: "Tiny bats that can eat thousands of insects per night—look for flickering flight at dusk.",
-      watchFor: ["hedgerows", "pond edges", "warm calm evenings"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Different pipistrelle species exist in the UK; confirm which is intended before adding status specifics.",
-      },
-      sources: [
-        { title: "Bat Conservation Trust: Pipistrelle bats", url: "https://www.bats.org.uk/about-bats/uk-bats/pipistrelle-bats", note: "UK pipistrelle overview." },
-        { title: "Wikipedia: Pipistrellus", url: "https://en.wikipedia.org/wiki/Pipistrellus", note: "Genus overview." },
-      ],
-    },
-    {
-      id: "greater-horseshoe",
-      commonName: "Greater horseshoe bat",
-      scientificName: "Rhinolophus ferrumequinum",
-      cover: {
-        src: "assets/field-guide/greater-horseshoe.jpg",
-        artist: "Charles J. Sharp",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Greater horseshoe bat (Rhinolophus ferrumequinum) Hrdovicka.jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3AGreater_horseshoe_bat_%28Rhinolophus_ferrumequinum%29_Hrdovicka.jpg",
-      },
-      group: "Mammals",
-      habitats: ["woodland", "farmland"],
-      seasonality: { Spring: "Emerges from winter roosts", Summer: "Maternity roosts active", Autumn: "Transition to hibernation sites", Winter: "Hibernates in caves/mines" },
-      notes: "A large UK bat associated with sheltered landscapes and traditional pasture/hedges.",
-      watchFor: ["caves/old buildings (not to disturb)", "connected hedgerow networks"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Confirm UK legal protection wording and any UK/GB conservation category via BCT/official sources.",
-      },
-      sources: [
-        { title: "Bat Conservation Trust: Greater horseshoe bat", url: "https://www.bats.org.uk/about-bats/uk-bats/greater-horseshoe-bat", note: "UK species profile." },
-        { title: "Wikipedia: Greater horseshoe bat", url: "https://en.wikipedia.org/wiki/Greater_horseshoe_bat", note: "General reference." },
-      ],
-    },
-    {
-      id: "adonis-blue",
-      commonName: "Adonis blue",
-      scientificName: "Polyommatus bellargus",
-      cover: {
-        src: "assets/field-guide/adonis-blue.jpg",
-        artist: "Charles J. Sharp",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Lysandra bellargus female underside ab. obsoleta.jpg",
-        sourceUrl: "https://commons.wikimedia.org/wiki/File%3ALysandra_bellargus_female_underside_ab._obsoleta.jpg",
-      },
-      group: "Insects",
-      habitats: ["chalk-grassland"],
-      seasonality: { Spring: "First broods on warm slopes", Summer: "Peak vivid blue males", Autumn: "Late broods in good years", Winter: "Overwinters as larva/egg" },
-      notes: "A jewel of chalk downland—often on short turf with the right foodplants.",
-      watchFor: ["sunny chalk banks", "short flower-rich turf"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add UK/GB conservation category once confirmed (Butterfly Conservation/official lists).",
-      },
-      sources: [
-        { title: "Butterfly Conservation: Adonis blue", url: "https://butterfly-conservation.org/butterflies/adonis-blue", note: "UK ecology, habitat, and management." },
-        { title: "Wikipedia: Adonis blue", url: "https://en.wikipedia.org/wiki/Adonis_blue", note: "General reference." },
-      ],
-    },
-    {
-      id: "chalkhill-blue",
-      commonName: "Chalkhill blue",
-      scientificName: "Polyommatus coridon",
-      cover: {
-        src: "assets/field-guide/chalkhill-blue.jpg",
-        artist: "Charles J. Sharp",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Chalkhill blue butterflies (Polyommatus coridon) mating 1.jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3AChalkhill_blue_butterflies_%28Polyommatus_coridon%29_mating_1.jpg",
-      },
-      group: "Insects",
-      habitats: ["chalk-grassland"],
-      seasonality: { Spring: "Larval stage", Summer: "Big colonies in midsummer", Autumn: "Adults fade; larval stage resumes", Winter: "Overwinters as larva" },
-      notes: "Often abundant on chalk slopes—look for clouds of pale blues.",
-      watchFor: ["warm chalk slopes", "flower heads in July/August"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add UK/GB conservation category once confirmed (Butterfly Conservation/official lists).",
-      },
-      sources: [
-        { title: "Butterfly Conservation: Chalkhill blue", url: "https://butterfly-conservation.org/butterflies/chalkhill-blue", note: "UK ecology and habitat." },
-        { title: "Wikipedia: Chalkhill blue", url: "https://en.wikipedia.org/wiki/Chalkhill_blue", note: "General reference." },
-      ],
-    },
-    {
-      id: "bee-orchid",
-      commonName: "Bee orchid",
-      scientificName: "Ophrys apifera",
-      cover: {
-        src: "assets/field-guide/bee-orchid.jpg",
-        artist: "Didier Descouens",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:(MHNT) Ophrys apifera - Villeneuve-lès-Bouloc - Flower.jpg",
-        sourceUrl: "https://commons.wikimedia.org/wiki/File%3A%28MHNT%29_Ophrys_apifera_-_Villeneuve-l%C3%A8s-Bouloc_-_Flower.jpg",
-      },
-      group: "Plants & Wildflowers",
-      habitats: ["chalk-grassland", "farmland"],
-      seasonality: { Spring: "Leaf rosettes", Summer: "Flowering spikes", Autumn: "Seeds disperse", Winter: "Dormant underground" },
-      notes: "A charismatic orchid of open ground; often appears in ‘unmown’ corners.",
-      watchFor: ["sunny banks", "short grass", "disturbed ground"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Confirm if any special legal protection applies locally; add rarity/status once verified.",
-      },
-      sources: [
-        { title: "RHS: Bee orchid", url: "https://www.rhs.org.uk/plants/ophrys-apifera/profile", note: "Species profile (horticultural + habitat notes)." },
-        { title: "Wikipedia: Ophrys apifera", url: "https://en.wikipedia.org/wiki/Ophrys_apifera", note: "General reference." },
-      ],
-    },
-    {
-      id: "pyramidal-orchid",
-      commonName: "Pyramidal orchid",
-      scientificName: "Anacamptis pyramidalis",
-      cover: {
-        src: "assets/field-guide/pyramidal-orchid.jpg",
-        artist: "Didier Descouens",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:(MHNT) Anacamptis pyramidalis - Immature inflorescence.jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3A%28MHNT%29_Anacamptis_pyramidalis_-_Immature_inflorescence.jpg",
-      },
-      group: "Plants & Wildflowers",
-      habitats: ["chalk-grassland", "coast"],
-      seasonality: { Spring: "Leaves emerge", Summer: "Bright pink flower spikes", Autumn: "Seed dispersal", Winter: "Dormant" },
-      notes: "Common on chalky soils—easy to spot by its ‘pyramidal’ flower head.",
-      watchFor: ["chalk grassland", "coastal banks", "sunny verges"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add rarity/status and any legal protections once verified.",
-      },
-      sources: [
-        { title: "RHS: Pyramidal orchid", url: "https://www.rhs.org.uk/plants/anacamptis-pyramidalis/profile", note: "Species profile (habitat notes)." },
-        { title: "Wikipedia: Anacamptis pyramidalis", url: "https://en.wikipedia.org/wiki/Anacamptis_pyramidalis", note: "General reference." },
-      ],
-    },
-    {
-      id: "ragged-robin",
-      commonName: "Ragged-robin",
-      scientificName: "Silene flos-cuculi",
-      cover: {
-        src: "assets/field-guide/ragged-robin.jpg",
-        artist: "Ivar Leidus",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Silene flos-cuculi flower - Niitvälja.jpg",
-        sourceUrl: "https://commons.wikimedia.org/wiki/File%3ASilene_flos-cuculi_flower_-_Niitv%C3%A4lja.jpg",
-      },
-      group: "Plants & Wildflowers",
-      habitats: ["wetlands", "farmland"],
-      seasonality: { Spring: "Fresh growth", Summer: "Flowering in damp meadows", Autumn: "Seed heads", Winter: "Dormant" },
-      notes: "A wet-meadow classic—frilly pink flowers that love damp ground.",
-      watchFor: ["wet meadow edges", "ditches", "pond margins"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add any known UK/GB status once verified (e.g., common/declining depending on region).",
-      },
-      sources: [
-        { title: "RHS: Ragged robin", url: "https://www.rhs.org.uk/plants/silene-flos-cuculi/profile", note: "Species profile and habitat notes." },
-        { title: "Wikipedia: Silene flos-cuculi", url: "https://en.wikipedia.org/wiki/Silene_flos-cuculi", note: "General reference." },
-      ],
-    },
-    {
-      id: "emperor-dragonfly",
-      commonName: "Emperor dragonfly",
-      scientificName: "Anax imperator",
-      cover: {
-        src: "assets/field-guide/emperor-dragonfly.jpg",
-        artist: "Didier Descouens",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Anax imperator Exuvie MHNT Parc de la Maourine.jpg",
-        sourceUrl: "https://commons.wikimedia.org/wiki/File%3AAnax_imperator_Exuvie_MHNT_Parc_de_la_Maourine.jpg",
-      },
-      group: "Insects",
-      habitats: ["wetlands"],
-      seasonality: { Spring: "First emergences", Summer: "Strong fliers patrol ponds", Autumn: "Late season adults", Winter: "Larval stage in water" },
-      notes: "Big, bold, and fast—often seen patrolling the same pond edge.",
-      watchFor: ["pond margins", "sunny still water"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Add any UK/GB status once verified (British Dragonfly Society / official lists).",
-      },
-      sources: [
-        { title: "British Dragonfly Society: Emperor Dragonfly", url: "https://british-dragonflies.org.uk/species/emperor-dragonfly/", note: "UK species profile." },
-        { title: "Wikipedia: Anax imperator", url: "https://en.wikipedia.org/wiki/Anax_imperator", note: "General reference." },
-      ],
-    },
-    {
-      id: "seagrass",
-      commonName: "Seagrass (eelgrass)",
-      scientificName: "Zostera spp.",
-      cover: {
-        src: "assets/field-guide/seagrass.jpg",
-        artist: "Ryan Hodnett",
-        license: "CC BY-SA 4.0",
-        licenseUrl: "https://creativecommons.org/licenses/by-sa/4.0",
-        sourceTitle: "File:Eelgrass (Zostera marina) - Tor Bay Provincial Park, Nova Scotia 2022-07-27.jpg",
-        sourceUrl:
-          "https://commons.wikimedia.org/wiki/File%3AEelgrass_%28Zostera_marina%29_-_Tor_Bay_Provincial_Park%2C_Nova_Scotia_2022-07-27.jpg",
-      },
-      group: "Marine & Coastal",
-      habitats: ["coast"],
-      seasonality: { Spring: "Growth begins", Summer: "Lush underwater meadows", Autumn: "Dieback in some beds", Winter: "Reduced growth" },
-      notes: "Underwater meadows that support fish nurseries and coastal food webs.",
-      watchFor: ["sheltered harbours", "clear shallow water"],
-      conservation: {
-        ukGbStatus: "TBD (verify in sources)",
-        priority: "TBD (verify in sources)",
-        protected: ["TBD (verify in sources)"],
-        notes: "Often treated as a priority habitat in the UK; confirm the exact designation for your context and add here.",
-      },
-      sources: [
-        { title: "Project Seagrass", url: "https://projectseagrass.org/", note: "UK-focused seagrass conservation and learning resources." },
-        { title: "Wikipedia: Eelgrass", url: "https://en.wikipedia.org/wiki/Zostera_marina", note: "General reference (Zostera marina)." },
-      ],
-    },
+    {"id": "dartford-warbler", "commonName": "Dartford warbler", "scientificName": "Sylvia undata", "cover": {"src": "assets/field-guide/dartford-warbler.jpg", "artist": "El Golli Mohamed", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Fauvette pitchou Ichkeul064.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AFauvette_pitchou_Ichkeul064.jpg", "placeholder": {"color": "#877054", "preview": "data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAACwAQCdASoQAAsAA4BaJaACdADbdPuoAPuS9GOBr9fWTydW0mUung5llLuhs5ZnQcHnuvi5Ja7t1r1PGBAAAA=="}}, "group": "Birds", "habitats": ["lowland-heath"], "seasonality": {"Spring": "Singing males in gorse/heather", "Summer": "Breeding on heathland", "Autumn": "Often skulking; listen for calls", "Winter": "Local movements; survives mild winters"}, "notes": "A classic heathland bird—small, restless, and often heard before it’s seen.", "watchFor": ["gorse tops", "heather mosaics", "calm sunny mornings"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add UK/GB conservation category, priority listing, and any specific legal protections once confirmed."}, "sources": [{"title": "BTO: Dartford Warbler", "url": "https://www.bto.org/understanding-birds/birdfacts/dartford-warbler", "note": "Species profile and ecology."}, {"title": "RSPB: Dartford warbler", "url": "https://www.rspb.org.uk/birds-and-wildlife/dartford-warbler/", "note": "Overview, ID and habitat."}, {"title": "Wikipedia: Dartford warbler", "url": "https://en.wikipedia.org/wiki/Dartford_warbler", "note": "General reference; cross-check conservation details."}]},
+    {"id": "nightjar", "commonName": "Nightjar", "scientificName": "Caprimulgus europaeus", "cover": {"src": "assets/field-guide/nightjar.jpg", "artist": "Derek Keats", "license": "CC BY 2.0", "licenseUrl": "https://creativecommons.org/licenses/by/2.0", "sourceTitle": "File:European nightjar, Caprimulgus europaeus, at Mapungubwe National Park, Limpopo, South Africa.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AEuropean_nightjar%2C_Caprimulgus_europaeus%2C_at_Mapungubwe_National_Park%2C_Limpopo%2C_South_Africa.jpg", "placeholder": {"color": "#7d7463", "preview": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAwAgCdASoLABAAA4BaJYwC7AEXxIbq46HkAAD8/1X85yWJlYYEXBNis4GR59liAWa4WakXgBg8kssPavEWCbKV39YSTpsz2hNAD1yC/o2pNBpCYv1L2yMhAAA="}}, "group": "Birds", "habitats": ["lowland-heath", "woodland"], "seasonality": {"Spring": "Arrives; churring begins", "Summer": "Best time—dusk ‘churr’", "Autumn": "Departs south", "Winter": "Absent (migratory)"}, "notes": "A dusk specialist—listen for the distinctive churring call over open heath.", "watchFor": ["dusk edges", "open rides", "moth-rich evenings"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add BoCC category and any priority/protection notes once confirmed."}, "sources": [{"title": "BTO: Nightjar", "url": "https://www.bto.org/understanding-birds/birdfacts/nightjar", "note": "Species profile and ecology."}, {"title": "RSPB: Nightjar", "url": "https://www.rspb.org.uk/birds-and-wildlife/nightjar/", "note": "ID, habitat, and behaviour."}, {"title": "Wikipedia: European nightjar", "url": "https://en.wikipedia.org/wiki/European_nightjar", "note": "General reference; cross-check conservation details."}]},
+    {"id": "sand-lizard", "commonName": "Sand lizard", "scientificName": "Lacerta agilis", "cover": {"src": "assets/field-guide/sand-lizard.jpg", "artist": "Сергій Мірошник", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Ящірка прудка скрутилась.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3A%D0%AF%D1%89%D1%96%D1%80%D0%BA%D0%B0_%D0%BF%D1%80%D1%83%D0%B4%D0%BA%D0%B0_%D1%81%D0%BA%D1%80%D1%83%D1%82%D0%B8%D0%BB%D0%B0%D1%81%D1%8C.jpg", "placeholder": {"color": "#7c695e", "preview": "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAsAA4BaJYgCsADibsR2k6AAzEjqhSDCFE+Cz0fwCndU4aiTDqo7gZpiYas8MLyY4V6jAsWxWVCj0BIAAA=="}}, "group": "Amphibians & Reptiles", "habitats": ["lowland-heath", "coast"], "seasonality": {"Spring": "Basking as temperatures rise", "Summer": "Most active; females lay eggs in warm sand", "Autumn": "Last basking days", "Winter": "Hibernates"}, "notes": "A heathland reptile that relies on sunny sandy patches for egg-laying.", "watchFor": ["warm sand banks", "heather edges", "still sunny mornings"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Confirm EPS/UK legal protection wording and any priority listing via ARC/official sources."}, "sources": [{"title": "Amphibian and Reptile Conservation: Sand Lizard", "url": "https://www.arc-trust.org/sand-lizard", "note": "UK ecology and conservation context."}, {"title": "Wikipedia: Sand lizard", "url": "https://en.wikipedia.org/wiki/Sand_lizard", "note": "General reference; cross-check protection details."}]},
+    {"id": "smooth-snake", "commonName": "Smooth snake", "scientificName": "Coronella austriaca", "cover": {"src": "assets/field-guide/smooth-snake.jpg", "artist": "Bernard DUPONT from FRANCE", "license": "CC BY-SA 2.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/2.0", "sourceTitle": "File:Smooth Snake (Coronella austriaca) (36381334186).jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3ASmooth_Snake_%28Coronella_austriaca%29_%2836381334186%29.jpg", "placeholder": {"color": "#757539", "preview": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADQAQCdASoQAAoAA4BaJagCdACKOtkWAADN01X9+mdVAcOFGuaBULrJeuKRC/9Vd0Mlh1y8Dx/r6ctLZsJ9AAAA"}}, "group": "Amphibians & Reptiles", "habitats": ["lowland-heath"], "seasonality": {"Spring": "Basking and emerging", "Summer": "Secretive—rarely seen", "Autumn": "Occasional basking", "Winter": "Hibernates"}, "notes": "Shy and elusive; one of the UK’s rarest snakes, strongly tied to heathland.", "watchFor": ["heather mosaics", "south-facing slopes", "quiet, undisturbed areas"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Confirm UK legal protection and any priority listings via ARC/official sources."}, "sources": [{"title": "Amphibian and Reptile Conservation: Smooth Snake", "url": "https://www.arc-trust.org/smooth-snake", "note": "UK ecology and conservation context."}, {"title": "Wikipedia: Smooth snake", "url": "https://en.wikipedia.org/wiki/Smooth_snake", "note": "General reference; cross-check protection details."}]},
+    {"id": "pipistrelle", "commonName": "Pipistrelle bats", "scientificName": "Pipistrellus spp.", "cover": {"src": "assets/field-guide/pipistrelle.jpg", "artist": "U. S. Fish and Wildlife Service - Northeast Region", "license": "Public domain", "licenseUrl": "", "sourceTitle": "File:Eastern pipistrelle (8002800529).jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AEastern_pipistrelle_%288002800529%29.jpg", "placeholder": {"color": "#4c433c", "preview": "data:image/webp;base64,UklGRjwAAABXRUJQVlA4IDAAAADwAQCdASoQAAsAA4BaJZQCdADcGh75N7AA/uzX6vG2DnDMxl8q3hg1MjSo2HzgAAA="}}, "group": "Mammals", "habitats": ["woodland", "farmland", "wetlands"], "seasonality": {"Spring": "First evening flights", "Summer": "Peak feeding over hedges/ponds", "Autumn": "Swarming near roosts", "Winter": "Mostly hibernating"}, "notes": "Tiny bats that can eat thousands of insects per night—look for flickering flight at dusk.", "watchFor": ["hedgerows", "pond edges", "warm calm evenings"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Different pipistrelle species exist in the UK; confirm which is intended before adding status specifics."}, "sources": [{"title": "Bat Conservation Trust: Pipistrelle bats", "url": "https://www.bats.org.uk/about-bats/uk-bats/pipistrelle-bats", "note": "UK pipistrelle overview."}, {"title": "Wikipedia: Pipistrellus", "url": "https://en.wikipedia.org/wiki/Pipistrellus", "note": "Genus overview."}]},
+    {"id": "greater-horseshoe", "commonName": "Greater horseshoe bat", "scientificName": "Rhinolophus ferrumequinum", "cover": {"src": "assets/field-guide/greater-horseshoe.jpg", "artist": "Charles J. Sharp", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Greater horseshoe bat (Rhinolophus ferrumequinum) Hrdovicka.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AGreater_horseshoe_bat_%28Rhinolophus_ferrumequinum%29_Hrdovicka.jpg", "placeholder": {"color": "#989a86", "preview": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAwAgCdASoQABAAA4BaJYwCdADwDdQnDzvIAAD+jwn2mhQel9hqPHdpczAceslY7j/l2kRr+FDlqxZDrYKoTwK5w30AqWrL0WQAAA=="}}, "group": "Mammals", "habitats": ["woodland", "farmland"], "seasonality": {"Spring": "Emerges from winter roosts", "Summer": "Maternity roosts active", "Autumn": "Transition to hibernation sites", "Winter": "Hibernates in caves/mines"}, "notes": "A large UK bat associated with sheltered landscapes and traditional pasture/hedges.", "watchFor": ["caves/old buildings (not to disturb)", "connected hedgerow networks"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Confirm UK legal protection wording and any UK/GB conservation category via BCT/official sources."}, "sources": [{"title": "Bat Conservation Trust: Greater horseshoe bat", "url": "https://www.bats.org.uk/about-bats/uk-bats/greater-horseshoe-bat", "note": "UK species profile."}, {"title": "Wikipedia: Greater horseshoe bat", "url": "https://en.wikipedia.org/wiki/Greater_horseshoe_bat", "note": "General reference."}]},
+    {"id": "adonis-blue", "commonName": "Adonis blue", "scientificName": "Polyommatus bellargus", "cover": {"src": "assets/field-guide/adonis-blue.jpg", "artist": "Charles J. Sharp", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Lysandra bellargus female underside ab. obsoleta.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3ALysandra_bellargus_female_underside_ab._obsoleta.jpg", "placeholder": {"color": "#5f6230", "preview": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoQAAsAA4BaJbACdACVvcrcvQAA/svhXcLqtZ7e5vNu5sKs49obxRcK2jH7iTQ9HZyvCNoryJREPTwUxQM9VgDLbm/HDsuwo4xfZF8h6VdCQAAA"}}, "group": "Insects", "habitats": ["chalk-grassland"], "seasonality": {"Spring": "First broods on warm slopes", "Summer": "Peak vivid blue males", "Autumn": "Late broods in good years", "Winter": "Overwinters as larva/egg"}, "notes": "A jewel of chalk downland—often on short turf with the right foodplants.", "watchFor": ["sunny chalk banks", "short flower-rich turf"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add UK/GB conservation category once confirmed (Butterfly Conservation/official lists)."}, "sources": [{"title": "Butterfly Conservation: Adonis blue", "url": "https://butterfly-conservation.org/butterflies/adonis-blue", "note": "UK ecology, habitat, and management."}, {"title": "Wikipedia: Adonis blue", "url": "https://en.wikipedia.org/wiki/Adonis_blue", "note": "General reference."}]},
+    {"id": "chalkhill-blue", "commonName": "Chalkhill blue", "scientificName": "Polyommatus coridon", "cover": {"src": "assets/field-guide/chalkhill-blue.jpg", "artist": "Charles J. Sharp", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Chalkhill blue butterflies (Polyommatus coridon) mating 1.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AChalkhill_blue_butterflies_%28Polyommatus_coridon%29_mating_1.jpg", "placeholder": {"color": "#5f6130", "preview": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAsAA4BaJagCsABuMGoAAP7QTfxHVEv5K3C7tlGTWTI7WTXlQcXRYziY3XbXXjNWoODt79bFHjcfvNU9rtreqqssaWuCZFvQD+AA"}}, "group": "Insects", "habitats": ["chalk-grassland"], "seasonality": {"Spring": "Larval stage", "Summer": "Big colonies in midsummer", "Autumn": "Adults fade; larval stage resumes", "Winter": "Overwinters as larva"}, "notes": "Often abundant on chalk slopes—look for clouds of pale blues.", "watchFor": ["warm chalk slopes", "flower heads in July/August"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add UK/GB conservation category once confirmed (Butterfly Conservation/official lists)."}, "sources": [{"title": "Butterfly Conservation: Chalkhill blue", "url": "https://butterfly-conservation.org/butterflies/chalkhill-blue", "note": "UK ecology and habitat."}, {"title": "Wikipedia: Chalkhill blue", "url": "https://en.wikipedia.org/wiki/Chalkhill_blue", "note": "General reference."}]},
+    {"id": "bee-orchid", "commonName": "Bee orchid", "scientificName": "Ophrys apifera", "cover": {"src": "assets/field-guide/bee-orchid.jpg", "artist": "Didier Descouens", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:(MHNT) Ophrys apifera - Villeneuve-lès-Bouloc - Flower.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3A%28MHNT%29_Ophrys_apifera_-_Villeneuve-l%C3%A8s-Bouloc_-_Flower.jpg", "placeholder": {"color": "#363c21", "preview": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAA0AA4BaJbACdAYv1d1rgGuXIAAA/tGWn/YPdjHO5paeidSIhHhRXYNlXeWOBc0ENxkvj8zWTLbNoGo3LqaOJ0tWIc95KUsebdu1u/klegeh7ux72sy6XC7p8gPYZbPe79pfbEFFnIAA"}}, "group": "Plants & Wildflowers", "habitats": ["chalk-grassland", "farmland"], "seasonality": {"Spring": "Leaf rosettes", "Summer": "Flowering spikes", "Autumn": "Seeds disperse", "Winter": "Dormant underground"}, "notes": "A charismatic orchid of open ground; often appears in ‘unmown’ corners.", "watchFor": ["sunny banks", "short grass", "disturbed ground"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Confirm if any special legal protection applies locally; add rarity/status once verified."}, "sources": [{"title": "RHS: Bee orchid", "url": "https://www.rhs.org.uk/plants/ophrys-apifera/profile", "note": "Species profile (horticultural + habitat notes)."}, {"title": "Wikipedia: Ophrys apifera", "url": "https://en.wikipedia.org/wiki/Ophrys_apifera", "note": "General reference."}]},
+    {"id": "pyramidal-orchid", "commonName": "Pyramidal orchid", "scientificName": "Anacamptis pyramidalis", "cover": {"src": "assets/field-guide/pyramidal-orchid.jpg", "artist": "Didier Descouens", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:(MHNT) Anacamptis pyramidalis - Immature inflorescence.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3A%28MHNT%29_Anacamptis_pyramidalis_-_Immature_inflorescence.jpg", "placeholder": {"color": "#000000", "preview": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAwAgCdASoQAAsAA4BaJQBOgMYJts6kFvKIAAD+97OgzCjwzQ7e1tcx/dhkqaNko2qgvxGnQR5N+xsfK80dJ1Apde9vX/DrWfDZS6KNfPKno4jHwFwjAkHLG3o+TKgvglJ4oAAA"}}, "group": "Plants & Wildflowers", "habitats": ["chalk-grassland", "coast"], "seasonality": {"Spring": "Leaves emerge", "Summer": "Bright pink flower spikes", "Autumn": "Seed dispersal", "Winter": "Dormant"}, "notes": "Common on chalky soils—easy to spot by its ‘pyramidal’ flower head.", "watchFor": ["chalk grassland", "coastal banks", "sunny verges"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add rarity/status and any legal protections once verified."}, "sources": [{"title": "RHS: Pyramidal orchid", "url": "https://www.rhs.org.uk/plants/anacamptis-pyramidalis/profile", "note": "Species profile (habitat notes)."}, {"title": "Wikipedia: Anacamptis pyramidalis", "url": "https://en.wikipedia.org/wiki/Anacamptis_pyramidalis", "note": "General reference."}]},
+    {"id": "ragged-robin", "commonName": "Ragged-robin", "scientificName": "Silene flos-cuculi", "cover": {"src": "assets/field-guide/ragged-robin.jpg", "artist": "Ivar Leidus", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Silene flos-cuculi flower - Niitvälja.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3ASilene_flos-cuculi_flower_-_Niitv%C3%A4lja.jpg", "placeholder": {"color": "#25301a", "preview": "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAACwAQCdASoLABAAA4BaJQBOgCHEAy+gAP7uid+czh1hlz4wMosrCYiX+8M47H0Buz0mH6ag9arQAA=="}}, "group": "Plants & Wildflowers", "habitats": ["wetlands", "farmland"], "seasonality": {"Spring": "Fresh growth", "Summer": "Flowering in damp meadows", "Autumn": "Seed heads", "Winter": "Dormant"}, "notes": "A wet-meadow classic—frilly pink flowers that love damp ground.", "watchFor": ["wet meadow edges", "ditches", "pond margins"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add any known UK/GB status once verified (e.g., common/declining depending on region)."}, "sources": [{"title": "RHS: Ragged robin", "url": "https://www.rhs.org.uk/plants/silene-flos-cuculi/profile", "note": "Species profile and habitat notes."}, {"title": "Wikipedia: Silene flos-cuculi", "url": "https://en.wikipedia.org/wiki/Silene_flos-cuculi", "note": "General reference."}]},
+    {"id": "emperor-dragonfly", "commonName": "Emperor dragonfly", "scientificName": "Anax imperator", "cover": {"src": "assets/field-guide/emperor-dragonfly.jpg", "artist": "Didier Descouens", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Anax imperator Exuvie MHNT Parc de la Maourine.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AAnax_imperator_Exuvie_MHNT_Parc_de_la_Maourine.jpg", "placeholder": {"color": "#16140c", "preview": "data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoQAA0AA4BaJQBOgCKVy5rWZAAA/vNfGir4CL1Uwc0vz5o5A9hHX2RCf7HLLoRpMGTv2uAsc9RH9IiInuRZTryfS2oGpYafDWq0voA8eyrmAAAA"}}, "group": "Insects", "habitats": ["wetlands"], "seasonality": {"Spring": "First emergences", "Summer": "Strong fliers patrol ponds", "Autumn": "Late season adults", "Winter": "Larval stage in water"}, "notes": "Big, bold, and fast—often seen patrolling the same pond edge.", "watchFor": ["pond margins", "sunny still water"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Add any UK/GB status once verified (British Dragonfly Society / official lists)."}, "sources": [{"title": "British Dragonfly Society: Emperor Dragonfly", "url": "https://british-dragonflies.org.uk/species/emperor-dragonfly/", "note": "UK species profile."}, {"title": "Wikipedia: Anax imperator", "url": "https://en.wikipedia.org/wiki/Anax_imperator", "note": "General reference."}]},
+    {"id": "seagrass", "commonName": "Seagrass (eelgrass)", "scientificName": "Zostera spp.", "cover": {"src": "assets/field-guide/seagrass.jpg", "artist": "Ryan Hodnett", "license": "CC BY-SA 4.0", "licenseUrl": "https://creativecommons.org/licenses/by-sa/4.0", "sourceTitle": "File:Eelgrass (Zostera marina) - Tor Bay Provincial Park, Nova Scotia 2022-07-27.jpg", "sourceUrl": "https://commons.wikimedia.org/wiki/File%3AEelgrass_%28Zostera_marina%29_-_Tor_Bay_Provincial_Park%2C_Nova_Scotia_2022-07-27.jpg", "placeholder": {"color": "#9d9e9a", "preview": "data:image/webp;base64,UklGRioAAABXRUJQVlA4IB4AAABQAQCdASoQAAkAA4BaJZwABAAAAP7fC4jdbnD4AAA="}}, "group": "Marine & Coastal", "habitats": ["coast"], "seasonality": {"Spring": "Growth begins", "Summer": "Lush underwater meadows", "Autumn": "Dieback in some beds", "Winter": "Reduced growth"}, "notes": "Underwater meadows that support fish nurseries and coastal food webs.", "watchFor": ["sheltered harbours", "clear shallow water"], "conservation": {"ukGbStatus": "TBD (verify in sources)", "priority": "TBD (verify in sources)", "protected": ["TBD (verify in sources)"], "notes": "Often treated as a priority habitat in the UK; confirm the exact designation for your context and add here."}, "sources": [{"title": "Project Seagrass", "url": "https://projectseagrass.org/", "note": "UK-focused seagrass conservation and learning resources."}, {"title": "Wikipedia: Eelgrass", "url": "https://en.wikipedia.org/wiki/Zostera_marina", "note": "General reference (Zostera marina)."}]},
   ],
-  // (Placeholders panel removed from UI)
+  searchIndex: {"terms": ["a", "abundant", "adonis", "agilis", "amphibians", "anacamptis", "anax", "and", "apifera", "appears", "areas", "associated", "at", "august", "austriaca", "banks", "bat", "bats", "bee", "before", "bellargus", "big", "bird", "birds", "blue", "blues", "bold", "buildings", "by", "call", "calm", "can", "caprimulgus", "caves", "chalk", "chalkhill", "chalky", "charismatic", "churring", "classic", "clear", "cliffs", "clouds", "coast", "coastal", "common", "connected", "coridon", "corners", "coronella", "cuculi", "damp", "dartford", "distinctive", "disturb", "disturbed", "ditches", "downland", "dragonfly", "dunes", "dusk", "easy", "eat", "edge", "edges", "eelgrass", "egg", "elusive", "emperor", "europaeus", "evenings", "facing", "farmland", "fast", "ferrumequinum", "field", "fish", "flickering", "flight", "flos", "flower", "flowers", "food", "foodplants", "for", "frilly", "gorse", "grass", "grassland", "greater", "ground", "harbours", "head", "heads", "heard", "heath", "heather", "heathland", "hedgerow", "hedgerows", "hedges", "horseshoe", "imperator", "in", "insects", "its", "jewel", "july", "lacerta", "landscapes", "large", "laying", "listen", "lizard", "look", "love", "lowland", "mammals", "margins", "marine", "meadow", "meadows", "mornings", "mosaics", "moth", "networks", "night", "nightjar", "not", "nurseries", "of", "often", "old", "on", "one", "open", "ophrys", "orchid", "over", "pale", "pasture", "patches", "patrolling", "per", "pink", "pipistrelle", "pipistrellus", "plants", "polyommatus", "pond", "ponds", "pyramidal", "pyramidalis", "quiet", "ragged", "rarest", "relies", "reptile", "reptiles", "restless", "rhinolophus", "rich", "rides", "right", "rivers", "robin", "same", "sand", "sandy", "seagrass", "seen", "shallow", "sheltered", "short", "shy", "silene", "slopes", "small", "smooth", "snake", "snakes", "soils", "south", "specialist", "spot", "spp", "still", "strongly", "sunny", "support", "sylvia", "that", "the", "thousands", "tied", "tiny", "to", "tops", "traditional", "turf", "uk", "uks", "undata", "underwater", "undisturbed", "unmown", "verges", "warbler", "warm", "water", "webs", "wet", "wetlands", "wildflowers", "with", "woodland", "zostera"], "postings": [[0, 1, 2, 5, 6, 8, 10], [7], [6], [2], [2, 3], [9], [11], [0, 3, 5, 11, 12], [8], [8], [3], [5], [4], [7], [3], [2, 6, 8, 9], [5], [4], [8], [0], [6], [11], [0], [0, 1], [6, 7], [7], [11], [5], [9], [1], [0, 4], [4], [1], [5], [6, 7, 8, 9], [7], [9], [8], [1], [0, 10], [12], [2, 9, 12], [7], [2, 9, 12], [9, 12], [9], [5], [7], [8], [3], [10], [10], [0], [1], [5], [8], [10], [6], [11], [2, 9, 12], [1, 4], [9], [4], [11], [1, 2, 4, 10], [12], [2], [3], [11], [1], [1, 4], [3], [4, 5, 8, 10], [11], [5], [4, 5, 8, 10], [12], [4], [4], [10], [6, 7, 9], [10], [12], [6], [1, 2, 4, 7], [10], [0], [8], [6, 7, 8, 9], [5], [8, 10], [12], [9], [7], [0], [0, 1, 2, 3], [0, 2, 3], [0, 2, 3], [5], [1, 4, 5], [5], [5], [11], [7, 8], [4, 6, 7, 11], [0, 9], [6], [7], [2], [5], [5], [2], [1], [2], [4, 7], [10], [0, 1, 2, 3], [4, 5], [4, 5, 8, 10, 11], [12], [10], [12], [0, 2], [0, 3], [1], [5], [4], [1], [5], [12], [3, 4, 6, 7, 8], [0, 6, 7, 8, 11], [5], [2, 6, 7, 9], [3], [1, 8], [8], [8, 9], [1], [7], [5], [2], [11], [4], [10], [4], [4], [8, 9, 10], [6, 7], [4, 10, 11], [4, 10, 11], [9], [9], [3], [10], [3], [2], [2], [2, 3], [0], [5], [1, 6], [1], [6], [4, 10, 11], [10], [11], [2], [2], [12], [0, 11], [12], [5, 12], [6, 8], [3], [10], [3, 7], [0], [3], [3], [3], [9], [3], [1], [9], [4, 12], [2, 11], [3], [0, 2, 6, 8, 9, 11], [12], [0], [2, 4, 10, 12], [1, 3, 6, 11], [4], [3], [4], [3, 5, 9], [0], [5], [6], [5], [3], [0], [12], [3], [8], [9], [0], [2, 4, 7], [11, 12], [12], [10], [4, 10, 11], [8, 9, 10], [5, 6], [1, 4, 5], [12]]},
+  facets: {"group": {"Birds": [3], "Mammals": [48], "Amphibians & Reptiles": [12], "Insects": [2240], "Plants & Wildflowers": [1792], "Fungi & Lichens": [0], "Marine & Coastal": [4096]}, "habitat": {"lowland-heath": [15], "chalk-grassland": [960], "woodland": [50], "wetlands": [3088], "coast": [4612], "farmland": [1328]}, "season": {"Spring": [8191], "Summer": [8191], "Autumn": [8191], "Winter": [8191]}},
 };
-
-
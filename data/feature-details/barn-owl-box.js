@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["barn-owl-box"] = {"description":"A nesting site built to support one of the farm’s most iconic hunters. Keep your eyes open at dusk for silent flight along field edges.","story":"A Barn Owl Box is a promise with a hinge: if the habitat is right, the wild might accept the invitation.\n\nNothing about a barn owl is loud. You don’t get a grand entrance—just a hush, a pale shape, and suddenly the field is listening.\n\nSo this is a place to practice dusk-patience. Watch the edges. Let the evening arrive. And if you’re lucky, you’ll see the silent sentence of flight written across the air.","text":"","seasonalNotes":{"Spring":"Breeding season begins—keep a respectful distance. Dusk is best for a chance of a hunting pass along edges.","Summer":"Long evenings: watch low, wavering flight over rough grass. Listen for calls near dark on still nights.","Autumn":"Young owls disperse; hunting can be active as nights lengthen—scan fence lines and field margins at dusk.","Winter":"Hard weather pushes hunting into daylight edges; look for pellets beneath roost spots and near posts."}};
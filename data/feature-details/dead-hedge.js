@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["dead-hedge"] = {"description":"A living boundary made from stacked branches and brash. It’s a quiet larder and shelter belt for insects, birds, and small mammals.","story":"At first glance it looks like a tidy pile of sticks. But the Dead Hedge is really a busy apartment block disguised as a boundary.\n\nStep closer (politely). In the gaps and shadows, small lives rehearse their daily routines: hiding, hunting, nesting, nibbling, and not being eaten.\n\nIf you stay still for long enough, you’ll notice the hedge is never actually still. It’s a soft edge where the farm quietly says: “Yes, you can live here too.”","text":"","seasonalNotes":{"Spring":"Fresh growth along the hedge line brings early insects—watch for busy birds collecting nesting material nearby.","Summer":"Peak invertebrate season: pause to listen for buzzing and scan blossoms and leaf edges for caterpillars and beetles.","Autumn":"Seeds and berries draw birds; look for fungal fruiting bodies on damp wood after rain.","Winter":"A shelter belt in the wind—spot roosting birds and look for tracks where animals use the hedge as cover."}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["fallen-tree"] = {"description":"A reminder that ‘dead’ wood is full of life. Look for fungi, beetles, and the tiny habitats that form as the trunk slowly returns to soil.","story":"The Fallen Tree has retired from standing up, and it’s never looked happier.\n\nWhere a trunk meets the ground, the whole plot thickens: fungi move in with quiet confidence, beetles arrive like tiny engineers, and birds turn up for the buffet.\n\nWilding has a sense of humour—what we call “fallen” is often the start of an entirely new career. This is a slow-motion feast, a shelter, and a nursery all at once.","text":"","seasonalNotes":{"Spring":"New leaves and rising sap bring activity—scan the bark for beetles and listen for birds feeding on hidden larvae.","Summer":"Warmth speeds decomposition: look for ants, wood-boring beetles, and sunning reptiles nearby.","Autumn":"Prime fungi time—after wet weather, check the log for brackets, mushrooms, and softening bark.","Winter":"A winter larder: woodpecker holes and peeled bark can reveal where birds have been hunting insects."},"gallery":[{"id":"auto-fallentreeee.png","url":"assets/features/fallen-tree/fallentreeee.png","width":2048,"height":1536},{"id":"auto-IMG_0532.jpeg","url":"assets/features/fallen-tree/IMG_0532.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0533.jpeg","url":"assets/features/fallen-tree/IMG_0533.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0534.jpeg","url":"assets/features/fallen-tree/IMG_0534.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0536.jpeg","url":"assets/features/fallen-tree/IMG_0536.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0537.jpeg","url":"assets/features/fallen-tree/IMG_0537.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0541.jpeg","url":"assets/features/fallen-tree/IMG_0541.jpeg","width":1536,"height":2048},{"id":"auto-IMG_0546.jpeg","url":"assets/features/fallen-tree/IMG_0546.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0547.jpeg","url":"assets/features/fallen-tree/IMG_0547.jpeg","width":2048,"height":1536},{"id":"auto-IMG_0548.jpeg","url":"assets/features/fallen-tree/IMG_0548.jpeg","width":1536,"height":2048},{"id":"auto-IMG_0549.jpeg","url":"assets/features/fallen-tree/IMG_0549.jpeg","width":2048,"height":1536}],"placeholders":{"assets/features/fallen-tree/IMG_0532.jpeg":{"color":"#8bb5df","preview":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADQAQCdASoQAAwAA4BaJYgCdAEOcSK9gADdBfp+cOwaCiMxdJlJu3Ou3sr6Mzc7RV6MvrEzB91F2VHLVfFasbdIIMnajj9jdQgwmp3eBaAAAA=="},"assets/features/fallen-tree/IMG_0533.jpeg":{"color":"#59583d","preview":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQAAwAA4BaJZgCdADcTahE/nvgAOHqSKCHF9WvOhHhUa62T0synAibA3OQT6GeTMV/9u6PfbyTEafNi6dC8EJ3DWY1SyKxgAAAAA=="},"assets/features/fallen-tree/IMG_0534.jpeg":{"color":"#55583f","preview":"data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAABQAgCdASoQAAwAA4BaJZACdEf/gUg/BR01d4AA8DDQFGH+xLvWOi3oLgSr60fnOhKBcTOg5oCsvMPOdJfcYE0r5MjGLw5whNwUsIAA"},"assets/features/fallen-tree/IMG_0536.jpeg":{"color":"#6b6753","preview":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAwAgCdASoQAAwAA4BaJYgCdAEPh8kLQqepAAD+QT5hiDocJAba/U6WQ1P/AYwxutQRXVlcqbFAPna9TTcsC5PJOOiE6FzpuNCDgAebLBXWQC0dAAA="},"assets/features/fallen-tree/IMG_0537.jpeg":{"color":"#80724f","preview":"data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAACQAQCdASoQAAwAA4BaJZACdACNStAA/iZ1oeEsDIlvttwZii83ZEdaX/no61uFbFwk8aBLMzWujtDJhfXDR9xzkrY9hhOQBNSIAA=="},"assets/features/fallen-tree/IMG_0541.jpeg":{"color":"#827754","preview":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoMABAAA4BaJaACdADZPQl/rYAAzexonXn11l9rwS34tPJWs+yARKbcshCZ3/Wl+q1f1MySZANKQ4pLjf0DKiLHyJKz7A5A1CfgFwAA"},"assets/features/fallen-tree/IMG_0546.jpeg":{"color":"#677071","preview":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADwAQCdASoQAAwAA4BaJYwCdAD0OmEoHgAA/ut0iOQ7o7w24idZTgSC7PFz5XebR/s2aEa70FHuTJFt2wb8fK+doNhx6B4jS2OJjnwoxgAAAA=="},"assets/features/fallen-tree/IMG_0547.jpeg":{"color":"#aec8e6","preview":"data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAAAwAgCdASoQAAwAA4BaJQBOgCHw/UNCYiRAAAD+1xxwEiztStIe4AikBgqJQoubQiFjS6JJdD1I0jlcY5Ry34wAAAA="},"assets/features/fallen-tree/IMG_0548.jpeg":{"color":"#686149","preview":"data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoMABAAA4BaJQBOgCB/u4VJAMAA/u5ESZe2k9LufREo1zOkGi+lLpaPvBTHl3Il7uoI/+U2QVaN2TnEmZJerugAAAA="},"assets/features/fallen-tree/IMG_0549.jpeg":{"color":"#c7d3df","preview":"data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAwAgCdASoQAAwAA4BaJYwCdH8AF8ZttNmnzAD+4ao1GCTUXfxEwOWhHreDVfkoSkbnH5msfYoSTihaQsbFIViyCq0ELxJOkM6AAA=="},"assets/features/fallen-tree/fallentreeee.png":{"color":"#5d5942","preview":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoQAAwAA4BaJagCdACg/uTa3QAA/r4WdjMG/NSIXDA4rstoLiBOhhz8IRf3FXNlkm01cMoscZcf9rb5vC0aYMuKF6H+NPKKi5oa/i203l0/ymCAAAA="}}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["giant-chair"] = {"description":"A playful landmark and a perfect pause-point on the walk. Sit, look out across the site, and notice what’s flowering, buzzing, and moving.","story":"Some landmarks are ancient standing stones. Some are giant chairs. Hooke Farm contains multitudes.\n\nThe Giant Chair is a polite invitation to do the most wilding-friendly thing possible: stop. Sit. Breathe. Look.\n\nFrom here you can watch the site behave like itself—flowers leaning, insects commuting, birds complaining, and grasses waving as if they’ve heard excellent gossip.","text":"","seasonalNotes":{"Spring":"Great for spotting the first waves of blossom and fresh green—listen for dawn birdsong and nesting bustle.","Summer":"Use it as a butterfly-and-bee lookout—scan sunny edges where flowers meet longer grass.","Autumn":"Watch the colour shift and seed heads form; birds often move along hedges and rides at this time.","Winter":"Clear views for silhouettes and tracks—look for winter birds moving in small flocks across open ground."},"gallery":[{"id":"auto-148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg","url":"assets/features/giant-chair/148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg","width":1440,"height":1439},{"id":"auto-C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg","url":"assets/features/giant-chair/C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg","width":1440,"height":1439},{"id":"auto-IMG_0024.jpeg","url":"assets/features/giant-chair/IMG_0024.jpeg","width":2304,"height":1536},{"id":"auto-IMG_0303.jpeg","url":"assets/features/giant-chair/IMG_0303.jpeg","width":2304,"height":1536},{"id":"auto-IMG_0308.jpeg","url":"assets/features/giant-chair/IMG_0308.jpeg","width":2304,"height":1536},{"id":"auto-IMG_0410.jpeg","url":"assets/features/giant-chair/IMG_0410.jpeg","width":1536,"height":2304},{"id":"auto-IMG_9989.jpeg","url":"assets/features/giant-chair/IMG_9989.jpeg","width":1536,"height":2304}],"placeholders":{"assets/features/giant-chair/148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg":{"color":"#779e58","preview":"data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADQAQCdASoQABAAA4BaJbACdAywB2LOgAD+5nrKOAgI5X1/gCyS8RDws6U5o/ZSlOOKWIO4Keo9GqJSQ61mtXC88IgzjQNsvJbi+0Q7qVVIbJzUrKfvf/sshRWQAA=="},"assets/features/giant-chair/C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg":{"color":"#7f934a","preview":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoQABAAA4BaJbACdADG8exfB1FYAAD+8rt1/Zv/lmqYuHFXTlyyiRnh5OL+7zfq9zp3pFyuGI3luQqCxfFJKKFhcSm34AAev/LAF5BvNCMXoIG/M4iLoAAA"},"assets/features/giant-chair/IMG_0024.jpeg":{"color":"#434d3d","preview":"data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAQAgCdASoQAAsAA4BaJYwCw7DpLyEbwnnAAP7cvm4F7ZPyBEIjfW8osDx5c9+JOqpWlSKhsG/blaMoAAA="},"assets/features/giant-chair/IMG_0303.jpeg":{"color":"#9a9b6b","preview":"data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAACwAQCdASoQAAsAA4BaJbACdAEWZlEgAP14KwVp8FphBdABvad4cLCFkLmOr2ceFWkLjtAA"},"assets/features/giant-chair/IMG_0308.jpeg":{"color":"#717e4e","preview":"data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADQAQCdASoQAAsAA4BaJaAAAgdGUOFKIAD7m2Hb3T4HpHTX8bOGBwqEwbXUwTnh8SlIBrL0Yi1p2f/ZOgnkzgAA"},"assets/features/giant-chair/IMG_0410.jpeg":{"color":"#7a963e","preview":"data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoLABAAA4BaJbACdADObjG6AAD+9mhPCRVpql6DaGZ099SXDa+PVUrC5NuCtPNeXh4LqXwY7qd8S8l9w4J1PgAA"},"assets/features/giant-chair/IMG_9989.jpeg":{"color":"#86984e","preview":"data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAAAQAgCdASoLABAAA4BaJbACdADhirbozSpAAP04g5JcGtQmOLqh9wJkXhIz62+iFBc4nOHTtb24AA=="}}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["green-roof"] = {"description":"A roof designed to be alive: planted, insulating, and rich in micro-habitats. Great for invertebrates, and a lovely example of ‘built’ nature.","story":"Most roofs have one job: keep weather out. This one has two: keep weather out and invite wildlife in.\n\nThe Green Roof is a tiny meadow that decided to live on top of a building. It drinks sun, holds heat, and offers a miniature neighbourhood of crevices, stems, and shelter.\n\nIf you ever need proof that “built” and “wild” can be friends, this is it—quietly blooming above your head like it planned it all along.","text":"","seasonalNotes":{"Spring":"Look for fresh sedum/plant growth and early pollinators on warm mornings; tiny flowers can be surprisingly busy.","Summer":"Peak bloom—expect bees and hoverflies. Heat shimmer and scent can be strong on still days.","Autumn":"Seed heads and dried stems provide structure; watch for spiders and late insects hunting in the shelter.","Winter":"The roof becomes a hardy, low-maintenance habitat—notice evergreen patches and frost patterns clinging to plants."}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["hen-henge"] = {"description":"A wonderfully odd feature with a name that makes you smile. It’s a small stop that hints at how the farm mixes usefulness, humour, and habitat.","story":"Hen Henge sounds like something you’d stumble across in a myth, right after a mysterious fog and just before a life-changing cup of tea.\n\nIn reality, it’s a small reminder that wilding isn’t only serious science—it’s also joy, curiosity, and the occasional splendidly silly name.\n\nStand here for a moment. The best features don’t shout; they wink. And this one definitely winks.","text":"","seasonalNotes":{"Spring":"A good stop for noticing new growth and early insects—hover a moment and watch the edges come alive.","Summer":"Expect constant small movement: flies, beetles, and bees working the sunny side of anything sheltering.","Autumn":"Look for fallen feathers, seed heads, and foraging signs—edges become busy as food gets patchier.","Winter":"A sheltered nook to pause in wind and rain; look for footprints and the quiet patterns of daily routes."},"gallery":[{"id":"auto-14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg","url":"assets/features/hen-henge/14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg","width":1440,"height":1794},{"id":"auto-chicken house2.png","url":"assets/features/hen-henge/chicken house2.png","width":1460,"height":1258},{"id":"auto-IMG_2449.jpeg","url":"assets/features/hen-henge/IMG_2449.jpeg","width":2182,"height":1536}],"placeholders":{"assets/features/hen-henge/14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg":{"color":"#02052d","preview":"data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAQAgCdASoNABAAA4BaJbACdADdSQL3dPaAAP7j6colqINGxkuvfnDWFs72bQy7VM011F4LX3IgwR5iCD4rwP2wVBQ5pDt1rh9TgsAblilM/0RarR7Ly0KQEa371ofBSWBLAAAA"},"assets/features/hen-henge/IMG_2449.jpeg":{"color":"#777865","preview":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoQAAsAA4BaJYgCdAC3dLq1bqsgAP2/EF691mqyhG5gKFa18NLeF/r5qmgU98OukR5JBOCJ0Dd5OyMGooBRD1lBFoPAQtSJdb1p0j3Ibld+BQAEkAA="},"assets/features/hen-henge/chicken house2.png":{"color":"#cfdedb","preview":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoQAA4AA4BaJQAAYnRc1CSUVibKgAD9ePlrG/Zsd5ccBa8JGtg6Jos9zbGhPyR3zjiaM/2W4w1ptApgHiPgRzymZ5UKRpGqoKsPubjheLE0FXeAfSAsywAA"}}};
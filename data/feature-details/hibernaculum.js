@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["hibernaculum"] = {"story":"The Hibernaculum is a five-star winter hotel for creatures who hate central heating.\n\nBuilt from logs and rocks and good intentions, it offers the kind of shelter that lets amphibians and reptiles make it through cold weather safely.\n\nIt’s not a feature you “see” so much as a feature you provide. And that’s the whole wilding point: you build the stage, then you let the actors arrive on their own timetable.","text":"It's an underground home that\namphibians and reptiles use\nthroughout winter to protect\nthemselves from the cold.\nThere are lots of frogs, toads and\nnewts in or near our ponds. They\nlove the boggy ground and sunny\nspots.  By creating a hibernaculum\nwe have provided a safe space for\nthem to hibernate over winter.\nHOW WE CREATED THE HIBERNACULUM\nWe lifted an area of turf about 1\nby 2 metres and dug out the soil\nat a depth of 50cm\nWe used old tiles to create entrance\ntunnels into the centre\nWe then filled the hole with rocks &\nlogs to create crawl spaces\nWe covered this with loose soil and the\noriginal turf was laid on top\nWe made sure the entrance tunnels were\naccessible\nAs the logs decompose\nthey release heat\nwarming  the\nhibernaculum and\nmaking it an ideal\nhibernation habitat for\namphibians & reptiles\nWHAT IS A HIBERNACULUM?\nOUR HIBERNACULUM\nIt was inspired and built by\nOscar McCarthy, in May\n2022. He has been working\nhere helping with land\nmanagement since 2021.","seasonalNotes":{"Spring":"Amphibians and reptiles begin to emerge—nearby sunny patches can be productive for sightings.","Summer":"A quiet refuge from heat—look around the edges for signs of use, but avoid disturbing entrances.","Autumn":"Animals seek shelter as temperatures drop—this is when safe overwintering spaces matter most.","Winter":"The headline season for a hibernaculum—leave it undisturbed and think ‘shelter, not spectacle’."}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["ichthyosaurus"] = {"description":"A Jurassic nod tucked into the landscape. A place to think about deep time, local stone, and the layers beneath our feet.","story":"Imagine Dorset when it was sea, and the sea was busy.\n\nIchthyosaurus is your doorway into deep time: a playful nudge that says, “Everything you’re standing on has stories older than trees.”\n\nTouch the idea more than the object. Let your mind swim backwards through layers—then come back to the present, where lichen writes its own slow, living script on stone.","text":"","seasonalNotes":{"Spring":"Low sun and fresh growth make textures pop—great for noticing stone surfaces, lichen, and tiny plants in cracks.","Summer":"In heat, stone holds warmth—watch for basking insects and listen for the hum of summer nearby.","Autumn":"After rain, colours deepen; look for moss brightening and fungal spots appearing around damp edges.","Winter":"Best season for form and silhouette—clear air and low light make the ‘deep time’ feeling strongest."}};
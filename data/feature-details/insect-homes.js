@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["insect-homes"] = {"story":"This is where the tiniest residents get the best housing.\n\nInsect Homes are both practical and poetic: a handful of materials arranged so that beetles, bees, and other busy workers can shelter, breed, and quietly keep the whole place running.\n\nIf you want to feel hopeful, watch the entrances for a minute. The traffic tells you the ecosystem is clocking in for work.","text":"You may have noticed these piles of stone\naround the site - they're insect cairns. We\nuse them as markers for the butterfly\ntransept. They're made from waste stone\ndug up from our yard.\nINSECT APOCALYPSE\n Please read 'Silent Earth' -\nit's a revelation about the\nplight of insects and why\nwe need to be concerned\nabout them.\nLEARNING ABOUT INSECTS\nRemember that insects are a vital ingredient in the web\nof life. They are food for birds and fish, which are, of\ncourse, in decline too.\nThe brilliant thing about our wilding project is that\ninsects love it - and I love them.\nIn part, my interest was sparked by Dave Goulson, author\nof numerous books about insects. He explained that\nthere has been a devastating decline in insects over the\nlast 100 years.\nINSECT HOMES:\nI've become fascinated by insects and have seen lots\nof different types at Hooke Farm - many of which I\ndidn't know existed.","seasonalNotes":{"Spring":"Early warm spells bring the first pollinators—watch sunny stones and nearby flowers for activity.","Summer":"Peak diversity: hover over flowers and watch the cairns for beetles, ants, and bees coming and going.","Autumn":"Late nectar becomes precious—look for final foraging bursts and spiders hunting around the structure.","Winter":"A shelter season—many insects overwinter in crevices; avoid disturbing and look instead for tracks and birds hunting."}};
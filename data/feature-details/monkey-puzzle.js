@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["monkey-puzzle"] = {"description":"A striking, spiky silhouette that’s hard to miss. A small landmark to orient yourself—and a great spot for photos in changing light.","story":"The Monkey Puzzle doesn’t just sit in the landscape—it declares itself.\n\nIts branches look like they were designed by a whimsical architect who only had triangles and attitude. Birds treat it as a lookout tower; walkers treat it as a compass.\n\nIf you ever lose your bearings, find the spiky silhouette and reset. The tree is basically saying: “You are here. Now go notice everything.”","text":"","seasonalNotes":{"Spring":"Fresh greens around it make the spiky silhouette stand out—great for contrast photos and listening for birds.","Summer":"Strong midday sun can be dramatic; try early morning or golden hour for softer light and more wildlife movement.","Autumn":"Moody skies and changing colour palettes make this a standout landmark—look for birds feeding nearby.","Winter":"The classic season for silhouettes—frost and low sun can make the structure feel almost sculptural."},"gallery":[{"id":"auto-20231202-_DSF0955.jpg","url":"assets/features/monkey-puzzle/20231202-_DSF0955.jpg","width":2304,"height":1536},{"id":"auto-20231202-_DSF0977.jpg","url":"assets/features/monkey-puzzle/20231202-_DSF0977.jpg","width":2304,"height":1536}],"placeholders":{"assets/features/monkey-puzzle/20231202-_DSF0955.jpg":{"color":"#828678","preview":"data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoQAAsAA4BaJYwCsAEO4cc2UwAA/lX8wL52Xm5icOeX9cKPE5wEWlOqToW2Z+2I//mTP4LxKnsuLW/ry8DCHAAA"},"assets/features/monkey-puzzle/20231202-_DSF0977.jpg":{"color":"#99a297","preview":"data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAQAgCdASoQAAsAA4BaJYwCsAEXtKk0C84QAP71V7GOezuwmA3CcbLQ56PuPpld3GrlnUm3/6Qyu4Tgp7s8WePBkqEVZfkvpGUZLDXsvyUNH5BbEnWzB3YsOSZnWfXL1QiG4OWhaYC6PAAA"}}};
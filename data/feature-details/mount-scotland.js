@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["mount-scotland"] = {"story":"Mount Scotland is a love letter disguised as a landscape feature.\n\nIt’s part family story, part artwork, part viewpoint—Scots pine on a mound, driftwood stags standing watch, and a name that carries a grin.\n\nCome here when the light is changing. The mound turns the farm into a panorama and makes even ordinary weather feel like an event.","text":"MOUNT SCOTLAND\nMy husband, Jamie Macdonald, is proud of his\nScottish heritage so we decided to dedicate this\nmound to him.  It includes 3 Scot's Pine trees and 2\ndriftwood stags.  The stags were bought in\nBridport market and made from driftwood which\noriginated in Indonesia - sadly, as a result of the\nhorrendous deforestation  However the wood\nwas drifting for some time before being made into\nsculptures, which makes them very resilient to\nthe weather.  The antlers were provided by Jamie","seasonalNotes":{"Spring":"Fresh growth makes the mound feel newly shaped—good for wide views and noticing the season turning.","Summer":"A bright landmark: visit early or late for the best light and to avoid harsh midday sun.","Autumn":"Great colour season—watch for shifting tones in grass and trees, and listen for migrating birds overhead.","Winter":"Clear air and low sun create strong silhouettes; a good spot for dramatic skies and long shadows."},"gallery":[{"id":"auto-2FD75449-9004-485D-B5BC-8ED282A590AC.jpg","url":"assets/features/mount-scotland/2FD75449-9004-485D-B5BC-8ED282A590AC.jpg","width":1440,"height":1431},{"id":"auto-IMG_1580.jpeg","url":"assets/features/mount-scotland/IMG_1580.jpeg","width":2048,"height":1536}],"placeholders":{"assets/features/mount-scotland/2FD75449-9004-485D-B5BC-8ED282A590AC.jpg":{"color":"#809e77","preview":"data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAwAgCdASoQABAAA4BaJZgCdAD7H1Mn53x1JAD+2FK90ygKBcllDPtJRYlhDCSXE40dqPXgMnn7SO1aCFwqe3mPf2kcy2APTKYbSDfKJltSIYjHCDW+XbRIJWn7HXZCukYZ1gAA"},"assets/features/mount-scotland/IMG_1580.jpeg":{"color":"#8f875c","preview":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAwAgCdASoQAAwAA4BaJaACdAEXuQmMRa6IAAD+74pot9d3u3630g5+aF/FYu4wU1o0uStmhkeZLRdMGiZpStzm4Kb/iD5iE2bEkFImROseYRSPzirRIISEAAA="}}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["old-mill-pond"] = {"description":"A calm patch of water with a sense of history. Watch for ripples, reeds, and the birds that patrol the margins.","story":"Old Mill Pond keeps its secrets in ripples.\n\nStand still and you’ll see the whole place rearrange itself: a shadow passes under the surface, reeds sway like they’re whispering, and birds patrol the edges with professional focus.\n\nIt’s a history-heavy kind of calm—water that remembers. Visit often and you’ll notice it never tells the same story twice.","text":"","seasonalNotes":{"Spring":"Birdsong and nesting activity ramps up; look for new reed shoots and early insects skimming the surface.","Summer":"Watch for dragonflies, swallows, and the shimmer of life on hot days; early mornings are often best.","Autumn":"Migrants may pause; falling leaves and softer light make reflections beautiful—look for fish ripples.","Winter":"Quiet and reflective—scan for winter birds and note how water levels and vegetation change."},"gallery":[{"id":"auto-FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg","url":"assets/features/old-mill-pond/FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg","width":1440,"height":1439}],"placeholders":{"assets/features/old-mill-pond/FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg":{"color":"#6b9345","preview":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAACQAQCdASoQABAAA4BaJbACdABZSwAA999ia7WPqxeRUJ1jea7qNEW0dGucfzv8zhPh7UndQQwIbttezJueP/ewiaWHT9h+pGtv/WNN8zvrfpmKAAA="}}};
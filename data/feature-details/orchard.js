@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["orchard"] = {"description":"A pocket of fruit trees where blossom and fallen fruit feed the food web. Listen for bees in spring and birds in autumn.","story":"The Orchard is where the farm quietly practices generosity.\n\nIn spring it throws confetti (blossom) for the bees. In summer it grows weight and sweetness. In autumn it lets the ground become a feast. In winter it stands back and shows you the architecture of branches.\n\nIt’s a place where food is never just for humans—and that’s exactly the point.","text":"","seasonalNotes":{"Spring":"Blossom season—stand still and you’ll hear bees. Watch for pollinators and early butterflies on warm days.","Summer":"Fruit begins to form; look for birds feeding and insects working leaves and flowers in the understory.","Autumn":"Fallen fruit draws wasps, thrushes, and small mammals—great time for busy, messy abundance.","Winter":"Bare branches reveal structure; look for lichens, buds, and winter birds using trees as perches."}};
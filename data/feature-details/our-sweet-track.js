@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["our-sweet-track"] = {"story":"The Sweet Track is an idea that keeps getting reinvented: “How do we cross wet ground without fighting it?”\n\nNeolithic people built their answer out of timber. Hooke Farm built theirs out of sweet chestnut and oak. Different centuries, same problem-solving.\n\nWalk it and imagine the original track under your feet—then look up and notice how wilding turns a path into a place.","text":"Our Sweet Track\nA ‘Sweet Track’ is a Neolithic timber walkway\nand was originally part of a network of tracks\nbuilt to provide a dry path across marshy\nground. The trees were cut using stone and\nflint axes making planks from oak, ash and\nlime, whereas the poles were made with hazel\n& alder.  The track found by Ray Sweet was\npreserved in the peat bog and it was thought\nto date back to around 3800 BC!\nOur Sweet track is made from\nsweet chestnut stakes and oak\nplanks.\nThe idea for its installation came\nfrom Andrew George, from Wessex\nWilding.  It was constructed by a\nsmall team headed by Joe Wood -\nin the early stages helped by\nJasper Rayner and later by Bertie\nClark. They’ve all been involved in\na number of projects at Hooke\nJasper & Joe\nJoe & Bertie\nAndrew George","seasonalNotes":{"Spring":"A great time for a slower walk—fresh growth and damp ground highlight why raised paths matter.","Summer":"Use it as a calm route through busy habitat; early morning walks can be full of birdsong and insects.","Autumn":"Falling leaves and softer light make it atmospheric—watch for fungi on nearby wood after rain.","Winter":"Best for reading the land: tracks, stems, and silhouettes. Take care on slippery boards after frost."},"gallery":[{"id":"auto-IMG_0169.jpeg","url":"assets/features/our-sweet-track/IMG_0169.jpeg","width":2048,"height":1536},{"id":"auto-IMG_3467.jpeg","url":"assets/features/our-sweet-track/IMG_3467.jpeg","width":2048,"height":1536}],"placeholders":{"assets/features/our-sweet-track/IMG_0169.jpeg":{"color":"#6b8c44","preview":"data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQAAwAA4BaJbACdAClSqU0AADMl1L6V0QE/9fpWb93brnymm8322zdpBiJXiHBCsDtToKZYdOp8aEno/zhubrrXjde93cAAAA="},"assets/features/our-sweet-track/IMG_3467.jpeg":{"color":"#758a5f","preview":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADwAQCdASoQAAwAA4BaJaACdADPjS/WcgAA/jNOiWD4DXKkF1XpDCOGHkVb4mVolgtmCVHy0mD77UCNXu9O02UWyGKwJYvTqqplDHJk7jAAAA=="}}};
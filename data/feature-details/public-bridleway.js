@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["public-bridleway"] = {"description":"A shared route through the landscape—part access, part corridor. Edges like this are often wildlife hotspots, so walk slowly and scan ahead.","story":"The Public Bridleway is a shared thread—human footsteps, hoof prints, and wild routes braided together.\n\nEdges are where stories happen: hedges hold nests, verges hold flowers, and cover holds creatures that would rather not be seen.\n\nWalk it like a guest, not an owner. If you keep your pace gentle, the bridleway will show you the busy life running alongside it.","text":"","seasonalNotes":{"Spring":"Hedgerows and verges green up fast—look for early wildflowers and listen for territorial birds.","Summer":"A corridor for butterflies and bees—scan sunny banks and flower-rich edges as you walk.","Autumn":"Berries and seed heads draw birds; look for mushrooms on damp verges after rain.","Winter":"Great for tracking: footprints in soft ground and clear views of birds moving between cover."},"gallery":[{"id":"auto-IMG_0489.jpeg","url":"assets/features/public-bridleway/IMG_0489.jpeg","width":2048,"height":1536},{"id":"auto-wild path.png","url":"assets/features/public-bridleway/wild path.png","width":1536,"height":2304}],"placeholders":{"assets/features/public-bridleway/IMG_0489.jpeg":{"color":"#9b988f","preview":"data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoQAAwAA4BaJaACdADaPb5ooAD4VAiKWRZiBXhgbIDq/9HKnUSes/lfPn+b/RVIo+eLyKkJsvvzZbgYADo7BAAA"},"assets/features/public-bridleway/wild path.png":{"color":"#646d44","preview":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADwAQCdASoLABAAA4BaJaACdADbYcu0jwAA/vWZtNgpAHZVH5QPT4QxB8l2rcXNvAVJCxXoceabo9TPlnizQJcal5bAsGIO3PsWxQ1YEwV5HPRgAAA="}}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["rats"] = {"story":"The Rats board asks you to do something brave: swap disgust for curiosity.\n\nRats are not a fairy-tale villain here—they’re part of the system. They clean up, move seeds, and, importantly, become food for predators.\n\nWilding isn’t about choosing “cute” animals. It’s about letting the whole cast do their jobs, even the ones with terrible PR.","text":"We think this is a rat hole!!\nWe’re delighted to find that we have rat holes\naround our garden - and embrace them.  They play\na crucial role in our eco-system for example by:\n“Why do we want certain animals around us and not\nother animals? In new build homes, facilities are made in\nthe cavity to provide bats with a home. At the same time,\nrats are controlled with clamps, glue plates and poision.”\n Scavenging:  Rats help clean up by\nscavenging and consuming waste carrion\nwhich can reduce the spread of disease.\nSeed dispersal:  They can help with plant\npropagation by spreading seeds.\nBeing prey:  They serve as a food source for\nmany predators such as snakes, owls and\nother birds of prey, such as buzzards and red\nkites.","seasonalNotes":{"Spring":"As food sources shift, watch for fresh signs near compost and edges—remember they’re part of the wider food web.","Summer":"Activity is often at dawn/dusk—look for runs through vegetation and listen for rustling in cover.","Autumn":"Foraging ramps up—fallen fruit and seeds attract many animals; predators may follow the same routes.","Winter":"Tracks in mud or frost can reveal paths; avoid feeding or leaving waste that concentrates animals unnaturally."}};
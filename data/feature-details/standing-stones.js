@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["standing-stones"] = {"story":"The Standing Stones are time travellers with excellent posture.\n\nThey’re modernly placed, but the story in the rock is ancient: Jurassic seas, retreating water, and limestone laid down layer by layer when Dorset had a very different job description.\n\nWalk around them slowly. The stones don’t move, but your perspective does—and that’s the trick.","text":"The standing stones were installed\nin September 2020. We chose them\nstraight from the quarry at\nMarnhull Stone near Sturminster\nNewton.\nThe stone is from the Corallian\ngroup of limestones which are\nabout 160 million years old and they\nwere deposited during the Jurassic\nperiod between 145 and 201 million\nyears ago, when the sea level was\nretreating!\nThe stones arrived on an\narticulated lorry\nAt least a third of each\nstone is underground\nThey were installed by our\nwonderful digger man,\nKevin Holt\nSTANDING STONES","seasonalNotes":{"Spring":"Lichen and moss can brighten; morning light shows texture beautifully—good for slow, close looking.","Summer":"Stone holds heat—watch for basking insects and listen for the hum of summer along nearby edges.","Autumn":"After rain, colours deepen; low sun makes shadows dramatic and highlights the stones’ shapes.","Winter":"The best season for silhouette and geology—frost and low light reveal form without distraction."},"gallery":[{"id":"auto-F2C3BA6A-6435-46A9-8E4E-8602F3008E52.jpg","url":"assets/features/standing-stones/F2C3BA6A-6435-46A9-8E4E-8602F3008E52.jpg","width":1440,"height":1440},{"id":"auto-IMG_0354.jpeg","url":"assets/features/standing-stones/IMG_0354.jpeg","width":2048,"height":1536},{"id":"auto-IMG_6493.jpeg","url":"assets/features/standing-stones/IMG_6493.jpeg","width":4032,"height":3024}],"placeholders":{"assets/features/standing-stones/F2C3BA6A-6435-46A9-8E4E-8602F3008E52.jpg":{"color":"#898d53","preview":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABQAgCdASoQABAAA4BaJbACdH8AGXz3CBURroAA+WmSHP4ALAfMHgaPcHiEmJJ/uRw0el1I7jjHXQNXv/2YitX05d4PWsh5EfdJ3Mg9Y/2hzPka52Brva5DrxFly1wAAAA="},"assets/features/standing-stones/IMG_0354.jpeg":{"color":"#a4a248","preview":"data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACQAQCdASoQAAwAA4BaJbACdACfHzYA/IHZPEkEM8Cc8W4jS033Lqy1PbCm0Nge1fT7up3OI3wv9dh9fjQ/KCETnjeCQXiIAAA="},"assets/features/standing-stones/IMG_6493.jpeg":{"color":"#415125","preview":"data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAwAA4BaJZgCdACzqZu7PgAA/u3QHSH7zBGixfwRnWWHcyJGzR0wmqv1lRDiftc1aveRoIj/839yzzAAAA=="}}};
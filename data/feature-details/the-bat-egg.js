@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["the-bat-egg"] = {"story":"The Bat Egg is a story about ambition—and nature’s right to disagree.\n\nIt was built with care and imagination, and then the bats did what bats do: they inspected, they visited… and they chose other plans.\n\nNow it’s becoming something else: a ruin, a texture, a wildflower stage set. Wilding loves a second act.","text":"We were very proud of our beautiful\nbat egg. Built from waste stone to\nhouse a few different bat species\nwith a specal cave inside.\nBut I think the bats knew more than\nwe did - they visited but never\nsettled. And then the egg collapsed,\nfirst on one side and then the other,\nin the past year.\nWe are not planning to rebuild it but\nlet it become a glorious ruin covered\nin wild flowers.\nStone carver, Tom Clark,built the bat\negg, finishing in December 2021.\nwww.tomclarkstonecarver.co.uk\nBe Careful - it’s not\nsafe. Please don’t\ngo close to it!!!\nThe Bat Egg\nhas collapsed!\nPipistrelle bats weigh between 3.5\nand 8.5 grams, but can eat up to\n3,000 insects in a single night!\nThey may be living in the crevices\nof the bat egg.","seasonalNotes":{"Spring":"As evenings warm, bats return to feeding routes—dusk is the moment to watch above hedges and open rides.","Summer":"Peak bat season—try a still, warm night for the best chance of activity. Listen for insects too.","Autumn":"Feeding intensifies before winter—watch for late dusk flights on mild evenings.","Winter":"Bats are largely inactive/hibernating—this becomes a place to think about shelter and seasonal cycles."}};
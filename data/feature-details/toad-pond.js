@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["toad-pond"] = {"description":"A watery corner for amphibians and pond life. In spring you might spot spawn, in summer dragonflies, and year-round the signs of hidden visitors.","story":"Toad Pond is the farm’s small mirror—reflecting sky, reeds, and whatever dares to move across the surface.\n\nIn spring it becomes a nursery; in summer, an airshow for dragonflies; in autumn, a quiet drinking place; in winter, a lesson in patience.\n\nIf you want to meet the shy residents, bring stillness. Water rewards the slow.","text":"","seasonalNotes":{"Spring":"Peak amphibian season—look for spawn and listen for evening calls. Tread carefully near pond edges.","Summer":"Dragonflies and damselflies patrol the margins; watch for tadpoles and water beetles in shallows.","Autumn":"Leaves fall in—look for frogs/toads sheltering nearby and birds coming to drink on quiet days.","Winter":"Life slows: amphibians overwinter nearby. Scan the surface for ice patterns and the edges for tracks."},"gallery":[{"id":"auto-C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg","url":"assets/features/toad-pond/C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg","width":1440,"height":1439},{"id":"auto-IMG_9728.jpeg","url":"assets/features/toad-pond/IMG_9728.jpeg","width":1536,"height":2048},{"id":"auto-IMG_9732.jpeg","url":"assets/features/toad-pond/IMG_9732.jpeg","width":1536,"height":2048},{"id":"auto-IMG_9735.jpeg","url":"assets/features/toad-pond/IMG_9735.jpeg","width":1536,"height":2048},{"id":"auto-IMG_9739.jpeg","url":"assets/features/toad-pond/IMG_9739.jpeg","width":2048,"height":1536}],"placeholders":{"assets/features/toad-pond/C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg":{"color":"#baa37f","preview":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAQAgCdASoQABAAA4BaJbACdAEfnzvHJaeAAP7PemX/jLC9GEFROdMi6ajZLClXXpAPKKQ9sU4aNqPdChyHYz6CGBhdOpMfK1XV10pYrTaIyPFzsymjRhC05Kkwj1JuAAA="},"assets/features/toad-pond/IMG_9728.jpeg":{"color":"#baa17d","preview":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAABQAgCdASoMABAAA4BaJbACdAEfsnUcBv4/AAAA/kUuUtJ2IO9TWcDU08b5fTEmZLlq/kjuO1HkSazCrcw2QxWL5FFKV4+hoHLFgL7j453LM2N+zEzLPaJgAAA="},"assets/features/toad-pond/IMG_9732.jpeg":{"color":"#80725a","preview":"data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoMABAAA4BaJZACsAYw7Zhp8ItAAP7pkSe9NFRMPHO0Tcigo44x6SzzaXZDtqpcsgF/TC2sW4OyDQreGiDar4PguR8bnJd63KbYyuJZDVg50eGD5kAAAA=="},"assets/features/toad-pond/IMG_9735.jpeg":{"color":"#a4a48c","preview":"data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADwAQCdASoMABAAA4BaJbACsADZuSmXKMAA/UyNuazVerffBzHvmfTbM4r3JE/z+9wH+kclV/m+aNGeu60AYn5lmpNzuIQqmCCf/mH9d+6wzuI+0+N3tInxqjqAAA=="},"assets/features/toad-pond/IMG_9739.jpeg":{"color":"#908055","preview":"data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABQAgCdASoQAAwAA4BaJbACdAYv1wRVkfq1TgAA/BKZ+weiSejdi2MVSt0CVkn9V5R7j6lxoWg7s/8T/gG1a6gX1YuGYTjSAxnZYoV8L7Ph6S7N5+Ggfr1GQ0/YF97c4zHGnIUVamgEdipMxzeTxTrI3b2JAAAA"}}};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["tree-lith"] = {"description":"A tree-and-stone moment that invites a slower look. Notice textures—bark, lichen, moss—and the small lives that hide in the cracks and shade.","story":"Tree Lith is a small stage for big details.\n\nBark becomes a map. Lichen becomes handwriting. Moss becomes velvet. Stone becomes a sun-warmed seat for an insect that will never know it’s sitting on geology.\n\nThis is a place to swap speed for attention. The reward is that everything you thought was “background” becomes the main event.","text":"","seasonalNotes":{"Spring":"Look for new leaves, fresh moss, and early insects on the sunny side; birds often forage along textured bark.","Summer":"In shade, it stays cool—good for spotting butterflies resting and spiders’ webs catching the light.","Autumn":"After rain, colours deepen; lichen and moss glow. Great time for fungi on nearby wood and roots.","Winter":"Best for reading structure: bark patterns, lichen maps, and the way stone holds damp and frost."}};
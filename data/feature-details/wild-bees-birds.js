@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["wild-bees-birds"] = {"story":"This feature is a tiny soap opera in wooden real estate.\n\nBoxes were built with one tenant in mind, but wilding has a way of saying, “Nice plan—here’s what actually happened.” Bees moved in. Birds negotiated. Outcomes varied.\n\nThe lesson is simple: provide habitat and let nature handle the casting. The best stories are never fully scripted.","text":"Wild Bees & Birds\nThese bird boxes were built for swifts but we think\nthey are too low - and the swifts wouldn’t have liked\nthe creeper either.  The first occupants were starlings,\nbut the bees usurped them - European honey bees\n(Apis mellifera).\nHowever, one rather brave or foolish starling returned\nthis year and made his or her nest in one of the holes\nbetween the bees.  It wasn’t a great success as the\nbird died - presumably killed by the bees.\nI love it when they form clusters like in the photo.  At\ntimes we could see honey seeping through the wood.  I\nthink that the swift boxes are a bit small for all the\nbees that want to live there, but they don’t seem\ndeterred!","seasonalNotes":{"Spring":"Nesting season begins and bee activity rises—watch entrances for comings and goings on warm days.","Summer":"Peak buzzing: look for clustered bees and busy flight paths; early morning and late afternoon are often best.","Autumn":"Colonies prepare for colder weather—activity can spike on sunny days as they stock up.","Winter":"Mostly quiet outside—look for shelter use and remember many insects and birds are conserving energy."},"gallery":[{"id":"auto-IMG_1498.jpeg","url":"assets/features/wild-bees-birds/IMG_1498.jpeg","width":2048,"height":1536}],"placeholders":{"assets/features/wild-bees-birds/IMG_1498.jpeg":{"color":"#d1ad7d","preview":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABQAgCdASoQAAwAA4BaJbACdAEQ0sbyv5Kp18AA+9LCA7u7/VJjGQ10t3ybhq77LXzKrQbWA1yhXJAFymJwa8uRyjAdg9ly76Z34qgksHQAAA=="}}};
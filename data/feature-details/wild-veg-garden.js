@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["wild-veg-garden"] = {"description":"Where growing food meets letting things get a bit wilder. A mix of beds, edges, and ‘volunteer’ plants that invite pollinators and predators alike.","story":"The Wild Veg Garden is what happens when you stop insisting on perfection and start inviting allies.\n\nYes, there are vegetables. And yes, there are weeds. But the real magic is the conversation between them: flowers calling in pollinators, predators arriving to keep balance, compost turning yesterday into next month.\n\nIt’s a kitchen garden with a slightly untamed grin—growing food while quietly growing habitat too.","text":"","seasonalNotes":{"Spring":"Seedlings, blossom, and early weeds all appear—look for hoverflies, ladybirds, and the first bumblebees.","Summer":"Peak pollinator time—scan flowering herbs and edges. You’ll often see predators too: spiders, wasps, and birds.","Autumn":"Harvest season plus seed heads—leave some stems for overwintering insects and watch for late foragers.","Winter":"Structure matters: piles, stems, and compost become shelter. Great time to notice ‘habitat gardening’ in action."},"gallery":[{"id":"auto-92C76591-099F-4FDB-889B-D5512EEC5F98.jpg","url":"assets/features/wild-veg-garden/92C76591-099F-4FDB-889B-D5512EEC5F98.jpg","width":1440,"height":1440},{"id":"auto-FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg","url":"assets/features/wild-veg-garden/FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg","width":1440,"height":1440}],"placeholders":{"assets/features/wild-veg-garden/92C76591-099F-4FDB-889B-D5512EEC5F98.jpg":{"color":"#6a9c73","preview":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABQAgCdASoQABAAA4BaJbACdH8AF+m2frG6YTAA/f00GavpdA5nMvTRfikQTgiDlGbygYRGYJkaPREAEjWGwcn5trsvaIY+IWvqCrRm56w1twu20A9Tr5zhVCVD30tEA1gAAA=="},"assets/features/wild-veg-garden/FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg":{"color":"#5a985e","preview":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADwAQCdASoQABAAA4BaJbACdACp9pR5pQAAyz0eRLDY1m0QRqSZAG7F3Zacx9+GxceBisV7Y2FVFydYEiQxcqNMcw1Hs7aQv+LVyWMCl4WhNISDf192sJU/hwNVMtR4AAA="}}};
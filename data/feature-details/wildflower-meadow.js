@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {})["wildflower-meadow"] = {"description":"A broad brush of colour and nectar when the season is right. The best place to linger for butterflies, bees, and the constant, quiet movement of grass.","story":"Wildflower Meadow doesn’t do stillness. It does shimmer.\n\nOn a good summer day the air is full of wings: bees commuting, butterflies zig-zagging, and grasses nodding like they’re keeping time.\n\nCome back in autumn and it turns into a library of seed heads. Come back in winter and it becomes sculpture. The meadow is always working—just at different speeds.","text":"","seasonalNotes":{"Spring":"Early flowers begin to appear; watch for the first butterflies and listen for skylark-like energy overhead.","Summer":"The headline season—nectar, butterflies, and bees. Visit on warm, still days for maximum activity.","Autumn":"Seed heads and grasses take over—look for finches feeding and late blooms hanging on.","Winter":"A season of structure: stems, frost, and tracks. Notice how ‘empty’ meadow still shelters life."},"gallery":[{"id":"auto-A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg","url":"assets/features/wildflower-meadow/A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg","width":1440,"height":1439},{"id":"auto-BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg","url":"assets/features/wildflower-meadow/BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg","width":1440,"height":1440},{"id":"auto-IMG_1707.jpeg","url":"assets/features/wildflower-meadow/IMG_1707.jpeg","width":2048,"height":1536},{"id":"auto-IMG_1715.jpeg","url":"assets/features/wildflower-meadow/IMG_1715.jpeg","width":1536,"height":2048},{"id":"auto-IMG_1813.jpeg","url":"assets/features/wildflower-meadow/IMG_1813.jpeg","width":2048,"height":1536},{"id":"auto-IMG_9861.jpeg","url":"assets/features/wildflower-meadow/IMG_9861.jpeg","width":2304,"height":1536}],"placeholders":{"assets/features/wildflower-meadow/A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg":{"color":"#3f281e","preview":"data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAAAQAwCdASoQABAAA4BaJbACdFQAuwDeUCIsK5MPBcqhvEAA+6FXnihRT45wOzRmTASaDezS0261URMKJffbtaWlzB4iVDg1ereig+tuzYs49gQjGxQPC6A94kSYFml4MQX2jrIj/2/PE9S51tu8Y1y12XXs74DSFCAU/tZgBT+vubkW1w2vKTCzC5lW5IAA"},"assets/features/wildflower-meadow/BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg":{"color":"#6db0a4","preview":"data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoQABAAA4BaJbACdADpg2MwmAD97onK3KauJrI4gtrqlI/ofymBL4zXSs24TvhCu7AToa7qj51s1XSfd5yjVAxgAAA="},"assets/features/wildflower-meadow/IMG_1707.jpeg":{"color":"#64702d","preview":"data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAQAgCdASoQAAwAA4BaJbACdADpGZz/q7kAAPvyJxabmz4Oe10S3rliOoJNEHFJRJeZ18U2V7ue6CyGXrQLjD4wzPElrInz7xNV/GVl0O34zFjzjbnH9/Bqy+db5Bla3z5B14AA"},"assets/features/wildflower-meadow/IMG_1715.jpeg":{"color":"#a2a2b1","preview":"data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoMABAAA4BaJYgC7ADceKhU09TAAPzpK1XNdxdHen6bb52OLLvmtVibbDjEE8/a3S3TvbxmAZYMiqFNC1yQw9luQrgAAA=="},"assets/features/wildflower-meadow/IMG_1813.jpeg":{"color":"#736f65","preview":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAwAA4BaJbAAAcTA9VQAAMxITSApKOko0fYmT1agDEi1PEvg2Ox4kjwn63UoMVrceSepegrdf18Xk02cn/eMr0xEVo7SXCCIwAAA"},"assets/features/wildflower-meadow/IMG_9861.jpeg":{"color":"#9aa15d","preview":"data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAQCdASoQAAsAA4BaJbACdADbsAAAze8dF2sjiSAe6JOU+3c6fYcAGEGew/RuuivY6gApbz7z3fVu+jzk2rAA"}}};
@@ -1,2 +1,2 @@
 // Auto-generated from data/features.json
-window.__HOOKE_DATA__ = {"generatedAt":"2025-12-24T00:00:00Z","sourceDir":"/Users/montybryant/Documents/Work/Knowledge Resources/vibecoding/Hooke Almighty","features":[{"id":"dead-hedge","title":"Dead Hedge","sourcePdf":"","thumb":"assets/features/dead-hedge/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/dead-hedge/page-001.png","width":0,"height":0,"textPreview":"A living boundary made from stacked branches and brash. It’s a quiet larder and shelter belt for insects, birds, and small mammals."}],"description":"A living boundary made from stacked branches and brash. It’s a quiet larder and shelter belt for insects, birds, and small mammals.","seasonalNotes":{"Spring":"Fresh growth along the hedge line brings early insects—watch for busy birds collecting nesting material nearby.","Summer":"Peak invertebrate season: pause to listen for buzzing and scan blossoms and leaf edges for caterpillars and beetles.","Autumn":"Seeds and berries draw birds; look for fungal fruiting bodies on damp wood after rain.","Winter":"A shelter belt in the wind—spot roosting birds and look for tracks where animals use the hedge as cover."},"story":"At first glance it looks like a tidy pile of sticks. But the Dead Hedge is really a busy apartment block disguised as a boundary.\n\nStep closer (politely). In the gaps and shadows, small lives rehearse their daily routines: hiding, hunting, nesting, nibbling, and not being eaten.\n\nIf you stay still for long enough, you’ll notice the hedge is never actually still. It’s a soft edge where the farm quietly says: “Yes, you can live here too.”","text":"","tags":[]},{"id":"fallen-tree","title":"Fallen Tree","sourcePdf":"","thumb":"assets/features/fallen-tree/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/fallen-tree/page-001.png","width":0,"height":0,"textPreview":"A reminder that ‘dead’ wood is full of life. Look for fungi, beetles, and the tiny habitats that form as the trunk slowly returns to soil."}],"description":"A reminder that ‘dead’ wood is full of life. Look for fungi, beetles, and the tiny habitats that form as the trunk slowly returns to soil.","seasonalNotes":{"Spring":"New leaves and rising sap bring activity—scan the bark for beetles and listen for birds feeding on hidden larvae.","Summer":"Warmth speeds decomposition: look for ants, wood-boring beetles, and sunning reptiles nearby.","Autumn":"Prime fungi time—after wet weather, check the log for brackets, mushrooms, and softening bark.","Winter":"A winter larder: woodpecker holes and peeled bark can reveal where birds have been hunting insects."},"story":"The Fallen Tree has retired from standing up, and it’s never looked happier.\n\nWhere a trunk meets the ground, the whole plot thickens: fungi move in with quiet confidence, beetles arrive like tiny engineers, and birds turn up for the buffet.\n\nWilding has a sense of humour—what we call “fallen” is often the start of an entirely new career. This is a slow-motion feast, a shelter, and a nursery all at once.","text":"","tags":[],"gallery":[{"id":"auto-fallentreeee.png","url":"assets/features/fallen-tree/fallentreeee.png"},{"id":"auto-IMG_0533.jpeg","url":"assets/features/fallen-tree/IMG_0533.jpeg"},{"id":"auto-IMG_0534.jpeg","url":"assets/features/fallen-tree/IMG_0534.jpeg"},{"id":"auto-IMG_0536.jpeg","url":"assets/features/fallen-tree/IMG_0536.jpeg"},{"id":"auto-IMG_0537.jpeg","url":"assets/features/fallen-tree/IMG_0537.jpeg"},{"id":"auto-IMG_0541.jpeg","url":"assets/features/fallen-tree/IMG_0541.jpeg"},{"id":"auto-IMG_0546.jpeg","url":"assets/features/fallen-tree/IMG_0546.jpeg"},{"id":"auto-IMG_0547.jpeg","url":"assets/features/fallen-tree/IMG_0547.jpeg"},{"id":"auto-IMG_0548.jpeg","url":"assets/features/fallen-tree/IMG_0548.jpeg"},{"id":"auto-IMG_0549.jpeg","url":"assets/features/fallen-tree/IMG_0549.jpeg"}]},{"id":"giant-chair","title":"Giant Chair","sourcePdf":"","thumb":"assets/features/giant-chair/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/giant-chair/page-001.png","width":0,"height":0,"textPreview":"A playful landmark and a perfect pause-point on the walk. Sit, look out across the site, and notice what’s flowering, buzzing, and moving."}],"description":"A playful landmark and a perfect pause-point on the walk. Sit, look out across the site, and notice what’s flowering, buzzing, and moving.","seasonalNotes":{"Spring":"Great for spotting the first waves of blossom and fresh green—listen for dawn birdsong and nesting bustle.","Summer":"Use it as a butterfly-and-bee lookout—scan sunny edges where flowers meet longer grass.","Autumn":"Watch the colour shift and seed heads form; birds often move along hedges and rides at this time.","Winter":"Clear views for silhouettes and tracks—look for winter birds moving in small flocks across open ground."},"story":"Some landmarks are ancient standing stones. Some are giant chairs. Hooke Farm contains multitudes.\n\nThe Giant Chair is a polite invitation to do the most wilding-friendly thing possible: stop. Sit. Breathe. Look.\n\nFrom here you can watch the site behave like itself—flowers leaning, insects commuting, birds complaining, and grasses waving as if they’ve heard excellent gossip.","text":"","tags":[],"gallery":[{"id":"auto-148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg","url":"assets/features/giant-chair/148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg"},{"id":"auto-C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg","url":"assets/features/giant-chair/C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg"},{"id":"auto-IMG_0024.jpeg","url":"assets/features/giant-chair/IMG_0024.jpeg"},{"id":"auto-IMG_0303.jpeg","url":"assets/features/giant-chair/IMG_0303.jpeg"},{"id":"auto-IMG_0308 (1).jpeg","url":"assets/features/giant-chair/IMG_0308 (1).jpeg"},{"id":"auto-IMG_0308.jpeg","url":"assets/features/giant-chair/IMG_0308.jpeg"},{"id":"auto-IMG_0410.jpeg","url":"assets/features/giant-chair/IMG_0410.jpeg"},{"id":"auto-IMG_9989.jpeg","url":"assets/features/giant-chair/IMG_9989.jpeg"}]},{"id":"hen-henge","title":"Hen Henge","sourcePdf":"","thumb":"assets/features/hen-henge/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/hen-henge/page-001.png","width":0,"height":0,"textPreview":"A wonderfully odd feature with a name that makes you smile. It’s a small stop that hints at how the farm mixes usefulness, humour, and habitat."}],"description":"A wonderfully odd feature with a name that makes you smile. It’s a small stop that hints at how the farm mixes usefulness, humour, and habitat.","seasonalNotes":{"Spring":"A good stop for noticing new growth and early insects—hover a moment and watch the edges come alive.","Summer":"Expect constant small movement: flies, beetles, and bees working the sunny side of anything sheltering.","Autumn":"Look for fallen feathers, seed heads, and foraging signs—edges become busy as food gets patchier.","Winter":"A sheltered nook to pause in wind and rain; look for footprints and the quiet patterns of daily routes."},"story":"Hen Henge sounds like something you’d stumble across in a myth, right after a mysterious fog and just before a life-changing cup of tea.\n\nIn reality, it’s a small reminder that wilding isn’t only serious science—it’s also joy, curiosity, and the occasional splendidly silly name.\n\nStand here for a moment. The best features don’t shout; they wink. And this one definitely winks.","text":"","tags":[],"gallery":[{"id":"auto-14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg","url":"assets/features/hen-henge/14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg"},{"id":"auto-chicken house2.png","url":"assets/features/hen-henge/chicken house2.png"},{"id":"auto-IMG_2449.jpeg","url":"assets/features/hen-henge/IMG_2449.jpeg"}]},{"id":"ichthyosaurus","title":"Ichthyosaurus","sourcePdf":"","thumb":"assets/features/ichthyosaurus/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/ichthyosaurus/page-001.png","width":0,"height":0,"textPreview":"A Jurassic nod tucked into the landscape. A place to think about deep time, local stone, and the layers beneath our feet."}],"description":"A Jurassic nod tucked into the landscape. A place to think about deep time, local stone, and the layers beneath our feet.","seasonalNotes":{"Spring":"Low sun and fresh growth make textures pop—great for noticing stone surfaces, lichen, and tiny plants in cracks.","Summer":"In heat, stone holds warmth—watch for basking insects and listen for the hum of summer nearby.","Autumn":"After rain, colours deepen; look for moss brightening and fungal spots appearing around damp edges.","Winter":"Best season for form and silhouette—clear air and low light make the ‘deep time’ feeling strongest."},"story":"Imagine Dorset when it was sea, and the sea was busy.\n\nIchthyosaurus is your doorway into deep time: a playful nudge that says, “Everything you’re standing on has stories older than trees.”\n\nTouch the idea more than the object. Let your mind swim backwards through layers—then come back to the present, where lichen writes its own slow, living script on stone.","text":"","tags":[]},{"id":"green-roof","title":"Green roof","sourcePdf":"","thumb":"assets/features/green-roof/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/green-roof/page-001.png","width":0,"height":0,"textPreview":"A roof designed to be alive: planted, insulating, and rich in micro-habitats. Great for invertebrates, and a lovely example of ‘built’ nature."}],"description":"A roof designed to be alive: planted, insulating, and rich in micro-habitats. Great for invertebrates, and a lovely example of ‘built’ nature.","seasonalNotes":{"Spring":"Look for fresh sedum/plant growth and early pollinators on warm mornings; tiny flowers can be surprisingly busy.","Summer":"Peak bloom—expect bees and hoverflies. Heat shimmer and scent can be strong on still days.","Autumn":"Seed heads and dried stems provide structure; watch for spiders and late insects hunting in the shelter.","Winter":"The roof becomes a hardy, low-maintenance habitat—notice evergreen patches and frost patterns clinging to plants."},"story":"Most roofs have one job: keep weather out. This one has two: keep weather out and invite wildlife in.\n\nThe Green Roof is a tiny meadow that decided to live on top of a building. It drinks sun, holds heat, and offers a miniature neighbourhood of crevices, stems, and shelter.\n\nIf you ever need proof that “built” and “wild” can be friends, this is it—quietly blooming above your head like it planned it all along.","text":"","tags":[]},{"id":"barn-owl-box","title":"Barn Owl Box","sourcePdf":"","thumb":"assets/features/barn-owl-box/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/barn-owl-box/page-001.png","width":0,"height":0,"textPreview":"A nesting site built to support one of the farm’s most iconic hunters. Keep your eyes open at dusk for silent flight along field edges."}],"description":"A nesting site built to support one of the farm’s most iconic hunters. Keep your eyes open at dusk for silent flight along field edges.","seasonalNotes":{"Spring":"Breeding season begins—keep a respectful distance. Dusk is best for a chance of a hunting pass along edges.","Summer":"Long evenings: watch low, wavering flight over rough grass. Listen for calls near dark on still nights.","Autumn":"Young owls disperse; hunting can be active as nights lengthen—scan fence lines and field margins at dusk.","Winter":"Hard weather pushes hunting into daylight edges; look for pellets beneath roost spots and near posts."},"story":"A Barn Owl Box is a promise with a hinge: if the habitat is right, the wild might accept the invitation.\n\nNothing about a barn owl is loud. You don’t get a grand entrance—just a hush, a pale shape, and suddenly the field is listening.\n\nSo this is a place to practice dusk-patience. Watch the edges. Let the evening arrive. And if you’re lucky, you’ll see the silent sentence of flight written across the air.","text":"","tags":[]},{"id":"monkey-puzzle","title":"Monkey Puzzle","sourcePdf":"","thumb":"assets/features/monkey-puzzle/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/monkey-puzzle/page-001.png","width":0,"height":0,"textPreview":"A striking, spiky silhouette that’s hard to miss. A small landmark to orient yourself—and a great spot for photos in changing light."}],"description":"A striking, spiky silhouette that’s hard to miss. A small landmark to orient yourself—and a great spot for photos in changing light.","seasonalNotes":{"Spring":"Fresh greens around it make the spiky silhouette stand out—great for contrast photos and listening for birds.","Summer":"Strong midday sun can be dramatic; try early morning or golden hour for softer light and more wildlife movement.","Autumn":"Moody skies and changing colour palettes make this a standout landmark—look for birds feeding nearby.","Winter":"The classic season for silhouettes—frost and low sun can make the structure feel almost sculptural."},"story":"The Monkey Puzzle doesn’t just sit in the landscape—it declares itself.\n\nIts branches look like they were designed by a whimsical architect who only had triangles and attitude. Birds treat it as a lookout tower; walkers treat it as a compass.\n\nIf you ever lose your bearings, find the spiky silhouette and reset. The tree is basically saying: “You are here. Now go notice everything.”","text":"","tags":[],"gallery":[{"id":"auto-20231202-_DSF0955.jpg","url":"assets/features/monkey-puzzle/20231202-_DSF0955.jpg"},{"id":"auto-20231202-_DSF0977.jpg","url":"assets/features/monkey-puzzle/20231202-_DSF0977.jpg"}]},{"id":"tree-lith","title":"Tree Lith","sourcePdf":"","thumb":"assets/features/tree-lith/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/tree-lith/page-001.png","width":0,"height":0,"textPreview":"A tree-and-stone moment that invites a slower look. Notice textures—bark, lichen, moss—and the small lives that hide in the cracks and shade."}],"description":"A tree-and-stone moment that invites a slower look. Notice textures—bark, lichen, moss—and the small lives that hide in the cracks and shade.","seasonalNotes":{"Spring":"Look for new leaves, fresh moss, and early insects on the sunny side; birds often forage along textured bark.","Summer":"In shade, it stays cool—good for spotting butterflies resting and spiders’ webs catching the light.","Autumn":"After rain, colours deepen; lichen and moss glow. Great time for fungi on nearby wood and roots.","Winter":"Best for reading structure: bark patterns, lichen maps, and the way stone holds damp and frost."},"story":"Tree Lith is a small stage for big details.\n\nBark becomes a map. Lichen becomes handwriting. Moss becomes velvet. Stone becomes a sun-warmed seat for an insect that will never know it’s sitting on geology.\n\nThis is a place to swap speed for attention. The reward is that everything you thought was “background” becomes the main event.","text":"","tags":[]},{"id":"toad-pond","title":"Toad Pond","sourcePdf":"","thumb":"assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg","pages":[{"pageNumber":1,"image":"assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg","width":0,"height":0,"textPreview":"A watery corner for amphibians and pond life. In spring you might spot spawn, in summer dragonflies, and year-round the signs of hidden visitors."}],"description":"A watery corner for amphibians and pond life. In spring you might spot spawn, in summer dragonflies, and year-round the signs of hidden visitors.","seasonalNotes":{"Spring":"Peak amphibian season—look for spawn and listen for evening calls. Tread carefully near pond edges.","Summer":"Dragonflies and damselflies patrol the margins; watch for tadpoles and water beetles in shallows.","Autumn":"Leaves fall in—look for frogs/toads sheltering nearby and birds coming to drink on quiet days.","Winter":"Life slows: amphibians overwinter nearby. Scan the surface for ice patterns and the edges for tracks."},"story":"Toad Pond is the farm’s small mirror—reflecting sky, reeds, and whatever dares to move across the surface.\n\nIn spring it becomes a nursery; in summer, an airshow for dragonflies; in autumn, a quiet drinking place; in winter, a lesson in patience.\n\nIf you want to meet the shy residents, bring stillness. Water rewards the slow.","text":"","tags":[],"gallery":[{"id":"auto-C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg","url":"assets/features/toad-pond/C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg"},{"id":"auto-IMG_9728.jpeg","url":"assets/features/toad-pond/IMG_9728.jpeg"},{"id":"auto-IMG_9732.jpeg","url":"assets/features/toad-pond/IMG_9732.jpeg"},{"id":"auto-IMG_9735.jpeg","url":"assets/features/toad-pond/IMG_9735.jpeg"},{"id":"auto-IMG_9739.jpeg","url":"assets/features/toad-pond/IMG_9739.jpeg"}]},{"id":"old-mill-pond","title":"Old Mill Pond","sourcePdf":"","thumb":"assets/features/old-mill-pond/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/old-mill-pond/page-001.png","width":0,"height":0,"textPreview":"A calm patch of water with a sense of history. Watch for ripples, reeds, and the birds that patrol the margins."}],"description":"A calm patch of water with a sense of history. Watch for ripples, reeds, and the birds that patrol the margins.","seasonalNotes":{"Spring":"Birdsong and nesting activity ramps up; look for new reed shoots and early insects skimming the surface.","Summer":"Watch for dragonflies, swallows, and the shimmer of life on hot days; early mornings are often best.","Autumn":"Migrants may pause; falling leaves and softer light make reflections beautiful—look for fish ripples.","Winter":"Quiet and reflective—scan for winter birds and note how water levels and vegetation change."},"story":"Old Mill Pond keeps its secrets in ripples.\n\nStand still and you’ll see the whole place rearrange itself: a shadow passes under the surface, reeds sway like they’re whispering, and birds patrol the edges with professional focus.\n\nIt’s a history-heavy kind of calm—water that remembers. Visit often and you’ll notice it never tells the same story twice.","text":"","tags":[],"gallery":[{"id":"auto-FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg","url":"assets/features/old-mill-pond/FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg"}]},{"id":"orchard","title":"Orchard","sourcePdf":"","thumb":"assets/features/orchard/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/orchard/page-001.png","width":0,"height":0,"textPreview":"A pocket of fruit trees where blossom and fallen fruit feed the food web. Listen for bees in spring and birds in autumn."}],"description":"A pocket of fruit trees where blossom and fallen fruit feed the food web. Listen for bees in spring and birds in autumn.","seasonalNotes":{"Spring":"Blossom season—stand still and you’ll hear bees. Watch for pollinators and early butterflies on warm days.","Summer":"Fruit begins to form; look for birds feeding and insects working leaves and flowers in the understory.","Autumn":"Fallen fruit draws wasps, thrushes, and small mammals—great time for busy, messy abundance.","Winter":"Bare branches reveal structure; look for lichens, buds, and winter birds using trees as perches."},"story":"The Orchard is where the farm quietly practices generosity.\n\nIn spring it throws confetti (blossom) for the bees. In summer it grows weight and sweetness. In autumn it lets the ground become a feast. In winter it stands back and shows you the architecture of branches.\n\nIt’s a place where food is never just for humans—and that’s exactly the point.","text":"","tags":[]},{"id":"public-bridleway","title":"Public Bridleway","sourcePdf":"","thumb":"assets/features/public-bridleway/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/public-bridleway/page-001.png","width":0,"height":0,"textPreview":"A shared route through the landscape—part access, part corridor. Edges like this are often wildlife hotspots, so walk slowly and scan ahead."}],"description":"A shared route through the landscape—part access, part corridor. Edges like this are often wildlife hotspots, so walk slowly and scan ahead.","seasonalNotes":{"Spring":"Hedgerows and verges green up fast—look for early wildflowers and listen for territorial birds.","Summer":"A corridor for butterflies and bees—scan sunny banks and flower-rich edges as you walk.","Autumn":"Berries and seed heads draw birds; look for mushrooms on damp verges after rain.","Winter":"Great for tracking: footprints in soft ground and clear views of birds moving between cover."},"story":"The Public Bridleway is a shared thread—human footsteps, hoof prints, and wild routes braided together.\n\nEdges are where stories happen: hedges hold nests, verges hold flowers, and cover holds creatures that would rather not be seen.\n\nWalk it like a guest, not an owner. If you keep your pace gentle, the bridleway will show you the busy life running alongside it.","text":"","tags":[],"gallery":[{"id":"auto-wild path.png","url":"assets/features/public-bridleway/wild path.png"}]},{"id":"wild-veg-garden","title":"Wild Veg Garden","sourcePdf":"","thumb":"assets/features/wild-veg-garden/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/wild-veg-garden/page-001.png","width":0,"height":0,"textPreview":"Where growing food meets letting things get a bit wilder. A mix of beds, edges, and ‘volunteer’ plants that invite pollinators and predators alike."}],"description":"Where growing food meets letting things get a bit wilder. A mix of beds, edges, and ‘volunteer’ plants that invite pollinators and predators alike.","seasonalNotes":{"Spring":"Seedlings, blossom, and early weeds all appear—look for hoverflies, ladybirds, and the first bumblebees.","Summer":"Peak pollinator time—scan flowering herbs and edges. You’ll often see predators too: spiders, wasps, and birds.","Autumn":"Harvest season plus seed heads—leave some stems for overwintering insects and watch for late foragers.","Winter":"Structure matters: piles, stems, and compost become shelter. Great time to notice ‘habitat gardening’ in action."},"story":"The Wild Veg Garden is what happens when you stop insisting on perfection and start inviting allies.\n\nYes, there are vegetables. And yes, there are weeds. But the real magic is the conversation between them: flowers calling in pollinators, predators arriving to keep balance, compost turning yesterday into next month.\n\nIt’s a kitchen garden with a slightly untamed grin—growing food while quietly growing habitat too.","text":"","tags":[],"gallery":[{"id":"auto-92C76591-099F-4FDB-889B-D5512EEC5F98.jpg","url":"assets/features/wild-veg-garden/92C76591-099F-4FDB-889B-D5512EEC5F98.jpg"},{"id":"auto-FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg","url":"assets/features/wild-veg-garden/FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg"}]},{"id":"wildflower-meadow","title":"Wildflower Meadow","sourcePdf":"","thumb":"assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg","pages":[{"pageNumber":1,"image":"assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg","width":0,"height":0,"textPreview":"A broad brush of colour and nectar when the season is right. The best place to linger for butterflies, bees, and the constant, quiet movement of grass."}],"description":"A broad brush of colour and nectar when the season is right. The best place to linger for butterflies, bees, and the constant, quiet movement of grass.","seasonalNotes":{"Spring":"Early flowers begin to appear; watch for the first butterflies and listen for skylark-like energy overhead.","Summer":"The headline season—nectar, butterflies, and bees. Visit on warm, still days for maximum activity.","Autumn":"Seed heads and grasses take over—look for finches feeding and late blooms hanging on.","Winter":"A season of structure: stems, frost, and tracks. Notice how ‘empty’ meadow still shelters life."},"story":"Wildflower Meadow doesn’t do stillness. It does shimmer.\n\nOn a good summer day the air is full of wings: bees commuting, butterflies zig-zagging, and grasses nodding like they’re keeping time.\n\nCome back in autumn and it turns into a library of seed heads. Come back in winter and it becomes sculpture. The meadow is always working—just at different speeds.","text":"","tags":[],"gallery":[{"id":"auto-A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg","url":"assets/features/wildflower-meadow/A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg"},{"id":"auto-BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg","url":"assets/features/wildflower-meadow/BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg"},{"id":"auto-IMG_1707.jpeg","url":"assets/features/wildflower-meadow/IMG_1707.jpeg"},{"id":"auto-IMG_1715.jpeg","url":"assets/features/wildflower-meadow/IMG_1715.jpeg"},{"id":"auto-IMG_1813.jpeg","url":"assets/features/wildflower-meadow/IMG_1813.jpeg"},{"id":"auto-IMG_9861.jpeg","url":"assets/features/wildflower-meadow/IMG_9861.jpeg"}]},{"id":"insect-homes","title":"Insect Homes","sourcePdf":"JH WW24 info Board - Insect Homes.pdf","thumb":"assets/features/insect-homes/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/insect-homes/page-001.png","width":1600,"height":1280,"textPreview":"You may have noticed these piles of stone\naround the site - they're insect cairns. We\nuse them as markers for the butterfly\ntransept. They're made from waste stone\ndug up from our yard.\nINSECT APOCALYPSE\n Please read 'Silent Earth' -\nit's a revelation about the\nplight of insects and why\nwe need to be concerned\nabout them.\nLEARNING ABOUT INSECTS\nRemember that insects are a vital ingredient in the w…"}],"text":"You may have noticed these piles of stone\naround the site - they're insect cairns. We\nuse them as markers for the butterfly\ntransept. They're made from waste stone\ndug up from our yard.\nINSECT APOCALYPSE\n Please read 'Silent Earth' -\nit's a revelation about the\nplight of insects and why\nwe need to be concerned\nabout them.\nLEARNING ABOUT INSECTS\nRemember that insects are a vital ingredient in the web\nof life. They are food for birds and fish, which are, of\ncourse, in decline too.\nThe brilliant thing about our wilding project is that\ninsects love it - and I love them.\nIn part, my interest was sparked by Dave Goulson, author\nof numerous books about insects. He explained that\nthere has been a devastating decline in insects over the\nlast 100 years.\nINSECT HOMES:\nI've become fascinated by insects and have seen lots\nof different types at Hooke Farm - many of which I\ndidn't know existed.","seasonalNotes":{"Spring":"Early warm spells bring the first pollinators—watch sunny stones and nearby flowers for activity.","Summer":"Peak diversity: hover over flowers and watch the cairns for beetles, ants, and bees coming and going.","Autumn":"Late nectar becomes precious—look for final foraging bursts and spiders hunting around the structure.","Winter":"A shelter season—many insects overwinter in crevices; avoid disturbing and look instead for tracks and birds hunting."},"story":"This is where the tiniest residents get the best housing.\n\nInsect Homes are both practical and poetic: a handful of materials arranged so that beetles, bees, and other busy workers can shelter, breed, and quietly keep the whole place running.\n\nIf you want to feel hopeful, watch the entrances for a minute. The traffic tells you the ecosystem is clocking in for work.","tags":["Insects"]},{"id":"rats","title":"Rats","sourcePdf":"JH WW24 Info Board - Rats.pdf","thumb":"assets/features/rats/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/rats/page-001.png","width":1600,"height":1132,"textPreview":"We think this is a rat hole!!\nWe’re delighted to find that we have rat holes\naround our garden - and embrace them.  They play\na crucial role in our eco-system for example by:\n“Why do we want certain animals around us and not\nother animals? In new build homes, facilities are made in\nthe cavity to provide bats with a home. At the same time,\nrats are controlled with clamps, glue plates and poision.”\n…"}],"text":"We think this is a rat hole!!\nWe’re delighted to find that we have rat holes\naround our garden - and embrace them.  They play\na crucial role in our eco-system for example by:\n“Why do we want certain animals around us and not\nother animals? In new build homes, facilities are made in\nthe cavity to provide bats with a home. At the same time,\nrats are controlled with clamps, glue plates and poision.”\n Scavenging:  Rats help clean up by\nscavenging and consuming waste carrion\nwhich can reduce the spread of disease.\nSeed dispersal:  They can help with plant\npropagation by spreading seeds.\nBeing prey:  They serve as a food source for\nmany predators such as snakes, owls and\nother birds of prey, such as buzzards and red\nkites.","seasonalNotes":{"Spring":"As food sources shift, watch for fresh signs near compost and edges—remember they’re part of the wider food web.","Summer":"Activity is often at dawn/dusk—look for runs through vegetation and listen for rustling in cover.","Autumn":"Foraging ramps up—fallen fruit and seeds attract many animals; predators may follow the same routes.","Winter":"Tracks in mud or frost can reveal paths; avoid feeding or leaving waste that concentrates animals unnaturally."},"story":"The Rats board asks you to do something brave: swap disgust for curiosity.\n\nRats are not a fairy-tale villain here—they’re part of the system. They clean up, move seeds, and, importantly, become food for predators.\n\nWilding isn’t about choosing “cute” animals. It’s about letting the whole cast do their jobs, even the ones with terrible PR.","tags":["Mammals"]},{"id":"standing-stones","title":"Standing Stones","sourcePdf":"JH WW24 Info Board - Standing Stones.pdf","thumb":"assets/features/standing-stones/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/standing-stones/page-001.png","width":1600,"height":1280,"textPreview":"The standing stones were installed\nin September 2020. We chose them\nstraight from the quarry at\nMarnhull Stone near Sturminster\nNewton.\nThe stone is from the Corallian\ngroup of limestones which are\nabout 160 million years old and they\nwere deposited during the Jurassic\nperiod between 145 and 201 million\nyears ago, when the sea level was\nretreating!\nThe stones arrived on an\narticulated lorry\nAt lea…"}],"text":"The standing stones were installed\nin September 2020. We chose them\nstraight from the quarry at\nMarnhull Stone near Sturminster\nNewton.\nThe stone is from the Corallian\ngroup of limestones which are\nabout 160 million years old and they\nwere deposited during the Jurassic\nperiod between 145 and 201 million\nyears ago, when the sea level was\nretreating!\nThe stones arrived on an\narticulated lorry\nAt least a third of each\nstone is underground\nThey were installed by our\nwonderful digger man,\nKevin Holt\nSTANDING STONES","seasonalNotes":{"Spring":"Lichen and moss can brighten; morning light shows texture beautifully—good for slow, close looking.","Summer":"Stone holds heat—watch for basking insects and listen for the hum of summer along nearby edges.","Autumn":"After rain, colours deepen; low sun makes shadows dramatic and highlights the stones’ shapes.","Winter":"The best season for silhouette and geology—frost and low light reveal form without distraction."},"story":"The Standing Stones are time travellers with excellent posture.\n\nThey’re modernly placed, but the story in the rock is ancient: Jurassic seas, retreating water, and limestone laid down layer by layer when Dorset had a very different job description.\n\nWalk around them slowly. The stones don’t move, but your perspective does—and that’s the trick.","tags":["Geology"],"gallery":[{"id":"auto-F2C3BA6A-6435-46A9-8E4E-8602F3008E52.jpg","url":"assets/features/standing-stones/F2C3BA6A-6435-46A9-8E4E-8602F3008E52.jpg"},{"id":"auto-IMG_0354.jpeg","url":"assets/features/standing-stones/IMG_0354.jpeg"},{"id":"auto-IMG_6493.jpeg","url":"assets/features/standing-stones/IMG_6493.jpeg"}]},{"id":"wild-bees-birds","title":"Wild Bees & Birds","sourcePdf":"JH WW24 Info Board - Wild Bees & Birds.pdf","thumb":"assets/features/wild-bees-birds/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/wild-bees-birds/page-001.png","width":1600,"height":1132,"textPreview":"Wild Bees & Birds\nThese bird boxes were built for swifts but we think\nthey are too low - and the swifts wouldn’t have liked\nthe creeper either.  The first occupants were starlings,\nbut the bees usurped them - European honey bees\n(Apis mellifera).\nHowever, one rather brave or foolish starling returned\nthis year and made his or her nest in one of the holes\nbetween the bees.  It wasn’t a great succes…"}],"text":"Wild Bees & Birds\nThese bird boxes were built for swifts but we think\nthey are too low - and the swifts wouldn’t have liked\nthe creeper either.  The first occupants were starlings,\nbut the bees usurped them - European honey bees\n(Apis mellifera).\nHowever, one rather brave or foolish starling returned\nthis year and made his or her nest in one of the holes\nbetween the bees.  It wasn’t a great success as the\nbird died - presumably killed by the bees.\nI love it when they form clusters like in the photo.  At\ntimes we could see honey seeping through the wood.  I\nthink that the swift boxes are a bit small for all the\nbees that want to live there, but they don’t seem\ndeterred!","seasonalNotes":{"Spring":"Nesting season begins and bee activity rises—watch entrances for comings and goings on warm days.","Summer":"Peak buzzing: look for clustered bees and busy flight paths; early morning and late afternoon are often best.","Autumn":"Colonies prepare for colder weather—activity can spike on sunny days as they stock up.","Winter":"Mostly quiet outside—look for shelter use and remember many insects and birds are conserving energy."},"story":"This feature is a tiny soap opera in wooden real estate.\n\nBoxes were built with one tenant in mind, but wilding has a way of saying, “Nice plan—here’s what actually happened.” Bees moved in. Birds negotiated. Outcomes varied.\n\nThe lesson is simple: provide habitat and let nature handle the casting. The best stories are never fully scripted.","tags":["Bees","Birds"],"gallery":[{"id":"auto-IMG_1498.jpeg","url":"assets/features/wild-bees-birds/IMG_1498.jpeg"}]},{"id":"our-sweet-track","title":"Our Sweet Track","sourcePdf":"Our Sweet Track.pdf","thumb":"assets/features/our-sweet-track/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/our-sweet-track/page-001.png","width":1600,"height":1132,"textPreview":"Our Sweet Track\nA ‘Sweet Track’ is a Neolithic timber walkway\nand was originally part of a network of tracks\nbuilt to provide a dry path across marshy\nground. The trees were cut using stone and\nflint axes making planks from oak, ash and\nlime, whereas the poles were made with hazel\n& alder.  The track found by Ray Sweet was\npreserved in the peat bog and it was thought\nto date back to around 3800 BC…"}],"text":"Our Sweet Track\nA ‘Sweet Track’ is a Neolithic timber walkway\nand was originally part of a network of tracks\nbuilt to provide a dry path across marshy\nground. The trees were cut using stone and\nflint axes making planks from oak, ash and\nlime, whereas the poles were made with hazel\n& alder.  The track found by Ray Sweet was\npreserved in the peat bog and it was thought\nto date back to around 3800 BC!\nOur Sweet track is made from\nsweet chestnut stakes and oak\nplanks.\nThe idea for its installation came\nfrom Andrew George, from Wessex\nWilding.  It was constructed by a\nsmall team headed by Joe Wood -\nin the early stages helped by\nJasper Rayner and later by Bertie\nClark. They’ve all been involved in\na number of projects at Hooke\nJasper & Joe\nJoe & Bertie\nAndrew George","seasonalNotes":{"Spring":"A great time for a slower walk—fresh growth and damp ground highlight why raised paths matter.","Summer":"Use it as a calm route through busy habitat; early morning walks can be full of birdsong and insects.","Autumn":"Falling leaves and softer light make it atmospheric—watch for fungi on nearby wood after rain.","Winter":"Best for reading the land: tracks, stems, and silhouettes. Take care on slippery boards after frost."},"story":"The Sweet Track is an idea that keeps getting reinvented: “How do we cross wet ground without fighting it?”\n\nNeolithic people built their answer out of timber. Hooke Farm built theirs out of sweet chestnut and oak. Different centuries, same problem-solving.\n\nWalk it and imagine the original track under your feet—then look up and notice how wilding turns a path into a place.","tags":["History"],"gallery":[{"id":"auto-IMG_0169.jpeg","url":"assets/features/our-sweet-track/IMG_0169.jpeg"},{"id":"auto-IMG_3467.jpeg","url":"assets/features/our-sweet-track/IMG_3467.jpeg"}]},{"id":"the-bat-egg","title":"The Bat Egg","sourcePdf":"The Bat Egg.pdf","thumb":"assets/features/the-bat-egg/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/the-bat-egg/page-001.png","width":1600,"height":1132,"textPreview":"We were very proud of our beautiful\nbat egg. Built from waste stone to\nhouse a few different bat species\nwith a specal cave inside.\nBut I think the bats knew more than\nwe did - they visited but never\nsettled. And then the egg collapsed,\nfirst on one side and then the other,\nin the past year.\nWe are not planning to rebuild it but\nlet it become a glorious ruin covered\nin wild flowers.\nStone carver, …"}],"text":"We were very proud of our beautiful\nbat egg. Built from waste stone to\nhouse a few different bat species\nwith a specal cave inside.\nBut I think the bats knew more than\nwe did - they visited but never\nsettled. And then the egg collapsed,\nfirst on one side and then the other,\nin the past year.\nWe are not planning to rebuild it but\nlet it become a glorious ruin covered\nin wild flowers.\nStone carver, Tom Clark,built the bat\negg, finishing in December 2021.\nwww.tomclarkstonecarver.co.uk\nBe Careful - it’s not\nsafe. Please don’t\ngo close to it!!!\nThe Bat Egg\nhas collapsed!\nPipistrelle bats weigh between 3.5\nand 8.5 grams, but can eat up to\n3,000 insects in a single night!\nThey may be living in the crevices\nof the bat egg.","seasonalNotes":{"Spring":"As evenings warm, bats return to feeding routes—dusk is the moment to watch above hedges and open rides.","Summer":"Peak bat season—try a still, warm night for the best chance of activity. Listen for insects too.","Autumn":"Feeding intensifies before winter—watch for late dusk flights on mild evenings.","Winter":"Bats are largely inactive/hibernating—this becomes a place to think about shelter and seasonal cycles."},"story":"The Bat Egg is a story about ambition—and nature’s right to disagree.\n\nIt was built with care and imagination, and then the bats did what bats do: they inspected, they visited… and they chose other plans.\n\nNow it’s becoming something else: a ruin, a texture, a wildflower stage set. Wilding loves a second act.","tags":["Bats"]},{"id":"hibernaculum","title":"Hibernaculum","sourcePdf":"WW24 Hibernaculum Info Board.pdf","thumb":"assets/features/hibernaculum/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/hibernaculum/page-001.png","width":1600,"height":1132,"textPreview":"It's an underground home that\namphibians and reptiles use\nthroughout winter to protect\nthemselves from the cold.\nThere are lots of frogs, toads and\nnewts in or near our ponds. They\nlove the boggy ground and sunny\nspots.  By creating a hibernaculum\nwe have provided a safe space for\nthem to hibernate over winter.\nHOW WE CREATED THE HIBERNACULUM\nWe lifted an area of turf about 1\nby 2 metres and dug o…"}],"text":"It's an underground home that\namphibians and reptiles use\nthroughout winter to protect\nthemselves from the cold.\nThere are lots of frogs, toads and\nnewts in or near our ponds. They\nlove the boggy ground and sunny\nspots.  By creating a hibernaculum\nwe have provided a safe space for\nthem to hibernate over winter.\nHOW WE CREATED THE HIBERNACULUM\nWe lifted an area of turf about 1\nby 2 metres and dug out the soil\nat a depth of 50cm\nWe used old tiles to create entrance\ntunnels into the centre\nWe then filled the hole with rocks &\nlogs to create crawl spaces\nWe covered this with loose soil and the\noriginal turf was laid on top\nWe made sure the entrance tunnels were\naccessible\nAs the logs decompose\nthey release heat\nwarming  the\nhibernaculum and\nmaking it an ideal\nhibernation habitat for\namphibians & reptiles\nWHAT IS A HIBERNACULUM?\nOUR HIBERNACULUM\nIt was inspired and built by\nOscar McCarthy, in May\n2022. He has been working\nhere helping with land\nmanagement since 2021.","seasonalNotes":{"Spring":"Amphibians and reptiles begin to emerge—nearby sunny patches can be productive for sightings.","Summer":"A quiet refuge from heat—look around the edges for signs of use, but avoid disturbing entrances.","Autumn":"Animals seek shelter as temperatures drop—this is when safe overwintering spaces matter most.","Winter":"The headline season for a hibernaculum—leave it undisturbed and think ‘shelter, not spectacle’."},"story":"The Hibernaculum is a five-star winter hotel for creatures who hate central heating.\n\nBuilt from logs and rocks and good intentions, it offers the kind of shelter that lets amphibians and reptiles make it through cold weather safely.\n\nIt’s not a feature you “see” so much as a feature you provide. And that’s the whole wilding point: you build the stage, then you let the actors arrive on their own timetable.","tags":["Amphibians & Reptiles"]},{"id":"mount-scotland","title":"Mount Scotland","sourcePdf":"WW24 Mount Scotland Info Board .pdf","thumb":"assets/features/mount-scotland/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/mount-scotland/page-001.png","width":1600,"height":1280,"textPreview":"MOUNT SCOTLAND\nMy husband, Jamie Macdonald, is proud of his\nScottish heritage so we decided to dedicate this\nmound to him.  It includes 3 Scot's Pine trees and 2\ndriftwood stags.  The stags were bought in\nBridport market and made from driftwood which\noriginated in Indonesia - sadly, as a result of the\nhorrendous deforestation  However the wood\nwas drifting for some time before being made into\nscul…"}],"text":"MOUNT SCOTLAND\nMy husband, Jamie Macdonald, is proud of his\nScottish heritage so we decided to dedicate this\nmound to him.  It includes 3 Scot's Pine trees and 2\ndriftwood stags.  The stags were bought in\nBridport market and made from driftwood which\noriginated in Indonesia - sadly, as a result of the\nhorrendous deforestation  However the wood\nwas drifting for some time before being made into\nsculptures, which makes them very resilient to\nthe weather.  The antlers were provided by Jamie","seasonalNotes":{"Spring":"Fresh growth makes the mound feel newly shaped—good for wide views and noticing the season turning.","Summer":"A bright landmark: visit early or late for the best light and to avoid harsh midday sun.","Autumn":"Great colour season—watch for shifting tones in grass and trees, and listen for migrating birds overhead.","Winter":"Clear air and low sun create strong silhouettes; a good spot for dramatic skies and long shadows."},"story":"Mount Scotland is a love letter disguised as a landscape feature.\n\nIt’s part family story, part artwork, part viewpoint—Scots pine on a mound, driftwood stags standing watch, and a name that carries a grin.\n\nCome here when the light is changing. The mound turns the farm into a panorama and makes even ordinary weather feel like an event.","tags":["Landmarks"],"gallery":[{"id":"auto-2FD75449-9004-485D-B5BC-8ED282A590AC.jpg","url":"assets/features/mount-scotland/2FD75449-9004-485D-B5BC-8ED282A590AC.jpg"},{"id":"auto-IMG_1580.jpeg","url":"assets/features/mount-scotland/IMG_1580.jpeg"}]}]};
+window.__HOOKE_DATA__ = {"generatedAt":"2025-12-24T00:00:00Z","sourceDir":"/Users/montybryant/Documents/Work/Knowledge Resources/vibecoding/Hooke Almighty","features":[{"id":"dead-hedge","title":"Dead Hedge","sourcePdf":"","thumb":"assets/features/dead-hedge/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/dead-hedge/page-001.png","width":2048,"height":1365,"textPreview":"A living boundary made from stacked branches and brash. It’s a quiet larder and shelter belt for insects, birds, and small mammals."}],"tags":[]},{"id":"fallen-tree","title":"Fallen Tree","sourcePdf":"","thumb":"assets/features/fallen-tree/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/fallen-tree/page-001.png","width":2048,"height":1536,"textPreview":"A reminder that ‘dead’ wood is full of life. Look for fungi, beetles, and the tiny habitats that form as the trunk slowly returns to soil."}],"tags":[]},{"id":"giant-chair","title":"Giant Chair","sourcePdf":"","thumb":"assets/features/giant-chair/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/giant-chair/page-001.png","width":2000,"height":1333,"textPreview":"A playful landmark and a perfect pause-point on the walk. Sit, look out across the site, and notice what’s flowering, buzzing, and moving."}],"tags":[]},{"id":"hen-henge","title":"Hen Henge","sourcePdf":"","thumb":"assets/features/hen-henge/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/hen-henge/page-001.png","width":1692,"height":2048,"textPreview":"A wonderfully odd feature with a name that makes you smile. It’s a small stop that hints at how the farm mixes usefulness, humour, and habitat."}],"tags":[]},{"id":"ichthyosaurus","title":"Ichthyosaurus","sourcePdf":"","thumb":"assets/field-guide/placeholder.svg","pages":[{"pageNumber":1,"image":"assets/field-guide/placeholder.svg","width":1200,"height":750,"textPreview":"A Jurassic nod tucked into the landscape. A place to think about deep time, local stone, and the layers beneath our feet."}],"tags":[]},{"id":"green-roof","title":"Green roof","sourcePdf":"","thumb":"assets/features/green-roof/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/green-roof/page-001.png","width":1536,"height":2304,"textPreview":"A roof designed to be alive: planted, insulating, and rich in micro-habitats. Great for invertebrates, and a lovely example of ‘built’ nature."}],"tags":[]},{"id":"barn-owl-box","title":"Barn Owl Box","sourcePdf":"","thumb":"assets/features/barn-owl-box/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/barn-owl-box/page-001.png","width":2304,"height":1536,"textPreview":"A nesting site built to support one of the farm’s most iconic hunters. Keep your eyes open at dusk for silent flight along field edges."}],"tags":[]},{"id":"monkey-puzzle","title":"Monkey Puzzle","sourcePdf":"","thumb":"assets/features/monkey-puzzle/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/monkey-puzzle/page-001.png","width":1536,"height":2048,"textPreview":"A striking, spiky silhouette that’s hard to miss. A small landmark to orient yourself—and a great spot for photos in changing light."}],"tags":[]},{"id":"tree-lith","title":"Tree Lith","sourcePdf":"","thumb":"assets/features/tree-lith/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/tree-lith/page-001.png","width":1440,"height":1440,"textPreview":"A tree-and-stone moment that invites a slower look. Notice textures—bark, lichen, moss—and the small lives that hide in the cracks and shade."}],"tags":[]},{"id":"toad-pond","title":"Toad Pond","sourcePdf":"","thumb":"assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg","pages":[{"pageNumber":1,"image":"assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg","width":1380,"height":950,"textPreview":"A watery corner for amphibians and pond life. In spring you might spot spawn, in summer dragonflies, and year-round the signs of hidden visitors."}],"tags":[]},{"id":"old-mill-pond","title":"Old Mill Pond","sourcePdf":"","thumb":"assets/features/old-mill-pond/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/old-mill-pond/page-001.png","width":2048,"height":1536,"textPreview":"A calm patch of water with a sense of history. Watch for ripples, reeds, and the birds that patrol the margins."}],"tags":[]},{"id":"orchard","title":"Orchard","sourcePdf":"","thumb":"assets/field-guide/placeholder.svg","pages":[{"pageNumber":1,"image":"assets/field-guide/placeholder.svg","width":1200,"height":750,"textPreview":"A pocket of fruit trees where blossom and fallen fruit feed the food web. Listen for bees in spring and birds in autumn."}],"tags":[]},{"id":"public-bridleway","title":"Public Bridleway","sourcePdf":"","thumb":"assets/features/public-bridleway/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/public-bridleway/page-001.png","width":1536,"height":2048,"textPreview":"A shared route through the landscape—part access, part corridor. Edges like this are often wildlife hotspots, so walk slowly and scan ahead."}],"tags":[]},{"id":"wild-veg-garden","title":"Wild Veg Garden","sourcePdf":"","thumb":"assets/features/wild-veg-garden/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/wild-veg-garden/page-001.png","width":1440,"height":1439,"textPreview":"Where growing food meets letting things get a bit wilder. A mix of beds, edges, and ‘volunteer’ plants that invite pollinators and predators alike."}],"tags":[]},{"id":"wildflower-meadow","title":"Wildflower Meadow","sourcePdf":"","thumb":"assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg","pages":[{"pageNumber":1,"image":"assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg","width":1440,"height":1440,"textPreview":"A broad brush of colour and nectar when the season is right. The best place to linger for butterflies, bees, and the constant, quiet movement of grass."}],"tags":[]},{"id":"insect-homes","title":"Insect Homes","sourcePdf":"JH WW24 info Board - Insect Homes.pdf","thumb":"assets/features/insect-homes/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/insect-homes/page-001.png","width":1600,"height":1280,"textPreview":"You may have noticed these piles of stone\naround the site - they're insect cairns. We\nuse them as markers for the butterfly\ntransept. They're made from waste stone\ndug up from our yard.\nINSECT APOCALYPSE\n Please read 'Silent Earth' -\nit's a revelation about the\nplight of insects and why\nwe need to be concerned\nabout them.\nLEARNING ABOUT INSECTS\nRemember that insects are a vital ingredient in the w…"}],"tags":["Insects"]},{"id":"rats","title":"Rats","sourcePdf":"JH WW24 Info Board - Rats.pdf","thumb":"assets/features/rats/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/rats/page-001.png","width":1600,"height":1132,"textPreview":"We think this is a rat hole!!\nWe’re delighted to find that we have rat holes\naround our garden - and embrace them.  They play\na crucial role in our eco-system for example by:\n“Why do we want certain animals around us and not\nother animals? In new build homes, facilities are made in\nthe cavity to provide bats with a home. At the same time,\nrats are controlled with clamps, glue plates and poision.”\n…"}],"tags":["Mammals"]},{"id":"standing-stones","title":"Standing Stones","sourcePdf":"JH WW24 Info Board - Standing Stones.pdf","thumb":"assets/features/standing-stones/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/standing-stones/page-001.png","width":1600,"height":1280,"textPreview":"The standing stones were installed\nin September 2020. We chose them\nstraight from the quarry at\nMarnhull Stone near Sturminster\nNewton.\nThe stone is from the Corallian\ngroup of limestones which are\nabout 160 million years old and they\nwere deposited during the Jurassic\nperiod between 145 and 201 million\nyears ago, when the sea level was\nretreating!\nThe stones arrived on an\narticulated lorry\nAt lea…"}],"tags":["Geology"]},{"id":"wild-bees-birds","title":"Wild Bees & Birds","sourcePdf":"JH WW24 Info Board - Wild Bees & Birds.pdf","thumb":"assets/features/wild-bees-birds/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/wild-bees-birds/page-001.png","width":1600,"height":1132,"textPreview":"Wild Bees & Birds\nThese bird boxes were built for swifts but we think\nthey are too low - and the swifts wouldn’t have liked\nthe creeper either.  The first occupants were starlings,\nbut the bees usurped them - European honey bees\n(Apis mellifera).\nHowever, one rather brave or foolish starling returned\nthis year and made his or her nest in one of the holes\nbetween the bees.  It wasn’t a great succes…"}],"tags":["Bees","Birds"]},{"id":"our-sweet-track","title":"Our Sweet Track","sourcePdf":"Our Sweet Track.pdf","thumb":"assets/features/our-sweet-track/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/our-sweet-track/page-001.png","width":1600,"height":1132,"textPreview":"Our Sweet Track\nA ‘Sweet Track’ is a Neolithic timber walkway\nand was originally part of a network of tracks\nbuilt to provide a dry path across marshy\nground. The trees were cut using stone and\nflint axes making planks from oak, ash and\nlime, whereas the poles were made with hazel\n& alder.  The track found by Ray Sweet was\npreserved in the peat bog and it was thought\nto date back to around 3800 BC…"}],"tags":["History"]},{"id":"the-bat-egg","title":"The Bat Egg","sourcePdf":"The Bat Egg.pdf","thumb":"assets/features/the-bat-egg/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/the-bat-egg/page-001.png","width":1600,"height":1132,"textPreview":"We were very proud of our beautiful\nbat egg. Built from waste stone to\nhouse a few different bat species\nwith a specal cave inside.\nBut I think the bats knew more than\nwe did - they visited but never\nsettled. And then the egg collapsed,\nfirst on one side and then the other,\nin the past year.\nWe are not planning to rebuild it but\nlet it become a glorious ruin covered\nin wild flowers.\nStone carver, …"}],"tags":["Bats"]},{"id":"hibernaculum","title":"Hibernaculum","sourcePdf":"WW24 Hibernaculum Info Board.pdf","thumb":"assets/features/hibernaculum/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/hibernaculum/page-001.png","width":1600,"height":1132,"textPreview":"It's an underground home that\namphibians and reptiles use\nthroughout winter to protect\nthemselves from the cold.\nThere are lots of frogs, toads and\nnewts in or near our ponds. They\nlove the boggy ground and sunny\nspots.  By creating a hibernaculum\nwe have provided a safe space for\nthem to hibernate over winter.\nHOW WE CREATED THE HIBERNACULUM\nWe lifted an area of turf about 1\nby 2 metres and dug o…"}],"tags":["Amphibians & Reptiles"]},{"id":"mount-scotland","title":"Mount Scotland","sourcePdf":"WW24 Mount Scotland Info Board .pdf","thumb":"assets/features/mount-scotland/page-001.png","pages":[{"pageNumber":1,"image":"assets/features/mount-scotland/page-001.png","width":1600,"height":1280,"textPreview":"MOUNT SCOTLAND\nMy husband, Jamie Macdonald, is proud of his\nScottish heritage so we decided to dedicate this\nmound to him.  It includes 3 Scot's Pine trees and 2\ndriftwood stags.  The stags were bought in\nBridport market and made from driftwood which\noriginated in Indonesia - sadly, as a result of the\nhorrendous deforestation  However the wood\nwas drifting for some time before being made into\nscul…"}],"tags":["Landmarks"]}],"placeholders":{"assets/features/barn-owl-box/page-001.png":{"color":"#526d3a","preview":"data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAsAA4BaJZgCdADOJpD1+AD+pQVdTZltUHTKivMJ3K5Bh26uOUMkad+qGaVxbIS273Gi3AprLu+PGGE1DfI9+RwAAA=="},"assets/features/dead-hedge/page-001.png":{"color":"#5e5b4b","preview":"data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoQAAsAA4BaJaACdAEUhXmGtxQAAP5KDrDOZor+M2evSUjpErFvneFe8ZCjw+Uye+PROIN0MVMKr4rnJ6N5hXp0TS0mAAAA"},"assets/features/fallen-tree/page-001.png":{"color":"#495042","preview":"data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAwAgCdASoQAAwAA4BaJaACdAEWmJWuhBfMAAD+Cd/R2OwhTVTnncVJa/7QzxuPRQIQ0+d7axST8NwMjAXH9NDpjwTi5sg9iCcYs7Vbse1vAZd9HWF+U+ZQ3KiyKdXysHsctFQs2f/1t3AAAAA="},"assets/features/giant-chair/page-001.png":{"color":"#566824","preview":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAgCdASoQAAsAA4BaJbACdAEfZuarQ+Uz9YAA/oh4kVE+uzeXu2F0KtNzybP7L0puwLjffzfC08UNPvBp5KkQMK7d+YtbSYTi5doL1SzvO3sVwAA="},"assets/features/green-roof/page-001.png":{"color":"#736f6b","preview":"data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACQAQCdASoLABAAA4BaJQAAP/67MQAA+49qsLr/KgloGORmvysCA7YGBbPVk4dbv8RxdociD760gsbW2lDmtQ+48XJoxfaQYAA="},"assets/features/hen-henge/page-001.png":{"color":"#746341","preview":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoNABAAA4BaJbACdACmA7XFQh4AAPeda3+CYU4lZ0n46BTI4/sdvLXLQmmzk1yZChFhlncWlNwl7famJsH+ydZzZwwIt+VtOX2gwo6rA1b6Q2ZkAAA="},"assets/features/hibernaculum/page-001.png":{"color":"#eab626","preview":"data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQAgCdASoQAAsAA4BaJbACdDBWgURKDc4AAP6ztNcGZoHN9vZ5nH3WvV6t1ZhAPYJ6hA6bct1nFW8stk6rqccKz/CiyGEH9v6fD10Dmq37ntZk/0Y333K5QoDpt0B7a9xrP3sq/ev5Epp4aMAAAA=="},"assets/features/insect-homes/page-001.png":{"color":"#73652e","preview":"data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAA0AA4BaJbACdAELYy8n9jtXsAAA/rLgKQiIW0YOWO53iomkDerZo6gUdHrsAf0Mses69vzIfP1c6tMG5CiN1x1QDkp38WEu/f/DDq/4uK7GY4w32ydBf/CifdrQ2qT+fhsttkN3SAAA"},"assets/features/monkey-puzzle/page-001.png":{"color":"#82923c","preview":"data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoMABAAA4BaJbAAAveG/KvpIWAA/tUWsVV9KnV1ENLOgMXaufmYpmOvdbsB+vEE1ffFf5nIC7X4UhB7/3DOYAAA"},"assets/features/mount-scotland/page-001.png":{"color":"#1a2527","preview":"data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAABQAgCdASoQAA0AA4BaJbACdDBKQZB3MrjazQAA4DQtKOJUMf3oHz2S879EMG1VoH9lVYxvjQ2N9OtcEaEPYOQYwxu55CjVRfH08f35A0P1ZLUkMFAMbI7voH21FsIVaukD1pAP+A0xwVz7d95ChnMfgPtnfkiwAAA="},"assets/features/old-mill-pond/page-001.png":{"color":"#455c2a","preview":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAwAgCdASoQAAwAA4BaJagCsADp/00fiFEKAAD+NF2vS1GM4JMe2RdfV4Jly6AIENKka71ZNlmjXU2qayqNrt+vR3W6uzBT5X4Ru4LaixNdAAAA"},"assets/features/our-sweet-track/page-001.png":{"color":"#2f2a12","preview":"data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAwAgCdASoQAAsAA4BaJbACdAEem7Enf/iIYAD+heijktQtzkOqO7DEAtHNP19lrXa+0oetz3c8zHywxWGvq9khBAeJ7ws8GaC+DUn3TuU0/s8miVL3cWk3yUnl/0qZ7rXe81ssHp1EVMdm3z+GgAAA"},"assets/features/public-bridleway/page-001.png":{"color":"#5b7464","preview":"data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoMABAAA4BaJbACdEf/gefu5lqAAP4nbDYucLH2VCS4OSdWeGtSd42ZP9RCYoPOI59KNzByGBX7T5iEv1nYnx/J6/Ezoasb3m/aVPvtACYF7zcsjMLAAA=="},"assets/features/rats/page-001.png":{"color":"#f8b401","preview":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoQAAsAA4BaJbACdDiAAMhaUAwA/sQSVZUvetWMUGcaOCFhFvGykioVhqVThu62skPGTnsxHwE7T/82/wPkxc9nQVfIFX9LX0tebZIE7ljBp/IoQB+p0/97KOAAAA=="},"assets/features/standing-stones/page-001.png":{"color":"#4b5932","preview":"data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwAgCdASoQAA0AA4BaJbACdA/ABGjYNIBgLgAAAPjf4PcF2WVS73aN4knft7Vb1BTzN/b57i/1psaMXOWa0Aah+JhJO/1xXbdQA38v6OfzIZrA3RYegOJ+tOHc2D9JfAl/NxOd8IeFCQAA"},"assets/features/the-bat-egg/page-001.png":{"color":"#53574e","preview":"data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAACwAQCdASoQAAsAA4BaJbACdAEH/VwAAP7mzO6pSOG8yiCJ061FAa4J4A5jAk9QK75hb4jG+hsztSfLFUfazTSN9/r25M8R2CytUVAyKQuSW6bXn/+FHHj/GT/PfbpOtOlJb96gnAxLsPvXIMVVqqgQOl776V2UumQAAA=="},"assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg":{"color":"#779760","preview":"data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAADQAQCdASoQAAsAA4BaJbACdACZ50pkwAD+yf9f3VhFLs/rPY9nvjqmle7x4MX1pNml2tKOHtex2tHO3nejm707Er+f3PRVd145sf4r227vTLUwfMUr3DyO5Mjel5sDrK78SP8BcEcIjAAA"},"assets/features/tree-lith/page-001.png":{"color":"#898d53","preview":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABQAgCdASoQABAAA4BaJbACdH8AGXz3CBURroAA+WmSHP4ALAfMHgaPcHiEmJJ/uRw0el1I7jjHXQNXv/2YitX05d4PWsh5EfdJ3Mg9Y/2hzPka52Brva5DrxFly1wAAAA="},"assets/features/wild-bees-birds/page-001.png":{"color":"#f7b301","preview":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAACwAQCdASoQAAsAA4BaJbACdADGWxLYAP7D4e1EtHbHV6tSC33zWlJ+YBBsJJD3PH8HrTAMOjCafzb8gartb0bv8aYQ//neREY7oKQoKl/2uWWU7kbL98/dWj5n5DSNAAA="},"assets/features/wild-veg-garden/page-001.png":{"color":"#81aa67","preview":"data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADQAQCdASoQABAAA4BaJbACdAYw7EbyoAD8jtCCsYXV2+1IKxttsHqvhs7JMNjiBNwpLzS4uBURSEACgYbw3YZIpukFoRIF5x1N8iIe1gWk9ov8c2ezZ1odFJZ5ozmmRGKK1AAA"},"assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg":{"color":"#598144","preview":"data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABQAgCdASoQABAAA4BaJbACdAYwxqe21uubEwAAzWcV/sEDXMB0RE/vqvEG+AeKRIFSJwX6xukLusrWJmOKP+iZng6/0EjZclrHtmEL7AWdTPysI7PokXayxx6nbmz2DT+MQLYcqX73rdKmlIviuhHCmfIu8HLtvkAfw7WnsFEsAA=="}},"detailChunks":{"dead-hedge":"data/feature-details/dead-hedge.js?v=fe7554d618","fallen-tree":"data/feature-details/fallen-tree.js?v=06c09e1f1d","giant-chair":"data/feature-details/giant-chair.js?v=e0b5e00a37","hen-henge":"data/feature-details/hen-henge.js?v=435c41b638","ichthyosaurus":"data/feature-details/ichthyosaurus.js?v=27d7359102","green-roof":"data/feature-details/green-roof.js?v=c425315dae","barn-owl-box":"data/feature-details/barn-owl-box.js?v=3eefd74b73","monkey-puzzle":"data/feature-details/monkey-puzzle.js?v=68df28f3ed","tree-lith":"data/feature-details/tree-lith.js?v=1f66c3ea6f","toad-pond":"data/feature-details/toad-pond.js?v=1f0a7f7ce9","old-mill-pond":"data/feature-details/old-mill-pond.js?v=753ef18f60","orchard":"data/feature-details/orchard.js?v=d1c6370a4a","public-bridleway":"data/feature-details/public-bridleway.js?v=f6ae2d7a03","wild-veg-garden":"data/feature-details/wild-veg-garden.js?v=fa57845c26","wildflower-meadow":"data/feature-details/wildflower-meadow.js?v=77e8fb1bac","insect-homes":"data/feature-details/insect-homes.js?v=cf7ad71d32","rats":"data/feature-details/rats.js?v=e4900f9a08","standing-stones":"data/feature-details/standing-stones.js?v=4bafecc92e","wild-bees-birds":"data/feature-details/wild-bees-birds.js?v=31cfc46072","our-sweet-track":"data/feature-details/our-sweet-track.js?v=72dea68ec2","the-bat-egg":"data/feature-details/the-bat-egg.js?v=0d2ea3e399","hibernaculum":"data/feature-details/hibernaculum.js?v=51b6a21149","mount-scotland":"data/feature-details/mount-scotland.js?v=68fb5a4a97"},"searchChunk":"data/features-search.js?v=ca8b17a3c6"};
@@ -0,0 +1,2 @@
+// Auto-generated from data/features.json
+window.__HOOKE_SEARCH__ = {"fields":["title","tags","sourcePdf","text"],"weights":[8,5,2,1],"docs":["dead-hedge","fallen-tree","giant-chair","hen-henge","ichthyosaurus","green-roof","barn-owl-box","monkey-puzzle","tree-lith","toad-pond","old-mill-pond","orchard","public-bridleway","wild-veg-garden","wildflower-meadow","insect-homes","rats","standing-stones","wild-bees-birds","our-sweet-track","the-bat-egg","hibernaculum","mount-scotland"],"terms":["000","1","100","145","160","2","201","2020","2021","2022","3","3800","5","50cm","8","a","about","accessible","across","ago","alder","all","amphibians","an","and","andrew","animals","antlers","apis","apocalypse","are","area","around","arrived","articulated","as","ash","at","author","axes","back","barn","bat","bats","bc","be","beautiful","become","been","bees","before","being","bertie","between","bird","birds","bit","board","bog","boggy","books","bought","box","boxes","brave","bridleway","bridport","brilliant","build","built","but","butterfly","buzzards","by","cairns","came","can","careful","carrion","carver","cave","cavity","centre","certain","chair","chestnut","chose","clamps","clark","clean","close","clusters","co","cold","collapsed","concerned","constructed","consuming","controlled","corallian","could","course","covered","crawl","create","created","creating","creeper","crevices","crucial","cut","date","dave","dead","december","decided","decline","decompose","dedicate","deforestation","delighted","deposited","depth","deterred","devastating","did","didnt","died","different","digger","disease","dispersal","do","dont","drifting","driftwood","dry","dug","during","each","early","earth","eat","eco","egg","either","embrace","entrance","european","example","existed","explained","facilities","fallen","farm","fascinated","few","filled","find","finishing","first","fish","flint","flowers","food","foolish","for","form","found","frogs","from","garden","geology","george","giant","glorious","glue","go","goulson","grams","great","green","ground","group","habitat","has","have","hazel","he","headed","heat","hedge","help","helped","helping","hen","henge","her","here","heritage","hibernaculum","hibernate","hibernation","him","his","history","hole","holes","holt","home","homes","honey","hooke","horrendous","house","how","however","husband","i","ichthyosaurus","idea","ideal","in","includes","indonesia","info","ingredient","insect","insects","inside","inspired","installation","installed","interest","into","involved","is","it","its","ive","jamie","jasper","jh","joe","jurassic","kevin","killed","kites","knew","know","laid","land","landmarks","last","later","learning","least","let","level","life","lifted","like","liked","lime","limestones","lith","live","living","logs","loose","lorry","lots","love","low","macdonald","made","makes","making","mammals","man","management","many","markers","market","marnhull","marshy","may","mccarthy","meadow","mellifera","metres","mill","million","monkey","more","mound","mount","my","near","need","neolithic","nest","network","never","new","newton","newts","night","not","noticed","number","numerous","oak","occupants","of","old","on","one","or","orchard","original","originally","originated","oscar","other","our","out","over","owl","owls","part","past","path","pdf","peat","period","photo","piles","pine","pipistrelle","planks","planning","plant","plates","play","please","plight","poision","poles","pond","ponds","predators","preserved","presumably","prey","project","projects","propagation","protect","proud","provide","provided","public","puzzle","quarry","rat","rather","rats","ray","rayner","read","rebuild","red","reduce","release","remember","reptiles","resilient","result","retreating","returned","revelation","rocks","role","roof","ruin","sadly","safe","same","scavenging","scotland","scots","scottish","sculptures","sea","see","seed","seeds","seem","seen","seeping","september","serve","settled","side","silent","since","single","site","small","snakes","so","soil","some","source","space","spaces","sparked","specal","species","spots","spread","spreading","stages","stags","stakes","standing","starling","starlings","stone","stones","straight","sturminster","success","such","sunny","sure","sweet","swift","swifts","system","team","than","that","the","them","themselves","then","there","these","they","theyre","theyve","thing","think","third","this","thought","through","throughout","tiles","timber","time","times","to","toad","toads","tom","tomclarkstonecarver","too","top","track","tracks","transept","tree","trees","tunnels","turf","types","uk","underground","up","us","use","used","using","usurped","veg","very","visited","vital","walkway","want","warming","was","wasnt","waste","we","weather","web","weigh","were","wessex","what","when","whereas","which","why","wild","wildflower","wilding","winter","with","wonderful","wood","working","wouldnt","ww24","www","yard","year","years","you"],"postings":[[20,1],[21,1],[15,1],[17,1],[17,1],[21,1,22,1],[17,1],[17,1],[20,1,21,1],[21,1],[20,2,22,1],[19,1],[20,2],[21,1],[20,1],[15,3,16,3,17,1,18,2,19,3,20,3,21,3,22,1],[15,3,17,1,21,1],[21,1],[19,1],[17,1],[19,1],[18,1,19,1],[21,7],[17,1,21,3],[15,3,16,3,17,2,18,2,19,3,20,3,21,3,22,2],[19,2],[16,2],[22,1],[18,1],[15,1],[15,3,16,2,17,1,18,2,20,1,21,1],[21,1],[15,1,16,2,19,1],[17,1],[17,1],[15,1,16,3,18,1,21,1,22,1],[19,1],[15,1,16,1,17,2,18,1,19,1,21,1],[15,1],[19,1],[19,1],[6,8],[20,13],[16,1,20,7],[19,1],[15,1,20,2],[20,1],[15,1,20,1],[15,1,19,1,21,1],[18,18],[22,1],[16,1,22,1],[19,2],[17,1,18,1,20,1],[18,2],[15,1,16,1,18,16],[18,1],[15,2,16,2,17,2,18,2,21,2,22,2],[19,1],[21,1],[15,1],[22,1],[6,8],[18,2],[18,1],[12,8],[22,1],[15,1],[16,1],[18,1,19,1,20,2,21,1],[18,3,20,3],[15,1],[16,1],[15,2,16,3,17,1,18,1,19,3,21,3,22,1],[15,1],[19,1],[16,2,20,1],[20,1],[16,1],[20,1],[20,1],[16,1],[21,1],[16,1],[2,8],[19,1],[17,1],[16,1],[19,1,20,1],[16,1],[20,1],[18,1],[20,1],[21,1],[20,2],[15,1],[19,1],[16,1],[16,1],[17,1],[18,1],[15,1],[20,1,21,1],[21,1],[21,2],[21,1],[21,1],[18,1],[20,1],[16,1],[19,1],[19,1],[15,1],[0,8],[20,1],[22,1],[15,2],[21,1],[22,1],[22,1],[16,1],[17,1],[21,1],[18,1],[15,1],[20,1],[15,1],[18,1],[15,1,20,1],[17,1],[16,1],[16,1],[16,1],[18,1,20,1],[22,1],[22,2],[19,1],[15,1,21,1],[17,1],[17,1],[19,1],[15,1],[20,1],[16,1],[20,13],[18,1],[16,1],[21,2],[18,1],[16,1],[15,1],[15,1],[16,1],[1,8],[15,1],[15,1],[20,1],[21,1],[16,1],[20,1],[18,1,20,1],[15,1],[19,1],[20,1],[15,1,16,1],[18,1],[15,2,16,2,18,2,19,1,21,2,22,1],[18,1],[19,1],[21,1],[15,2,17,2,19,3,20,1,21,1,22,1],[13,8,16,1],[17,5],[19,2],[2,8],[20,1],[16,1],[20,1],[15,1],[20,1],[18,1],[5,8],[19,1,21,1],[17,1],[21,1],[15,1,20,1,21,1],[15,2,16,1,18,1,21,1],[19,1],[15,1,21,1],[19,1],[21,1],[0,8],[16,2],[19,1],[21,1],[3,8],[3,8],[18,1],[21,1],[22,1],[21,13],[21,1],[21,1],[22,1],[18,1,22,1],[19,5],[16,1,21,1],[16,1,18,1],[17,1],[16,1,21,1],[15,11,16,1],[18,2],[15,1,19,1],[22,1],[20,1],[21,1],[18,1,22,1],[22,1],[15,2,18,2,20,1],[4,8],[19,1],[21,1],[15,3,16,3,17,1,18,2,19,3,20,3,21,2,22,2],[22,1],[22,1],[15,2,16,2,17,2,18,2,21,2,22,2],[15,1],[15,13],[15,8,20,1],[20,1],[21,1],[19,1],[17,2],[15,1],[21,1,22,1],[19,1],[15,1,16,1,17,2,19,2,21,1,22,1],[15,1,18,2,19,2,20,3,21,2,22,1],[15,1,19,1,20,1,21,1],[15,1],[22,2],[19,2],[15,2,16,2,17,2,18,2],[19,3],[17,1],[17,1],[18,1],[16,1],[20,1],[15,1],[21,1],[21,1],[22,5],[15,1],[19,1],[15,1],[17,1],[20,1],[17,1],[15,1],[21,1],[18,1],[18,1],[19,1],[17,1],[8,8],[18,1],[20,1],[21,2],[21,1],[17,1],[15,1,21,1],[15,2,18,1,21,1],[18,1],[22,1],[15,1,16,1,18,1,19,2,21,1,22,2],[22,1],[19,1,21,1],[16,5],[17,1],[21,1],[15,1,16,1],[15,1],[22,1],[17,1],[19,1],[15,1,20,1,21,1],[21,1],[14,8],[18,1],[21,1],[10,8],[17,2],[7,8],[20,1],[22,1],[22,11],[15,1,22,1],[17,1,21,1],[15,1],[19,1],[18,1],[19,1],[20,1],[16,1],[17,1],[21,1],[20,1],[16,1,20,2],[15,1],[19,1],[15,1],[19,2],[18,1],[15,3,16,2,17,2,18,1,19,3,20,2,21,3,22,2],[10,8,17,1,21,1],[17,1,20,1,21,1],[18,2,20,1],[18,2,21,1],[11,8],[21,1],[19,1],[22,1],[21,1],[16,2,20,1],[15,2,16,2,17,1,19,12,20,1,21,2],[21,1],[15,1,21,1],[6,8],[16,1],[15,1,19,1],[20,1],[19,1],[15,2,16,2,17,2,18,2,19,2,20,2,21,2,22,2],[19,1],[17,1],[18,1],[15,1],[22,1],[20,1],[19,2],[20,1],[16,1],[16,1],[16,1],[15,1,20,1],[15,1],[16,1],[19,1],[9,8,10,8],[21,1],[16,1],[19,1],[18,1],[16,2],[15,1],[19,1],[16,1],[21,1],[20,1,22,1],[16,1,19,1],[21,1,22,1],[12,8],[7,8],[17,1],[16,2],[18,1],[16,12],[19,1],[19,1],[15,1],[20,1],[16,1],[16,1],[21,1],[15,1],[21,7],[22,1],[22,1],[17,1],[18,1],[15,1],[21,1],[16,1],[5,8],[20,1],[22,1],[20,1,21,1],[16,1],[16,2],[22,11],[22,1],[22,1],[22,1],[17,1],[18,1],[16,1],[16,1],[18,1],[15,1],[18,1],[17,1],[16,1],[20,1],[20,1],[15,1],[21,1],[20,1],[15,1],[18,1,19,1],[16,1],[22,1],[21,2],[22,1],[16,1],[21,1],[21,1],[15,1],[20,1],[20,1],[21,1],[16,1],[16,1],[19,1],[22,2],[19,1],[17,12],[18,1],[18,1],[15,2,17,3,19,1,20,2],[17,13],[17,1],[17,1],[18,1],[16,2],[21,1],[21,1],[19,13],[18,1],[18,2],[16,1],[19,1],[20,1],[15,3,16,1,18,2,21,1],[15,3,16,3,17,3,18,3,19,3,20,13,21,3,22,3],[15,3,16,1,17,1,18,1,21,1,22,1],[21,1],[20,2,21,1],[15,1,18,1,21,1],[15,1,18,1],[15,1,16,3,17,2,18,3,20,2,21,2],[15,2],[19,1],[15,1],[16,1,18,2,20,1],[17,1],[16,1,18,1,21,1,22,1],[19,1],[18,1],[21,1],[21,1],[19,1],[16,1,22,1],[18,1],[15,1,16,2,18,1,19,3,20,3,21,3,22,3],[9,8],[21,1],[20,1],[20,1],[15,1,18,1],[21,1],[19,13],[19,1],[15,1],[1,8,8,8],[19,1,22,1],[21,2],[21,2],[15,1],[20,1],[17,1,21,1],[15,1,16,1,20,1],[16,1],[15,1,21,1],[21,1],[19,1],[18,1],[13,8],[20,1,22,1],[20,1],[15,1],[19,1],[16,1,18,1],[21,1],[15,1,17,1,19,3,21,2,22,1],[18,1],[15,1,16,1,20,1],[15,2,16,3,17,1,18,2,20,3,21,3,22,1],[22,1],[15,1],[20,1],[16,1,17,3,18,2,19,2,20,1,21,1,22,2],[19,1],[21,1],[17,1,18,1],[19,1],[15,2,16,1,17,1,22,2],[15,1,16,1],[13,8,18,11,20,1],[14,8],[15,1,19,1],[21,2],[16,3,19,1,20,1,21,3],[17,1],[18,1,19,1,22,1],[21,1],[18,1],[15,2,16,2,17,2,18,2,21,2,22,2],[20,1],[15,1],[18,1,20,1],[15,1,17,2],[15,1]]};
@@ -1,81 +1,15 @@
 // Auto-generated by tools/build_gallery_manifest.py
 // Gallery images for Hooke Farm Wilding Portal (excluding assets/field-guide).
+// The images themselves are in per-category pages under data/gallery/, loaded as the grid scrolls.
 window.__HOOKE_GALLERY__ = {
-  generatedAt: "2025-12-24T23:55:45Z",
-  images: [
-    { src: "assets/about/hooke-farm-1.jpg", category: "About", label: "hooke-farm-1.jpg" },
-    { src: "assets/about/hooke-farm-2.jpg", category: "About", label: "hooke-farm-2.jpg" },
-    { src: "assets/hookewildingmisc/IMG_6498.jpeg", category: "Hooke wilding misc", label: "IMG_6498" },
-    { src: "assets/features/fallen-tree/IMG_0533.jpeg", category: "Feature photos", label: "IMG_0533" },
-    { src: "assets/features/fallen-tree/IMG_0534.jpeg", category: "Feature photos", label: "IMG_0534" },
-    { src: "assets/features/fallen-tree/IMG_0536.jpeg", category: "Feature photos", label: "IMG_0536" },
-    { src: "assets/features/fallen-tree/IMG_0537.jpeg", category: "Feature photos", label: "IMG_0537" },
-    { src: "assets/features/fallen-tree/IMG_0541.jpeg", category: "Feature photos", label: "IMG_0541" },
-    { src: "assets/features/fallen-tree/IMG_0546.jpeg", category: "Feature photos", label: "IMG_0546" },
-    { src: "assets/features/fallen-tree/IMG_0547.jpeg", category: "Feature photos", label: "IMG_0547" },
-    { src: "assets/features/fallen-tree/IMG_0548.jpeg", category: "Feature photos", label: "IMG_0548" },
-    { src: "assets/features/fallen-tree/IMG_0549.jpeg", category: "Feature photos", label: "IMG_0549" },
-    { src: "assets/features/fallen-tree/fallentreeee.png", category: "Feature photos", label: "fallentreeee" },
-    { src: "assets/features/giant-chair/148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg", category: "Feature photos", label: "148D9450-3A96-41C7-9946-4B9EA60FAE42" },
-    { src: "assets/features/giant-chair/C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg", category: "Feature photos", label: "C203B05C-FB00-4F26-ABEA-60289584DBFC" },
-    { src: "assets/features/giant-chair/IMG_0024.jpeg", category: "Feature photos", label: "IMG_0024" },
-    { src: "assets/features/giant-chair/IMG_0303.jpeg", category: "Feature photos", label: "IMG_0303" },
-    { src: "assets/features/giant-chair/IMG_0308 (1).jpeg", category: "Feature photos", label: "IMG_0308 (1)" },
-    { src: "assets/features/giant-chair/IMG_0308.jpeg", category: "Feature photos", label: "IMG_0308" },
-    { src: "assets/features/giant-chair/IMG_0410.jpeg", category: "Feature photos", label: "IMG_0410" },
-    { src: "assets/features/giant-chair/IMG_9989.jpeg", category: "Feature photos", label: "IMG_9989" },
-    { src: "assets/features/hen-henge/14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg", category: "Feature photos", label: "14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375" },
-    { src: "assets/features/hen-henge/IMG_2449.jpeg", category: "Feature photos", label: "IMG_2449" },
-    { src: "assets/features/hen-henge/chicken house2.png", category: "Feature photos", label: "chicken house2" },
-    { src: "assets/features/monkey-puzzle/20231202-_DSF0955.jpg", category: "Feature photos", label: "20231202-_DSF0955" },
-    { src: "assets/features/monkey-puzzle/20231202-_DSF0977.jpg", category: "Feature photos", label: "20231202-_DSF0977" },
-    { src: "assets/features/mount-scotland/2FD75449-9004-485D-B5BC-8ED282A590AC.jpg", category: "Feature photos", label: "2FD75449-9004-485D-B5BC-8ED282A590AC" },
-    { src: "assets/features/mount-scotland/IMG_1580.jpeg", category: "Feature photos", label: "IMG_1580" },
-    { src: "assets/features/old-mill-pond/FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg", category: "Feature photos", label: "FC23A0C0-A45A-4A2C-983B-3855571349F5" },
-    { src: "assets/features/our-sweet-track/IMG_0169.jpeg", category: "Feature photos", label: "IMG_0169" },
-    { src: "assets/features/our-sweet-track/IMG_3467.jpeg", category: "Feature photos", label: "IMG_3467" },
-    { src: "assets/features/public-bridleway/wild path.png", category: "Feature photos", label: "wild path" },
-    { src: "assets/features/standing-stones/F2C3BA6A-6435-46A9-8E4E-8602F3008E52.jpg", category: "Feature photos", label: "F2C3BA6A-6435-46A9-8E4E-8602F3008E52" },
-    { src: "assets/features/standing-stones/IMG_0354.jpeg", category: "Feature photos", label: "IMG_0354" },
-    { src: "assets/features/standing-stones/IMG_6493.jpeg", category: "Feature photos", label: "IMG_6493" },
-    { src: "assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg", category: "Feature photos", label: "5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A" },
-    { src: "assets/features/toad-pond/C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg", category: "Feature photos", label: "C4B05C76-4B62-4675-A6AF-E6D19827A5D8" },
-    { src: "assets/features/toad-pond/IMG_9728.jpeg", category: "Feature photos", label: "IMG_9728" },
-    { src: "assets/features/toad-pond/IMG_9732.jpeg", category: "Feature photos", label: "IMG_9732" },
-    { src: "assets/features/toad-pond/IMG_9735.jpeg", category: "Feature photos", label: "IMG_9735" },
-    { src: "assets/features/toad-pond/IMG_9739.jpeg", category: "Feature photos", label: "IMG_9739" },
-    { src: "assets/features/wild-bees-birds/IMG_1498.jpeg", category: "Feature photos", label: "IMG_1498" },
-    { src: "assets/features/wild-veg-garden/92C76591-099F-4FDB-889B-D5512EEC5F98.jpg", category: "Feature photos", label: "92C76591-099F-4FDB-889B-D5512EEC5F98" },
-    { src: "assets/features/wild-veg-garden/FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg", category: "Feature photos", label: "FCD21189-E7B2-469D-96AC-9FE85FF65F99" },
-    { src: "assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg", category: "Feature photos", label: "732B50B0-1D64-454C-BA6C-A238BC62D60C" },
-    { src: "assets/features/wildflower-meadow/A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg", category: "Feature photos", label: "A6E44959-C7D8-4FC1-B056-C04DD70188C9" },
-    { src: "assets/features/wildflower-meadow/BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg", category: "Feature photos", label: "BD612141-B0A2-45EB-AEC9-7DAA87629720" },
-    { src: "assets/features/wildflower-meadow/IMG_1707.jpeg", category: "Feature photos", label: "IMG_1707" },
-    { src: "assets/features/wildflower-meadow/IMG_1715.jpeg", category: "Feature photos", label: "IMG_1715" },
-    { src: "assets/features/wildflower-meadow/IMG_1813.jpeg", category: "Feature photos", label: "IMG_1813" },
-    { src: "assets/features/wildflower-meadow/IMG_9861.jpeg", category: "Feature photos", label: "IMG_9861" },
-    { src: "assets/features/Ichthyosaurus/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/barn-owl-box/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/dead-hedge/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/fallen-tree/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/giant-chair/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/green-roof/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/hen-henge/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/hibernaculum/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/insect-homes/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/monkey-puzzle/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/mount-scotland/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/old-mill-pond/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/orchard/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/our-sweet-track/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/public-bridleway/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/rats/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/standing-stones/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/the-bat-egg/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/tree-lith/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/wild-bees-birds/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/features/wild-veg-garden/page-001.png", category: "Info boards", label: "page-001.png" },
-    { src: "assets/hooke-farm-watercolour.png", category: "Artwork", label: "Hooke Farm watercolor map" },
-    { src: "assets/sunflower.webp", category: "Artwork", label: "Sunflower" },
+  generatedAt: "2026-10-17T02:24:01Z",
+  sizes: "(max-width: 640px) 100vw, (max-width: 980px) 50vw, 290px",
+  total: 71,
+  chunkSize: 60,
+  categories: [
+    { name: "About", count: 2, chunks: ["data/gallery/about-001.js?v=5166d475f4"] },
+    { name: "Feature photos", count: 48, chunks: ["data/gallery/feature-photos-001.js?v=4c3e531003"] },
+    { name: "Info boards", count: 20, chunks: ["data/gallery/info-boards-001.js?v=a23d578ce7"] },
+    { name: "Artwork", count: 1, chunks: ["data/gallery/artwork-001.js?v=153dfe37c4"] },
   ],
 };
@@ -0,0 +1,5 @@
+// Auto-generated by tools/build_gallery_manifest.py
+(window.__HOOKE_GALLERY_CHUNKS__ = window.__HOOKE_GALLERY_CHUNKS__ || {})["about-001"] = [
+  { src: "assets/about/hooke-farm-1.jpg", category: "About", label: "hooke-farm-1.jpg", width: 4032, height: 3024, placeholder: {"color": "#bdc6d2", "preview": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAQAgCdASoQAAwAA4BaJaACdAD0ofkwQVwAAP63JyMlZ/PP+3iZnYoMlsFP+z5nOEZ7pEl3LgEqR823WdBGSGnBBG7kUQ6+gAA="} },
+  { src: "assets/about/hooke-farm-2.jpg", category: "About", label: "hooke-farm-2.jpg", width: 3024, height: 4032, placeholder: {"color": "#7b8d58", "preview": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAACwAQCdASoMABAAA4BaJZgCdADcAvyAAP7q8EvyMxRLBn1HgTH1tQQFs56mFnEW6yvl6BL2MkJf1jTaJz6AQbWLW+4+MyAA"} },
+];
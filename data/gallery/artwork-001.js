@@ -0,0 +1,4 @@
+// Auto-generated by tools/build_gallery_manifest.py
+(window.__HOOKE_GALLERY_CHUNKS__ = window.__HOOKE_GALLERY_CHUNKS__ || {})["artwork-001"] = [
+  { src: "assets/sunflower.webp", category: "Artwork", label: "Sunflower", width: 512, height: 512 },
+];
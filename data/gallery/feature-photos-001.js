@@ -0,0 +1,51 @@
+// Auto-generated by tools/build_gallery_manifest.py
+(window.__HOOKE_GALLERY_CHUNKS__ = window.__HOOKE_GALLERY_CHUNKS__ || {})["feature-photos-001"] = [
+  { src: "assets/features/fallen-tree/IMG_0532.jpeg", category: "Feature photos", label: "IMG_0532", width: 2048, height: 1536, placeholder: {"color": "#8bb5df", "preview": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADQAQCdASoQAAwAA4BaJYgCdAEOcSK9gADdBfp+cOwaCiMxdJlJu3Ou3sr6Mzc7RV6MvrEzB91F2VHLVfFasbdIIMnajj9jdQgwmp3eBaAAAA=="} },
+  { src: "assets/features/fallen-tree/IMG_0533.jpeg", category: "Feature photos", label: "IMG_0533", width: 2048, height: 1536, placeholder: {"color": "#59583d", "preview": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoQAAwAA4BaJZgCdADcTahE/nvgAOHqSKCHF9WvOhHhUa62T0synAibA3OQT6GeTMV/9u6PfbyTEafNi6dC8EJ3DWY1SyKxgAAAAA=="} },
+  { src: "assets/features/fallen-tree/IMG_0534.jpeg", category: "Feature photos", label: "IMG_0534", width: 2048, height: 1536, placeholder: {"color": "#55583f", "preview": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAABQAgCdASoQAAwAA4BaJZACdEf/gUg/BR01d4AA8DDQFGH+xLvWOi3oLgSr60fnOhKBcTOg5oCsvMPOdJfcYE0r5MjGLw5whNwUsIAA"} },
+  { src: "assets/features/fallen-tree/IMG_0536.jpeg", category: "Feature photos", label: "IMG_0536", width: 2048, height: 1536, placeholder: {"color": "#6b6753", "preview": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAwAgCdASoQAAwAA4BaJYgCdAEPh8kLQqepAAD+QT5hiDocJAba/U6WQ1P/AYwxutQRXVlcqbFAPna9TTcsC5PJOOiE6FzpuNCDgAebLBXWQC0dAAA="} },
+  { src: "assets/features/fallen-tree/IMG_0537.jpeg", category: "Feature photos", label: "IMG_0537", width: 2048, height: 1536, placeholder: {"color": "#80724f", "preview": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAACQAQCdASoQAAwAA4BaJZACdACNStAA/iZ1oeEsDIlvttwZii83ZEdaX/no61uFbFwk8aBLMzWujtDJhfXDR9xzkrY9hhOQBNSIAA=="} },
+  { src: "assets/features/fallen-tree/IMG_0541.jpeg", category: "Feature photos", label: "IMG_0541", width: 1536, height: 2048, placeholder: {"color": "#827754", "preview": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoMABAAA4BaJaACdADZPQl/rYAAzexonXn11l9rwS34tPJWs+yARKbcshCZ3/Wl+q1f1MySZANKQ4pLjf0DKiLHyJKz7A5A1CfgFwAA"} },
+  { src: "assets/features/fallen-tree/IMG_0546.jpeg", category: "Feature photos", label: "IMG_0546", width: 2048, height: 1536, placeholder: {"color": "#677071", "preview": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADwAQCdASoQAAwAA4BaJYwCdAD0OmEoHgAA/ut0iOQ7o7w24idZTgSC7PFz5XebR/s2aEa70FHuTJFt2wb8fK+doNhx6B4jS2OJjnwoxgAAAA=="} },
+  { src: "assets/features/fallen-tree/IMG_0547.jpeg", category: "Feature photos", label: "IMG_0547", width: 2048, height: 1536, placeholder: {"color": "#aec8e6", "preview": "data:image/webp;base64,UklGRk4AAABXRUJQVlA4IEIAAAAwAgCdASoQAAwAA4BaJQBOgCHw/UNCYiRAAAD+1xxwEiztStIe4AikBgqJQoubQiFjS6JJdD1I0jlcY5Ry34wAAAA="} },
+  { src: "assets/features/fallen-tree/IMG_0548.jpeg", category: "Feature photos", label: "IMG_0548", width: 1536, height: 2048, placeholder: {"color": "#686149", "preview": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADwAQCdASoMABAAA4BaJQBOgCB/u4VJAMAA/u5ESZe2k9LufREo1zOkGi+lLpaPvBTHl3Il7uoI/+U2QVaN2TnEmZJerugAAAA="} },
+  { src: "assets/features/fallen-tree/IMG_0549.jpeg", category: "Feature photos", label: "IMG_0549", width: 2048, height: 1536, placeholder: {"color": "#c7d3df", "preview": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAwAgCdASoQAAwAA4BaJYwCdH8AF8ZttNmnzAD+4ao1GCTUXfxEwOWhHreDVfkoSkbnH5msfYoSTihaQsbFIViyCq0ELxJOkM6AAA=="} },
+  { src: "assets/features/fallen-tree/fallentreeee.png", category: "Feature photos", label: "fallentreeee", width: 2048, height: 1536, placeholder: {"color": "#5d5942", "preview": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoQAAwAA4BaJagCdACg/uTa3QAA/r4WdjMG/NSIXDA4rstoLiBOhhz8IRf3FXNlkm01cMoscZcf9rb5vC0aYMuKF6H+NPKKi5oa/i203l0/ymCAAAA="} },
+  { src: "assets/features/giant-chair/148D9450-3A96-41C7-9946-4B9EA60FAE42.jpg", category: "Feature photos", label: "148D9450-3A96-41C7-9946-4B9EA60FAE42", width: 1440, height: 1439, placeholder: {"color": "#779e58", "preview": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADQAQCdASoQABAAA4BaJbACdAywB2LOgAD+5nrKOAgI5X1/gCyS8RDws6U5o/ZSlOOKWIO4Keo9GqJSQ61mtXC88IgzjQNsvJbi+0Q7qVVIbJzUrKfvf/sshRWQAA=="} },
+  { src: "assets/features/giant-chair/C203B05C-FB00-4F26-ABEA-60289584DBFC.jpg", category: "Feature photos", label: "C203B05C-FB00-4F26-ABEA-60289584DBFC", width: 1440, height: 1439, placeholder: {"color": "#7f934a", "preview": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoQABAAA4BaJbACdADG8exfB1FYAAD+8rt1/Zv/lmqYuHFXTlyyiRnh5OL+7zfq9zp3pFyuGI3luQqCxfFJKKFhcSm34AAev/LAF5BvNCMXoIG/M4iLoAAA"} },
+  { src: "assets/features/giant-chair/IMG_0024.jpeg", category: "Feature photos", label: "IMG_0024", width: 2304, height: 1536, placeholder: {"color": "#434d3d", "preview": "data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAAAQAgCdASoQAAsAA4BaJYwCw7DpLyEbwnnAAP7cvm4F7ZPyBEIjfW8osDx5c9+JOqpWlSKhsG/blaMoAAA="} },
+  { src: "assets/features/giant-chair/IMG_0303.jpeg", category: "Feature photos", label: "IMG_0303", width: 2304, height: 1536, placeholder: {"color": "#9a9b6b", "preview": "data:image/webp;base64,UklGRkAAAABXRUJQVlA4IDQAAACwAQCdASoQAAsAA4BaJbACdAEWZlEgAP14KwVp8FphBdABvad4cLCFkLmOr2ceFWkLjtAA"} },
+  { src: "assets/features/giant-chair/IMG_0308.jpeg", category: "Feature photos", label: "IMG_0308", width: 2304, height: 1536, placeholder: {"color": "#717e4e", "preview": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAADQAQCdASoQAAsAA4BaJaAAAgdGUOFKIAD7m2Hb3T4HpHTX8bOGBwqEwbXUwTnh8SlIBrL0Yi1p2f/ZOgnkzgAA"} },
+  { src: "assets/features/giant-chair/IMG_0410.jpeg", category: "Feature photos", label: "IMG_0410", width: 1536, height: 2304, placeholder: {"color": "#7a963e", "preview": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoLABAAA4BaJbACdADObjG6AAD+9mhPCRVpql6DaGZ099SXDa+PVUrC5NuCtPNeXh4LqXwY7qd8S8l9w4J1PgAA"} },
+  { src: "assets/features/giant-chair/IMG_9989.jpeg", category: "Feature photos", label: "IMG_9989", width: 1536, height: 2304, placeholder: {"color": "#86984e", "preview": "data:image/webp;base64,UklGRkQAAABXRUJQVlA4IDgAAAAQAgCdASoLABAAA4BaJbACdADhirbozSpAAP04g5JcGtQmOLqh9wJkXhIz62+iFBc4nOHTtb24AA=="} },
+  { src: "assets/features/hen-henge/14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375.jpg", category: "Feature photos", label: "14E1F2D0-AFD1-4C9F-8811-ED7CB84D6375", width: 1440, height: 1794, placeholder: {"color": "#02052d", "preview": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAQAgCdASoNABAAA4BaJbACdADdSQL3dPaAAP7j6colqINGxkuvfnDWFs72bQy7VM011F4LX3IgwR5iCD4rwP2wVBQ5pDt1rh9TgsAblilM/0RarR7Ly0KQEa371ofBSWBLAAAA"} },
+  { src: "assets/features/hen-henge/IMG_2449.jpeg", category: "Feature photos", label: "IMG_2449", width: 2182, height: 1536, placeholder: {"color": "#777865", "preview": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoQAAsAA4BaJYgCdAC3dLq1bqsgAP2/EF691mqyhG5gKFa18NLeF/r5qmgU98OukR5JBOCJ0Dd5OyMGooBRD1lBFoPAQtSJdb1p0j3Ibld+BQAEkAA="} },
+  { src: "assets/features/hen-henge/chicken house2.png", category: "Feature photos", label: "chicken house2", width: 1460, height: 1258, placeholder: {"color": "#cfdedb", "preview": "data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoQAA4AA4BaJQAAYnRc1CSUVibKgAD9ePlrG/Zsd5ccBa8JGtg6Jos9zbGhPyR3zjiaM/2W4w1ptApgHiPgRzymZ5UKRpGqoKsPubjheLE0FXeAfSAsywAA"} },
+  { src: "assets/features/monkey-puzzle/20231202-_DSF0955.jpg", category: "Feature photos", label: "20231202-_DSF0955", width: 2304, height: 1536, placeholder: {"color": "#828678", "preview": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoQAAsAA4BaJYwCsAEO4cc2UwAA/lX8wL52Xm5icOeX9cKPE5wEWlOqToW2Z+2I//mTP4LxKnsuLW/ry8DCHAAA"} },
+  { src: "assets/features/monkey-puzzle/20231202-_DSF0977.jpg", category: "Feature photos", label: "20231202-_DSF0977", width: 2304, height: 1536, placeholder: {"color": "#99a297", "preview": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAQAgCdASoQAAsAA4BaJYwCsAEXtKk0C84QAP71V7GOezuwmA3CcbLQ56PuPpld3GrlnUm3/6Qyu4Tgp7s8WePBkqEVZfkvpGUZLDXsvyUNH5BbEnWzB3YsOSZnWfXL1QiG4OWhaYC6PAAA"} },
+  { src: "assets/features/mount-scotland/2FD75449-9004-485D-B5BC-8ED282A590AC.jpg", category: "Feature photos", label: "2FD75449-9004-485D-B5BC-8ED282A590AC", width: 1440, height: 1431, placeholder: {"color": "#809e77", "preview": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAwAgCdASoQABAAA4BaJZgCdAD7H1Mn53x1JAD+2FK90ygKBcllDPtJRYlhDCSXE40dqPXgMnn7SO1aCFwqe3mPf2kcy2APTKYbSDfKJltSIYjHCDW+XbRIJWn7HXZCukYZ1gAA"} },
+  { src: "assets/features/mount-scotland/IMG_1580.jpeg", category: "Feature photos", label: "IMG_1580", width: 2048, height: 1536, placeholder: {"color": "#8f875c", "preview": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAwAgCdASoQAAwAA4BaJaACdAEXuQmMRa6IAAD+74pot9d3u3630g5+aF/FYu4wU1o0uStmhkeZLRdMGiZpStzm4Kb/iD5iE2bEkFImROseYRSPzirRIISEAAA="} },
+  { src: "assets/features/old-mill-pond/FC23A0C0-A45A-4A2C-983B-3855571349F5.jpg", category: "Feature photos", label: "FC23A0C0-A45A-4A2C-983B-3855571349F5", width: 1440, height: 1439, placeholder: {"color": "#6b9345", "preview": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAACQAQCdASoQABAAA4BaJbACdABZSwAA999ia7WPqxeRUJ1jea7qNEW0dGucfzv8zhPh7UndQQwIbttezJueP/ewiaWHT9h+pGtv/WNN8zvrfpmKAAA="} },
+  { src: "assets/features/our-sweet-track/IMG_0169.jpeg", category: "Feature photos", label: "IMG_0169", width: 2048, height: 1536, placeholder: {"color": "#6b8c44", "preview": "data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoQAAwAA4BaJbACdAClSqU0AADMl1L6V0QE/9fpWb93brnymm8322zdpBiJXiHBCsDtToKZYdOp8aEno/zhubrrXjde93cAAAA="} },
+  { src: "assets/features/our-sweet-track/IMG_3467.jpeg", category: "Feature photos", label: "IMG_3467", width: 2048, height: 1536, placeholder: {"color": "#758a5f", "preview": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAADwAQCdASoQAAwAA4BaJaACdADPjS/WcgAA/jNOiWD4DXKkF1XpDCOGHkVb4mVolgtmCVHy0mD77UCNXu9O02UWyGKwJYvTqqplDHJk7jAAAA=="} },
+  { src: "assets/features/public-bridleway/IMG_0489.jpeg", category: "Feature photos", label: "IMG_0489", width: 2048, height: 1536, placeholder: {"color": "#9b988f", "preview": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADQAQCdASoQAAwAA4BaJaACdADaPb5ooAD4VAiKWRZiBXhgbIDq/9HKnUSes/lfPn+b/RVIo+eLyKkJsvvzZbgYADo7BAAA"} },
+  { src: "assets/features/public-bridleway/wild path.png", category: "Feature photos", label: "wild path", width: 1536, height: 2304, placeholder: {"color": "#646d44", "preview": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADwAQCdASoLABAAA4BaJaACdADbYcu0jwAA/vWZtNgpAHZVH5QPT4QxB8l2rcXNvAVJCxXoceabo9TPlnizQJcal5bAsGIO3PsWxQ1YEwV5HPRgAAA="} },
+  { src: "assets/features/standing-stones/IMG_0354.jpeg", category: "Feature photos", label: "IMG_0354", width: 2048, height: 1536, placeholder: {"color": "#a4a248", "preview": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACQAQCdASoQAAwAA4BaJbACdACfHzYA/IHZPEkEM8Cc8W4jS033Lqy1PbCm0Nge1fT7up3OI3wv9dh9fjQ/KCETnjeCQXiIAAA="} },
+  { src: "assets/features/standing-stones/IMG_6493.jpeg", category: "Feature photos", label: "IMG_6493", width: 4032, height: 3024, placeholder: {"color": "#415125", "preview": "data:image/webp;base64,UklGRlAAAABXRUJQVlA4IEQAAADwAQCdASoQAAwAA4BaJZgCdACzqZu7PgAA/u3QHSH7zBGixfwRnWWHcyJGzR0wmqv1lRDiftc1aveRoIj/839yzzAAAA=="} },
+  { src: "assets/features/toad-pond/5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A.jpg", category: "Feature photos", label: "5D86463D-7E74-43B8-B0DF-03FC9F8E4E5A", width: 1380, height: 950, placeholder: {"color": "#779760", "preview": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAADQAQCdASoQAAsAA4BaJbACdACZ50pkwAD+yf9f3VhFLs/rPY9nvjqmle7x4MX1pNml2tKOHtex2tHO3nejm707Er+f3PRVd145sf4r227vTLUwfMUr3DyO5Mjel5sDrK78SP8BcEcIjAAA"} },
+  { src: "assets/features/toad-pond/C4B05C76-4B62-4675-A6AF-E6D19827A5D8.jpg", category: "Feature photos", label: "C4B05C76-4B62-4675-A6AF-E6D19827A5D8", width: 1440, height: 1439, placeholder: {"color": "#baa37f", "preview": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAQAgCdASoQABAAA4BaJbACdAEfnzvHJaeAAP7PemX/jLC9GEFROdMi6ajZLClXXpAPKKQ9sU4aNqPdChyHYz6CGBhdOpMfK1XV10pYrTaIyPFzsymjRhC05Kkwj1JuAAA="} },
+  { src: "assets/features/toad-pond/IMG_9728.jpeg", category: "Feature photos", label: "IMG_9728", width: 1536, height: 2048, placeholder: {"color": "#baa17d", "preview": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAABQAgCdASoMABAAA4BaJbACdAEfsnUcBv4/AAAA/kUuUtJ2IO9TWcDU08b5fTEmZLlq/kjuO1HkSazCrcw2QxWL5FFKV4+hoHLFgL7j453LM2N+zEzLPaJgAAA="} },
+  { src: "assets/features/toad-pond/IMG_9732.jpeg", category: "Feature photos", label: "IMG_9732", width: 1536, height: 2048, placeholder: {"color": "#80725a", "preview": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoMABAAA4BaJZACsAYw7Zhp8ItAAP7pkSe9NFRMPHO0Tcigo44x6SzzaXZDtqpcsgF/TC2sW4OyDQreGiDar4PguR8bnJd63KbYyuJZDVg50eGD5kAAAA=="} },
+  { src: "assets/features/toad-pond/IMG_9735.jpeg", category: "Feature photos", label: "IMG_9735", width: 1536, height: 2048, placeholder: {"color": "#a4a48c", "preview": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAADwAQCdASoMABAAA4BaJbACsADZuSmXKMAA/UyNuazVerffBzHvmfTbM4r3JE/z+9wH+kclV/m+aNGeu60AYn5lmpNzuIQqmCCf/mH9d+6wzuI+0+N3tInxqjqAAA=="} },
+  { src: "assets/features/toad-pond/IMG_9739.jpeg", category: "Feature photos", label: "IMG_9739", width: 2048, height: 1536, placeholder: {"color": "#908055", "preview": "data:image/webp;base64,UklGRoIAAABXRUJQVlA4IHYAAABQAgCdASoQAAwAA4BaJbACdAYv1wRVkfq1TgAA/BKZ+weiSejdi2MVSt0CVkn9V5R7j6lxoWg7s/8T/gG1a6gX1YuGYTjSAxnZYoV8L7Ph6S7N5+Ggfr1GQ0/YF97c4zHGnIUVamgEdipMxzeTxTrI3b2JAAAA"} },
+  { src: "assets/features/wild-bees-birds/IMG_1498.jpeg", category: "Feature photos", label: "IMG_1498", width: 2048, height: 1536, placeholder: {"color": "#d1ad7d", "preview": "data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAABQAgCdASoQAAwAA4BaJbACdAEQ0sbyv5Kp18AA+9LCA7u7/VJjGQ10t3ybhq77LXzKrQbWA1yhXJAFymJwa8uRyjAdg9ly76Z34qgksHQAAA=="} },
+  { src: "assets/features/wild-veg-garden/92C76591-099F-4FDB-889B-D5512EEC5F98.jpg", category: "Feature photos", label: "92C76591-099F-4FDB-889B-D5512EEC5F98", width: 1440, height: 1440, placeholder: {"color": "#6a9c73", "preview": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAABQAgCdASoQABAAA4BaJbACdH8AF+m2frG6YTAA/f00GavpdA5nMvTRfikQTgiDlGbygYRGYJkaPREAEjWGwcn5trsvaIY+IWvqCrRm56w1twu20A9Tr5zhVCVD30tEA1gAAA=="} },
+  { src: "assets/features/wild-veg-garden/FCD21189-E7B2-469D-96AC-9FE85FF65F99.jpg", category: "Feature photos", label: "FCD21189-E7B2-469D-96AC-9FE85FF65F99", width: 1440, height: 1440, placeholder: {"color": "#5a985e", "preview": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADwAQCdASoQABAAA4BaJbACdACp9pR5pQAAyz0eRLDY1m0QRqSZAG7F3Zacx9+GxceBisV7Y2FVFydYEiQxcqNMcw1Hs7aQv+LVyWMCl4WhNISDf192sJU/hwNVMtR4AAA="} },
+  { src: "assets/features/wildflower-meadow/732B50B0-1D64-454C-BA6C-A238BC62D60C.jpg", category: "Feature photos", label: "732B50B0-1D64-454C-BA6C-A238BC62D60C", width: 1440, height: 1440, placeholder: {"color": "#598144", "preview": "data:image/webp;base64,UklGRowAAABXRUJQVlA4IIAAAABQAgCdASoQABAAA4BaJbACdAYwxqe21uubEwAAzWcV/sEDXMB0RE/vqvEG+AeKRIFSJwX6xukLusrWJmOKP+iZng6/0EjZclrHtmEL7AWdTPysI7PokXayxx6nbmz2DT+MQLYcqX73rdKmlIviuhHCmfIu8HLtvkAfw7WnsFEsAA=="} },
+  { src: "assets/features/wildflower-meadow/A6E44959-C7D8-4FC1-B056-C04DD70188C9.jpg", category: "Feature photos", label: "A6E44959-C7D8-4FC1-B056-C04DD70188C9", width: 1440, height: 1439, placeholder: {"color": "#3f281e", "preview": "data:image/webp;base64,UklGRpoAAABXRUJQVlA4II4AAAAQAwCdASoQABAAA4BaJbACdFQAuwDeUCIsK5MPBcqhvEAA+6FXnihRT45wOzRmTASaDezS0261URMKJffbtaWlzB4iVDg1ereig+tuzYs49gQjGxQPC6A94kSYFml4MQX2jrIj/2/PE9S51tu8Y1y12XXs74DSFCAU/tZgBT+vubkW1w2vKTCzC5lW5IAA"} },
+  { src: "assets/features/wildflower-meadow/BD612141-B0A2-45EB-AEC9-7DAA87629720.jpg", category: "Feature photos", label: "BD612141-B0A2-45EB-AEC9-7DAA87629720", width: 1440, height: 1440, placeholder: {"color": "#6db0a4", "preview": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoQABAAA4BaJbACdADpg2MwmAD97onK3KauJrI4gtrqlI/ofymBL4zXSs24TvhCu7AToa7qj51s1XSfd5yjVAxgAAA="} },
+  { src: "assets/features/wildflower-meadow/IMG_1707.jpeg", category: "Feature photos", label: "IMG_1707", width: 2048, height: 1536, placeholder: {"color": "#64702d", "preview": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAAAQAgCdASoQAAwAA4BaJbACdADpGZz/q7kAAPvyJxabmz4Oe10S3rliOoJNEHFJRJeZ18U2V7ue6CyGXrQLjD4wzPElrInz7xNV/GVl0O34zFjzjbnH9/Bqy+db5Bla3z5B14AA"} },
+  { src: "assets/features/wildflower-meadow/IMG_1715.jpeg", category: "Feature photos", label: "IMG_1715", width: 1536, height: 2048, placeholder: {"color": "#a2a2b1", "preview": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAAAQAgCdASoMABAAA4BaJYgC7ADceKhU09TAAPzpK1XNdxdHen6bb52OLLvmtVibbDjEE8/a3S3TvbxmAZYMiqFNC1yQw9luQrgAAA=="} },
+  { src: "assets/features/wildflower-meadow/IMG_1813.jpeg", category: "Feature photos", label: "IMG_1813", width: 2048, height: 1536, placeholder: {"color": "#736f65", "preview": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoQAAwAA4BaJbAAAcTA9VQAAMxITSApKOko0fYmT1agDEi1PEvg2Ox4kjwn63UoMVrceSepegrdf18Xk02cn/eMr0xEVo7SXCCIwAAA"} },
+  { src: "assets/features/wildflower-meadow/IMG_9861.jpeg", category: "Feature photos", label: "IMG_9861", width: 2304, height: 1536, placeholder: {"color": "#9aa15d", "preview": "data:image/webp;base64,UklGRkwAAABXRUJQVlA4IEAAAACQAQCdASoQAAsAA4BaJbACdADbsAAAze8dF2sjiSAe6JOU+3c6fYcAGEGew/RuuivY6gApbz7z3fVu+jzk2rAA"} },
+];
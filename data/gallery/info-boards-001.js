@@ -0,0 +1,23 @@
+// Auto-generated by tools/build_gallery_manifest.py
+(window.__HOOKE_GALLERY_CHUNKS__ = window.__HOOKE_GALLERY_CHUNKS__ || {})["info-boards-001"] = [
+  { src: "assets/features/Ichthyosaurus/page-001.png", category: "Info boards", label: "page-001.png", width: 2048, height: 1536, placeholder: {"color": "#494526", "preview": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAAAQAgCdASoQAAwAA4BaJaACdAED81ficLYAAP6i2Shcw5hFAbe9F0mmV51vJh6avoDGtLbwHZkn+P4QtPLltk7AWP7o3y6AAAA="} },
+  { src: "assets/features/barn-owl-box/page-001.png", category: "Info boards", label: "page-001.png", width: 2304, height: 1536, placeholder: {"color": "#526d3a", "preview": "data:image/webp;base64,UklGRlYAAABXRUJQVlA4IEoAAADQAQCdASoQAAsAA4BaJZgCdADOJpD1+AD+pQVdTZltUHTKivMJ3K5Bh26uOUMkad+qGaVxbIS273Gi3AprLu+PGGE1DfI9+RwAAA=="} },
+  { src: "assets/features/dead-hedge/page-001.png", category: "Info boards", label: "page-001.png", width: 2048, height: 1365, placeholder: {"color": "#5e5b4b", "preview": "data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoQAAsAA4BaJaACdAEUhXmGtxQAAP5KDrDOZor+M2evSUjpErFvneFe8ZCjw+Uye+PROIN0MVMKr4rnJ6N5hXp0TS0mAAAA"} },
+  { src: "assets/features/fallen-tree/page-001.png", category: "Info boards", label: "page-001.png", width: 2048, height: 1536, placeholder: {"color": "#495042", "preview": "data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAwAgCdASoQAAwAA4BaJaACdAEWmJWuhBfMAAD+Cd/R2OwhTVTnncVJa/7QzxuPRQIQ0+d7axST8NwMjAXH9NDpjwTi5sg9iCcYs7Vbse1vAZd9HWF+U+ZQ3KiyKdXysHsctFQs2f/1t3AAAAA="} },
+  { src: "assets/features/giant-chair/page-001.png", category: "Info boards", label: "page-001.png", width: 2000, height: 1333, placeholder: {"color": "#566824", "preview": "data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAABQAgCdASoQAAsAA4BaJbACdAEfZuarQ+Uz9YAA/oh4kVE+uzeXu2F0KtNzybP7L0puwLjffzfC08UNPvBp5KkQMK7d+YtbSYTi5doL1SzvO3sVwAA="} },
+  { src: "assets/features/green-roof/page-001.png", category: "Info boards", label: "page-001.png", width: 1536, height: 2304, placeholder: {"color": "#736f6b", "preview": "data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAACQAQCdASoLABAAA4BaJQAAP/67MQAA+49qsLr/KgloGORmvysCA7YGBbPVk4dbv8RxdociD760gsbW2lDmtQ+48XJoxfaQYAA="} },
+  { src: "assets/features/hen-henge/page-001.png", category: "Info boards", label: "page-001.png", width: 1692, height: 2048, placeholder: {"color": "#746341", "preview": "data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoNABAAA4BaJbACdACmA7XFQh4AAPeda3+CYU4lZ0n46BTI4/sdvLXLQmmzk1yZChFhlncWlNwl7famJsH+ydZzZwwIt+VtOX2gwo6rA1b6Q2ZkAAA="} },
+  { src: "assets/features/hibernaculum/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1132, placeholder: {"color": "#eab626", "preview": "data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQAgCdASoQAAsAA4BaJbACdDBWgURKDc4AAP6ztNcGZoHN9vZ5nH3WvV6t1ZhAPYJ6hA6bct1nFW8stk6rqccKz/CiyGEH9v6fD10Dmq37ntZk/0Y333K5QoDpt0B7a9xrP3sq/ev5Epp4aMAAAA=="} },
+  { src: "assets/features/insect-homes/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1280, placeholder: {"color": "#73652e", "preview": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAABQAgCdASoQAA0AA4BaJbACdAELYy8n9jtXsAAA/rLgKQiIW0YOWO53iomkDerZo6gUdHrsAf0Mses69vzIfP1c6tMG5CiN1x1QDkp38WEu/f/DDq/4uK7GY4w32ydBf/CifdrQ2qT+fhsttkN3SAAA"} },
+  { src: "assets/features/monkey-puzzle/page-001.png", category: "Info boards", label: "page-001.png", width: 1536, height: 2048, placeholder: {"color": "#82923c", "preview": "data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAADwAQCdASoMABAAA4BaJbAAAveG/KvpIWAA/tUWsVV9KnV1ENLOgMXaufmYpmOvdbsB+vEE1ffFf5nIC7X4UhB7/3DOYAAA"} },
+  { src: "assets/features/mount-scotland/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1280, placeholder: {"color": "#1a2527", "preview": "data:image/webp;base64,UklGRoQAAABXRUJQVlA4IHgAAABQAgCdASoQAA0AA4BaJbACdDBKQZB3MrjazQAA4DQtKOJUMf3oHz2S879EMG1VoH9lVYxvjQ2N9OtcEaEPYOQYwxu55CjVRfH08f35A0P1ZLUkMFAMbI7voH21FsIVaukD1pAP+A0xwVz7d95ChnMfgPtnfkiwAAA="} },
+  { src: "assets/features/old-mill-pond/page-001.png", category: "Info boards", label: "page-001.png", width: 2048, height: 1536, placeholder: {"color": "#455c2a", "preview": "data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAwAgCdASoQAAwAA4BaJagCsADp/00fiFEKAAD+NF2vS1GM4JMe2RdfV4Jly6AIENKka71ZNlmjXU2qayqNrt+vR3W6uzBT5X4Ru4LaixNdAAAA"} },
+  { src: "assets/features/our-sweet-track/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1132, placeholder: {"color": "#2f2a12", "preview": "data:image/webp;base64,UklGRnwAAABXRUJQVlA4IHAAAAAwAgCdASoQAAsAA4BaJbACdAEem7Enf/iIYAD+heijktQtzkOqO7DEAtHNP19lrXa+0oetz3c8zHywxWGvq9khBAeJ7ws8GaC+DUn3TuU0/s8miVL3cWk3yUnl/0qZ7rXe81ssHp1EVMdm3z+GgAAA"} },
+  { src: "assets/features/public-bridleway/page-001.png", category: "Info boards", label: "page-001.png", width: 1536, height: 2048, placeholder: {"color": "#5b7464", "preview": "data:image/webp;base64,UklGRmgAAABXRUJQVlA4IFwAAAAQAgCdASoMABAAA4BaJbACdEf/gefu5lqAAP4nbDYucLH2VCS4OSdWeGtSd42ZP9RCYoPOI59KNzByGBX7T5iEv1nYnx/J6/Ezoasb3m/aVPvtACYF7zcsjMLAAA=="} },
+  { src: "assets/features/rats/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1132, placeholder: {"color": "#f8b401", "preview": "data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoQAAsAA4BaJbACdDiAAMhaUAwA/sQSVZUvetWMUGcaOCFhFvGykioVhqVThu62skPGTnsxHwE7T/82/wPkxc9nQVfIFX9LX0tebZIE7ljBp/IoQB+p0/97KOAAAA=="} },
+  { src: "assets/features/standing-stones/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1280, placeholder: {"color": "#4b5932", "preview": "data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAABwAgCdASoQAA0AA4BaJbACdA/ABGjYNIBgLgAAAPjf4PcF2WVS73aN4knft7Vb1BTzN/b57i/1psaMXOWa0Aah+JhJO/1xXbdQA38v6OfzIZrA3RYegOJ+tOHc2D9JfAl/NxOd8IeFCQAA"} },
+  { src: "assets/features/the-bat-egg/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1132, placeholder: {"color": "#53574e", "preview": "data:image/webp;base64,UklGRoYAAABXRUJQVlA4IHoAAACwAQCdASoQAAsAA4BaJbACdAEH/VwAAP7mzO6pSOG8yiCJ061FAa4J4A5jAk9QK75hb4jG+hsztSfLFUfazTSN9/r25M8R2CytUVAyKQuSW6bXn/+FHHj/GT/PfbpOtOlJb96gnAxLsPvXIMVVqqgQOl776V2UumQAAA=="} },
+  { src: "assets/features/tree-lith/page-001.png", category: "Info boards", label: "page-001.png", width: 1440, height: 1440, placeholder: {"color": "#898d53", "preview": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAABQAgCdASoQABAAA4BaJbACdH8AGXz3CBURroAA+WmSHP4ALAfMHgaPcHiEmJJ/uRw0el1I7jjHXQNXv/2YitX05d4PWsh5EfdJ3Mg9Y/2hzPka52Brva5DrxFly1wAAAA="} },
+  { src: "assets/features/wild-bees-birds/page-001.png", category: "Info boards", label: "page-001.png", width: 1600, height: 1132, placeholder: {"color": "#f7b301", "preview": "data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAACwAQCdASoQAAsAA4BaJbACdADGWxLYAP7D4e1EtHbHV6tSC33zWlJ+YBBsJJD3PH8HrTAMOjCafzb8gartb0bv8aYQ//neREY7oKQoKl/2uWWU7kbL98/dWj5n5DSNAAA="} },
+  { src: "assets/features/wild-veg-garden/page-001.png", category: "Info boards", label: "page-001.png", width: 1440, height: 1439, placeholder: {"color": "#81aa67", "preview": "data:image/webp;base64,UklGRnAAAABXRUJQVlA4IGQAAADQAQCdASoQABAAA4BaJbACdAYw7EbyoAD8jtCCsYXV2+1IKxttsHqvhs7JMNjiBNwpLzS4uBURSEACgYbw3YZIpukFoRIF5x1N8iIe1gWk9ov8c2ezZ1odFJZ5ozmmRGKK1AAA"} },
+];
@@ -15,8 +15,15 @@ function escapeHtml(s) {
     .replaceAll("'", "&#039;");
 }
 
-function normalize(s) {
-  return String(s || "").toLowerCase().trim();
+function placeholderCss(ph) {
+  // Dominant colour + tiny preview from the build, painted under the <img> until the real image covers it.
+  if (!ph || typeof ph.color !== "string") return "";
+  return ph.preview ? `${ph.color} url(${ph.preview}) center / cover no-repeat` : ph.color;
+}
+
+function placeholderStyle(ph) {
+  const css = placeholderCss(ph);
+  return css ? ` style="background:${escapeHtml(css)}"` : "";
 }
 
 function escapeRegExp(s) {
@@ -41,9 +48,32 @@ function unique(arr) {
   return Array.from(new Set(arr));
 }
 
+// Tokenization must match tools/search_index.py (the build-time index).
+function searchTokens(s) {
+  return String(s || "")
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .toLowerCase()
+    .replace(/['’]/g, "")
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean);
+}
+
+function lowerBound(sorted, key) {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (sorted[mid] < key) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
 function main() {
   const data = window.__DORSET_GUIDE__;
-  if (!data || !Array.isArray(data.species)) {
+  // The search index and filter bitsets come from tools/build_field_guide.py.
+  if (!data || !Array.isArray(data.species) || !data.searchIndex || !data.facets) {
     document.body.innerHTML = "<div style='padding:24px;font-family:system-ui'>Missing Dorset guide data.</div>";
     return;
   }
@@ -75,6 +105,51 @@ function main() {
 
   const state = { q: "", groups: new Set(), habitats: new Set(), seasons: new Set() };
 
+  // Filtering works on bitsets over species numbers (bit n % 32 of word n >> 5): one per
+  // search term and one per filter chip, so a query is binary searches plus bitwise ANDs.
+  const { terms, postings } = data.searchIndex;
+  const bitWords = (data.species.length + 31) >>> 5;
+  const facetBits = {};
+  Object.entries(data.facets).forEach(([facet, byKey]) => {
+    facetBits[facet] = new Map(Object.entries(byKey).map(([k, words]) => [k, Uint32Array.from(words)]));
+  });
+  const tokenBits = new Map(); // query token -> species with a term starting with it
+
+  function bitsForToken(tok) {
+    if (!tokenBits.has(tok)) {
+      const bits = new Uint32Array(bitWords);
+      for (let i = lowerBound(terms, tok); i < terms.length && terms[i].startsWith(tok); i++) {
+        postings[i].forEach((n) => (bits[n >>> 5] |= 1 << (n & 31)));
+      }
+      tokenBits.set(tok, bits);
+    }
+    return tokenBits.get(tok);
+  }
+
+  function facetUnion(facet, keys) {
+    // Chips within one filter are alternatives (OR); the filters combine with AND.
+    const bits = new Uint32Array(bitWords);
+    keys.forEach((k) => {
+      const words = facetBits[facet].get(k);
+      if (words) for (let i = 0; i < bitWords; i++) bits[i] |= words[i];
+    });
+    return bits;
+  }
+
+  function matchingBits() {
+    // null when nothing is filtered.
+    let bits = null;
+    const and = (other) => {
+      if (!bits) bits = Uint32Array.from(other);
+      else for (let i = 0; i < bitWords; i++) bits[i] &= other[i];
+    };
+    searchTokens(state.q).forEach((tok) => and(bitsForToken(tok)));
+    if (state.groups.size) and(facetUnion("group", state.groups));
+    if (state.habitats.size) and(facetUnion("habitat", state.habitats));
+    if (state.seasons.size) and(facetUnion("season", state.seasons));
+    return bits;
+  }
+
   function updateClearVisibility() {
     const hasActive =
       !!String(state.q || "").trim() ||
@@ -84,28 +159,6 @@ function main() {
     $clear.hidden = !hasActive;
   }
 
-  function matches(s) {
-    const q = normalize(state.q);
-    const hay = normalize(
-      [
-        s.commonName,
-        s.scientificName,
-        s.group,
-        (s.habitats || []).join(" "),
-        (s.notes || ""),
-        (s.watchFor || []).join(" "),
-      ].join(" ")
-    );
-    const qOk = !q || hay.includes(q);
-    const gOk = state.groups.size === 0 || state.groups.has(s.group);
-    const hOk = state.habitats.size === 0 || (s.habitats || []).some((h) => state.habitats.has(h));
-    const seasonOk =
-      state.seasons.size === 0 ||
-      (s.seasonality &&
-        Object.keys(s.seasonality).some((k) => state.seasons.has(k) && String(s.seasonality[k] || "").trim() !== ""));
-    return qOk && gOk && hOk && seasonOk;
-  }
-
   function renderFilters() {
     $groups.innerHTML = groups
       .map((g) => {
@@ -138,7 +191,8 @@ function main() {
   }
 
   function renderGrid() {
-    const filtered = data.species.filter(matches);
+    const bits = matchingBits();
+    const filtered = bits ? data.species.filter((_, n) => bits[n >>> 5] & (1 << (n & 31))) : data.species;
     $meta.textContent = `${filtered.length} item${filtered.length === 1 ? "" : "s"}`;
 
     if (filtered.length === 0) {
@@ -159,7 +213,7 @@ function main() {
         return `<article class="fg-card is-clickable" role="button" tabindex="0" data-species-id="${escapeHtml(s.id)}" aria-label="Open details for ${escapeHtml(
           s.commonName
         )}">
-          <img class="fg-card__img" src="./${escapeHtml(cover)}" alt="" loading="lazy" onerror="this.src='./assets/field-guide/placeholder.svg'" />
+          <img class="fg-card__img" src="./${escapeHtml(cover)}" alt="" loading="lazy"${placeholderStyle(s.cover && s.cover.placeholder)} onerror="this.src='./assets/field-guide/placeholder.svg'" />
           <div class="fg-card__head">
             <div class="fg-card__title">${highlight(s.commonName, q)}</div>
             <div class="fg-card__meta">
@@ -199,6 +253,9 @@ function main() {
     $speciesModalTitle.innerHTML = `${highlight(s.commonName, q)}${
       s.scientificName ? ` <span class="muted" style="font-weight:400"><em>${highlight(s.scientificName, q)}</em></span>` : ""
     }`;
+    const ph = placeholderCss(s.cover && s.cover.placeholder);
+    $speciesModalImg.style.background = ph;
+    if (ph) $speciesModalImg.addEventListener("load", () => ($speciesModalImg.style.background = ""), { once: true });
     $speciesModalImg.src = `./${cover}`;
     $speciesModalImg.alt = `${s.commonName} cover photo`;
     if (s.cover && (s.cover.sourceUrl || s.cover.license || s.cover.artist)) {
@@ -19,9 +19,70 @@ function escapeHtml(s) {
     .replaceAll("'", "&#039;");
 }
 
+function pictureHtml(srcset, sizes, imgHtml) {
+  // Wrap an <img> in <picture> with AVIF/WebP sources from the manifest's `srcset` data.
+  if (!srcset) return imgHtml;
+  const sources = ["avif", "webp"]
+    .filter((fmt) => srcset[fmt])
+    .map((fmt) => `<source type="image/${fmt}" srcset="${escapeHtml(srcset[fmt])}" sizes="${escapeHtml(sizes || "100vw")}" />`)
+    .join("");
+  return `<picture class="pic">${sources}${imgHtml}</picture>`;
+}
+
+function sizeAttrs(item) {
+  // Intrinsic width/height from the build (header-probed) so the browser can reserve the box before load.
+  const w = item && Number(item.width);
+  const h = item && Number(item.height);
+  return w > 0 && h > 0 ? ` width="${w}" height="${h}"` : "";
+}
+
+function placeholderCss(ph) {
+  // Dominant colour + tiny preview from the build, painted under the <img> until the real image covers it.
+  if (!ph || typeof ph.color !== "string") return "";
+  return ph.preview ? `${ph.color} url(${ph.preview}) center / cover no-repeat` : ph.color;
+}
+
+function placeholderStyle(ph) {
+  const css = placeholderCss(ph);
+  return css ? ` style="background:${escapeHtml(css)}"` : "";
+}
+
+function setSizeAttrs(img, item) {
+  const w = item && Number(item.width);
+  const h = item && Number(item.height);
+  if (w > 0 && h > 0) {
+    img.width = w;
+    img.height = h;
+  } else {
+    img.removeAttribute("width");
+    img.removeAttribute("height");
+  }
+}
+
+function loadScript(src) {
+  // JSONP-style loading for generated data chunks: works over http(s) and file:// alike.
+  return new Promise((resolve) => {
+    const s = document.createElement("script");
+    s.src = src;
+    s.async = true;
+    s.onload = () => {
+      s.remove();
+      resolve(true);
+    };
+    s.onerror = () => {
+      s.remove();
+      resolve(false);
+    };
+    document.head.appendChild(s);
+  });
+}
+
+// Rows rendered above and below the viewport, so fast scrolling rarely shows an empty band.
+const OVERSCAN_ROWS = 3;
+
 function main() {
   const data = window.__HOOKE_GALLERY__;
-  if (!data || !Array.isArray(data.images)) {
+  if (!data || !Array.isArray(data.categories)) {
     document.body.innerHTML =
       "<div style='padding:24px;font-family:system-ui'>Missing gallery manifest. Expected window.__HOOKE_GALLERY__.</div>";
     return;
@@ -41,13 +102,93 @@ function main() {
 
   const state = { q: "", cats: new Set() };
 
-  const categories = Array.from(new Set(data.images.map((im) => im.category))).sort((a, b) => a.localeCompare(b));
+  // The manifest only lists categories, counts and chunk URLs; each category's images fill in
+  // (by position) as its chunks arrive, so nothing is fetched for pages nobody scrolls to.
+  const chunkSize = Math.max(1, Number(data.chunkSize) || 1);
+  const groups = data.categories.map((c) => {
+    const count = Math.max(0, Number(c.count) || 0);
+    return {
+      name: String(c.name),
+      count,
+      chunks: Array.isArray(c.chunks) ? c.chunks : [],
+      items: new Array(count),
+      hay: new Array(count),
+      settled: new Set(), // chunk numbers loaded (or failed): never requested twice
+    };
+  });
+  const chunkLoads = new Map();
+
+  const categories = groups.map((g) => g.name).sort((a, b) => a.localeCompare(b));
+
+  let view = null;
+  let rendered = "";
+  let frame = 0;
+  let rebuildNext = false;
 
-  function matches(im) {
+  function loadChunk(g, n) {
+    const url = g.chunks[n];
+    if (!url || g.settled.has(n)) return;
+    if (chunkLoads.has(url)) return;
+    const key = url.split("?")[0].split("/").pop().replace(/\.js$/, "");
+    chunkLoads.set(
+      url,
+      loadScript(`./${url}`).then(() => {
+        const loaded = window.__HOOKE_GALLERY_CHUNKS__ || {};
+        const list = Array.isArray(loaded[key]) ? loaded[key] : [];
+        delete loaded[key];
+        list.forEach((im, i) => {
+          const j = n * chunkSize + i;
+          if (j >= g.count) return;
+          g.items[j] = im;
+          g.hay[j] = `${normalize(im.src)}\n${normalize(im.label || "")}`;
+        });
+        g.settled.add(n);
+        chunkLoads.delete(url);
+        schedule(true);
+      })
+    );
+  }
+
+  function buildView() {
+    // A view is { total, pending, at(i) }: the filtered list, addressed by position.
+    const active = groups.filter((g) => state.cats.size === 0 || state.cats.has(g.name));
     const q = normalize(state.q);
-    const catOk = state.cats.size === 0 || state.cats.has(im.category);
-    const qOk = !q || normalize(im.src).includes(q) || normalize(im.label || "").includes(q);
-    return catOk && qOk;
+    if (!q) {
+      // Counts come from the manifest, so the full length is known before any chunk loads.
+      const starts = [];
+      let total = 0;
+      active.forEach((g) => {
+        starts.push(total);
+        total += g.count;
+      });
+      return {
+        total,
+        pending: false,
+        at(i) {
+          let k = active.length - 1;
+          while (k > 0 && starts[k] > i) k -= 1;
+          const g = active[k];
+          const j = i - starts[k];
+          if (!g.items[j]) loadChunk(g, Math.floor(j / chunkSize));
+          return g.items[j] || null;
+        },
+      };
+    }
+    // Searching needs every page of the active categories: match what has arrived, refine as the rest lands.
+    const results = [];
+    let pending = false;
+    active.forEach((g) => {
+      g.chunks.forEach((_url, n) => {
+        if (!g.settled.has(n)) {
+          pending = true;
+          loadChunk(g, n);
+        }
+      });
+      for (let j = 0; j < g.count; j += 1) {
+        if (g.hay[j] && g.hay[j].includes(q)) results.push(g.items[j]);
+      }
+    });
+    return { total: results.length, pending, at: (i) => results[i] || null };
   }
 
   function renderCats() {
@@ -64,33 +205,113 @@ function main() {
     $clear.hidden = state.cats.size === 0 && !String(state.q || "").trim();
   }
 
+  function gridLayout() {
+    // Column count and row pitch straight from the CSS grid, so the breakpoints in styles.css stay the only source.
+    const cs = window.getComputedStyle($grid);
+    const cols = Math.max(1, String(cs.gridTemplateColumns || "").split(" ").filter(Boolean).length);
+    const gap = parseFloat(cs.rowGap) || 0;
+    const card = $grid.querySelector(".gal-card");
+    const colWidth = ($grid.clientWidth - gap * (cols - 1)) / cols;
+    const cardHeight = card ? card.getBoundingClientRect().height : colWidth * 0.75 + 2;
+    return { cols, rowHeight: Math.max(1, cardHeight + gap) };
+  }
+
+  function cardHtml(im, idx) {
+    if (!im) {
+      return `<article class="gal-card gal-card--loading" aria-hidden="true"><div class="gal-card__img"></div></article>`;
+    }
+    const label = im.label || im.src.split("/").pop();
+    return `<article class="gal-card" role="button" tabindex="0" data-gal-idx="${escapeHtml(String(idx))}" aria-label="Open image ${escapeHtml(
+      label
+    )}" data-gal-category="${escapeHtml(im.category)}">
+          ${pictureHtml(im.srcset, data.sizes, `<img class="gal-card__img" src="${escapeHtml(im.src)}" alt="" loading="lazy"${sizeAttrs(im)}${placeholderStyle(im.placeholder)} />`)}
+        </article>`;
+  }
+
+  function renderWindow(force) {
+    // Only the rows around the viewport exist in the DOM; padding stands in for the rest,
+    // so DOM size stays the same whether the archive holds a hundred images or ten thousand.
+    const { cols, rowHeight } = gridLayout();
+    const rows = Math.ceil(view.total / cols);
+    const above = -$grid.getBoundingClientRect().top;
+    const visible = Math.ceil(window.innerHeight / rowHeight) + 2 * OVERSCAN_ROWS;
+    // Clamped to the last screenful, so a filter that shortens the page while scrolled down still shows its rows.
+    const first = Math.max(0, Math.min(Math.floor(above / rowHeight) - OVERSCAN_ROWS, rows - visible));
+    const last = Math.min(rows, first + visible);
+    const start = first * cols;
+    const end = Math.min(view.total, last * cols);
+    const key = `${start}:${end}:${cols}`;
+    if (!force && key === rendered) return;
+    rendered = key;
+
+    const focused = document.activeElement && document.activeElement.closest && document.activeElement.closest("[data-gal-idx]");
+    const focusedIdx = focused && $grid.contains(focused) ? focused.dataset.galIdx : null;
+
+    $grid.style.paddingTop = `${first * rowHeight}px`;
+    $grid.style.paddingBottom = `${(rows - last) * rowHeight}px`;
+    const html = [];
+    for (let i = start; i < end; i += 1) html.push(cardHtml(view.at(i), i));
+    $grid.innerHTML = html.join("");
+
+    if (focusedIdx !== null) {
+      const again = $grid.querySelector(`[data-gal-idx="${focusedIdx}"]`);
+      if (again) again.focus({ preventScroll: true });
+    }
+  }
+
   function renderGrid() {
-    const filtered = data.images.filter(matches);
-    $meta.textContent = `${filtered.length} image${filtered.length === 1 ? "" : "s"}`;
+    view = buildView();
+    const n = view.total;
+    $meta.textContent = `${n} image${n === 1 ? "" : "s"}${view.pending ? " (searching…)" : ""}`;
 
-    if (filtered.length === 0) {
-      $grid.innerHTML = `<div class="panel" style="grid-column:1 / -1">
+    if (n === 0) {
+      rendered = "";
+      $grid.style.paddingTop = "";
+      $grid.style.paddingBottom = "";
+      $grid.innerHTML = view.pending
+        ? ""
+        : `<div class="panel" style="grid-column:1 / -1">
         <div class="panel__title">No matches</div>
         <div class="panel__meta">Try clearing filters or using a shorter search.</div>
       </div>`;
       return;
     }
+    renderWindow(true);
+  }
 
-    $grid.innerHTML = filtered
-      .map((im, idx) => {
-        const label = im.label || im.src.split("/").pop();
-        return `<article class="gal-card" role="button" tabindex="0" data-gal-idx="${escapeHtml(String(idx))}" aria-label="Open image ${escapeHtml(
-          label
-        )}" data-gal-category="${escapeHtml(im.category)}">
-          <img class="gal-card__img" src="${escapeHtml(im.src)}" alt="" loading="lazy" />
-        </article>`;
-      })
-      .join("");
+  function schedule(rebuild) {
+    // Coalesce scroll/resize/chunk arrivals into one update per frame.
+    rebuildNext = rebuildNext || rebuild;
+    if (frame) return;
+    frame = window.requestAnimationFrame(() => {
+      frame = 0;
+      const rebuild = rebuildNext;
+      rebuildNext = false;
+      if (rebuild) renderGrid();
+      else if (view && view.total > 0) renderWindow(false);
+    });
+  }
+
+  function cardItem(card) {
+    const idx = Number(card.dataset.galIdx);
+    return view && Number.isInteger(idx) ? view.at(idx) : null;
   }
 
   function openModalFor(im) {
     const label = im.label || im.src.split("/").pop();
     $modalTitle.textContent = label;
+    if (im.srcset && im.srcset.webp) {
+      $modalImg.srcset = im.srcset.webp;
+      $modalImg.sizes = "100vw";
+    } else {
+      $modalImg.removeAttribute("srcset");
+      $modalImg.removeAttribute("sizes");
+    }
+    setSizeAttrs($modalImg, im);
+    const ph = placeholderCss(im.placeholder);
+    $modalImg.style.background = ph;
+    // The lightbox letterboxes (object-fit: contain), so drop the preview once the photo is in.
+    if (ph) $modalImg.addEventListener("load", () => ($modalImg.style.background = ""), { once: true });
     $modalImg.src = im.src;
     $modalImg.alt = label;
     $modalCap.textContent = `${im.category} · ${im.src}`;
@@ -129,9 +350,7 @@ function main() {
 
     const card = e.target.closest("[data-gal-idx]");
     if (card) {
-      const idx = Number(card.dataset.galIdx);
-      const filtered = data.images.filter(matches);
-      const im = filtered[idx];
+      const im = cardItem(card);
       if (im) openModalFor(im);
     }
   });
@@ -140,12 +359,13 @@ function main() {
     if (e.key !== "Enter") return;
     const card = document.activeElement && document.activeElement.closest && document.activeElement.closest("[data-gal-idx]");
     if (!card) return;
-    const idx = Number(card.dataset.galIdx);
-    const filtered = data.images.filter(matches);
-    const im = filtered[idx];
+    const im = cardItem(card);
     if (im) openModalFor(im);
   });
 
+  window.addEventListener("scroll", () => schedule(false), { passive: true });
+  window.addEventListener("resize", () => schedule(false));
+
   $modalClose.addEventListener("click", () => $modal.close());
   $modal.addEventListener("click", (e) => {
     if (e.target === $modal) $modal.close();
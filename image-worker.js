@@ -0,0 +1,37 @@
+/* global self, createImageBitmap, OffscreenCanvas */
+
+// Downscales admin-uploaded photos off the main thread (see saveUpload() in app.js).
+// Message in: { id, file, maxEdge, quality }. Out: { id, blob, width, height, scaled } or
+// { id, error, unsupported } — app.js then does the same work on the main thread.
+
+function fitWithin(width, height, maxEdge) {
+  const scale = Math.min(1, maxEdge / Math.max(width, height));
+  return { width: Math.max(1, Math.round(width * scale)), height: Math.max(1, Math.round(height * scale)), scaled: scale < 1 };
+}
+
+async function downscale(file, maxEdge, quality) {
+  const bitmap = await createImageBitmap(file, { imageOrientation: "from-image" });
+  const size = fitWithin(bitmap.width, bitmap.height, maxEdge);
+  const canvas = new OffscreenCanvas(size.width, size.height);
+  const ctx = canvas.getContext("2d");
+  ctx.imageSmoothingQuality = "high";
+  ctx.drawImage(bitmap, 0, 0, size.width, size.height);
+  bitmap.close();
+  let blob = await canvas.convertToBlob({ type: "image/webp", quality });
+  // Browsers without a WebP encoder hand back PNG; JPEG is far smaller for photos.
+  if (blob.type !== "image/webp") blob = await canvas.convertToBlob({ type: "image/jpeg", quality });
+  return { blob, ...size };
+}
+
+self.addEventListener("message", async (e) => {
+  const { id, file, maxEdge, quality } = e.data || {};
+  if (typeof OffscreenCanvas === "undefined" || typeof createImageBitmap !== "function") {
+    self.postMessage({ id, error: "OffscreenCanvas is not supported", unsupported: true });
+    return;
+  }
+  try {
+    self.postMessage({ id, ...(await downscale(file, maxEdge, quality)) });
+  } catch (err) {
+    self.postMessage({ id, error: String((err && err.message) || err) });
+  }
+});
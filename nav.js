@@ -1,4 +1,25 @@
-/* global window, document */
+/* global window, document, navigator */
+
+// Offline support: register the generated service worker (see tools/build_service_worker.py).
+// Only where the published pages say one was built (tools/fingerprint_assets.py adds the
+// <meta name="hooke-sw"> tag), only over http(s) — service workers don't exist for file:// pages —
+// and never on localhost, where a worker would keep serving stale copies of the files being edited.
+(function () {
+  if (!("serviceWorker" in navigator) || !/^https?:$/.test(window.location.protocol)) return;
+  const host = window.location.hostname;
+  if (host === "localhost" || host.endsWith(".localhost") || host === "127.0.0.1" || host === "[::1]") {
+    // Drop a worker left over from testing a published build on this origin.
+    navigator.serviceWorker.getRegistrations().then((regs) => regs.forEach((r) => r.unregister()), () => {});
+    return;
+  }
+  const meta = document.querySelector('meta[name="hooke-sw"]');
+  if (!meta || !meta.content) return;
+  window.addEventListener("load", () => {
+    navigator.serviceWorker.register(meta.content).catch(() => {
+      // ignore (e.g. blocked by the browser's privacy settings)
+    });
+  });
+})();
 
 (function () {
   function qs(sel, root) {
@@ -0,0 +1,20 @@
+from asset_catalog import AssetCatalog
+
+
+def test_get_finds_files_by_path_and_follows_rescans(tmp_path):
+    folder = tmp_path / "assets" / "gallery"
+    folder.mkdir(parents=True)
+    for n in range(2000):
+        (folder / f"IMG_{n:04d}.jpg").write_bytes(b"x" * (n % 7))
+    cat = AssetCatalog.scan(tmp_path)
+
+    assert cat.get("assets/gallery/IMG_1999.jpg").size == 1999 % 7
+    assert cat.get("assets/gallery/missing.jpg") is None
+    assert cat.get("assets/nowhere/IMG_0001.jpg") is None
+    assert [e.name for e in cat.files("assets/gallery")][:2] == ["IMG_0000.jpg", "IMG_0001.jpg"]
+
+    (folder / "IMG_0000.jpg").unlink()
+    (folder / "new.png").write_bytes(b"png")
+    cat.rescan_folder("assets/gallery")
+    assert cat.get("assets/gallery/IMG_0000.jpg") is None
+    assert cat.get("assets/gallery/new.png").size == 3
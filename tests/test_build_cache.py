@@ -0,0 +1,96 @@
+import os
+
+import build_cache
+from build_cache import BuildCache, sha256_file, signature, write_if_changed
+
+
+def counting_sha(monkeypatch) -> list:
+    calls = []
+
+    def sha(path, *args):
+        calls.append(path.name)
+        return sha256_file(path, *args)
+
+    monkeypatch.setattr(build_cache, "sha256_file", sha)
+    return calls
+
+
+def test_file_hash_is_reused_until_size_or_mtime_moves(tmp_path, monkeypatch):
+    calls = counting_sha(monkeypatch)
+    path = tmp_path / "a.txt"
+    path.write_text("one")
+    cache = BuildCache(tmp_path)
+
+    first = cache.file_hash(path)
+    assert cache.file_hash(path) == first
+    assert calls == ["a.txt"]
+
+    # Same size, new mtime: rehashed.
+    path.write_text("two")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = cache.file_hash(path)
+    assert second != first
+    assert calls == ["a.txt", "a.txt"]
+
+    # New size: rehashed.
+    path.write_text("three")
+    assert cache.fingerprint(path) == f"5:{sha256_file(path)}"
+    assert len(calls) == 3
+
+
+def test_unchanged_stat_trusts_the_recorded_hash(tmp_path, monkeypatch):
+    calls = counting_sha(monkeypatch)
+    (tmp_path / "a.txt").write_text("one")
+    cache = BuildCache(tmp_path)
+    st = (tmp_path / "a.txt").stat()
+    digest = cache.content_hash("a.txt", st.st_size, st.st_mtime_ns)
+    assert cache.entry_fingerprint("a.txt", st.st_size, st.st_mtime_ns) == f"3:{digest}"
+    assert cache.entry_fingerprint("a.txt", st.st_size, st.st_mtime_ns + 1) == f"3:{digest}"
+    assert len(calls) == 2
+
+
+def test_save_round_trip_and_pruning(tmp_path):
+    (tmp_path / "keep.txt").write_text("keep")
+    (tmp_path / "gone.txt").write_text("gone")
+    cache = BuildCache(tmp_path)
+    keep, gone = cache.file_hash(tmp_path / "keep.txt"), cache.file_hash(tmp_path / "gone.txt")
+    cache.put("step", "key", {"n": 1})
+    cache.content_put("dims", keep, [1, 2])
+    cache.content_put("dims", gone, [3, 4])
+    (tmp_path / "gone.txt").unlink()
+    cache.save()
+
+    loaded = BuildCache(tmp_path)
+    assert set(loaded.files) == {"keep.txt"}
+    assert loaded.get("step", "key") == {"n": 1}
+    assert loaded.content_get("dims", keep) == [1, 2]
+    assert loaded.content_get("dims", gone) is None
+
+    mtime = loaded.path.stat().st_mtime_ns
+    loaded.put("step", "key", {"n": 1})
+    loaded.save()
+    assert loaded.path.stat().st_mtime_ns == mtime
+
+
+def test_other_cache_versions_are_ignored(tmp_path):
+    cache = BuildCache(tmp_path)
+    cache.put("step", "key", 1)
+    cache.save()
+    cache.path.write_text(cache.path.read_text().replace(f'"version":{build_cache.CACHE_VERSION}', '"version":1'))
+    assert BuildCache(tmp_path).get("step", "key") is None
+
+
+def test_signature_is_stable_and_order_independent():
+    assert signature({"a": 1, "b": [1, 2]}) == signature({"b": [1, 2], "a": 1})
+    assert signature({"a": 1}) != signature({"a": 2})
+    assert len(signature("x")) == 32
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / "out" / "a.js"
+    assert write_if_changed(path, "x = 1;\n")
+    assert not write_if_changed(path, "x = 1;\n")
+    assert write_if_changed(path, "x = 2;\n")
+    assert path.read_text() == "x = 2;\n"
+    assert [p.name for p in path.parent.iterdir()] == ["a.js"]
@@ -0,0 +1,15 @@
+import build_content_oembed as bco
+from test_http_client import tiny_png
+
+
+def test_thumbnail_names_keep_dots_in_the_id_and_spare_other_items(tmp_path):
+    neighbour = tmp_path / "talk-v1.webp"
+    neighbour.write_bytes(b"another item's thumbnail")
+    old = tmp_path / "talk-v1.2.jpg"
+    old.write_bytes(b"this item's previous thumbnail")
+
+    out = bco.store_thumbnail(tiny_png(), "image/png", tmp_path / "talk-v1.2")
+
+    assert out.name == ("talk-v1.2.webp" if bco.Image is not None else "talk-v1.2.png")
+    assert neighbour.read_bytes() == b"another item's thumbnail"
+    assert not old.exists()
@@ -0,0 +1,18 @@
+from build_image_derivatives import derived_path, plan_derivatives
+
+
+def test_derived_path_keeps_the_source_extension():
+    assert derived_path("assets/features/x/IMG_1.jpeg", 640, "webp") == "assets/derived/features/x/IMG_1.jpeg.640w.webp"
+
+
+def test_sources_differing_only_in_extension_do_not_collide(tmp_path):
+    from PIL import Image
+
+    (tmp_path / "assets" / "x").mkdir(parents=True)
+    outputs = []
+    for name in ("foo.png", "foo.jpg"):
+        rel = f"assets/x/{name}"
+        Image.new("RGB", (800, 600), "green").save(tmp_path / rel)
+        entry = plan_derivatives(str(tmp_path / rel), rel, (320, 640), ("webp",))
+        outputs += [path for path, _w in entry["variants"]["webp"]]
+    assert len(outputs) == len(set(outputs)) == 4
@@ -0,0 +1,24 @@
+import time
+
+import pytest
+
+import content_data_js as cdj
+
+
+def test_parses_comments_between_tokens():
+    root = cdj.parse(b'window.x = { a: 1, // c // d // e\n  b: "q" /* x */ };')
+    assert [p.key for p in root.props] == ["a", "b"]
+    assert root.props[1].value.value == "q"
+
+
+@pytest.mark.parametrize(
+    "prefix",
+    [b" " * 20000, b"\n  " * 5000, b"// a // b // c // d // e // f // g // h // i // j\n" * 200],
+)
+def test_bad_token_after_long_skip_run_fails_fast(prefix):
+    # Used to backtrack over every split of the whitespace/comment run (exponential).
+    src = b'window.x = { title: "x"\n' + prefix + b'+ "y" };'
+    t0 = time.perf_counter()
+    with pytest.raises(cdj.ContentParseError):
+        cdj.parse(src)
+    assert time.perf_counter() - t0 < 1.0
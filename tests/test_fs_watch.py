@@ -0,0 +1,33 @@
+import fs_watch
+
+
+def test_failed_batch_is_retried_with_the_next_change(tmp_path, monkeypatch, capsys):
+    (tmp_path / "assets").mkdir()
+    calls = []
+    steps = iter(
+        [
+            # tick 1: a bulk photo drop plus a broken JSON edit
+            lambda: [(tmp_path / "assets" / f"p{n}.jpg").write_bytes(b"x") for n in range(3)]
+            + [(tmp_path / "assets" / "f.json").write_text("{")],
+            lambda: None,  # quiet: rebuild (fails)
+            lambda: (tmp_path / "assets" / "f.json").write_text("{}"),  # the fix
+            lambda: None,  # quiet: rebuild again
+        ]
+    )
+
+    def sleep(_s):
+        try:
+            next(steps)()
+        except StopIteration:
+            raise KeyboardInterrupt from None
+
+    def on_change(batch):
+        calls.append(sorted(batch))
+        if (tmp_path / "assets" / "f.json").read_text() == "{":
+            raise ValueError("invalid JSON")
+
+    monkeypatch.setattr(fs_watch.time, "sleep", sleep)
+    fs_watch.watch(tmp_path, ["assets"], on_change, settle=0)
+
+    photos = [f"assets/p{n}.jpg" for n in range(3)]
+    assert calls == [sorted(photos + ["assets/f.json"])] * 2
@@ -0,0 +1,162 @@
+"""
+`http_client` record / replay, offline.
+
+`fixtures/http/127.0.0.1_8800/` was recorded from `OembedHandler` below, served on
+port 8800 (the `--youtube-oembed http://127.0.0.1:8800/oembed` setup from
+`build_content_oembed.py`), by `record_fixtures()`.
+"""
+
+import json
+import struct
+import tempfile
+import threading
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from build_content_oembed import fetch_meta, oembed_url
+from content_data_js import iter_items, parse
+from http_client import HttpClient, HttpError
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures" / "http"
+RECORDED_ENDPOINT = "http://127.0.0.1:8800/oembed"
+CONTENT_SRC = b"""window.__HOOKE_CONTENT__ = {
+  items: [
+    { id: "yt-8_xMAAbjcaw", type: "youtube", url: "https://www.youtube.com/watch?v=8_xMAAbjcaw" },
+  ],
+};
+"""
+
+
+def tiny_png(width: int = 4, height: int = 3, rgb: bytes = b"\x4a\x7a\x3c") -> bytes:
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    rows = b"".join(b"\x00" + rgb * width for _ in range(height))
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr) + chunk(b"IDAT", zlib.compress(rows)) + chunk(b"IEND", b"")
+
+
+class OembedHandler(BaseHTTPRequestHandler):
+    """A YouTube-like oEmbed endpoint plus thumbnails, cacheable for an hour."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 (http.server naming)
+        parts = urllib.parse.urlsplit(self.path)
+        if parts.path == "/oembed":
+            video = urllib.parse.parse_qs(parts.query).get("url", [""])[0].rpartition("v=")[2]
+            origin = f"http://{self.headers['Host']}"
+            body = json.dumps(
+                {
+                    "title": f"Hooke wilding: {video}",
+                    "author_name": "Hooke Court",
+                    "provider_name": "YouTube",
+                    "thumbnail_url": f"{origin}/vi/{video}/hqdefault.png",
+                }
+            ).encode("utf-8")
+            ctype = "application/json"
+        elif parts.path.startswith("/vi/"):
+            body, ctype = tiny_png(), "image/png"
+        else:
+            self.send_error(404)
+            return
+        etag = f'"{zlib.crc32(body):08x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Cache-Control", "max-age=3600")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port: int = 0) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", port), OembedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def content_item():
+    return next(iter_items(parse(CONTENT_SRC)))
+
+
+def record_fixtures(fixtures_dir: Path = FIXTURES) -> None:
+    server = serve(8800)
+    try:
+        client = HttpClient(mode="record", fixtures_dir=fixtures_dir, cache_dir=None, retries=0)
+        item = content_item()
+        with tempfile.TemporaryDirectory() as scratch:
+            rec = fetch_meta(item, oembed_url(item, RECORDED_ENDPOINT, ""), Path(scratch), client)
+        assert "error" not in rec and "thumbnailError" not in rec, rec
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = serve()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_replay_committed_fixtures(tmp_path):
+    client = HttpClient(mode="replay", fixtures_dir=FIXTURES, cache_dir=None)
+    item = content_item()
+    rec = fetch_meta(item, oembed_url(item, RECORDED_ENDPOINT, ""), tmp_path, client)
+    assert rec["title"] == "Hooke wilding: 8_xMAAbjcaw"
+    assert rec["author_name"] == "Hooke Court"
+    assert (tmp_path / rec["thumbnail"]).is_file()
+    assert client.stats["127.0.0.1:8800"].fixtures == 2
+    assert client.stats["127.0.0.1:8800"].requests == 0
+
+
+def test_replay_defaults_to_the_committed_fixtures(monkeypatch):
+    monkeypatch.setenv("HOOKE_HTTP_MODE", "replay")
+    monkeypatch.delenv("HOOKE_HTTP_FIXTURES", raising=False)
+    client = HttpClient.from_env(cache_dir=None)
+    url = oembed_url(content_item(), RECORDED_ENDPOINT, "")
+    assert client.get_json(url)["title"] == "Hooke wilding: 8_xMAAbjcaw"
+
+
+def test_replay_without_fixture_fails(tmp_path):
+    client = HttpClient(mode="replay", fixtures_dir=tmp_path, cache_dir=None)
+    with pytest.raises(HttpError, match="no fixture"):
+        client.get(RECORDED_ENDPOINT + "?format=json&url=missing")
+
+
+def test_record_saves_responses_that_are_fresh_in_the_cache(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_port}/oembed?format=json&url=https%3A%2F%2Fyoutu.be%2F%3Fv%3Dabc"
+    cache, fixtures = tmp_path / "cache", tmp_path / "fixtures"
+
+    live = HttpClient(cache_dir=cache)
+    assert live.get(url).source == "network"
+    assert live.get(url).source == "cache"
+    live.close()
+
+    recorder = HttpClient(mode="record", fixtures_dir=fixtures, cache_dir=cache)
+    recorded = recorder.get(url)
+    recorder.close()
+    assert recorded.source == "revalidated"
+
+    server.shutdown()
+    replayed = HttpClient(mode="replay", fixtures_dir=fixtures, cache_dir=None).get(url)
+    assert replayed.source == "fixture"
+    assert replayed.body == recorded.body
+    assert replayed.json()["title"] == "Hooke wilding: abc"
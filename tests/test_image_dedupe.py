@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+
+import image_dedupe
+from build_cache import BuildCache
+from image_dedupe import _BAND_BITS, ImageDuplicates, is_copy_name
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BASE = 0x0123456789ABCDEF
+
+
+def synthetic(monkeypatch, tmp_path, phashes: dict[str, tuple[int, int, int]]) -> ImageDuplicates:
+    """ImageDuplicates over made-up files: {rel: (phash bits, width, height)}, all with distinct bytes."""
+    dupes = ImageDuplicates(tmp_path, BuildCache(tmp_path), jobs=1)
+    monkeypatch.setattr(dupes, "_stat", lambda rel: (f"sha-{rel}", 1000) if rel in phashes else None)
+    monkeypatch.setattr(
+        dupes,
+        "_phashes",
+        lambda digests: {rel: {"phash": f"{bits:016x}", "width": w, "height": h} for rel, (bits, w, h) in phashes.items()},
+    )
+    return dupes
+
+
+def flip(bits: int, *positions: int) -> int:
+    for pos in positions:
+        bits ^= 1 << pos
+    return bits
+
+
+@pytest.mark.skipif(not image_dedupe.Image, reason="needs Pillow")
+def test_known_copies_collapse_to_the_original(tmp_path):
+    rels = sorted(
+        p.relative_to(REPO_ROOT).as_posix()
+        for folder in ("giant-chair", "fallen-tree")
+        for p in (REPO_ROOT / "assets" / "features" / folder).iterdir()
+        if p.name != "page-001.png"
+    )
+    dupes = ImageDuplicates(REPO_ROOT, BuildCache(REPO_ROOT, rel_path=str(tmp_path / "cache.json")), jobs=1)
+    canonical = dupes.canonical(rels)
+    moved = {rel: canon for rel, canon in canonical.items() if rel != canon}
+    assert moved == {
+        "assets/features/giant-chair/IMG_0308 (1).jpeg": "assets/features/giant-chair/IMG_0308.jpeg",
+        "assets/features/fallen-tree/IMG_0534 2.jpeg": "assets/features/fallen-tree/IMG_0534.jpeg",
+    }
+    assert dupes.report(canonical)[0] == 2
+
+
+def test_hashes_one_bit_off_in_four_bands_meet_in_the_fifth(monkeypatch, tmp_path):
+    near = flip(BASE, *(band * _BAND_BITS for band in range(4)))
+    dupes = synthetic(monkeypatch, tmp_path, {"a.jpg": (BASE, 800, 600), "b.jpg": (near, 400, 300)})
+    assert dupes.canonical(["a.jpg", "b.jpg"]) == {"a.jpg": "a.jpg", "b.jpg": "a.jpg"}
+
+
+def test_five_bits_apart_is_not_a_duplicate(monkeypatch, tmp_path):
+    far = flip(BASE, 0, 1, 2, 3, 4)  # same band, so they are compared, but too far apart
+    dupes = synthetic(monkeypatch, tmp_path, {"a.jpg": (BASE, 800, 600), "b.jpg": (far, 800, 600)})
+    assert dupes.canonical(["a.jpg", "b.jpg"]) == {"a.jpg": "a.jpg", "b.jpg": "b.jpg"}
+
+
+def test_different_aspect_ratio_is_not_a_duplicate(monkeypatch, tmp_path):
+    dupes = synthetic(monkeypatch, tmp_path, {"a.jpg": (BASE, 800, 600), "b.jpg": (BASE, 800, 450)})
+    assert dupes.canonical(["a.jpg", "b.jpg"]) == {"a.jpg": "a.jpg", "b.jpg": "b.jpg"}
+
+
+def test_canonical_prefers_pixels_then_the_original_name(monkeypatch, tmp_path):
+    dupes = synthetic(
+        monkeypatch,
+        tmp_path,
+        {"IMG_1.jpeg": (BASE, 400, 300), "IMG_1 (1).jpeg": (BASE, 800, 600), "IMG_1 copy.jpeg": (BASE, 800, 600)},
+    )
+    assert set(dupes.canonical(["IMG_1.jpeg", "IMG_1 (1).jpeg", "IMG_1 copy.jpeg"]).values()) == {"IMG_1 (1).jpeg"}
+
+    dupes = synthetic(monkeypatch, tmp_path, {"x/IMG_2 2.jpeg": (BASE, 800, 600), "x/IMG_2.jpeg": (BASE, 800, 600)})
+    assert set(dupes.canonical(["x/IMG_2 2.jpeg", "x/IMG_2.jpeg"]).values()) == {"x/IMG_2.jpeg"}
+
+
+def test_identical_bytes_are_duplicates_without_perceptual_hashes(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"same")
+    (tmp_path / "a copy.png").write_bytes(b"same")
+    (tmp_path / "b.png").write_bytes(b"other")
+    dupes = ImageDuplicates(tmp_path, BuildCache(tmp_path), jobs=1)
+    dupes.perceptual = False
+    assert dupes.canonical(["a copy.png", "a.png", "b.png"]) == {"a copy.png": "a.png", "a.png": "a.png", "b.png": "b.png"}
+    assert dupes.report({"a copy.png": "a.png"}) == (1, 4)
+
+
+def test_is_copy_name():
+    assert is_copy_name("a/IMG_0308 (1).jpeg")
+    assert is_copy_name("IMG_0534 2.jpeg")
+    assert is_copy_name("photo copy.png")
+    assert is_copy_name("photo Copy 3.png")
+    assert not is_copy_name("IMG_0534.jpeg")
+    assert not is_copy_name("page-001.png")
+    assert not is_copy_name("copy (1)/IMG_0308.jpeg")
@@ -0,0 +1,60 @@
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from search_index import TF_CAP, build_index, tokenize
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SAMPLES = [
+    "Giant Chair",
+    "Hooke’s wilding — Bee-orchid's meadow",
+    "Café Crème, naïve Ångström",
+    "ﬁeld notes ½ ²",  # compatibility forms
+    "IMG_0308 (1).jpeg",
+    "dragonfly2025 v1.2",
+    "Straße Øre İstanbul",
+    "a⃗b x́y",  # combining marks inside and outside U+0300-U+036F
+    "",
+    "   ",
+]
+
+
+def js_search_tokens(page: str) -> str:
+    src = (REPO_ROOT / page).read_text(encoding="utf-8")
+    m = re.search(r"^function searchTokens\(s\) \{\n.*?^\}\n", src, re.S | re.M)
+    assert m, f"searchTokens() not found in {page}"
+    return m.group(0)
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="needs Node.js")
+@pytest.mark.parametrize("page", ["app.js", "field-guide.js"])
+def test_tokenize_matches_the_browser(page):
+    script = js_search_tokens(page) + f"console.log(JSON.stringify({json.dumps(SAMPLES)}.map(searchTokens)));"
+    out = subprocess.run(["node", "-e", script], capture_output=True, text=True, check=True).stdout
+    assert json.loads(out) == [tokenize(s) for s in SAMPLES]
+
+
+def test_tokenize():
+    assert tokenize("Hooke’s Bee-orchid, Café!") == ["hookes", "bee", "orchid", "cafe"]
+    assert tokenize("IMG_0308 (1).jpeg") == ["img", "0308", "1", "jpeg"]
+
+
+def test_build_index_weights_fields_and_caps_repeats():
+    docs = [
+        {"id": "chair", "title": "Giant chair", "tags": ["oak"], "text": "chair " * 10},
+        {"id": "oak", "title": "Old oak", "sourcePdf": "oak-board.pdf", "text": "an oak by the chair"},
+    ]
+    index = build_index(docs)
+    assert index["docs"] == ["chair", "oak"]
+    assert index["terms"] == sorted(index["terms"])
+    postings = dict(zip(index["terms"], index["postings"]))
+    # title 8, capped board text 1 * TF_CAP
+    assert postings["chair"] == [0, 8 + TF_CAP, 1, 1]
+    # tags 5 / title 8 + pdf name 2 + text 1
+    assert postings["oak"] == [0, 5, 1, 8 + 2 + 1]
+    assert "pdf" in postings and "board" in postings
@@ -0,0 +1,51 @@
+import http.client
+import socket
+import threading
+import time
+
+import pytest
+
+import serve
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / "index.html").write_text("<!doctype html><title>Hooke</title>\n", encoding="utf-8")
+    handler = type("Handler", (serve.SiteHandler,), {"root": tmp_path.resolve(), "immutable": frozenset()})
+    server = serve.PooledHTTPServer(("127.0.0.1", 0), handler, workers=2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def get(conn: http.client.HTTPConnection, path: str = "/") -> bytes:
+    conn.request("GET", path)
+    resp = conn.getresponse()
+    assert resp.status == 200
+    return resp.read()
+
+
+def test_idle_keep_alive_connections_do_not_hold_workers(site, capsys):
+    idle = [http.client.HTTPConnection("127.0.0.1", site, timeout=5) for _ in range(8)]
+    for conn in idle:
+        get(conn)  # served, then left open and idle
+
+    t0 = time.perf_counter()
+    fresh = http.client.HTTPConnection("127.0.0.1", site, timeout=5)
+    assert b"Hooke" in get(fresh)
+    assert time.perf_counter() - t0 < 1.0
+
+    for conn in idle:  # still usable: they were parked, not dropped
+        assert b"Hooke" in get(conn)
+        conn.close()
+    fresh.close()
+
+
+def test_pipelined_requests_are_all_answered(site, capsys):
+    with socket.create_connection(("127.0.0.1", site), timeout=5) as sock:
+        sock.sendall(b"GET / HTTP/1.1\r\nHost: x\r\n\r\n" * 2 + b"GET / HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+    assert data.count(b"HTTP/1.1 200 OK") == 3
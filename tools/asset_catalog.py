@@ -0,0 +1,138 @@
+"""
+Single-pass catalog of everything under `assets/`, shared by the build tools.
+
+Why:
+  `build_features_data.py` used to `iterdir()` each feature folder twice plus a
+  handful of `exists()`/`is_file()` stats per feature, and
+  `build_gallery_manifest.py` walked the whole tree again with `rglob("*")`,
+  stat-ing every file. The catalog walks `assets/` once with `os.scandir`
+  (which gets file type for free and size/mtime from one stat per file) and
+  keeps a compact index grouped by folder, so build time scales with the number
+  of files rather than features x stats.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg"}
+
+
+class AssetEntry(NamedTuple):
+    name: str
+    suffix: str  # lower-cased, including the dot
+    size: int
+    mtime_ns: int
+
+
+def scan_tree(repo_root: Path, root: str, skip_prefixes: tuple[str, ...] = ()) -> Iterator[tuple[str, AssetEntry]]:
+    """
+    Yield (folder_rel, entry) for every non-hidden file under `root` (repo-relative, posix).
+
+    Dotfiles and dot-folders (e.g. .DS_Store) are skipped, as are paths starting
+    with any of `skip_prefixes`.
+    """
+    base = repo_root / root
+    if not base.is_dir():
+        return
+    root_len = len(str(repo_root)) + 1
+    stack = [str(base)]
+    while stack:
+        d = stack.pop()
+        folder_rel = d[root_len:].replace(os.sep, "/")
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.name.startswith("."):
+                    continue
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if not (skip_prefixes and f"{folder_rel}/{e.name}/".startswith(skip_prefixes)):
+                            stack.append(e.path)
+                        continue
+                    if not e.is_file():
+                        continue
+                    st = e.stat()
+                except OSError:
+                    continue
+                yield folder_rel, AssetEntry(e.name, os.path.splitext(e.name)[1].lower(), st.st_size, st.st_mtime_ns)
+
+
+class AssetCatalog:
+    """
+    In-memory index of `assets/`: folder (repo-relative posix path) -> entries sorted by name,
+    plus a name -> entry map per folder so `get()` is a dict lookup however big the folder.
+
+    Build it once per run with `AssetCatalog.scan(repo_root)` and pass it to
+    whatever needs to list or stat asset files. `rescan_folder()` refreshes one
+    folder in place (used by `--watch`).
+    """
+
+    def __init__(self, repo_root: Path, root: str = "assets", skip_prefixes: tuple[str, ...] = ()):
+        self.repo_root = repo_root
+        self.root = root
+        self.skip_prefixes = skip_prefixes
+        self.folders: dict[str, list[AssetEntry]] = {}
+        self._by_name: dict[str, dict[str, AssetEntry]] = {}
+
+    @classmethod
+    def scan(cls, repo_root: Path, root: str = "assets", skip_prefixes: tuple[str, ...] = ()) -> "AssetCatalog":
+        cat = cls(repo_root, root, skip_prefixes)
+        for folder_rel, entry in scan_tree(repo_root, root, skip_prefixes):
+            cat.folders.setdefault(folder_rel, []).append(entry)
+        for folder_rel, entries in cat.folders.items():
+            entries.sort(key=lambda e: e.name)
+            cat._by_name[folder_rel] = {e.name: e for e in entries}
+        return cat
+
+    def rescan_folder(self, folder_rel: str) -> None:
+        """Refresh the direct children of one folder (subfolders are left as they are)."""
+        entries: list[AssetEntry] = []
+        try:
+            it = os.scandir(self.repo_root / folder_rel)
+        except OSError:
+            self.folders.pop(folder_rel, None)
+            self._by_name.pop(folder_rel, None)
+            return
+        with it:
+            for e in it:
+                if e.name.startswith("."):
+                    continue
+                try:
+                    if not e.is_file():
+                        continue
+                    st = e.stat()
+                except OSError:
+                    continue
+                entries.append(AssetEntry(e.name, os.path.splitext(e.name)[1].lower(), st.st_size, st.st_mtime_ns))
+        if entries:
+            self.folders[folder_rel] = sorted(entries, key=lambda e: e.name)
+            self._by_name[folder_rel] = {e.name: e for e in entries}
+        else:
+            self.folders.pop(folder_rel, None)
+            self._by_name.pop(folder_rel, None)
+
+    def has_folder(self, folder_rel: str) -> bool:
+        return folder_rel in self.folders
+
+    def files(self, folder_rel: str) -> list[AssetEntry]:
+        return self.folders.get(folder_rel, [])
+
+    def images(self, folder_rel: str) -> list[AssetEntry]:
+        return [e for e in self.files(folder_rel) if e.suffix in IMAGE_EXTS]
+
+    def get(self, rel: str) -> AssetEntry | None:
+        folder, _, name = rel.rpartition("/")
+        return self._by_name.get(folder, {}).get(name)
+
+    def walk(self) -> Iterator[tuple[str, AssetEntry]]:
+        """Yield (file_rel, entry) for every file, in sorted path order."""
+        for folder in sorted(self.folders):
+            for e in self.folders[folder]:
+                yield f"{folder}/{e.name}", e
@@ -0,0 +1,186 @@
+"""
+Persistent build cache shared by the `tools/build_*.py` scripts.
+
+Why:
+  The builders used to rescan, rehash and rewrite everything on every run. This
+  cache remembers (size, mtime, sha256) per input file so unchanged files are
+  never re-read, stores per-step results keyed by an input signature, and only
+  rewrites an output when its bytes would actually change.
+
+The cache lives in `.build-cache/build-cache.json` (git-ignored). Deleting it is
+always safe: the next run just recomputes everything once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_PATH = ".build-cache/build-cache.json"
+
+
+def sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def signature(parts: object) -> str:
+    """Stable short hash of any JSON-serialisable value (used as a cache key)."""
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write `text` to `path` only if the bytes differ. Returns True if written.
+
+    Skipping identical writes keeps mtimes (and browser/CDN caches) stable.
+    """
+    data = text.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+class BuildCache:
+    """
+    On-disk cache of file fingerprints and step results.
+
+    - `file_hash(path)` returns the sha256 of a file, recomputing it only when
+      its size or mtime changed since the last run.
+    - `get(ns, key)` / `put(ns, key, value)` store JSON values per namespace
+      (e.g. one namespace per builder).
+    - `content_get(ns, digest)` / `content_put(ns, digest, value)` store facts
+      about file *contents* (e.g. image dimensions), keyed by sha256; entries
+      whose content no longer belongs to any known file are dropped on save.
+    """
+
+    def __init__(self, repo_root: Path, rel_path: str = DEFAULT_CACHE_PATH):
+        self.repo_root = repo_root
+        self.path = repo_root / rel_path
+        self.files: dict[str, list] = {}
+        self.entries: dict[str, dict] = {}
+        self.content_namespaces: set[str] = set()
+        self._dirty = False
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raw = None
+        if isinstance(raw, dict) and raw.get("version") == CACHE_VERSION:
+            self.files = raw.get("files") or {}
+            self.entries = raw.get("entries") or {}
+            self.content_namespaces = set(raw.get("contentNamespaces") or [])
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def file_hash(self, path: Path, st: os.stat_result | None = None) -> str:
+        st = st or path.stat()
+        return self._hash(self._rel(path), st.st_size, st.st_mtime_ns)
+
+    def content_hash(self, rel: str, size: int, mtime_ns: int) -> str:
+        """sha256 of a repo-relative file already stat-ed by the caller."""
+        return self._hash(rel, size, mtime_ns)
+
+    def _hash(self, rel: str, size: int, mtime_ns: int) -> str:
+        rec = self.files.get(rel)
+        if rec and rec[0] == size and rec[1] == mtime_ns:
+            return rec[2]
+        digest = sha256_file(self.repo_root / rel)
+        self.files[rel] = [size, mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def prehash(self, files: list[tuple[str, int, int]], jobs: int | None = None) -> int:
+        """
+        Hash every (rel, size, mtime_ns) the cache doesn't know yet, on a process pool.
+
+        Later `content_hash()` / `entry_fingerprint()` calls then hit the cache; worth
+        it before a loop over many new files (a fresh checkout, a big import).
+        Returns how many files were hashed.
+        """
+        stale = []
+        for rel, size, mtime_ns in files:
+            rec = self.files.get(rel)
+            if not rec or rec[0] != size or rec[1] != mtime_ns:
+                stale.append((rel, size, mtime_ns))
+        jobs = min(jobs or os.cpu_count() or 1, len(stale))
+        if jobs < 2:
+            return 0  # not worth a pool: the callers hash lazily as before
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            digests = pool.map(sha256_file, [self.repo_root / rel for rel, _size, _mtime in stale], chunksize=16)
+            for (rel, size, mtime_ns), digest in zip(stale, digests):
+                self.files[rel] = [size, mtime_ns, digest]
+        self._dirty = True
+        return len(stale)
+
+    def fingerprint(self, path: Path) -> str:
+        """Change token for a file: size + content hash (rehashed only if size/mtime moved)."""
+        st = path.stat()
+        return f"{st.st_size}:{self.file_hash(path, st)}"
+
+    def entry_fingerprint(self, rel: str, size: int, mtime_ns: int) -> str:
+        """Same as `fingerprint()`, for files already stat-ed by the asset catalog."""
+        return f"{size}:{self._hash(rel, size, mtime_ns)}"
+
+    def get(self, ns: str, key: str) -> object | None:
+        return (self.entries.get(ns) or {}).get(key)
+
+    def put(self, ns: str, key: str, value: object) -> None:
+        bucket = self.entries.setdefault(ns, {})
+        if bucket.get(key) != value:
+            bucket[key] = value
+            self._dirty = True
+
+    def content_get(self, ns: str, digest: str) -> object | None:
+        return self.get(ns, digest)
+
+    def content_put(self, ns: str, digest: str, value: object) -> None:
+        if ns not in self.content_namespaces:
+            self.content_namespaces.add(ns)
+            self._dirty = True
+        self.put(ns, digest, value)
+
+    def prune(self, ns: str, keep: set[str]) -> None:
+        bucket = self.entries.get(ns) or {}
+        for key in [k for k in bucket if k not in keep]:
+            del bucket[key]
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        # Forget files that no longer exist so the cache doesn't grow forever.
+        self.files = {rel: rec for rel, rec in self.files.items() if (self.repo_root / rel).exists()}
+        live = {rec[2] for rec in self.files.values()}
+        for ns in self.content_namespaces:
+            self.prune(ns, live)
+        payload = {
+            "version": CACHE_VERSION,
+            "files": self.files,
+            "entries": self.entries,
+            "contentNamespaces": sorted(self.content_namespaces),
+        }
+        write_if_changed(self.path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        self._dirty = False
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Bake oEmbed metadata (titles, authors, thumbnails) into data/content-data.js.
+
+Why: Watch & Read used to call the YouTube oEmbed endpoint and each blog's WordPress
+`wp-json/oembed` endpoint from the browser, per item, before cards had titles and thumbnails.
+First visits paid dozens of round-trips (and got nothing offline or when the endpoints were
+blocked). This script does those lookups once, at build time:
+
+  - fetches oEmbed for every YouTube / blog item concurrently through `http_client.py`
+    (results cached in `.build-cache/`, so re-runs only ask about new URLs; `--refresh` asks
+    again; HOOKE_HTTP_MODE=record / replay for offline runs);
+  - downloads each thumbnail and stores a resized copy under `assets/content/` (WebP, 480px wide,
+    with Pillow; the original bytes without it);
+  - writes `title`, `author`, `publisher` (blogs), `thumbnail` and the thumbnail's
+    `thumbnailWidth` / `thumbnailHeight` into the items, keeping the file's formatting.
+
+Curated values win: fields already set in the file are left alone unless `--overwrite` is given
+(a remote `thumbnail` URL is always replaced by the local copy). `content.js` skips the runtime
+oEmbed calls for items that already have a title and thumbnail.
+
+The endpoints can be pointed at a local fixture server:
+  --youtube-oembed http://127.0.0.1:8800/oembed --blog-oembed-base http://127.0.0.1:8800
+
+Usage:
+  python3 tools/build_content_oembed.py            # dry run
+  python3 tools/build_content_oembed.py --write
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import os
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from build_cache import BuildCache
+from build_content_youtube_dates import youtube_id_from_url
+from content_data_js import ContentItem, ContentParseError, Edit, apply_edits, iter_items, js_string, parse, set_field
+from http_client import HttpClient, HttpError
+from image_probe import probe
+
+try:
+  from PIL import Image
+except ImportError:  # optional: thumbnails are stored as downloaded without it
+  Image = None
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONTENT_JS_PATH = os.path.join(ROOT, "data", "content-data.js")
+THUMBS_DIR = "assets/content"
+THUMB_WIDTH = 480
+THUMB_EXTS = (".webp", ".jpg", ".png", ".gif")  # every extension store_thumbnail() can write
+DEFAULT_YOUTUBE_OEMBED = "https://www.youtube.com/oembed"
+WP_OEMBED_PATH = "/wp-json/oembed/1.0/embed"
+CACHE_NS = "oembed"
+# Field written -> oEmbed key, per item type (in the order they're inserted after `url:`).
+FIELDS = {
+  "youtube": (("title", "title"), ("author", "author_name")),
+  "blog": (("title", "title"), ("author", "author_name"), ("publisher", "provider_name")),
+}
+
+
+def oembed_url(item: ContentItem, youtube_endpoint: str, blog_base: str) -> str:
+  if item.type == "youtube":
+    endpoint = youtube_endpoint
+  else:
+    u = urllib.parse.urlsplit(item.url)
+    endpoint = (blog_base.rstrip("/") if blog_base else f"{u.scheme}://{u.netloc}") + WP_OEMBED_PATH
+  return f"{endpoint}?{urllib.parse.urlencode({'format': 'json', 'url': item.url})}"
+
+
+def thumb_slug(item: ContentItem) -> str:
+  if item.type == "youtube":
+    vid = youtube_id_from_url(item.url)
+    if vid:
+      return f"yt-{vid}"
+  return item.content_id
+
+
+def store_thumbnail(data: bytes, content_type: str, dest_stem: Path) -> Path:
+  """Write a resized WebP (or, without Pillow, the original bytes). Returns the written path."""
+  dest_stem.parent.mkdir(parents=True, exist_ok=True)
+  if Image is not None:
+    with Image.open(io.BytesIO(data)) as im:
+      im = im.convert("RGB")
+      if im.width > THUMB_WIDTH:
+        im = im.resize((THUMB_WIDTH, round(im.height * THUMB_WIDTH / im.width)), Image.LANCZOS)
+      buf = io.BytesIO()
+      im.save(buf, "WEBP", quality=80, method=6)
+      data, ext = buf.getvalue(), ".webp"
+  else:
+    ext = {"image/png": ".png", "image/webp": ".webp", "image/gif": ".gif"}.get(content_type.split(";")[0].strip(), ".jpg")
+  # Append rather than with_suffix(): ids such as `talk-v1.2` contain dots of their own.
+  out = dest_stem.with_name(dest_stem.name + ext)
+  tmp = out.with_name(out.name + ".tmp")
+  tmp.write_bytes(data)
+  os.replace(tmp, out)
+  for stale_ext in THUMB_EXTS:
+    stale = dest_stem.with_name(dest_stem.name + stale_ext)
+    if stale != out and stale.is_file():
+      stale.unlink()
+  return out
+
+
+def fetch_meta(item: ContentItem, url: str, repo_root: Path, client: HttpClient) -> Dict[str, object]:
+  """oEmbed lookup + thumbnail download for one item. Errors are returned, not raised."""
+  try:
+    meta = client.get_json(url)
+    if not isinstance(meta, dict):
+      raise HttpError("not a JSON object")
+  except HttpError as e:
+    return {"error": f"oEmbed: {e}"}
+  rec: Dict[str, object] = {k: meta.get(k) for k in ("title", "author_name", "provider_name", "thumbnail_url")}
+  thumb_url = meta.get("thumbnail_url")
+  if isinstance(thumb_url, str) and thumb_url.startswith(("http://", "https://")):
+    try:
+      resp = client.get(thumb_url)
+      out = store_thumbnail(resp.body, resp.content_type, repo_root / THUMBS_DIR / thumb_slug(item))
+      rec["thumbnail"] = out.relative_to(repo_root).as_posix()
+      rec["thumbnailSha"] = hashlib.sha256(out.read_bytes()).hexdigest()[:16]
+    except Exception as e:  # noqa: BLE001 (HTTP and decoder errors vary by format)
+      rec["thumbnailError"] = str(e)
+  return rec
+
+
+def _thumb_ok(repo_root: Path, rec: Dict[str, object]) -> bool:
+  rel = rec.get("thumbnail")
+  if not isinstance(rel, str):
+    return "thumbnail_url" not in rec or not rec.get("thumbnail_url")
+  p = repo_root / rel
+  return p.is_file() and hashlib.sha256(p.read_bytes()).hexdigest()[:16] == rec.get("thumbnailSha")
+
+
+def bake(
+  src: bytes, items: List[ContentItem], metas: Dict[str, Dict[str, object]], repo_root: Path, overwrite: bool
+) -> Tuple[bytes, int]:
+  """Apply metadata to the items. Returns (new source, number of items changed)."""
+  edits: List[Edit] = []
+  changed = 0
+  for item in items:
+    rec = metas.get(item.url)
+    if not rec or "error" in rec:
+      continue
+    before = len(edits)
+    for field, key in FIELDS.get(item.type, ()):
+      value = rec.get(key)
+      if not isinstance(value, str) or not value.strip():
+        continue
+      if item.node.get_str(field) and not overwrite:
+        continue
+      edit = set_field(src, item.node, field, js_string(value.strip()), after="url")
+      if edit:
+        edits.append(edit)
+    thumb = rec.get("thumbnail")
+    current = item.node.get_str("thumbnail") or ""
+    if isinstance(thumb, str) and (overwrite or not current or current.startswith(("http://", "https://"))):
+      values = [("thumbnail", js_string(f"./{thumb}"))]
+      dims = probe(repo_root / thumb)
+      if dims:
+        values += [("thumbnailWidth", str(dims[0]).encode()), ("thumbnailHeight", str(dims[1]).encode())]
+      for field, value in values:
+        edit = set_field(src, item.node, field, value, after="url")
+        if edit:
+          edits.append(edit)
+    changed += len(edits) > before
+  return apply_edits(src, edits), changed
+
+
+def main() -> int:
+  ap = argparse.ArgumentParser()
+  ap.add_argument("--write", action="store_true", help="Write changes back to data/content-data.js")
+  ap.add_argument("--path", default=CONTENT_JS_PATH, help="Path to content-data.js")
+  ap.add_argument("--refresh", action="store_true", help="Ignore cached oEmbed results and fetch again")
+  ap.add_argument("--overwrite", action="store_true", help="Replace curated title/author/publisher/thumbnail values")
+  ap.add_argument("--youtube-oembed", default=DEFAULT_YOUTUBE_OEMBED, help="YouTube oEmbed endpoint")
+  ap.add_argument("--blog-oembed-base", default="", help="Origin to use for WordPress oEmbed instead of each blog's own")
+  ap.add_argument("--concurrency", type=int, default=8, help="Parallel requests")
+  ap.add_argument("--retries", type=int, default=3, help="Retries per request on 429/5xx/network errors")
+  args = ap.parse_args()
+
+  path = os.path.abspath(args.path)
+  if not os.path.exists(path):
+    print(f"ERROR: not found: {path}", file=sys.stderr)
+    return 2
+  src = open(path, "rb").read()
+  try:
+    items = [it for it in iter_items(parse(src)) if it.type in FIELDS]
+  except ContentParseError as e:
+    print(f"ERROR: can't parse {path}: {e}", file=sys.stderr)
+    return 2
+  if not items:
+    print("No YouTube or blog items found.")
+    return 0
+
+  repo_root = Path(ROOT)
+  cache = BuildCache(repo_root)
+  metas: Dict[str, Dict[str, object]] = {}
+  jobs: Dict[str, Tuple[ContentItem, str]] = {}
+  for item in items:
+    if item.url in metas or item.url in jobs:
+      continue
+    url = oembed_url(item, args.youtube_oembed, args.blog_oembed_base)
+    rec = None if args.refresh else cache.get(CACHE_NS, url)
+    if isinstance(rec, dict) and _thumb_ok(repo_root, rec):
+      metas[item.url] = rec
+    else:
+      jobs[item.url] = (item, url)
+  print(f"Found {len(items)} items; {len(metas)} cached, {len(jobs)} to fetch.")
+
+  if jobs:
+    try:
+      client = HttpClient.from_env(retries=max(0, args.retries))
+    except ValueError as e:
+      print(f"ERROR: {e}", file=sys.stderr)
+      return 2
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+      futures = {u: pool.submit(fetch_meta, it, url, repo_root, client) for u, (it, url) in jobs.items()}
+      for item_url, fut in futures.items():
+        rec = fut.result()
+        if "error" in rec:
+          print(f"  !! {item_url}: {rec['error']}")
+          continue
+        if "thumbnailError" in rec:
+          print(f"  !! {item_url}: thumbnail: {rec['thumbnailError']}")
+        metas[item_url] = rec
+        cache.put(CACHE_NS, jobs[item_url][1], rec)
+    cache.save()
+    client.close()
+    print(f"Fetched {sum(1 for u in jobs if u in metas)} of {len(jobs)} in {time.perf_counter() - t0:.1f}s.")
+    print(client.report())
+
+  patched, n = bake(src, items, metas, repo_root, args.overwrite)
+  if n == 0:
+    print("Nothing to bake (metadata already in place).")
+    return 0
+  if args.write:
+    tmp = path + ".tmp"
+    open(tmp, "wb").write(patched)
+    os.replace(tmp, path)
+    print(f"Wrote updates to {path} ({n} items).")
+  else:
+    print(f"Dry run: would update {n} items. Re-run with --write to apply.")
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
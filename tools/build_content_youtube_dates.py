@@ -5,30 +5,47 @@ Populate YouTube publish dates for items in data/content-data.js.
 Why: YouTube oEmbed does NOT include publish dates, and browsers can't reliably scrape youtube.com pages due to CORS.
 This script fetches `snippet.publishedAt` from YouTube Data API v3 and patches `date:` fields for YouTube items.
 
+Fetched dates are kept in the build cache (`.build-cache/`), so a video is only ever looked up
+once (`--refresh` asks again); with `--only-missing`, items that already have a `date:` are
+not looked up at all. Lookups go out 50 IDs per request, a few requests at a time, through the
+shared client in `http_client.py` (kept-alive connections, backoff on 429 / 5xx, record / replay
+via HOOKE_HTTP_MODE). `--api-base` (or YOUTUBE_API_BASE) points the script at another server,
+e.g. a local stub for testing.
+
 Usage:
   export YOUTUBE_API_KEY="YOUR_KEY"
   python3 tools/build_content_youtube_dates.py --write
 
 Dry-run (no file write):
   python3 tools/build_content_youtube_dates.py
+
+Nightly sync (only items without a date; no API call at all if they're all cached):
+  python3 tools/build_content_youtube_dates.py --write --only-missing
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import re
 import sys
+import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from build_cache import BuildCache
+from content_data_js import ContentParseError, apply_edits, iter_items, js_string, parse, set_field
+from http_client import HttpClient, HttpError
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONTENT_JS_PATH = os.path.join(ROOT, "data", "content-data.js")
+DEFAULT_API_BASE = "https://www.googleapis.com/youtube/v3"
+CACHE_NS = "youtube-dates"
+IDS_PER_REQUEST = 50  # API maximum
 
 
 @dataclass(frozen=True)
@@ -36,6 +53,7 @@ class YouTubeItem:
   content_id: str
   url: str
   video_id: str
+  date: Optional[str] = None  # current `date:` value in the file
 
 
 def youtube_id_from_url(url: str) -> Optional[str]:
@@ -59,118 +77,91 @@ def youtube_id_from_url(url: str) -> Optional[str]:
 
 def extract_youtube_items(content_js: str) -> List[YouTubeItem]:
   """
-  Very small JS-ish extractor:
-  finds object literals that contain:
-    id: "..."
-    type: "youtube"
-    url: "..."
+  YouTube items (`type: "youtube"` with a parseable `url`) from content-data.js, in file order.
+  The same video may appear more than once (e.g. featured + in the list).
+  Raises ContentParseError if the file isn't the expected object literal.
   """
-  # Grab object blocks: { ... } with a conservative match.
-  # This assumes each item is a plain object literal in the array (as in our curated file).
-  blocks = re.findall(r"\{\s*[^{}]*?id:\s*\"[^\"]+\"[\s\S]*?\}", content_js)
   out: List[YouTubeItem] = []
-  for b in blocks:
-    m_id = re.search(r'id:\s*"([^"]+)"', b)
-    m_type = re.search(r'type:\s*"([^"]+)"', b)
-    m_url = re.search(r'url:\s*"([^"]+)"', b)
-    if not (m_id and m_type and m_url):
-      continue
-    if m_type.group(1) != "youtube":
+  for item in iter_items(parse(content_js.encode("utf-8"))):
+    if item.type != "youtube":
       continue
-    url = m_url.group(1)
-    vid = youtube_id_from_url(url)
+    vid = youtube_id_from_url(item.url)
     if not vid:
       continue
-    out.append(YouTubeItem(content_id=m_id.group(1), url=url, video_id=vid))
-  # Deduplicate by video_id (keep first)
-  seen = set()
-  uniq: List[YouTubeItem] = []
-  for it in out:
-    if it.video_id in seen:
-      continue
-    seen.add(it.video_id)
-    uniq.append(it)
-  return uniq
+    date = item.node.get_str("date")
+    out.append(YouTubeItem(content_id=item.content_id, url=item.url, video_id=vid, date=date or None))
+  return out
 
 
-def fetch_youtube_published_at(api_key: str, video_ids: List[str]) -> Dict[str, str]:
+def _iso_date(published_at: str) -> Optional[str]:
+  # Example: 2025-01-02T12:34:56Z
+  try:
+    dt = datetime.fromisoformat(published_at.replace("Z", "+00:00")).astimezone(timezone.utc)
+  except ValueError:
+    return None
+  return dt.date().isoformat()
+
+
+def fetch_youtube_published_at(
+  api_key: str, video_ids: List[str], client: HttpClient, api_base: str = DEFAULT_API_BASE, concurrency: int = 4
+) -> Dict[str, Dict[str, str]]:
   """
-  Returns mapping: videoId -> YYYY-MM-DD
+  Returns mapping: videoId -> {"date": YYYY-MM-DD}. IDs the API doesn't know
+  (private / deleted videos) are simply absent.
   """
-  out: Dict[str, str] = {}
-  # API supports up to 50 ids per request.
-  for i in range(0, len(video_ids), 50):
-    chunk = video_ids[i : i + 50]
-    qs = urllib.parse.urlencode(
-      {
-        "part": "snippet",
-        "id": ",".join(chunk),
-        "key": api_key,
-      }
-    )
-    url = f"https://www.googleapis.com/youtube/v3/videos?{qs}"
-    req = urllib.request.Request(url, headers={"User-Agent": "hooke-wilding-webapp/1.0"})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-      body = resp.read().decode("utf-8")
-    data = json.loads(body)
-    for item in data.get("items", []):
-      vid = item.get("id")
-      snippet = item.get("snippet") or {}
-      published_at = snippet.get("publishedAt")
-      if not (vid and published_at):
-        continue
-      # Example: 2025-01-02T12:34:56Z
-      try:
-        dt = datetime.fromisoformat(published_at.replace("Z", "+00:00")).astimezone(timezone.utc)
-        out[str(vid)] = dt.date().isoformat()
-      except Exception:
-        continue
+  chunks = [video_ids[i : i + IDS_PER_REQUEST] for i in range(0, len(video_ids), IDS_PER_REQUEST)]
+
+  def fetch(chunk: List[str]) -> dict:
+    params = {"part": "snippet", "id": ",".join(chunk), "key": api_key, "fields": "items(id,snippet/publishedAt)"}
+    data = client.get_json(f"{api_base.rstrip('/')}/videos?{urllib.parse.urlencode(params)}")
+    return data if isinstance(data, dict) else {}
+
+  out: Dict[str, Dict[str, str]] = {}
+  with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks) or 1))) as pool:
+    for data in pool.map(fetch, chunks):
+      for item in data.get("items", []):
+        vid = item.get("id")
+        date = _iso_date((item.get("snippet") or {}).get("publishedAt") or "")
+        if vid and date:
+          out[str(vid)] = {"date": date}
   return out
 
 
-def patch_dates(content_js: str, dates_by_video_id: Dict[str, str]) -> Tuple[str, int]:
+def patch_dates(content_js: str, dates_by_video_id: Dict[str, str], only_missing: bool = False) -> Tuple[str, int]:
   """
   Patch `date:` fields for youtube objects by matching their `url` and computing video id from it.
+  Only dates that actually change are rewritten (a missing `date` is inserted after `url`); all
+  other bytes are kept as they are. With `only_missing`, dates already set are left alone.
   Returns (new_content, patch_count)
   """
-  patch_count = 0
-
-  # Replace inside each object literal block to keep change localized.
-  def repl_obj(match: re.Match) -> str:
-    nonlocal patch_count
-    obj = match.group(0)
-    m_type = re.search(r'type:\s*"([^"]+)"', obj)
-    if not m_type or m_type.group(1) != "youtube":
-      return obj
-    m_url = re.search(r'url:\s*"([^"]+)"', obj)
-    if not m_url:
-      return obj
-    vid = youtube_id_from_url(m_url.group(1))
-    if not vid:
-      return obj
-    iso = dates_by_video_id.get(vid)
+  src = content_js.encode("utf-8")
+  edits = []
+  for item in iter_items(parse(src)):
+    if item.type != "youtube" or (only_missing and item.node.get_str("date")):
+      continue
+    vid = youtube_id_from_url(item.url)
+    iso = dates_by_video_id.get(vid) if vid else None
     if not iso:
-      return obj
-    # Patch or insert date field.
-    if re.search(r"date:\s*(null|\"[^\"]*\")\s*,", obj):
-      new_obj, n = re.subn(r"date:\s*(null|\"[^\"]*\")\s*,", f'date: "{iso}",', obj, count=1)
-      if n:
-        patch_count += 1
-      return new_obj
-    # If date field missing (shouldn't happen), insert after url.
-    new_obj, n = re.subn(r'(url:\s*"[^"]+"\s*,)', r'\1\n    date: "' + iso + r'",', obj, count=1)
-    if n:
-      patch_count += 1
-    return new_obj
-
-  new_content = re.sub(r"\{\s*[^{}]*?id:\s*\"[^\"]+\"[\s\S]*?\}", repl_obj, content_js)
-  return new_content, patch_count
+      continue
+    edit = set_field(src, item.node, "date", js_string(iso), after="url")
+    if edit:
+      edits.append(edit)
+  return apply_edits(src, edits).decode("utf-8"), len(edits)
 
 
 def main() -> int:
   ap = argparse.ArgumentParser()
   ap.add_argument("--write", action="store_true", help="Write changes back to data/content-data.js")
   ap.add_argument("--path", default=CONTENT_JS_PATH, help="Path to content-data.js")
+  ap.add_argument("--only-missing", action="store_true", help="Only look up items whose date isn't set yet")
+  ap.add_argument("--refresh", action="store_true", help="Ignore cached dates and ask the API again")
+  ap.add_argument(
+    "--api-base",
+    default=os.environ.get("YOUTUBE_API_BASE", "").strip() or DEFAULT_API_BASE,
+    help=f"YouTube Data API base URL (default {DEFAULT_API_BASE}, or env YOUTUBE_API_BASE)",
+  )
+  ap.add_argument("--concurrency", type=int, default=4, help="Parallel API requests")
+  ap.add_argument("--retries", type=int, default=4, help="Retries per request on 429/5xx/network errors")
   args = ap.parse_args()
 
   path = os.path.abspath(args.path)
@@ -178,24 +169,66 @@ def main() -> int:
     print(f"ERROR: not found: {path}", file=sys.stderr)
     return 2
 
-  api_key = os.environ.get("YOUTUBE_API_KEY", "").strip()
-  if not api_key:
-    print("ERROR: Missing env var YOUTUBE_API_KEY", file=sys.stderr)
-    return 2
-
   src = open(path, "r", encoding="utf-8").read()
-  items = extract_youtube_items(src)
+  try:
+    items = extract_youtube_items(src)
+  except ContentParseError as e:
+    print(f"ERROR: can't parse {path}: {e}", file=sys.stderr)
+    return 2
   if not items:
     print("No YouTube items found to update.")
     return 0
 
-  vids = [it.video_id for it in items]
-  print(f"Found {len(vids)} unique YouTube video IDs.")
+  wanted: List[str] = []
+  for it in items:
+    if (not args.only_missing or not it.date) and it.video_id not in wanted:
+      wanted.append(it.video_id)
+  print(f"Found {len(items)} YouTube items ({len(wanted)} unique video IDs to date).")
+  if not wanted:
+    print("Nothing to do: every item already has a date.")
+    return 0
 
-  dates = fetch_youtube_published_at(api_key, vids)
-  print(f"Fetched publish dates for {len(dates)} videos.")
+  cache = BuildCache(Path(ROOT))
+  known: Dict[str, Dict[str, str]] = {}
+  if not args.refresh:
+    for vid in wanted:
+      rec = cache.get(CACHE_NS, vid)
+      if isinstance(rec, dict) and rec.get("date"):
+        known[vid] = rec
+  missing = [vid for vid in wanted if vid not in known]
+
+  if missing:
+    api_key = os.environ.get("YOUTUBE_API_KEY", "").strip()
+    if not api_key:
+      print("ERROR: Missing env var YOUTUBE_API_KEY", file=sys.stderr)
+      return 2
+    try:
+      client = HttpClient.from_env(retries=max(0, args.retries))
+    except ValueError as e:
+      print(f"ERROR: {e}", file=sys.stderr)
+      return 2
+    try:
+      t0 = time.perf_counter()
+      fetched = fetch_youtube_published_at(api_key, missing, client, args.api_base, concurrency=args.concurrency)
+    except HttpError as e:
+      print(f"ERROR: {e}", file=sys.stderr)
+      return 2
+    finally:
+      client.close()
+    for vid, rec in fetched.items():
+      cache.put(CACHE_NS, vid, rec)
+    cache.save()
+    known.update(fetched)
+    print(
+      f"Fetched publish dates for {len(fetched)} of {len(missing)} uncached videos "
+      f"in {time.perf_counter() - t0:.1f}s; {len(wanted) - len(missing)} from cache."
+    )
+    print(client.report())
+  else:
+    print(f"All {len(wanted)} publish dates came from the cache (no API requests).")
 
-  patched, n = patch_dates(src, dates)
+  dates = {vid: rec["date"] for vid, rec in known.items()}
+  patched, n = patch_dates(src, dates, only_missing=args.only_missing)
   if n == 0:
     print("No date fields patched (maybe already set?).")
     return 0
@@ -210,5 +243,3 @@ def main() -> int:
 
 if __name__ == "__main__":
   raise SystemExit(main())
-
-
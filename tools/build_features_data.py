@@ -7,21 +7,87 @@ Why:
   Keeping a single source of truth (`data/features.json`) makes it easier to
   update paths/content and regenerate the JS bundle deterministically.
 
+  If `data/image-derivatives.json` exists (see `build_image_derivatives.py`),
+  the bundle also carries `responsive` (srcset strings per image + format) and
+  `responsiveSizes` (the `sizes` attribute per UI slot).
+
+  `pages[0].width/height` and each gallery item's `width`/`height` are read from
+  the image headers (see `image_probe.py`) so the UI can reserve space for
+  images before they load.
+
+  A search index over each feature's title, tags, source PDF name and text
+  (see `search_index.py`) lets `app.js` answer searches without rescanning
+  every feature.
+
+  To keep startup cheap, the bundle only carries what the grid and pins need.
+  Each feature's long-form fields (`description`, `story`, `text`,
+  `seasonalNotes`, `gallery`) go into a detail chunk,
+  `data/feature-details/<id>.js`, which `app.js` loads with a <script> tag
+  (so it also works from file://) the first time the feature is opened.
+  `detailChunks` in the bundle maps id -> chunk URL (with a content-hash `?v=`).
+  The search index (which grows with the texts) likewise lives in
+  `data/features-search.js`, referenced by `searchChunk` and loaded when the
+  search box is first used.
+
+  `placeholders` maps each of those image URLs to a dominant colour and a tiny
+  preview (see `image_placeholders.py`), so cards paint something meaningful
+  before their image arrives. Like `responsive`, gallery-only entries travel in
+  the detail chunks.
+
+  Auto-detected folder photos that duplicate another shown image (same bytes,
+  or the same picture re-encoded; see `image_dedupe.py`) are left out of the
+  gallery strip, and the run reports how many bytes that saved.
+
+  Per-feature results are cached in `.build-cache/` (see `build_cache.py`), and
+  the bundle is only rewritten when its bytes change.
+
 Usage:
   python3 tools/build_features_data.py
+  python3 tools/build_features_data.py --watch   # rebuild affected features on change
 """
 
 from __future__ import annotations
 
+import argparse
+import copy
+import hashlib
 import json
+import re
 from pathlib import Path
 
+from build_cache import BuildCache, signature, write_if_changed
+from asset_catalog import AssetCatalog
+from build_image_derivatives import MANIFEST_PATH as DERIVATIVES_MANIFEST, load_manifest, srcset_for
+from fs_watch import watch
+from image_dedupe import PHASH_DISTANCE, ImageDuplicates
+from image_placeholders import ImagePlaceholders
+from image_probe import ImageDimensions
+from search_index import build_index
+
 
-IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg"}
 PLACEHOLDER_IMG = "assets/field-guide/placeholder.svg"
 
+DETAILS_DIR = "data/feature-details"
+SEARCH_CHUNK = "data/features-search.js"
+# Fields only needed once a feature is opened (modal / admin form).
+DETAIL_FIELDS = ("description", "story", "text", "seasonalNotes", "gallery")
+# Per-URL image maps whose gallery-only entries move into the detail chunks.
+URL_MAPS = ("responsive", "placeholders")
+_CHUNK_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# `sizes` attribute per UI slot; keep in sync with the `.grid` / `.thumb` rules in styles.css.
+RESPONSIVE_SIZES = {
+    "card": "(max-width: 640px) 100vw, (max-width: 980px) 50vw, 290px",
+    "board": "(max-width: 740px) 100vw, 900px",
+    "thumb": "140px",
+}
+
+
+def _feature_folder(feature_id: str) -> str:
+    return f"assets/features/{feature_id}"
+
 
-def _auto_primary_image_for_feature(repo_root: Path, feature_id: str) -> Path | None:
+def _auto_primary_image_for_feature(catalog: AssetCatalog, feature_id: str) -> str | None:
     """
     Pick a "primary/board" image for a feature folder, if present.
 
@@ -29,139 +95,413 @@ def _auto_primary_image_for_feature(repo_root: Path, feature_id: str) -> Path |
       1) page-001.png (info-board render)
       2) thumb.png (explicit cover)
       3) First image file in the folder (sorted by name)
+
+    Returns the repo-relative path, or None.
     """
-    folder = repo_root / "assets" / "features" / feature_id
-    if not folder.exists() or not folder.is_dir():
+    folder = _feature_folder(feature_id)
+    imgs = catalog.images(folder)
+    if not imgs:
         return None
 
-    preferred = [folder / "page-001.png", folder / "thumb.png"]
-    for p in preferred:
-        if p.exists() and p.is_file() and p.suffix.lower() in IMAGE_EXTS:
-            return p
+    names = {e.name for e in imgs}
+    for preferred in ("page-001.png", "thumb.png"):
+        if preferred in names:
+            return f"{folder}/{preferred}"
 
-    imgs: list[Path] = []
-    for p in folder.iterdir():
-        if not p.is_file():
-            continue
-        if p.name.startswith("."):
-            continue
-        if p.suffix.lower() not in IMAGE_EXTS:
-            continue
-        imgs.append(p)
-
-    if not imgs:
-        return None
-    imgs = sorted(imgs, key=lambda p: p.name.lower())
-    return imgs[0]
+    first = min(imgs, key=lambda e: e.name.lower())
+    return f"{folder}/{first.name}"
 
 
-def _auto_gallery_for_feature(repo_root: Path, feature_id: str, exclude_names: set[str] | None = None) -> list[dict]:
+def _auto_gallery_for_feature(catalog: AssetCatalog, feature_id: str, exclude_names: set[str] | None = None) -> list[dict]:
     """
     Collect additional images from `assets/features/<feature_id>/`.
 
     We intentionally exclude the info-board renders (`page-*.png`) and `thumb.png`
     because those are already used as the primary/board image.
     """
-    folder = repo_root / "assets" / "features" / feature_id
-    if not folder.exists() or not folder.is_dir():
+    folder = _feature_folder(feature_id)
+    exclude_names = exclude_names or set()
+    imgs = [
+        e
+        for e in catalog.images(folder)
+        if e.name != "thumb.png" and not e.name.startswith("page-") and e.name not in exclude_names
+    ]
+    imgs = sorted(imgs, key=lambda e: e.name.lower())
+    return [{"id": f"auto-{e.name}", "url": f"{folder}/{e.name}"} for e in imgs]
+
+
+def enrich_feature(catalog: AssetCatalog, f: dict, dupes: ImageDuplicates | None = None) -> list[str]:
+    """
+    Enrich one feature (in place) with auto-detected photos from its folder.
+
+    Returns the folder photos left out as duplicates of an image already shown.
+    """
+    fid = f.get("id")
+    if not isinstance(fid, str) or not fid.strip():
         return []
 
-    exclude_names = exclude_names or set()
-    imgs: list[Path] = []
-    for p in folder.iterdir():
-        if not p.is_file():
-            continue
-        if p.name.startswith("."):
+    # Headline image policy:
+    # - If assets/features/<id>/page-001.png exists, it ALWAYS becomes the headline
+    #   feature image + thumbnail (even if features.json specifies something else).
+    # - Otherwise, only promote a folder image if the feature is using the placeholder
+    #   (or missing), to keep existing curated images stable.
+    page001 = f"{_feature_folder(fid)}/page-001.png"
+    force_primary = catalog.get(page001) is not None
+
+    primary_rel = page001 if force_primary else (_auto_primary_image_for_feature(catalog, fid) or "")
+    if primary_rel:
+        thumb = f.get("thumb")
+        if force_primary or (not isinstance(thumb, str) or thumb.strip() in ("", PLACEHOLDER_IMG)):
+            f["thumb"] = primary_rel
+
+        pages = f.get("pages")
+        if isinstance(pages, list) and pages and isinstance(pages[0], dict):
+            img0 = pages[0].get("image")
+            if force_primary or (not isinstance(img0, str) or img0.strip() in ("", PLACEHOLDER_IMG)):
+                pages[0]["image"] = primary_rel
+                pages[0].setdefault("width", 0)
+                pages[0].setdefault("height", 0)
+                pages[0].setdefault("pageNumber", 1)
+                pages[0].setdefault("textPreview", "")
+        else:
+            f["pages"] = [{"pageNumber": 1, "image": primary_rel, "width": 0, "height": 0, "textPreview": ""}]
+
+    base_gallery = f.get("gallery") if isinstance(f.get("gallery"), list) else []
+    # Avoid duplicating the primary image in the gallery thumbnail strip.
+    exclude = {primary_rel.rsplit("/", 1)[-1]} if primary_rel else set()
+    auto_gallery = _auto_gallery_for_feature(catalog, fid, exclude_names=exclude)
+    # Collapse duplicate photos to their canonical copy (see image_dedupe.py);
+    # copies of the headline image are dropped as well.
+    canonical: dict[str, str] = {}
+    dropped: list[str] = []
+    if dupes:
+        urls = [it["url"] for it in auto_gallery]
+        canonical = dupes.canonical([primary_rel, *urls] if primary_rel else urls)
+        primary_key = canonical.get(primary_rel)
+        keep = []
+        for it in auto_gallery:
+            key = canonical.get(it["url"], it["url"])
+            (keep if key == it["url"] and key != primary_key else dropped).append(it)
+        auto_gallery = keep
+    # Merge + dedupe by url, or by canonical copy (stable).
+    seen = set()
+    merged = []
+    for it in [*base_gallery, *auto_gallery]:
+        if not isinstance(it, dict):
             continue
-        if p.suffix.lower() not in IMAGE_EXTS:
+        url = it.get("url")
+        if not isinstance(url, str) or not url:
             continue
-        if p.name == "thumb.png":
+        key = canonical.get(url, url)
+        if key in seen:
+            if key != url and it in auto_gallery:
+                dropped.append(it)
             continue
-        if p.name.startswith("page-"):
+        seen.add(key)
+        merged.append(it)
+    if merged:
+        f["gallery"] = merged
+    return [it["url"] for it in dropped]
+
+
+def attach_dimensions(catalog: AssetCatalog, dims: ImageDimensions, f: dict) -> None:
+    """Fill in intrinsic width/height for the board image and gallery items (in place)."""
+
+    def lookup(url: object) -> tuple[int, int] | None:
+        if not isinstance(url, str) or not url.startswith("assets/"):
+            return None  # data: URLs, remote images
+        e = catalog.get(url)
+        return dims.get(url, e.size, e.mtime_ns) if e else dims.get(url)
+
+    pages = f.get("pages")
+    if isinstance(pages, list) and pages and isinstance(pages[0], dict):
+        wh = lookup(pages[0].get("image"))
+        if wh:
+            pages[0]["width"], pages[0]["height"] = wh
+    for it in f.get("gallery") or []:
+        if isinstance(it, dict):
+            wh = lookup(it.get("url"))
+            if wh:
+                it["width"], it["height"] = wh
+
+
+def feature_signature(cache: BuildCache, catalog: AssetCatalog, f: dict) -> str:
+    """Cache key for one feature: its source JSON plus the fingerprints of its folder's images."""
+    fid = f.get("id")
+    files = []
+    if isinstance(fid, str) and fid.strip():
+        folder = _feature_folder(fid)
+        for e in catalog.images(folder):
+            files.append([e.name, cache.entry_fingerprint(f"{folder}/{e.name}", e.size, e.mtime_ns)])
+    return signature([f, files])
+
+
+def build_responsive(repo_root: Path, features: list) -> dict[str, dict]:
+    """Responsive variants for every image the UI shows (cards, board, gallery strip)."""
+    derivatives = load_manifest(repo_root)
+    responsive: dict[str, dict] = {}
+    if not derivatives:
+        return responsive
+    for f in features:
+        if not isinstance(f, dict):
             continue
-        if p.name in exclude_names:
+        pages = f.get("pages") if isinstance(f.get("pages"), list) else []
+        urls = [f.get("thumb"), pages[0].get("image") if pages and isinstance(pages[0], dict) else None]
+        urls += [it.get("url") for it in (f.get("gallery") or []) if isinstance(it, dict)]
+        for url in urls:
+            if isinstance(url, str) and url not in responsive:
+                srcset = srcset_for(derivatives, url)
+                if srcset:
+                    responsive[url] = srcset
+    return dict(sorted(responsive.items()))
+
+
+def _feature_image_urls(f: dict) -> list[str]:
+    """Local image URLs the UI shows for a feature: card, board and gallery strip."""
+    pages = f.get("pages") if isinstance(f.get("pages"), list) else []
+    urls = [f.get("thumb"), pages[0].get("image") if pages and isinstance(pages[0], dict) else None]
+    urls += [it.get("url") for it in (f.get("gallery") or []) if isinstance(it, dict)]
+    return list(dict.fromkeys(u for u in urls if isinstance(u, str) and u.startswith("assets/")))
+
+
+def build_placeholders(placeholders: ImagePlaceholders, features: list) -> dict[str, dict]:
+    """Colour + tiny preview for every image the UI shows (computed in parallel, cached by content hash)."""
+    urls = list(dict.fromkeys(u for f in features if isinstance(f, dict) for u in _feature_image_urls(f)))
+    placeholders.prepare(urls)
+    out: dict[str, dict] = {}
+    for url in urls:
+        ph = placeholders.get(url)
+        if ph:
+            out[url] = ph
+    return dict(sorted(out.items()))
+
+
+def render_bundle(data: dict) -> str:
+    # Minified JSON for fast load + small file size.
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return "// Auto-generated from data/features.json\n" f"window.__HOOKE_DATA__ = {payload};\n"
+
+
+def render_chunk(feature_id: str, detail: dict) -> str:
+    payload = json.dumps(detail, ensure_ascii=False, separators=(",", ":"))
+    return (
+        "// Auto-generated from data/features.json\n"
+        f"(window.__HOOKE_DETAILS__ = window.__HOOKE_DETAILS__ || {{}})[{json.dumps(feature_id)}] = {payload};\n"
+    )
+
+
+def _versioned(rel: str, text: str) -> str:
+    return f"{rel}?v={hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]}"
+
+
+def split_bundle(data: dict) -> tuple[dict, dict[str, str]]:
+    """
+    Split the full bundle payload into (eager index, {chunk path: chunk text}).
+
+    Gallery-only `responsive` / `placeholders` entries travel with their
+    feature's chunk; images the grid or board shows up front stay in the eager maps.
+    """
+    index = dict(data)
+    features = data.get("features") if isinstance(data.get("features"), list) else []
+    url_maps = {name: dict(data.get(name) or {}) for name in URL_MAPS}
+    eager_urls = set()
+    for f in features:
+        if isinstance(f, dict):
+            pages = f.get("pages") if isinstance(f.get("pages"), list) else []
+            eager_urls.add(f.get("thumb"))
+            eager_urls.add(pages[0].get("image") if pages and isinstance(pages[0], dict) else None)
+
+    chunks: dict[str, str] = {}
+    chunk_urls: dict[str, str] = {}
+    slim: list = []
+    for f in features:
+        fid = f.get("id") if isinstance(f, dict) else None
+        if not isinstance(fid, str) or not _CHUNK_ID_RE.match(fid):
+            slim.append(f)
             continue
-        imgs.append(p)
+        detail = {k: f[k] for k in DETAIL_FIELDS if k in f}
+        gallery_urls = [it.get("url") for it in (f.get("gallery") or []) if isinstance(it, dict)]
+        for name, url_map in url_maps.items():
+            moved = {u: url_map.pop(u) for u in gallery_urls if u in url_map and u not in eager_urls}
+            if moved:
+                detail[name] = dict(sorted(moved.items()))
+        slim.append({k: v for k, v in f.items() if k not in DETAIL_FIELDS})
+        rel = f"{DETAILS_DIR}/{fid}.js"
+        text = render_chunk(fid, detail)
+        chunks[rel] = text
+        chunk_urls[fid] = _versioned(rel, text)
 
-    imgs = sorted(imgs, key=lambda p: p.name.lower())
-    out: list[dict] = []
-    for p in imgs:
-        rel = p.relative_to(repo_root).as_posix()
-        out.append({"id": f"auto-{p.name}", "url": rel})
-    return out
+    index["features"] = slim
+    if chunk_urls:
+        index["detailChunks"] = chunk_urls
+    for name, url_map in url_maps.items():
+        if name in data:
+            index[name] = url_map
+    search = index.pop("searchIndex", None)
+    if search is not None:
+        payload = json.dumps(search, ensure_ascii=False, separators=(",", ":"))
+        text = f"// Auto-generated from data/features.json\nwindow.__HOOKE_SEARCH__ = {payload};\n"
+        chunks[SEARCH_CHUNK] = text
+        index["searchChunk"] = _versioned(SEARCH_CHUNK, text)
+    return index, chunks
 
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parent.parent
-    src = repo_root / "data" / "features.json"
-    out = repo_root / "data" / "features-data.js"
+def write_bundle(repo_root: Path, out: Path, data: dict) -> tuple[bool, int, bool]:
+    """
+    Write the eager bundle, detail chunks (pruning stale ones) and search chunk.
+    Returns (bundle written, detail chunks written, search chunk written).
+    """
+    index, chunks = split_bundle(data)
+    written = {rel: write_if_changed(repo_root / rel, text) for rel, text in chunks.items()}
+    details_dir = repo_root / DETAILS_DIR
+    if details_dir.is_dir():
+        for p in details_dir.glob("*.js"):
+            if f"{DETAILS_DIR}/{p.name}" not in chunks:
+                p.unlink()
+    search_written = written.pop(SEARCH_CHUNK, False)
+    return write_if_changed(out, render_bundle(index)), sum(written.values()), search_written
 
-    data = json.loads(src.read_text(encoding="utf-8"))
 
-    # Enrich each feature with auto-detected photos from its folder.
+def _chunk_summary(chunks: int, search_written: bool) -> str:
+    return f"{chunks} detail chunks written, search index {'written' if search_written else 'unchanged'}"
+
+
+def feature_key(f: dict, i: int) -> str:
+    return f["id"] if isinstance(f.get("id"), str) else f"#{i}"
+
+
+def build_bundle(
+    repo_root: Path, cache: BuildCache, catalog: AssetCatalog, source: dict, only: set[str] | None = None
+) -> tuple[dict, int, list[str]]:
+    """
+    Build the bundle payload from the parsed `features.json`.
+
+    Returns (data, rebuilt_count, folder photos skipped as duplicates).
+
+    Features are enriched with auto-detected photos from their folders, reusing the
+    cached result when their JSON and folder contents are unchanged. With `only`
+    (watch mode, where we already know what changed), features outside that set
+    are taken straight from the cache without re-fingerprinting their folders.
+    """
+    data = copy.deepcopy(source)
+    dims = ImageDimensions(repo_root, cache)
+    placeholders = ImagePlaceholders(repo_root, cache)
+    dupes = ImageDuplicates(repo_root, cache)
     features = data.get("features") or []
+    rebuilt = 0
+    duplicates: list[str] = []
     if isinstance(features, list):
-        for f in features:
+        keep: set[str] = set()
+        for i, f in enumerate(features):
             if not isinstance(f, dict):
                 continue
-            fid = f.get("id")
-            if not isinstance(fid, str) or not fid.strip():
+            key = feature_key(f, i)
+            keep.add(key)
+            hit = cache.get("features", key)
+            if only is not None and key not in only and isinstance(hit, dict):
+                features[i] = hit["feature"]
+                duplicates += hit.get("duplicates") or []
                 continue
+            sig = signature([feature_signature(cache, catalog, f), dupes.perceptual, PHASH_DISTANCE])
+            if isinstance(hit, dict) and hit.get("sig") == sig:
+                features[i] = hit["feature"]
+                duplicates += hit.get("duplicates") or []
+                continue
+            dropped = enrich_feature(catalog, f, dupes)
+            attach_dimensions(catalog, dims, f)
+            cache.put("features", key, {"sig": sig, "feature": f, "duplicates": dropped})
+            duplicates += dropped
+            rebuilt += 1
+        cache.prune("features", keep)
 
-            # Headline image policy:
-            # - If assets/features/<id>/page-001.png exists, it ALWAYS becomes the headline
-            #   feature image + thumbnail (even if features.json specifies something else).
-            # - Otherwise, only promote a folder image if the feature is using the placeholder
-            #   (or missing), to keep existing curated images stable.
-            folder = repo_root / "assets" / "features" / fid
-            page001 = folder / "page-001.png"
-            force_primary = page001.exists() and page001.is_file()
-
-            primary = page001 if force_primary else _auto_primary_image_for_feature(repo_root, fid)
-            primary_rel = primary.relative_to(repo_root).as_posix() if primary else ""
-            if primary_rel:
-                thumb = f.get("thumb")
-                if force_primary or (not isinstance(thumb, str) or thumb.strip() in ("", PLACEHOLDER_IMG)):
-                    f["thumb"] = primary_rel
-
-                pages = f.get("pages")
-                if isinstance(pages, list) and pages and isinstance(pages[0], dict):
-                    img0 = pages[0].get("image")
-                    if force_primary or (not isinstance(img0, str) or img0.strip() in ("", PLACEHOLDER_IMG)):
-                        pages[0]["image"] = primary_rel
-                        pages[0].setdefault("width", 0)
-                        pages[0].setdefault("height", 0)
-                        pages[0].setdefault("pageNumber", 1)
-                        pages[0].setdefault("textPreview", "")
-                else:
-                    f["pages"] = [{"pageNumber": 1, "image": primary_rel, "width": 0, "height": 0, "textPreview": ""}]
-
-            base_gallery = f.get("gallery") if isinstance(f.get("gallery"), list) else []
-            # Avoid duplicating the primary image in the gallery thumbnail strip.
-            exclude = {primary.name} if primary else set()
-            auto_gallery = _auto_gallery_for_feature(repo_root, fid, exclude_names=exclude)
-            # Merge + dedupe by url (stable).
-            seen = set()
-            merged = []
-            for it in [*base_gallery, *auto_gallery]:
-                if not isinstance(it, dict):
-                    continue
-                url = it.get("url")
-                if not isinstance(url, str) or not url:
-                    continue
-                if url in seen:
-                    continue
-                seen.add(url)
-                merged.append(it)
-            if merged:
-                f["gallery"] = merged
+        data["searchIndex"] = build_index(
+            [f for f in features if isinstance(f, dict) and isinstance(f.get("id"), str)]
+        )
 
-    # Minified JSON for fast load + small file size.
-    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        responsive = build_responsive(repo_root, features)
+        if responsive:
+            data["responsive"] = responsive
+            data["responsiveSizes"] = RESPONSIVE_SIZES
+
+        image_placeholders = build_placeholders(placeholders, features)
+        if image_placeholders:
+            data["placeholders"] = image_placeholders
+    return data, rebuilt, duplicates
+
+
+def report_duplicates(repo_root: Path, duplicates: list[str]) -> None:
+    if not duplicates:
+        return
+    saved = sum((repo_root / rel).stat().st_size for rel in duplicates if (repo_root / rel).is_file())
+    print(f"Skipped {len(duplicates)} duplicate photo(s) in feature galleries, saving {saved / 1024:.0f} KiB:")
+    for rel in sorted(duplicates):
+        print(f"  {rel}")
+
+
+def affected_features(paths: set[str], old_source: dict, new_source: dict) -> set[str]:
+    """Feature keys touched by a batch of changed paths (watch mode)."""
+    ids: set[str] = set()
+    for p in paths:
+        parts = p.split("/")
+        if len(parts) >= 4 and parts[0] == "assets" and parts[1] == "features":
+            ids.add(parts[2])
+    if "data/features.json" in paths:
+        def by_key(src: dict) -> dict[str, dict]:
+            feats = src.get("features") if isinstance(src.get("features"), list) else []
+            return {feature_key(f, i): f for i, f in enumerate(feats) if isinstance(f, dict)}
+
+        old, new = by_key(old_source), by_key(new_source)
+        ids |= {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+    return ids
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--watch", action="store_true", help="Keep running and rebuild affected features on change")
+    args = ap.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    src = repo_root / "data" / "features.json"
+    out = repo_root / "data" / "features-data.js"
+    cache = BuildCache(repo_root)
+    catalog = AssetCatalog.scan(repo_root, "assets/features")
+
+    source = json.loads(src.read_text(encoding="utf-8"))
+    cache.prehash([(rel, e.size, e.mtime_ns) for rel, e in catalog.walk()])
+    data, rebuilt, duplicates = build_bundle(repo_root, cache, catalog, source)
+    wrote, chunks, search_written = write_bundle(repo_root, out, data)
+    cache.save()
+    n = len(data.get("features") or [])
+    print(
+        f"{'Wrote' if wrote else 'Up to date:'} {out} "
+        f"({n} features, {rebuilt} rebuilt, {_chunk_summary(chunks, search_written)})"
+    )
+    report_duplicates(repo_root, duplicates)
+
+    if not args.watch:
+        return 0
+
+    def on_change(paths: set[str]) -> None:
+        nonlocal source
+        new_source = json.loads(src.read_text(encoding="utf-8")) if "data/features.json" in paths else source
+        ids = affected_features(paths, source, new_source)
+        source = new_source
+        for fid in ids:
+            catalog.rescan_folder(_feature_folder(fid))
+        data, rebuilt, _duplicates = build_bundle(repo_root, cache, catalog, source, only=ids)
+        wrote, chunks, search_written = write_bundle(repo_root, out, data)
+        cache.save()
+        names = ", ".join(sorted(ids)) or "no features"
+        print(
+            f"{'Patched' if wrote else 'Unchanged:'} {out.name} "
+            f"({names}; {rebuilt} rebuilt, {_chunk_summary(chunks, search_written)})"
+        )
 
-    out_text = "// Auto-generated from data/features.json\n" f"window.__HOOKE_DATA__ = {payload};\n"
-    out.write_text(out_text, encoding="utf-8")
-    print(f"Wrote {out} ({len(data.get('features') or [])} features)")
+    watch(
+        repo_root,
+        ["data/features.json", "assets/features", DERIVATIVES_MANIFEST],
+        on_change,
+    )
     return 0
 
 
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Compile `data/dorset-field-guide.json` into `data/dorset-field-guide.js`.
+
+Why:
+  The field guide used to be a hand-written JS file, and `field-guide.js`
+  rebuilt and lower-cased a haystack per species on every keystroke, then
+  checked groups, habitats and seasons by scanning each species' arrays. This
+  tool does that work once: the page gets a search index and one bitset per
+  filter chip, so a query is a few binary searches plus bitwise ANDs however
+  many species the guide grows to.
+
+Rules:
+  - `data/dorset-field-guide.json` is the source (`region`, `habitats`, `groups`,
+    `seasons`, `species[]`); edit it, then re-run this tool
+  - Species ids must be unique, and every species' group, habitats and
+    seasonality keys must be listed at the top level (the run fails otherwise)
+  - `searchIndex`: sorted `terms` with the species numbers containing each one,
+    from common + scientific name, group, habitats (id and name), notes and
+    watch-for; tokenized like the Explore search (`search_index.tokenize()`)
+  - `facets`: per group / habitat / season, a bitset over species numbers as
+    32-bit words (bit `n % 32` of word `n // 32`); a species is "in" a season
+    when its seasonality note for it isn't empty
+  - With Pillow installed, each `cover` gets a `placeholder` (dominant colour
+    plus a tiny preview, see `image_placeholders.py`) painted until the photo
+    loads; re-run after `fetch_commons_covers.py` replaces covers
+  - The output is only rewritten when its bytes change
+
+Usage:
+  python3 tools/build_field_guide.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+from build_cache import BuildCache, write_if_changed
+from image_placeholders import ImagePlaceholders
+from search_index import tokenize
+
+
+SRC_FILE = "data/dorset-field-guide.json"
+OUT_FILE = "data/dorset-field-guide.js"
+TOP_LEVEL_KEYS = ("region", "habitats", "groups", "seasons")
+
+
+def validate(guide: dict) -> list[str]:
+    problems: list[str] = []
+    if not isinstance(guide, dict):
+        return ["the top level must be an object"]
+    species = guide.get("species")
+    if not isinstance(species, list):
+        return ["`species` must be a list"]
+    groups = set(guide.get("groups") or [])
+    habitats = {h.get("id") for h in guide.get("habitats") or [] if isinstance(h, dict)}
+    seasons = set(guide.get("seasons") or [])
+    seen: set[str] = set()
+    for n, s in enumerate(species):
+        sid = s.get("id") if isinstance(s, dict) else None
+        if not isinstance(sid, str) or not sid or not s.get("commonName"):
+            problems.append(f"species #{n}: needs an `id` and a `commonName`")
+            continue
+        if sid in seen:
+            problems.append(f"{sid}: duplicate id")
+        seen.add(sid)
+        if s.get("group") not in groups:
+            problems.append(f"{sid}: group {s.get('group')!r} is not in `groups`")
+        for h in s.get("habitats") or []:
+            if h not in habitats:
+                problems.append(f"{sid}: habitat {h!r} is not in `habitats`")
+        for k in s.get("seasonality") or {}:
+            if k not in seasons:
+                problems.append(f"{sid}: season {k!r} is not in `seasons`")
+    return problems
+
+
+def bitset(members: list[int], count: int) -> list[int]:
+    words = [0] * ((count + 31) // 32)
+    for n in members:
+        words[n >> 5] |= 1 << (n & 31)
+    return words
+
+
+def search_text(s: dict, habitat_names: dict[str, str]) -> str:
+    habitats = s.get("habitats") or []
+    return " ".join(
+        [
+            s.get("commonName") or "",
+            s.get("scientificName") or "",
+            s.get("group") or "",
+            " ".join(habitats),
+            " ".join(habitat_names.get(h, "") for h in habitats),
+            s.get("notes") or "",
+            " ".join(s.get("watchFor") or []),
+        ]
+    )
+
+
+def with_placeholders(species: list[dict], placeholders: ImagePlaceholders) -> list[dict]:
+    """Species whose cover has a placeholder get a copy of the cover with it (the source stays as is)."""
+    out = []
+    for s in species:
+        cover = s.get("cover")
+        placeholder = placeholders.get(cover["src"]) if isinstance(cover, dict) and cover.get("src") else None
+        out.append({**s, "cover": {**cover, "placeholder": placeholder}} if placeholder else s)
+    return out
+
+
+def compile_guide(guide: dict, placeholders: ImagePlaceholders | None = None) -> dict:
+    species = guide["species"]
+    if placeholders is not None:
+        species = with_placeholders(species, placeholders)
+    count = len(species)
+    habitat_names = {h["id"]: h.get("name", "") for h in guide.get("habitats") or []}
+
+    postings: dict[str, list[int]] = {}
+    for n, s in enumerate(species):
+        for term in sorted(set(tokenize(search_text(s, habitat_names)))):
+            postings.setdefault(term, []).append(n)
+    terms = sorted(postings)
+
+    def facet(keys: list[str], has) -> dict[str, list[int]]:
+        return {k: bitset([n for n, s in enumerate(species) if has(s, k)], count) for k in keys}
+
+    out = {k: guide[k] for k in TOP_LEVEL_KEYS if k in guide}
+    out["species"] = species
+    out["searchIndex"] = {"terms": terms, "postings": [postings[t] for t in terms]}
+    out["facets"] = {
+        "group": facet(guide.get("groups") or [], lambda s, g: s.get("group") == g),
+        "habitat": facet(list(habitat_names), lambda s, h: h in (s.get("habitats") or [])),
+        "season": facet(
+            guide.get("seasons") or [],
+            lambda s, k: str((s.get("seasonality") or {}).get(k) or "").strip() != "",
+        ),
+    }
+    return out
+
+
+def render(bundle: dict) -> str:
+    out_lines: list[str] = []
+    out_lines.append(f"// Auto-generated by tools/build_field_guide.py from {SRC_FILE} (edit that, then re-run the tool).")
+    out_lines.append("// Offline dataset for the Dorset Living Field Guide, with its search index and filter bitsets.")
+    out_lines.append("window.__DORSET_GUIDE__ = {")
+    for key, value in bundle.items():
+        if key in ("habitats", "species"):
+            # One record per line, so edits show up as small diffs.
+            out_lines.append(f"  {key}: [")
+            for item in value:
+                out_lines.append(f"    {json.dumps(item, ensure_ascii=False)},")
+            out_lines.append("  ],")
+        else:
+            out_lines.append(f"  {key}: {json.dumps(value, ensure_ascii=False)},")
+    out_lines.append("};")
+    out_lines.append("")
+    return "\n".join(out_lines)
+
+
+def main() -> int:
+    repo_root = Path(__file__).resolve().parent.parent
+    src = repo_root / SRC_FILE
+    try:
+        guide = json.loads(src.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: could not read {SRC_FILE}: {exc}", file=sys.stderr)
+        return 2
+    problems = validate(guide)
+    if problems:
+        for p in problems:
+            print(f"ERROR: {p}", file=sys.stderr)
+        return 2
+
+    cache = BuildCache(repo_root)
+    placeholders = ImagePlaceholders(repo_root, cache)
+    covers = [s["cover"]["src"] for s in guide["species"] if isinstance(s.get("cover"), dict) and s["cover"].get("src")]
+    computed = placeholders.prepare(covers)
+    bundle = compile_guide(guide, placeholders)
+    wrote = write_if_changed(repo_root / OUT_FILE, render(bundle))
+    cache.save()
+    with_ph = sum(1 for s in bundle["species"] if (s.get("cover") or {}).get("placeholder"))
+    print(
+        f"{'Wrote' if wrote else 'Up to date:'} {OUT_FILE} ({len(bundle['species'])} species, "
+        f"{len(bundle['searchIndex']['terms'])} search terms, "
+        f"{with_ph} cover placeholders{f', {computed} computed' if computed else ''}"
+        f"{'' if placeholders.available else '; install Pillow for placeholders'})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
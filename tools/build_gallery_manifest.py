@@ -9,24 +9,56 @@ Why:
 Rules:
   - Include images under `assets/` (png/jpg/jpeg/webp/gif/svg)
   - Exclude anything under `assets/field-guide/` (internet-sourced)
+  - Exclude `assets/derived/` (resized copies from `build_image_derivatives.py`)
+    and `assets/map-tiles/` (from `build_map_tiles.py`)
   - Ignore dotfiles (e.g. .DS_Store)
+  - Each entry carries its intrinsic `width`/`height` (read from the file header,
+    see `image_probe.py`) so tiles can reserve space before the image loads
+  - If `data/image-derivatives.json` exists, each entry gets a `srcset` per format
+  - Duplicates (identical bytes, or the same picture re-encoded/resized, see
+    `image_dedupe.py`) collapse to one canonical entry; the run reports the
+    bytes saved
+  - With Pillow installed, each entry gets a `placeholder` (dominant colour plus a
+    tiny preview, see `image_placeholders.py`) painted until the tile loads
+  - The entries are split into per-category pages of `--chunk-size` images under
+    `data/gallery/` (one `<script>` each, so they load from file:// too); the
+    manifest itself only lists categories, their counts and chunk URLs, so its
+    size doesn't grow with the archive and `gallery.js` loads pages on scroll
+  - Inputs are fingerprinted in `.build-cache/`; an unchanged tree is a no-op, and
+    `generatedAt` only moves when the image list actually changes
 
 Usage:
   python3 tools/build_gallery_manifest.py
+  python3 tools/build_gallery_manifest.py --watch   # patch entries as images come and go
 """
 
 from __future__ import annotations
 
+import argparse
 import datetime as _dt
+import hashlib
+import json
 import os
+import re
 from pathlib import Path
 
+from asset_catalog import IMAGE_EXTS, AssetCatalog
+from build_cache import BuildCache, signature, write_if_changed
+from build_image_derivatives import DERIVED_DIR, MANIFEST_PATH as DERIVATIVES_MANIFEST, load_manifest, srcset_for
+from build_map_tiles import TILES_DIR
+from fs_watch import watch
+from image_dedupe import PHASH_DISTANCE, ImageDuplicates
+from image_placeholders import ImagePlaceholders
+from image_probe import ImageDimensions
 
-IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg"}
 
-
-def rel_posix(path: Path, root: Path) -> str:
-    return path.relative_to(root).as_posix()
+# Matches the `.gal-grid` breakpoints in styles.css (3 / 2 / 1 columns).
+GALLERY_SIZES = "(max-width: 640px) 100vw, (max-width: 980px) 50vw, 290px"
+CHUNKS_DIR = "data/gallery"
+# Generated image folders (never gallery material, and not worth watching).
+SKIP_PREFIXES = (DERIVED_DIR + "/", TILES_DIR + "/")
+# Images per chunk: a few screens of tiles, so scrolling loads a page well before it's needed.
+CHUNK_SIZE = 60
 
 
 def categorize(src: str) -> tuple[str, str]:
@@ -50,62 +82,246 @@ def categorize(src: str) -> tuple[str, str]:
     return ("Other", os.path.splitext(base)[0])
 
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parent.parent
-    assets_dir = repo_root / "assets"
-    out_file = repo_root / "data" / "gallery-manifest.js"
+# Stable ordering (requested): About, Hooke wilding misc, Feature photos, Info boards, Artwork, Other
+CATEGORY_ORDER = {
+    "About": 1,
+    "Hooke wilding misc": 2,
+    "Feature photos": 3,
+    "Info boards": 4,
+    "Artwork": 5,
+    "Other": 6,
+}
+
+
+def chunk_key(category: str, n: int) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", category.lower()).strip("-") or "other"
+    return f"{slug}-{n:03d}"
 
-    imgs: list[str] = []
-    for p in assets_dir.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.name.startswith("."):
-            continue
-        if p.suffix.lower() not in IMAGE_EXTS:
-            continue
-        rel = rel_posix(p, repo_root)
-        if rel.startswith("assets/field-guide/"):
-            continue
-        imgs.append(rel)
-
-    imgs = sorted(set(imgs))
-
-    # Stable ordering (requested): About, Hooke wilding misc, Feature photos, Info boards, Artwork, Other
-    order = {
-        "About": 1,
-        "Hooke wilding misc": 2,
-        "Feature photos": 3,
-        "Info boards": 4,
-        "Artwork": 5,
-        "Other": 6,
-    }
-
-    entries = []
-    for src in imgs:
-        category, label = categorize(src)
-        entries.append({"src": src, "category": category, "label": label})
-
-    entries.sort(key=lambda e: (order.get(e["category"], 99), e["category"], e["src"]))
-
-    ts = _dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
+def render_chunk(key: str, entries: list[dict]) -> str:
+    out_lines: list[str] = []
+    out_lines.append("// Auto-generated by tools/build_gallery_manifest.py")
+    out_lines.append(f"(window.__HOOKE_GALLERY_CHUNKS__ = window.__HOOKE_GALLERY_CHUNKS__ || {{}})[{json.dumps(key)}] = [")
+    for e in entries:
+        size = f", width: {e['width']}, height: {e['height']}" if e.get("width") else ""
+        srcset = f", srcset: {json.dumps(e['srcset'], ensure_ascii=False)}" if e.get("srcset") else ""
+        placeholder = f", placeholder: {json.dumps(e['placeholder'])}" if e.get("placeholder") else ""
+        out_lines.append(
+            f'  {{ src: "{e["src"]}", category: "{e["category"]}", label: "{e["label"]}"{size}{srcset}{placeholder} }},'
+        )
+    out_lines.append("];")
+    out_lines.append("")
+    return "\n".join(out_lines)
+
+
+def split_chunks(entries: list[dict], chunk_size: int) -> tuple[list[dict], dict[str, str]]:
+    """
+    Group sorted entries into per-category pages of `chunk_size`.
+
+    Returns (category index for the manifest, {chunk path: chunk text}). Chunk
+    URLs in the index carry a content-hash `?v=`, so a page whose images didn't
+    change keeps its URL (and its place in browser caches).
+    """
+    by_cat: dict[str, list[dict]] = {}
+    for e in entries:
+        by_cat.setdefault(e["category"], []).append(e)
+    index: list[dict] = []
+    chunks: dict[str, str] = {}
+    for category, items in by_cat.items():
+        urls = []
+        for n, start in enumerate(range(0, len(items), chunk_size), start=1):
+            key = chunk_key(category, n)
+            rel = f"{CHUNKS_DIR}/{key}.js"
+            text = render_chunk(key, items[start : start + chunk_size])
+            chunks[rel] = text
+            urls.append(f"{rel}?v={hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]}")
+        index.append({"name": category, "count": len(items), "chunks": urls})
+    return index, chunks
+
+
+def render_manifest(index: list[dict], chunk_size: int, generated_at: str) -> str:
     out_lines: list[str] = []
     out_lines.append("// Auto-generated by tools/build_gallery_manifest.py")
     out_lines.append("// Gallery images for Hooke Farm Wilding Portal (excluding assets/field-guide).")
+    out_lines.append(f"// The images themselves are in per-category pages under {CHUNKS_DIR}/, loaded as the grid scrolls.")
     out_lines.append("window.__HOOKE_GALLERY__ = {")
-    out_lines.append(f'  generatedAt: "{ts}",')
-    out_lines.append("  images: [")
-    for e in entries:
+    out_lines.append(f'  generatedAt: "{generated_at}",')
+    out_lines.append(f"  sizes: {json.dumps(GALLERY_SIZES)},")
+    out_lines.append(f"  total: {sum(c['count'] for c in index)},")
+    out_lines.append(f"  chunkSize: {chunk_size},")
+    out_lines.append("  categories: [")
+    for c in index:
         out_lines.append(
-            f'    {{ src: "{e["src"]}", category: "{e["category"]}", label: "{e["label"]}" }},'
+            f"    {{ name: {json.dumps(c['name'])}, count: {c['count']}, chunks: {json.dumps(c['chunks'])} }},"
         )
     out_lines.append("  ],")
     out_lines.append("};")
     out_lines.append("")
+    return "\n".join(out_lines)
+
+
+def is_gallery_image(rel: str) -> bool:
+    name = rel.rsplit("/", 1)[-1]
+    if name.startswith(".") or os.path.splitext(name)[1].lower() not in IMAGE_EXTS:
+        return False
+    return not rel.startswith(("assets/field-guide/", *SKIP_PREFIXES))
+
+
+def make_entry(
+    src: str,
+    derivatives: dict[str, dict],
+    dims: ImageDimensions,
+    placeholders: ImagePlaceholders,
+    catalog: AssetCatalog | None = None,
+) -> dict:
+    category, label = categorize(src)
+    entry = {"src": src, "category": category, "label": label}
+    e = catalog.get(src) if catalog else None
+    wh = dims.get(src, e.size, e.mtime_ns) if e else dims.get(src)
+    if wh:
+        entry["width"], entry["height"] = wh
+    srcset = srcset_for(derivatives, src)
+    if srcset:
+        entry["srcset"] = srcset
+    placeholder = placeholders.get(src)
+    if placeholder:
+        entry["placeholder"] = placeholder
+    return entry
+
+
+def write_manifest(
+    repo_root: Path, out_file: Path, entries_by_src: dict[str, dict], chunk_size: int = CHUNK_SIZE
+) -> tuple[bool, int]:
+    """Write the index and its chunks (pruning stale chunks). Returns (index written, chunks written)."""
+    entries = sorted(
+        entries_by_src.values(), key=lambda e: (CATEGORY_ORDER.get(e["category"], 99), e["category"], e["src"])
+    )
+    index, chunks = split_chunks(entries, chunk_size)
+    written = sum(write_if_changed(repo_root / rel, text) for rel, text in chunks.items())
+    chunks_dir = repo_root / CHUNKS_DIR
+    if chunks_dir.is_dir():
+        for p in chunks_dir.glob("*.js"):
+            if f"{CHUNKS_DIR}/{p.name}" not in chunks:
+                p.unlink()
+
+    # Keep the previous `generatedAt` when nothing else changed, so identical
+    # content produces identical bytes (and doesn't bust browser caches).
+    existing = out_file.read_text(encoding="utf-8") if out_file.exists() else ""
+    m = re.search(r'^  generatedAt: "([^"]+)",$', existing, re.M)
+    text = render_manifest(index, chunk_size, m.group(1)) if m else None
+    if text != existing:
+        ts = _dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        text = render_manifest(index, chunk_size, ts)
+    return write_if_changed(out_file, text), written
+
+
+def outputs_fingerprint(cache: BuildCache, repo_root: Path, out_file: Path) -> str:
+    """Change token for the index plus every chunk file, so a deleted or edited chunk forces a rebuild."""
+    parts = [cache.fingerprint(out_file)]
+    chunks_dir = repo_root / CHUNKS_DIR
+    if chunks_dir.is_dir():
+        parts += [[p.name, cache.fingerprint(p)] for p in sorted(chunks_dir.glob("*.js"))]
+    return signature(parts)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--watch", action="store_true", help="Keep running and patch entries for changed images")
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Images per manifest chunk")
+    args = ap.parse_args()
+    chunk_size = max(1, args.chunk_size)
+
+    repo_root = Path(__file__).resolve().parent.parent
+    out_file = repo_root / "data" / "gallery-manifest.js"
+    derivatives_file = repo_root / DERIVATIVES_MANIFEST
+    cache = BuildCache(repo_root)
+    placeholders = ImagePlaceholders(repo_root, cache)
+    dupes = ImageDuplicates(repo_root, cache)
+
+    catalog = AssetCatalog.scan(repo_root, "assets", skip_prefixes=SKIP_PREFIXES)
+
+    found = [(rel, e) for rel, e in catalog.walk() if is_gallery_image(rel)]
+    # A fresh checkout has every image to hash: do that in parallel rather than one by one below.
+    cache.prehash([(rel, e.size, e.mtime_ns) for rel, e in found])
+    imgs = [rel for rel, _e in found]
+    fingerprints = [[rel, cache.entry_fingerprint(rel, e.size, e.mtime_ns)] for rel, e in found]
+
+    # Nothing changed since the last run (same images, same derivatives, output untouched)?
+    sig = signature(
+        [
+            fingerprints,
+            cache.fingerprint(derivatives_file) if derivatives_file.exists() else "",
+            GALLERY_SIZES,
+            chunk_size,
+            placeholders.available,
+            [dupes.perceptual, PHASH_DISTANCE],
+        ]
+    )
+    prev = cache.get("gallery", "output")
+    if (
+        not args.watch
+        and isinstance(prev, dict)
+        and prev.get("sig") == sig
+        and out_file.exists()
+        and prev.get("out") == outputs_fingerprint(cache, repo_root, out_file)
+    ):
+        cache.save()
+        print(f"Up to date: {out_file} ({prev.get('count', 0)} images, {prev.get('duplicates', 0)} duplicates skipped)")
+        return 0
+
+    derivatives = load_manifest(repo_root)
+    dims = ImageDimensions(repo_root, cache)
+    sources = set(imgs)
+    canonical = dupes.canonical(imgs)
+    keep = [src for src in imgs if canonical.get(src, src) == src]
+    placeholders.prepare(keep)
+    entries_by_src = {src: make_entry(src, derivatives, dims, placeholders, catalog) for src in keep}
+    wrote, chunks = write_manifest(repo_root, out_file, entries_by_src, chunk_size)
+    dropped, saved = dupes.report(canonical)
+    out_sig = outputs_fingerprint(cache, repo_root, out_file)
+    cache.put("gallery", "output", {"sig": sig, "out": out_sig, "count": len(entries_by_src), "duplicates": dropped})
+    cache.save()
+    print(f"{'Wrote' if wrote else 'Up to date:'} {out_file} ({len(entries_by_src)} images, {chunks} chunks written)")
+    for src in sorted(src for src in imgs if canonical.get(src, src) != src):
+        print(f"  duplicate: {src} -> {canonical[src]}")
+    if dropped:
+        print(f"Skipped {dropped} duplicate image(s), saving {saved / 1024:.0f} KiB.")
+
+    if not args.watch:
+        return 0
+
+    def on_change(paths: set[str]) -> None:
+        nonlocal derivatives
+        if DERIVATIVES_MANIFEST in paths:
+            derivatives = load_manifest(repo_root)
+            targets = set(entries_by_src) | paths
+        else:
+            targets = paths
+        targets = {rel for rel in targets if is_gallery_image(rel)}
+        for rel in targets:
+            if (repo_root / rel).is_file():
+                sources.add(rel)
+            else:
+                sources.discard(rel)
+        # An added or removed copy can change which file of its group is canonical.
+        canonical = dupes.canonical(sorted(sources))
+        before = set(entries_by_src)
+        for rel in before - {src for src in sources if canonical.get(src, src) == src}:
+            del entries_by_src[rel]
+        for rel in sorted(sources):
+            if canonical.get(rel, rel) == rel and (rel in targets or rel not in entries_by_src):
+                entries_by_src[rel] = make_entry(rel, derivatives, dims, placeholders)
+        added, removed = len(set(entries_by_src) - before), len(before - set(entries_by_src))
+        wrote, chunks = write_manifest(repo_root, out_file, entries_by_src, chunk_size)
+        # The cached signature no longer describes the output; the next one-shot run re-checks.
+        cache.put("gallery", "output", None)
+        cache.save()
+        print(
+            f"{'Patched' if wrote else 'Unchanged:'} {out_file.name} "
+            f"(+{added} / -{removed}, {len(entries_by_src)} images, {chunks} chunks written)"
+        )
 
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_text("\n".join(out_lines), encoding="utf-8")
-    print(f"Wrote {out_file} ({len(entries)} images)")
+    watch(repo_root, ["assets", DERIVATIVES_MANIFEST], on_change, skip_prefixes=SKIP_PREFIXES)
     return 0
 
 
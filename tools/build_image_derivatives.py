@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Build responsive image derivatives (resized WebP/AVIF copies) for the site.
+
+Why:
+  Cards, the feature modal and the Gallery page used to load the original photos
+  and board renders, many of which are 2–4 MB. This script writes resized copies
+  under `assets/derived/` plus a manifest (`data/image-derivatives.json`) that
+  `build_features_data.py` and `build_gallery_manifest.py` read to emit
+  `srcset`/`sizes` data, so the browser can pick the smallest suitable file.
+
+Rules:
+  - Sources: raster images under `assets/` (png/jpg/jpeg/webp), excluding
+    `assets/derived/` itself, the map tiles (`assets/map-tiles/`) and dotfiles. SVGs and GIFs are served as-is.
+  - Widths: 320/640/960/1600 by default. We never upscale: an image narrower
+    than the largest width gets one extra derivative at its own width.
+  - Output names are derived from the full source path (extension included,
+    so `x.png` and `x.jpg` never share a derivative), width and format
+    (`assets/derived/<path>.<width>w.<format>`), so runs are deterministic.
+  - A source is skipped when all of its derivatives exist and are newer than it
+    (checked from the image header, so an interrupted run resumes where it stopped).
+  - Derivatives whose source has gone away are removed.
+
+Requires Pillow (`pip install Pillow`). AVIF output additionally needs a Pillow
+build with AVIF support; without it only WebP is written.
+
+Usage:
+  python3 tools/build_image_derivatives.py
+  python3 tools/build_image_derivatives.py --formats webp --widths 480,960 --jobs 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from asset_catalog import AssetCatalog
+from build_cache import write_if_changed
+from build_map_tiles import TILES_DIR
+
+SOURCE_EXTS = {".png", ".jpg", ".jpeg", ".webp"}
+DEFAULT_WIDTHS = (320, 640, 960, 1600)
+DEFAULT_FORMATS = ("avif", "webp")
+DERIVED_DIR = "assets/derived"
+MANIFEST_PATH = "data/image-derivatives.json"
+
+# Encoder settings are pinned so repeated runs produce identical bytes.
+ENCODE_OPTS = {
+    "webp": {"quality": 78, "method": 6},
+    "avif": {"quality": 55, "speed": 6},
+}
+
+
+def derived_path(src_rel: str, width: int, fmt: str) -> str:
+    """`assets/features/x/IMG_1.jpeg` -> `assets/derived/features/x/IMG_1.jpeg.640w.webp`."""
+    under_assets = src_rel[len("assets/") :] if src_rel.startswith("assets/") else src_rel
+    return f"{DERIVED_DIR}/{under_assets}.{width}w.{fmt}"
+
+
+def target_widths(src_width: int, widths: tuple[int, ...]) -> list[int]:
+    out = [w for w in widths if w < src_width]
+    if src_width < max(widths):
+        out.append(src_width)
+    return sorted(set(out))
+
+
+def load_manifest(repo_root: Path) -> dict[str, dict]:
+    """
+    Return the `images` map from `data/image-derivatives.json` ({} if not built yet).
+
+    Keys are source paths relative to the repo root; values hold the source
+    dimensions and the derivative list per format.
+    """
+    path = repo_root / MANIFEST_PATH
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    images = data.get("images") if isinstance(data, dict) else None
+    return images if isinstance(images, dict) else {}
+
+
+def srcset_for(images: dict[str, dict], src: str) -> dict[str, str] | None:
+    """
+    Build ready-to-use `srcset` strings for `src`, keyed by format.
+
+    URLs are percent-encoded because a literal space would split a srcset entry.
+    """
+    entry = images.get(src)
+    if not isinstance(entry, dict):
+        return None
+    variants = entry.get("variants") or {}
+    out: dict[str, str] = {}
+    for fmt in DEFAULT_FORMATS:
+        items = variants.get(fmt) or []
+        if items:
+            out[fmt] = ", ".join(f"{urllib.parse.quote(url)} {w}w" for url, w in items)
+    return out or None
+
+
+def _supported_formats(requested: tuple[str, ...]) -> tuple[str, ...]:
+    from PIL import features
+
+    out = []
+    for fmt in requested:
+        if fmt == "avif" and not features.check("avif"):
+            print("  !! Pillow was built without AVIF support (skipping avif)")
+            continue
+        out.append(fmt)
+    return tuple(out)
+
+
+def plan_derivatives(src_abs: str, src_rel: str, widths: tuple[int, ...], formats: tuple[str, ...]) -> dict:
+    """
+    Work out the manifest entry for one source from its header alone (no pixel decode).
+
+    EXIF orientations 5–8 swap width/height, matching what `exif_transpose` produces.
+    """
+    from PIL import Image
+
+    with Image.open(src_abs) as im:
+        w, h = im.size
+        if im.getexif().get(0x0112) in (5, 6, 7, 8):
+            w, h = h, w
+    variants = {fmt: [[derived_path(src_rel, tw, fmt), tw] for tw in target_widths(w, widths)] for fmt in formats}
+    return {"width": w, "height": h, "variants": variants}
+
+
+def _render_one(job: tuple[str, str, dict]) -> tuple[str, dict]:
+    """Worker: decode one source once and write all of its planned derivatives."""
+    from PIL import Image, ImageOps
+
+    src_abs, src_rel, entry = job
+    repo_root = Path(src_abs[: -len(src_rel)])
+    with Image.open(src_abs) as im:
+        im = ImageOps.exif_transpose(im)
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if "A" in im.getbands() else "RGB")
+        src_w, src_h = im.size
+
+        resized_by_width: dict[int, object] = {}
+        for fmt, items in entry["variants"].items():
+            for rel, w in items:
+                resized = resized_by_width.get(w)
+                if resized is None:
+                    h = max(1, round(src_h * w / src_w))
+                    resized = im if w == src_w else im.resize((w, h), Image.Resampling.LANCZOS)
+                    resized_by_width[w] = resized
+                out = repo_root / rel
+                out.parent.mkdir(parents=True, exist_ok=True)
+                tmp = out.with_name(out.name + ".tmp")
+                resized.save(tmp, format=fmt.upper(), **ENCODE_OPTS[fmt])
+                os.replace(tmp, out)
+
+    return src_rel, entry
+
+
+def _is_fresh(repo_root: Path, src: Path, entry: dict) -> bool:
+    src_mtime = src.stat().st_mtime
+    for items in entry["variants"].values():
+        for rel, _w in items:
+            out = repo_root / rel
+            if not out.is_file() or out.stat().st_mtime < src_mtime:
+                return False
+    return True
+
+
+def collect_sources(repo_root: Path) -> list[str]:
+    catalog = AssetCatalog.scan(repo_root, "assets", skip_prefixes=(DERIVED_DIR + "/", TILES_DIR + "/"))
+    return [rel for rel, e in catalog.walk() if e.suffix in SOURCE_EXTS]
+
+
+def _prune(repo_root: Path, keep: set[str]) -> int:
+    derived = repo_root / DERIVED_DIR
+    if not derived.is_dir():
+        return 0
+    removed = 0
+    for p in sorted(derived.rglob("*"), reverse=True):
+        rel = p.relative_to(repo_root).as_posix()
+        if p.is_file() and rel not in keep:
+            p.unlink()
+            removed += 1
+        elif p.is_dir() and not any(p.iterdir()):
+            p.rmdir()
+    return removed
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--widths", default=",".join(str(w) for w in DEFAULT_WIDTHS), help="Comma-separated target widths")
+    ap.add_argument("--formats", default=",".join(DEFAULT_FORMATS), help="Comma-separated formats (avif, webp)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    ap.add_argument("--force", action="store_true", help="Re-render every derivative")
+    args = ap.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("ERROR: Pillow is required (pip install Pillow)", file=sys.stderr)
+        return 2
+
+    widths = tuple(sorted({int(w) for w in args.widths.split(",") if w.strip()}))
+    requested = tuple(f.strip().lower() for f in args.formats.split(",") if f.strip())
+    unknown = [f for f in requested if f not in ENCODE_OPTS]
+    if not widths or unknown:
+        print(f"ERROR: bad --widths/--formats ({', '.join(unknown) or 'no widths'})", file=sys.stderr)
+        return 2
+    formats = _supported_formats(requested)
+    if not formats:
+        print("ERROR: no usable output formats", file=sys.stderr)
+        return 2
+
+    repo_root = Path(__file__).resolve().parent.parent
+    sources = collect_sources(repo_root)
+
+    images: dict[str, dict] = {}
+    jobs = []
+    for rel in sources:
+        entry = plan_derivatives(str(repo_root / rel), rel, widths, formats)
+        if not args.force and _is_fresh(repo_root, repo_root / rel, entry):
+            images[rel] = entry
+            continue
+        jobs.append((str(repo_root / rel), rel, entry))
+
+    if jobs:
+        print(f"Rendering {len(jobs)} of {len(sources)} images ({', '.join(formats)} @ {', '.join(map(str, widths))}w)...")
+        with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            for rel, entry in pool.map(_render_one, jobs):
+                print(f"  -> {rel}")
+                images[rel] = entry
+
+    keep = {rel for entry in images.values() for items in entry["variants"].values() for rel, _w in items}
+    removed = _prune(repo_root, keep)
+
+    manifest = {"widths": list(widths), "formats": list(formats), "images": dict(sorted(images.items()))}
+    out = repo_root / MANIFEST_PATH
+    wrote = write_if_changed(out, json.dumps(manifest, indent=1, ensure_ascii=False) + "\n")
+    print(
+        f"{'Wrote' if wrote else 'Up to date:'} {out} ({len(images)} images, {len(jobs)} rendered, "
+        f"{len(sources) - len(jobs)} up to date, {removed} stale derivatives removed)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
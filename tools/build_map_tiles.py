@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Cut the watercolour map into a deep-zoom tile pyramid.
+
+Why:
+  The home page used to show `assets/hooke-farm-watercolour.png` as one large
+  bitmap, so on a phone nothing was usable until all of it had downloaded and
+  decoded. With a pyramid, the page paints a tiny base layer at once and then
+  fetches only the tiles it can see, at the resolution it needs; zooming in
+  loads sharper tiles for the visible area only.
+
+Rules:
+  - Levels follow the Deep Zoom convention: level `n` is the map scaled by
+    1 / 2^(max - n), rounded up, so the last level is the original size. Levels
+    too small to need more than one tile are skipped (the base layer covers them).
+  - Tiles are `--tile-size` px WebP (edge tiles are smaller), written to
+    `assets/map-tiles/<level>/<col>_<row>.webp`, plus a `base.webp` at
+    `BASE_WIDTH` px that the page shows first.
+  - `data/map-tiles.js` sets `window.__HOOKE_MAP_TILES__`: the map size, tile
+    size, the size of each level and URL templates with a `?v=` of the source
+    hash, so replaced tiles never come from a stale cache.
+  - The hero image in `index.html` ships pointing at the full map. Once the
+    tiles exist, its `src` is switched to the base layer and a `data-tiles`
+    attribute names the manifest; `app.js` only loads the manifest (and offers
+    zoom) when that attribute is there, so an unbuilt tree makes no requests
+    for missing files.
+  - Pins and the tour path keep their `xPct`/`yPct` coordinates: they are
+    fractions of the map, whatever the level.
+  - Tiles are encoded on a process pool. The run is skipped when the source
+    and settings match the last run (`.build-cache/`) and the output is in
+    place (`--force` rebuilds).
+
+Needs Pillow.
+
+Usage:
+  python3 tools/build_map_tiles.py
+  python3 tools/build_map_tiles.py --tile-size 512 --quality 85
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache, signature, write_if_changed
+
+try:
+    from PIL import Image
+except ImportError:  # reported in main()
+    Image = None
+
+
+MAP_SRC = "assets/hooke-farm-watercolour.png"
+TILES_DIR = "assets/map-tiles"
+OUT_FILE = "data/map-tiles.js"
+PAGE_FILE = "index.html"
+CACHE_NS = "map-tiles"
+TILE_SIZE = 256
+BASE_WIDTH = 480
+DEFAULT_QUALITY = 80
+_HERO_IMG_RE = re.compile(r'<img\b[^>]*\bclass="hero__img"[^>]*>')
+_SRC_RE = re.compile(r'(\s+)src="[^"]*"')
+_TILES_ATTR_RE = re.compile(r'\s+data-tiles="[^"]*"')
+
+# Worker-side: the current level, scaled once and reused for all of its rows.
+_level_image: tuple[tuple, object] | None = None
+
+
+def level_sizes(width: int, height: int, tile_size: int) -> tuple[int, list[list[int]]]:
+    """(first level written, [[w, h] per level from that one up to full size])."""
+    top = math.ceil(math.log2(max(width, height, 2)))
+    sizes = [[math.ceil(width / 2 ** (top - n)), math.ceil(height / 2 ** (top - n))] for n in range(top + 1)]
+    first = max(n for n, (w, h) in enumerate(sizes) if max(w, h) <= tile_size)
+    return first, sizes[first:]
+
+
+def _open_source(src: str) -> "Image.Image":
+    Image.MAX_IMAGE_PIXELS = None  # our own (large) map, not untrusted input
+    im = Image.open(src)
+    im.load()
+    has_alpha = im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info)
+    return im.convert("RGBA" if has_alpha else "RGB")
+
+
+def cut_row(job: tuple[str, str, int, int, int, int, int, int]) -> int:
+    """Write one row of tiles for one level. Returns the number of tiles written."""
+    global _level_image
+    src, out_dir, level, width, height, row, tile_size, quality = job
+    key = (src, level, width, height)
+    if _level_image is None or _level_image[0] != key:
+        im = _open_source(src)
+        if im.size != (width, height):
+            im = im.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        _level_image = (key, im)
+    im = _level_image[1]
+    folder = Path(out_dir) / str(level)
+    folder.mkdir(parents=True, exist_ok=True)
+    top = row * tile_size
+    bottom = min(height, top + tile_size)
+    cols = math.ceil(width / tile_size)
+    for col in range(cols):
+        left = col * tile_size
+        tile = im.crop((left, top, min(width, left + tile_size), bottom))
+        tile.save(folder / f"{col}_{row}.webp", "WEBP", quality=quality, method=4)
+    return cols
+
+
+def write_base(src: Path, dest: Path, width: int, quality: int) -> None:
+    im = _open_source(str(src))
+    height = max(1, round(im.height * width / im.width))
+    im.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0).save(dest, "WEBP", quality=quality, method=6)
+
+
+def render_manifest(info: dict) -> str:
+    out_lines: list[str] = []
+    out_lines.append("// Auto-generated by tools/build_map_tiles.py")
+    out_lines.append("// Deep-zoom tiles for the watercolour map; app.js loads the visible ones per zoom level.")
+    out_lines.append("window.__HOOKE_MAP_TILES__ = {")
+    for key, value in info.items():
+        out_lines.append(f"  {key}: {json.dumps(value)},")
+    out_lines.append("};")
+    out_lines.append("")
+    return "\n".join(out_lines)
+
+
+def point_hero_at_tiles(html: str, base: str) -> str | None:
+    """`html` with the hero image showing `base` and naming the tile manifest (None without a hero image)."""
+    m = _HERO_IMG_RE.search(html)
+    if not m:
+        return None
+    tag = _TILES_ATTR_RE.sub("", m.group(0))
+    tag = _SRC_RE.sub(lambda s: f'{s.group(1)}src="./{base}"{s.group(1)}data-tiles="./{OUT_FILE}"', tag, count=1)
+    return html[: m.start()] + tag + html[m.end() :]
+
+
+def update_page(repo_root: Path, base: str) -> bool:
+    page = repo_root / PAGE_FILE
+    html = point_hero_at_tiles(page.read_text(encoding="utf-8"), base)
+    if html is None:
+        print(f"WARNING: no hero image in {PAGE_FILE}; it keeps showing the full map", file=sys.stderr)
+        return False
+    return write_if_changed(page, html)
+
+
+def _count_tiles(tiles_dir: Path) -> int:
+    return sum(1 for _p in tiles_dir.glob("*/*.webp")) if tiles_dir.is_dir() else 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--src", default=MAP_SRC, help=f"Map image, repo-relative (default: {MAP_SRC})")
+    ap.add_argument("--tile-size", type=int, default=TILE_SIZE, help="Tile edge in pixels")
+    ap.add_argument("--quality", type=int, default=DEFAULT_QUALITY, help="WebP quality (0-100)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    ap.add_argument("--force", action="store_true", help="Rebuild even if the source is unchanged")
+    args = ap.parse_args()
+
+    if Image is None:
+        print("ERROR: Pillow is required (pip install Pillow)", file=sys.stderr)
+        return 2
+    if args.tile_size < 64 or not 0 <= args.quality <= 100:
+        print("ERROR: --tile-size must be at least 64 and --quality within 0-100", file=sys.stderr)
+        return 2
+
+    repo_root = Path(__file__).resolve().parent.parent
+    src = repo_root / args.src
+    if not src.is_file():
+        print(f"ERROR: map image not found: {args.src}", file=sys.stderr)
+        return 2
+    tiles_dir = repo_root / TILES_DIR
+    out_file = repo_root / OUT_FILE
+    cache = BuildCache(repo_root)
+
+    sha = cache.file_hash(src)
+    opts = signature([args.src, args.tile_size, args.quality, BASE_WIDTH])
+    rec = cache.get(CACHE_NS, "output")
+    if (
+        not args.force
+        and isinstance(rec, dict)
+        and rec.get("sha") == sha
+        and rec.get("opts") == opts
+        and out_file.exists()
+        and (tiles_dir / "base.webp").exists()
+        and _count_tiles(tiles_dir) == rec.get("tiles")
+    ):
+        cache.save()
+        paged = update_page(repo_root, f"{TILES_DIR}/base.webp?v={sha[:10]}")
+        print(f"Up to date: {OUT_FILE} ({rec.get('tiles')} tiles){f'; updated {PAGE_FILE}' if paged else ''}")
+        return 0
+
+    with Image.open(src) as im:
+        width, height = im.size
+    first, sizes = level_sizes(width, height, args.tile_size)
+    t0 = time.perf_counter()
+
+    # Tiles are only ever regenerated together, so start from an empty folder (no stale levels).
+    if tiles_dir.is_dir():
+        shutil.rmtree(tiles_dir)
+    tiles_dir.mkdir(parents=True)
+    write_base(src, tiles_dir / "base.webp", min(BASE_WIDTH, width), 60)
+
+    # Biggest levels first, so the slow rows don't trail at the end.
+    jobs = [
+        (str(src), str(tiles_dir), first + i, w, h, row, args.tile_size, args.quality)
+        for i, (w, h) in reversed(list(enumerate(sizes)))
+        for row in range(math.ceil(h / args.tile_size))
+    ]
+    print(f"Cutting {width}x{height} {args.src} into {len(sizes)} levels ({len(jobs)} rows of tiles)...")
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+            tiles = sum(pool.map(cut_row, jobs, chunksize=4))
+    else:
+        tiles = sum(cut_row(job) for job in jobs)
+
+    version = sha[:10]
+    info = {
+        "src": args.src,
+        "width": width,
+        "height": height,
+        "tileSize": args.tile_size,
+        "minLevel": first,
+        "levels": sizes,
+        "tiles": f"{TILES_DIR}/{{z}}/{{x}}_{{y}}.webp?v={version}",
+        "base": f"{TILES_DIR}/base.webp?v={version}",
+    }
+    wrote = write_if_changed(out_file, render_manifest(info))
+    paged = update_page(repo_root, info["base"])
+    cache.put(CACHE_NS, "output", {"sha": sha, "opts": opts, "tiles": tiles})
+    cache.save()
+    size_kb = sum(p.stat().st_size for p in tiles_dir.rglob("*.webp")) / 1024
+    print(
+        f"Done in {time.perf_counter() - t0:.1f}s: {tiles} tiles + base layer ({size_kb:.0f} KiB); "
+        f"{'wrote' if wrote else 'unchanged:'} {OUT_FILE}{f', updated {PAGE_FILE}' if paged else ''}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Generate `sw.js`, the offline service worker for the Hooke Wilding Webapp.
+
+Why:
+  The site is meant to be an offline guide, but without a service worker every
+  visit on patchy farm signal re-downloads the pages, scripts, data bundles and
+  multi-megabyte board images. This script writes a service worker with a
+  content-hashed precache manifest baked in, so:
+
+  - the app shell (pages, scripts, styles, icons/map referenced by the pages)
+    and every data bundle (incl. feature detail and gallery chunks) are precached on
+    install and served cache-first;
+  - on an update only entries whose hash changed are downloaded again — the
+    rest are copied over from the previous precache;
+  - images are cached at runtime, with least-recently-used eviction once the
+    cache grows past a byte budget.
+
+Rules:
+  - Run it after the bundle builders (`build_features_data.py`,
+    `build_gallery_manifest.py`, ...), since it hashes their outputs. Any
+    change to a precached file changes `sw.js`, which is what makes browsers
+    pick up the new version.
+  - `sw.js` is a publish-time output (git-ignored): run this right before
+    `fingerprint_assets.py`, which copies it into `dist/` and adds the
+    `<meta name="hooke-sw">` tag to the pages there. `nav.js` only registers
+    the worker on pages with that tag, over http(s), and never on localhost,
+    so opening the repo root (file:// or `serve.py`) is unaffected.
+  - `--uninstall` writes a worker that clears its caches and unregisters
+    itself (to switch offline support off for a published site).
+
+Usage:
+  python3 tools/build_service_worker.py
+  python3 tools/build_service_worker.py --image-budget-mb 120
+  python3 tools/build_service_worker.py --uninstall
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from build_cache import BuildCache, signature, write_if_changed
+
+
+OUT_FILE = "sw.js"
+DEFAULT_IMAGE_BUDGET_MB = 60
+
+# Repo-relative globs that make up the app shell + data bundles.
+PRECACHE_GLOBS = (
+    "*.html",
+    "*.js",
+    "*.css",
+    "data/*.js",
+    "data/feature-details/*.js",
+    "data/gallery/*.js",
+)
+# Local assets referenced directly by the pages (favicon, header icon, map).
+_HTML_ASSET_RE = re.compile(r"""(?:src|href)\s*=\s*["']\./(assets/[^"'?#]+)""")
+
+
+def collect_precache(repo_root: Path) -> tuple[list[str], list[str]]:
+    """Return (precache paths, missing asset paths), repo-relative and sorted."""
+    paths: set[str] = set()
+    for pattern in PRECACHE_GLOBS:
+        for p in repo_root.glob(pattern):
+            if p.is_file() and not p.name.startswith("."):
+                paths.add(p.relative_to(repo_root).as_posix())
+    paths.discard(OUT_FILE)
+
+    missing: set[str] = set()
+    for html in [p for p in paths if p.endswith(".html")]:
+        text = (repo_root / html).read_text(encoding="utf-8")
+        for rel in _HTML_ASSET_RE.findall(text):
+            (paths if (repo_root / rel).is_file() else missing).add(rel)
+    return sorted(paths), sorted(missing)
+
+
+SW_TEMPLATE = """/* Auto-generated by tools/build_service_worker.py — do not edit by hand. */
+/* global self, caches, fetch, Response, URL */
+
+const VERSION = "__VERSION__";
+// [url, content hash] for the app shell and data bundles.
+const PRECACHE = __PRECACHE__;
+const IMAGE_BUDGET_BYTES = __BUDGET__;
+
+const PRECACHE_PREFIX = "hooke-precache-";
+const PRECACHE_NAME = `${PRECACHE_PREFIX}${VERSION}`;
+const IMAGE_CACHE_NAME = "hooke-images";
+// Bookkeeping lives in the caches themselves, under URLs the site never requests.
+const META_URL = "./__sw__/precache.json";
+const LRU_URL = "./__sw__/image-lru.json";
+const IMAGE_RE = /\\.(png|jpe?g|webp|avif|gif|svg)$/i;
+
+const precachePaths = new Set(PRECACHE.map(([url]) => new URL(url, self.registration.scope).pathname));
+
+function abs(url) {
+  return new URL(url, self.registration.scope).href;
+}
+
+async function readJson(cache, url) {
+  const res = await cache.match(abs(url));
+  if (!res) return null;
+  try {
+    return await res.json();
+  } catch {
+    return null;
+  }
+}
+
+function writeJson(cache, url, value) {
+  return cache.put(abs(url), new Response(JSON.stringify(value), { headers: { "Content-Type": "application/json" } }));
+}
+
+// --- Install: fetch only what changed since the previous version ---
+async function precache() {
+  const cache = await caches.open(PRECACHE_NAME);
+  const previous = [];
+  for (const name of await caches.keys()) {
+    if (name === PRECACHE_NAME || !name.startsWith(PRECACHE_PREFIX)) continue;
+    const old = await caches.open(name);
+    previous.push({ cache: old, hashes: (await readJson(old, META_URL)) || {} });
+  }
+
+  const done = {};
+  await Promise.all(
+    PRECACHE.map(async ([url, hash]) => {
+      for (const prev of previous) {
+        if (prev.hashes[url] !== hash) continue;
+        const res = await prev.cache.match(abs(url));
+        if (res) {
+          await cache.put(abs(url), res);
+          done[url] = hash;
+          return;
+        }
+      }
+      const res = await fetch(abs(url), { cache: "reload" });
+      if (!res.ok) throw new Error(`Precache failed for ${url} (${res.status})`);
+      await cache.put(abs(url), res);
+      done[url] = hash;
+    })
+  );
+  await writeJson(cache, META_URL, done);
+}
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(precache().then(() => self.skipWaiting()));
+});
+
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((names) =>
+        Promise.all(names.filter((n) => n.startsWith(PRECACHE_PREFIX) && n !== PRECACHE_NAME).map((n) => caches.delete(n)))
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+// --- Runtime image cache with LRU eviction ---
+let lru = null; // Map url -> [bytes, lastUsed]
+let lruWrite = null;
+
+async function loadLru(cache) {
+  if (!lru) lru = new Map(Object.entries((await readJson(cache, LRU_URL)) || {}));
+  return lru;
+}
+
+function saveLru(cache) {
+  // Coalesce bursts of hits (a gallery page loads dozens of images) into one write.
+  if (!lruWrite) {
+    lruWrite = new Promise((resolve) => setTimeout(resolve, 500)).then(() => {
+      lruWrite = null;
+      return writeJson(cache, LRU_URL, Object.fromEntries(lru));
+    });
+  }
+  return lruWrite;
+}
+
+async function evict(cache) {
+  let total = 0;
+  lru.forEach(([bytes]) => (total += bytes));
+  if (total <= IMAGE_BUDGET_BYTES) return;
+  const oldestFirst = Array.from(lru).sort((a, b) => a[1][1] - b[1][1]);
+  for (const [url, [bytes]] of oldestFirst) {
+    if (total <= IMAGE_BUDGET_BYTES) break;
+    await cache.delete(url);
+    lru.delete(url);
+    total -= bytes;
+  }
+}
+
+async function fromImageCache(event) {
+  const cache = await caches.open(IMAGE_CACHE_NAME);
+  const entries = await loadLru(cache);
+  const url = event.request.url;
+  const hit = await cache.match(url);
+  if (hit) {
+    const entry = entries.get(url);
+    entries.set(url, [entry ? entry[0] : 0, Date.now()]);
+    event.waitUntil(saveLru(cache));
+    return hit;
+  }
+
+  const res = await fetch(event.request);
+  if (res.ok && res.type === "basic") {
+    const copy = res.clone();
+    event.waitUntil(
+      copy
+        .blob()
+        .then(async (blob) => {
+          if (blob.size > IMAGE_BUDGET_BYTES) return;
+          await cache.put(url, new Response(blob, { headers: copy.headers }));
+          entries.set(url, [blob.size, Date.now()]);
+          await evict(cache);
+          await saveLru(cache);
+        })
+        .catch(() => {
+          // ignore (quota errors etc.: the image was still served)
+        })
+    );
+  }
+  return res;
+}
+
+// --- Precached shell: cache-first, network fallback ---
+async function fromPrecache(request, path) {
+  const cache = await caches.open(PRECACHE_NAME);
+  const hit = await cache.match(abs(`.${path}`));
+  if (hit) return hit;
+  try {
+    return await fetch(request);
+  } catch (err) {
+    if (request.mode === "navigate") {
+      const home = await cache.match(abs("./index.html"));
+      if (home) return home;
+    }
+    throw err;
+  }
+}
+
+self.addEventListener("fetch", (event) => {
+  const req = event.request;
+  if (req.method !== "GET" || req.headers.has("range")) return;
+  const url = new URL(req.url);
+  if (url.origin !== self.location.origin) return;
+
+  const scopePath = new URL(self.registration.scope).pathname;
+  let path = url.pathname;
+  if (path === scopePath) path = `${scopePath}index.html`;
+  if (precachePaths.has(path) || req.mode === "navigate") {
+    // Query strings (`?v=...` cache-busters) are ignored: the manifest hash is the version.
+    event.respondWith(fromPrecache(req, path.slice(scopePath.length - 1)));
+  } else if (req.destination === "image" || IMAGE_RE.test(path)) {
+    event.respondWith(fromImageCache(event));
+  }
+});
+"""
+
+UNINSTALL_TEMPLATE = """/* Auto-generated by tools/build_service_worker.py --uninstall — do not edit by hand. */
+/* global self, caches */
+
+// Offline support switched off: drop our caches and unregister.
+self.addEventListener("install", () => self.skipWaiting());
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches
+      .keys()
+      .then((names) => Promise.all(names.filter((n) => n.startsWith("hooke-")).map((n) => caches.delete(n))))
+      .then(() => self.registration.unregister())
+  );
+});
+"""
+
+
+def render_sw(entries: list[list[str]], budget_bytes: int) -> str:
+    version = signature([entries, budget_bytes])[:12]
+    # One entry per line keeps diffs of the generated file readable.
+    precache = "[\n" + ",\n".join(f"  {json.dumps(e, ensure_ascii=False)}" for e in entries) + "\n]"
+    return (
+        SW_TEMPLATE.replace("__VERSION__", version)
+        .replace("__PRECACHE__", precache)
+        .replace("__BUDGET__", str(budget_bytes))
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--image-budget-mb",
+        type=float,
+        default=DEFAULT_IMAGE_BUDGET_MB,
+        help=f"Max size of the runtime image cache (default {DEFAULT_IMAGE_BUDGET_MB})",
+    )
+    ap.add_argument("--uninstall", action="store_true", help="Write a worker that removes itself and its caches")
+    args = ap.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    out = repo_root / OUT_FILE
+
+    if args.uninstall:
+        wrote = write_if_changed(out, UNINSTALL_TEMPLATE)
+        print(f"{'Wrote' if wrote else 'Up to date:'} {out} (uninstall worker)")
+        return 0
+
+    cache = BuildCache(repo_root)
+    paths, missing = collect_precache(repo_root)
+    entries = [[f"./{rel}", cache.file_hash(repo_root / rel)[:16]] for rel in paths]
+    budget = int(args.image_budget_mb * 1024 * 1024)
+    wrote = write_if_changed(out, render_sw(entries, budget))
+    cache.save()
+
+    for rel in missing:
+        print(f"  !! referenced by a page but missing (not precached): {rel}")
+    total = sum((repo_root / rel).stat().st_size for rel in paths)
+    print(
+        f"{'Wrote' if wrote else 'Up to date:'} {out} ({len(entries)} precached files, "
+        f"{total / 1024:.0f} KB; image cache budget {args.image_budget_mb:g} MB)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Single-pass parser + rewriter for data/content-data.js.
+
+Why: the content tools used to find items with a lazy `{ ... id: ... }` regex over the whole
+file, then run more regexes per block. That breaks on nested braces (or a `}` inside a string)
+and gets slower the bigger the curated library grows. This module tokenizes the JS object-literal
+subset the file uses exactly once, builds a small model that remembers where every value lives,
+and applies edits in one linear rewrite that leaves all other bytes (comments, spacing, key
+order) untouched.
+
+Supported subset:
+  - `// line` and `/* block */` comments
+  - "double" / 'single' quoted strings (JSON-style escapes), plain `backtick` strings (no `${}`)
+  - numbers, true / false / null, identifiers
+  - object literals (bare, quoted or numeric keys; trailing commas) and arrays
+  - a top-level assignment `<target> = <value>;` (e.g. `window.__HOOKE_CONTENT__ = {...};`)
+
+Offsets are byte offsets into the UTF-8 file.
+
+Usage (synthetic benchmark, shows parse + patch time per item stays flat as the file grows):
+  python3 tools/content_data_js.py --bench
+  python3 tools/content_data_js.py --bench --sizes 1000,10000,100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+class ContentParseError(ValueError):
+  pass
+
+
+# One master pattern, matched at the current position only (never searched), so the scan is linear.
+# Whitespace and comments are consumed as a prefix of the next token rather than as tokens. That
+# prefix is matched inside a lookahead (which never backtracks) and then consumed by backreference,
+# i.e. an atomic group: otherwise a failing token after a long run of whitespace or `//` retries
+# every way of splitting the run, which is exponential.
+_TOKEN_RE = re.compile(
+  rb"""
+  (?=(?P<skip>(?:\s|//[^\n]*|/\*(?:[^*]|\*(?!/))*\*/)*))(?P=skip)
+  (?:
+    (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\$]|\\.|\$(?!\{))*`)
+  | (?P<number>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+  | (?P<ident>[A-Za-z_$][A-Za-z0-9_$]*)
+  | (?P<punct>[{}\[\]:,=;.()])
+  | (?P<eof>$)
+  )
+  """,
+  re.X,
+)
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "0": "\0"}
+_ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)", re.S)
+_LITERALS = {b"true": True, b"false": False, b"null": None}
+
+
+class Token(NamedTuple):
+  kind: str
+  start: int
+  end: int
+  text: bytes
+
+
+def tokenize(src: bytes) -> Iterator[Token]:
+  """Significant tokens (whitespace and comments dropped), in order."""
+  pos = 0
+  match = _TOKEN_RE.match
+  while True:
+    m = match(src, pos)
+    if not m:
+      raise ContentParseError(f"unexpected character at {_where(src, pos)}")
+    kind = m.lastgroup
+    if kind == "eof":
+      return
+    start, pos = m.start(kind), m.end()
+    yield Token(kind, start, pos, src[start:pos])
+
+
+def _where(src: bytes, pos: int) -> str:
+  line = src.count(b"\n", 0, pos) + 1
+  col = pos - (src.rfind(b"\n", 0, pos) + 1) + 1
+  return f"line {line}, col {col}"
+
+
+def _unquote(raw: bytes) -> str:
+  body = raw[1:-1].decode("utf-8")
+
+  def repl(m: re.Match) -> str:
+    esc = m.group(1)
+    if esc.startswith("u{"):
+      return chr(int(esc[2:-1], 16))
+    if esc[0] in "ux" and len(esc) > 1:
+      return chr(int(esc[1:], 16))
+    if esc == "\n":
+      return ""
+    return _ESCAPES.get(esc, esc)
+
+  return _ESCAPE_RE.sub(repl, body) if "\\" in body else body
+
+
+# --- Model -----------------------------------------------------------------------------------
+
+
+@dataclass
+class Scalar:
+  value: Union[str, float, int, bool, None]
+  start: int
+  end: int
+
+
+@dataclass
+class Prop:
+  key: str
+  start: int  # start of the key
+  value: "Node"
+  comma_end: Optional[int]  # end of the trailing `,`, if any
+
+
+@dataclass
+class Obj:
+  start: int
+  end: int  # just past `}`
+  props: List[Prop] = field(default_factory=list)
+
+  def get(self, key: str) -> Optional["Node"]:
+    for p in self.props:
+      if p.key == key:
+        return p.value
+    return None
+
+  def prop(self, key: str) -> Optional[Prop]:
+    for p in self.props:
+      if p.key == key:
+        return p
+    return None
+
+  def get_str(self, key: str) -> Optional[str]:
+    v = self.get(key)
+    return v.value if isinstance(v, Scalar) and isinstance(v.value, str) else None
+
+
+@dataclass
+class Arr:
+  start: int
+  end: int
+  items: List["Node"] = field(default_factory=list)
+
+
+Node = Union[Scalar, Obj, Arr]
+
+
+class _Parser:
+  def __init__(self, src: bytes):
+    self.src = src
+    self.tokens = list(tokenize(src))
+    self.i = 0
+
+  def peek(self) -> Optional[Token]:
+    return self.tokens[self.i] if self.i < len(self.tokens) else None
+
+  def next(self) -> Token:
+    tok = self.peek()
+    if tok is None:
+      raise ContentParseError("unexpected end of file")
+    self.i += 1
+    return tok
+
+  def expect(self, text: bytes) -> Token:
+    tok = self.next()
+    if tok.text != text:
+      raise ContentParseError(f"expected {text.decode()!r}, got {tok.text.decode()!r} at {_where(self.src, tok.start)}")
+    return tok
+
+  def value(self) -> Node:
+    tok = self.next()
+    if tok.text == b"{":
+      return self.obj(tok)
+    if tok.text == b"[":
+      return self.arr(tok)
+    if tok.kind == "string":
+      return Scalar(_unquote(tok.text), tok.start, tok.end)
+    if tok.kind == "number":
+      num = float(tok.text) if any(c in tok.text for c in b".eE") else int(tok.text)
+      return Scalar(num, tok.start, tok.end)
+    if tok.kind == "ident" and tok.text in _LITERALS:
+      return Scalar(_LITERALS[tok.text], tok.start, tok.end)
+    raise ContentParseError(f"unexpected {tok.text.decode()!r} at {_where(self.src, tok.start)}")
+
+  def obj(self, open_tok: Token) -> Obj:
+    node = Obj(open_tok.start, open_tok.end)
+    while True:
+      tok = self.next()
+      if tok.text == b"}":
+        node.end = tok.end
+        return node
+      if tok.kind == "string":
+        key = _unquote(tok.text)
+      elif tok.kind in ("ident", "number"):
+        key = tok.text.decode("utf-8")
+      else:
+        raise ContentParseError(f"expected a key, got {tok.text.decode()!r} at {_where(self.src, tok.start)}")
+      self.expect(b":")
+      prop = Prop(key, tok.start, self.value(), None)
+      node.props.append(prop)
+      after = self.peek()
+      if after is not None and after.text == b",":
+        prop.comma_end = self.next().end
+      elif after is None or after.text != b"}":
+        where = _where(self.src, after.start) if after else "end of file"
+        raise ContentParseError(f"expected ',' or '}}' at {where}")
+
+  def arr(self, open_tok: Token) -> Arr:
+    node = Arr(open_tok.start, open_tok.end)
+    while True:
+      tok = self.peek()
+      if tok is not None and tok.text == b"]":
+        node.end = self.next().end
+        return node
+      node.items.append(self.value())
+      after = self.next()
+      if after.text == b"]":
+        node.end = after.end
+        return node
+      if after.text != b",":
+        raise ContentParseError(f"expected ',' or ']' at {_where(self.src, after.start)}")
+
+
+def parse(src: bytes) -> Node:
+  """Parse `<target> = <value>;` (or a bare value) and return the value's model."""
+  # The model is acyclic; pausing the cyclic GC keeps big files from triggering repeated
+  # full collections over the growing token list (which made parse time creep up per item).
+  was_enabled = gc.isenabled()
+  gc.disable()
+  try:
+    return _parse(src)
+  finally:
+    if was_enabled:
+      gc.enable()
+
+
+def _parse(src: bytes) -> Node:
+  p = _Parser(src)
+  # Skip the assignment target (`window.__HOOKE_CONTENT__ =`), if any.
+  for j, tok in enumerate(p.tokens):
+    if tok.text == b"=":
+      p.i = j + 1
+      break
+    if tok.text in (b"{", b"["):
+      break
+  value = p.value()
+  tail = p.peek()
+  if tail is not None and tail.text == b";":
+    p.next()
+    tail = p.peek()
+  if tail is not None:
+    raise ContentParseError(f"unexpected {tail.text.decode()!r} after the value at {_where(src, tail.start)}")
+  return value
+
+
+# --- Items + edits ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ContentItem:
+  content_id: str
+  type: str
+  url: str
+  node: Obj
+
+
+def iter_items(root: Node) -> Iterator[ContentItem]:
+  """`featured` and every object in `items` that has string `id`, `type` and `url` fields."""
+  if not isinstance(root, Obj):
+    return
+  candidates: List[Node] = []
+  featured = root.get("featured")
+  if featured is not None:
+    candidates.append(featured)
+  items = root.get("items")
+  if isinstance(items, Arr):
+    candidates.extend(items.items)
+  for node in candidates:
+    if not isinstance(node, Obj):
+      continue
+    cid, typ, url = node.get_str("id"), node.get_str("type"), node.get_str("url")
+    if cid and typ and url:
+      yield ContentItem(cid, typ, url, node)
+
+
+Edit = Tuple[int, int, bytes]  # replace src[start:end] with bytes
+
+
+def apply_edits(src: bytes, edits: List[Edit]) -> bytes:
+  """Apply non-overlapping edits in one pass."""
+  out: List[bytes] = []
+  pos = 0
+  for start, end, text in sorted(edits, key=lambda e: (e[0], e[1])):
+    if start < pos:
+      raise ValueError("overlapping edits")
+    out.append(src[pos:start])
+    out.append(text)
+    pos = end
+  out.append(src[pos:])
+  return b"".join(out)
+
+
+def js_string(value: str) -> bytes:
+  return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _indent_of(src: bytes, pos: int) -> bytes:
+  line_start = src.rfind(b"\n", 0, pos) + 1
+  prefix = src[line_start:pos]
+  return prefix if not prefix.strip() else b"  "
+
+
+def set_field(src: bytes, node: Obj, key: str, value: bytes, after: str = "url") -> Optional[Edit]:
+  """
+  Edit that sets `key: <value>` on `node` (value is raw JS source, e.g. `js_string(...)`).
+
+  Replaces the existing value in place; otherwise inserts the field after the `after` property
+  (or the last one), on its own line with the same indentation (inline for one-line objects). Returns None if nothing would change.
+  """
+  prop = node.prop(key)
+  if prop is not None:
+    if src[prop.value.start : prop.value.end] == value:
+      return None
+    return (prop.value.start, prop.value.end, value)
+  anchor = node.prop(after) or (node.props[-1] if node.props else None)
+  if anchor is None:
+    return (node.start + 1, node.start + 1, b" " + key.encode() + b": " + value + b" ")
+  inline = b"\n" not in src[node.start : anchor.start]  # `{ id: "x", url: "..." }` on one line
+  sep = b" " if inline else b"\n" + _indent_of(src, anchor.start)
+  field_src = sep + key.encode() + b": " + value
+  if anchor.comma_end is not None:
+    return (anchor.comma_end, anchor.comma_end, field_src + b",")
+  return (anchor.value.end, anchor.value.end, b"," + field_src)
+
+
+# --- Benchmark -------------------------------------------------------------------------------
+
+
+def synthetic_content(n_items: int) -> bytes:
+  parts = [
+    "/* global window */\n\n// Synthetic library for benchmarking.\nwindow.__HOOKE_CONTENT__ = {\n",
+    '  featured: { id: "featured", type: "youtube", url: "https://www.youtube.com/watch?v=AAAAAAAAAAA", date: null },\n',
+    "  items: [\n",
+  ]
+  for i in range(n_items):
+    vid = f"{i:011d}"
+    if i % 3:
+      parts.append(
+        f'    {{\n      id: "yt-{vid}",\n      type: "youtube",\n      url: "https://www.youtube.com/watch?v={vid}",\n'
+        f'      tags: ["Wilding Weekend", "Talk {{#{i}}}"], // braces in strings + comments\n      date: null,\n    }},\n'
+      )
+    else:
+      parts.append(
+        f'    {{\n      id: "blog-{i}",\n      type: "blog",\n      url: "https://example.org/post-{i}/",\n'
+        f'      title: "Post \\"{i}\\" \u2014 notes",\n      tags: ["Blog"],\n      date: "2025-01-01",\n    }},\n'
+      )
+  parts.append("  ],\n};\n")
+  return "".join(parts).encode("utf-8")
+
+
+def bench(sizes: List[int]) -> None:
+  print(f"{'items':>8} {'file':>10} {'parse':>10} {'patch':>10} {'us/item':>9}")
+  for n in sizes:
+    src = synthetic_content(n)
+    t0 = time.perf_counter()
+    items = list(iter_items(parse(src)))
+    t1 = time.perf_counter()
+    edits = [e for it in items if it.type == "youtube" for e in [set_field(src, it.node, "date", b'"2024-01-01"')] if e]
+    out = apply_edits(src, edits)
+    t2 = time.perf_counter()
+    assert len(edits) == sum(1 for it in items if it.type == "youtube") and len(out) > len(src)
+    print(f"{n:>8} {len(src) / 1024:>8.0f}KB {1000 * (t1 - t0):>8.1f}ms {1000 * (t2 - t1):>8.1f}ms {1e6 * (t2 - t0) / n:>9.1f}")
+
+
+def main() -> int:
+  ap = argparse.ArgumentParser()
+  ap.add_argument("--bench", action="store_true", help="Run the synthetic scaling benchmark")
+  ap.add_argument("--sizes", default="500,2000,8000,32000", help="Comma-separated item counts for --bench")
+  args = ap.parse_args()
+  if not args.bench:
+    ap.print_help()
+    return 0
+  bench([int(s) for s in args.sizes.split(",") if s.strip()])
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
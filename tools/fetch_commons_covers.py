@@ -7,23 +7,40 @@ Fetch open-licensed cover photos from Wikimedia Commons for the Living Dorset Fi
 - Downloads a resized thumbnail (width=1200) to assets/field-guide/<species-id>.jpg
 - Prints a JSON mapping with attribution metadata to paste back into the dataset.
 
+Searches and downloads run on a small worker pool through the shared client in `http_client.py`:
+one rate limit per host (so the pool never hammers Commons), kept-alive connections, backoff on
+429 / 5xx, a revalidating response cache, and record / replay via HOOKE_HTTP_MODE. Image info for all species' candidates is fetched in batches of 50 titles per
+request instead of one request per species. Downloads stream to a temp file that is renamed into
+place, and a cover whose existing file already matches the picked thumbnail (same URL recorded
+in the build cache, or same pixel size) is not downloaded again (`--force` re-downloads).
+
 Usage:
   python3 tools/fetch_commons_covers.py
+  python3 tools/fetch_commons_covers.py --only nightjar,sand-lizard --force
+  python3 tools/fetch_commons_covers.py --workers 8 --rate 5
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import os
 import re
 import sys
 import time
 import urllib.parse
-import urllib.request
-import ssl
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache
+from http_client import HttpClient, HttpError
+from image_probe import probe
 
 
 COMMONS_API = "https://commons.wikimedia.org/w/api.php"
+TITLES_PER_REQUEST = 50  # MediaWiki limit for `titles=` (non-bot)
+DEFAULT_RATE = 3.0  # requests per second, per host
+CACHE_NS = "commons-covers"
 
 
 SPECIES = [
@@ -43,19 +60,12 @@ SPECIES = [
 ]
 
 
-def http_get_json(url: str) -> dict:
-    req = urllib.request.Request(url, headers={"User-Agent": "HookeWildingPortal/1.0 (offline app builder)"})
-    ctx = None
-    # Some environments (like sandboxed macOS toolchains) may lack a usable CA bundle.
-    # Allow an explicit insecure mode to still fetch public Commons content.
-    if os.environ.get("HOOKE_INSECURE_SSL", "").strip() == "1":
-        ctx = ssl._create_unverified_context()
-    with urllib.request.urlopen(req, timeout=30, context=ctx) as r:
-        raw = r.read().decode("utf-8")
-    return json.loads(raw)
+def http_get_json(client: HttpClient, url: str) -> dict:
+    data = client.get_json(url)
+    return data if isinstance(data, dict) else {}
 
 
-def commons_search_files(query: str, limit: int = 8) -> list[str]:
+def commons_search_files(client: HttpClient, query: str, limit: int = 8) -> list[str]:
     params = {
         "action": "query",
         "format": "json",
@@ -65,7 +75,7 @@ def commons_search_files(query: str, limit: int = 8) -> list[str]:
         "srsearch": query,
     }
     url = COMMONS_API + "?" + urllib.parse.urlencode(params)
-    data = http_get_json(url)
+    data = http_get_json(client, url)
     out = []
     for it in data.get("query", {}).get("search", []):
         title = it.get("title", "")
@@ -74,27 +84,31 @@ def commons_search_files(query: str, limit: int = 8) -> list[str]:
     return out
 
 
-def get_imageinfo(file_titles: list[str], width: int = 1200) -> dict[str, dict]:
-    if not file_titles:
-        return {}
-    params = {
-        "action": "query",
-        "format": "json",
-        "prop": "imageinfo",
-        "titles": "|".join(file_titles),
-        "iiprop": "url|extmetadata|mime|size",
-        "iiurlwidth": str(width),
-    }
-    url = COMMONS_API + "?" + urllib.parse.urlencode(params)
-    data = http_get_json(url)
-    pages = data.get("query", {}).get("pages", {}) or {}
+def get_imageinfo(client: HttpClient, file_titles: list[str], width: int = 1200) -> dict[str, dict]:
+    """imageinfo for many files, `TITLES_PER_REQUEST` titles per API call."""
+    titles = list(dict.fromkeys(file_titles))
+    chunks = [titles[i : i + TITLES_PER_REQUEST] for i in range(0, len(titles), TITLES_PER_REQUEST)]
     out = {}
-    for _, page in pages.items():
-        title = page.get("title", "")
-        infos = page.get("imageinfo", []) or []
-        if not title or not infos:
-            continue
-        out[title] = infos[0]
+    for chunk in chunks:
+        params = {
+            "action": "query",
+            "format": "json",
+            "prop": "imageinfo",
+            "titles": "|".join(chunk),
+            "iiprop": "url|extmetadata|mime|size",
+            "iiurlwidth": str(width),
+        }
+        url = COMMONS_API + "?" + urllib.parse.urlencode(params)
+        data = http_get_json(client, url)
+        query = data.get("query", {}) or {}
+        # Map normalized titles back to the ones we asked for.
+        renamed = {n.get("to"): n.get("from") for n in query.get("normalized", []) or []}
+        for _, page in (query.get("pages", {}) or {}).items():
+            title = page.get("title", "")
+            infos = page.get("imageinfo", []) or []
+            if not title or not infos:
+                continue
+            out[renamed.get(title, title)] = infos[0]
     return out
 
 
@@ -148,68 +162,127 @@ def pick_best_candidate(infos: dict[str, dict]) -> tuple[str, dict] | None:
     return candidates[0]
 
 
-def download(url: str, dest: str) -> None:
-    os.makedirs(os.path.dirname(dest), exist_ok=True)
-    req = urllib.request.Request(url, headers={"User-Agent": "HookeWildingPortal/1.0 (offline app builder)"})
-    ctx = None
-    if os.environ.get("HOOKE_INSECURE_SSL", "").strip() == "1":
-        ctx = ssl._create_unverified_context()
-    with urllib.request.urlopen(req, timeout=60, context=ctx) as r:
-        data = r.read()
-    with open(dest, "wb") as f:
-        f.write(data)
+def download(client: HttpClient, url: str, dest: str) -> int:
+    """Stream `url` to a temp file next to `dest`, then rename it into place. Returns bytes written."""
+    return client.download(url, Path(dest))
 
 
-def main() -> int:
-    out_dir = os.path.join(os.path.dirname(__file__), "..", "assets", "field-guide")
-    out_dir = os.path.abspath(out_dir)
-
-    results = {}
-    failures = []
-
-    for species_id, query in SPECIES:
-        print(f"- Searching: {species_id}  ({query})")
-        titles = commons_search_files(query, limit=10)
-        infos = get_imageinfo(titles, width=1200)
-        picked = pick_best_candidate(infos)
-        if not picked:
-            print(f"  !! No suitable open-license JPG found (skipping)")
-            failures.append(species_id)
-            continue
-
-        title, info = picked
-        meta = info.get("extmetadata", {}) or {}
-        thumburl = info.get("thumburl") or info.get("url")
-        if not thumburl:
-            print("  !! No url/thumburl (skipping)")
-            failures.append(species_id)
-            continue
-
-        artist = clean_html((meta.get("Artist") or {}).get("value", "")) or clean_html((meta.get("Credit") or {}).get("value", ""))
-        license_short = clean_html((meta.get("LicenseShortName") or {}).get("value", "")) or clean_html((meta.get("UsageTerms") or {}).get("value", ""))
-        license_url = clean_html((meta.get("LicenseUrl") or {}).get("value", ""))
-        source_url = f"https://commons.wikimedia.org/wiki/{urllib.parse.quote(title.replace(' ', '_'))}"
-
-        dest = os.path.join(out_dir, f"{species_id}.jpg")
-        print(f"  -> {title}")
-        print(f"     license: {license_short}")
-        if artist:
-            print(f"     artist: {artist}")
-        print(f"     downloading: {thumburl}")
-        download(thumburl, dest)
-
-        results[species_id] = {
-            "src": f"assets/field-guide/{species_id}.jpg",
-            "sourceTitle": title,
-            "sourceUrl": source_url,
-            "artist": artist,
-            "license": license_short,
-            "licenseUrl": license_url,
-        }
+def cover_is_current(dest: str, info: dict, thumburl: str, rec: object) -> bool:
+    """Does the file at `dest` already hold the picked thumbnail?"""
+    if not os.path.exists(dest):
+        return False
+    if isinstance(rec, dict) and rec.get("thumburl"):
+        st = os.stat(dest)
+        return rec["thumburl"] == thumburl and rec.get("size") == st.st_size
+    # Downloaded before the cache knew about it: trust a file with the expected pixel size.
+    expected = (int(info.get("thumbwidth") or 0), int(info.get("thumbheight") or 0))
+    return all(expected) and probe(Path(dest)) == expected
+
+
+def attribution(species_id: str, title: str, meta: dict) -> dict:
+    artist = clean_html((meta.get("Artist") or {}).get("value", "")) or clean_html((meta.get("Credit") or {}).get("value", ""))
+    license_short = clean_html((meta.get("LicenseShortName") or {}).get("value", "")) or clean_html((meta.get("UsageTerms") or {}).get("value", ""))
+    license_url = clean_html((meta.get("LicenseUrl") or {}).get("value", ""))
+    source_url = f"https://commons.wikimedia.org/wiki/{urllib.parse.quote(title.replace(' ', '_'))}"
+    return {
+        "src": f"assets/field-guide/{species_id}.jpg",
+        "sourceTitle": title,
+        "sourceUrl": source_url,
+        "artist": artist,
+        "license": license_short,
+        "licenseUrl": license_url,
+    }
 
-        # be polite
-        time.sleep(0.35)
 
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=4, help="Concurrent requests")
+    ap.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Max requests per second per host")
+    ap.add_argument("--width", type=int, default=1200, help="Thumbnail width to download")
+    ap.add_argument("--only", default="", help="Comma-separated species ids (default: all)")
+    ap.add_argument("--force", action="store_true", help="Download covers even if the existing file matches")
+    args = ap.parse_args()
+
+    only = {s.strip() for s in args.only.split(",") if s.strip()}
+    species = [(sid, q) for sid, q in SPECIES if not only or sid in only]
+    unknown = only - {sid for sid, _q in SPECIES}
+    if unknown:
+        print(f"ERROR: unknown species id(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    repo_root = Path(__file__).resolve().parent.parent
+    out_dir = str(repo_root / "assets" / "field-guide")
+    cache = BuildCache(repo_root)
+    try:
+        client = HttpClient.from_env(rate=args.rate)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    t0 = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        # 1) Search (one request per species, in parallel under the rate limit).
+        print(f"Searching Commons for {len(species)} species...")
+        searches = pool.map(lambda sq: commons_search_files(client, sq[1], limit=10), species)
+        found = dict(zip((sid for sid, _q in species), searches))
+
+        # 2) Image info for every candidate, batched across species.
+        all_titles = list(dict.fromkeys(t for titles in found.values() for t in titles))
+        batches = [all_titles[i : i + TITLES_PER_REQUEST] for i in range(0, len(all_titles), TITLES_PER_REQUEST)]
+        infos: dict[str, dict] = {}
+        for part in pool.map(lambda batch: get_imageinfo(client, batch, width=args.width), batches):
+            infos.update(part)
+        print(f"Fetched image info for {len(infos)} candidate files in {len(batches)} request(s).")
+
+        # 3) Pick + download (skipping covers that are already in place).
+        results = {}
+        failures = []
+        downloads = []
+        up_to_date = 0
+        for species_id, _query in species:
+            picked = pick_best_candidate({t: infos[t] for t in found[species_id] if t in infos})
+            if not picked:
+                print(f"- {species_id}: !! No suitable open-license JPG found (skipping)")
+                failures.append(species_id)
+                continue
+            title, info = picked
+            thumburl = info.get("thumburl") or info.get("url")
+            if not thumburl:
+                print(f"- {species_id}: !! No url/thumburl (skipping)")
+                failures.append(species_id)
+                continue
+            results[species_id] = attribution(species_id, title, info.get("extmetadata", {}) or {})
+            print(f"- {species_id}: {title}  [{results[species_id]['license']}]")
+            dest = os.path.join(out_dir, f"{species_id}.jpg")
+            if not args.force and cover_is_current(dest, info, thumburl, cache.get(CACHE_NS, species_id)):
+                cache.put(CACHE_NS, species_id, {"thumburl": thumburl, "size": os.stat(dest).st_size})
+                up_to_date += 1
+                continue
+            downloads.append((species_id, thumburl, dest))
+
+        def fetch(job: tuple[str, str, str]) -> tuple[str, str, int | str]:
+            species_id, thumburl, dest = job
+            try:
+                return species_id, thumburl, download(client, thumburl, dest)
+            except (HttpError, OSError) as e:
+                return species_id, thumburl, str(e)
+
+        for species_id, thumburl, outcome in pool.map(fetch, downloads):
+            if isinstance(outcome, str):
+                print(f"  !! {species_id}: download failed: {outcome}")
+                failures.append(species_id)
+                results.pop(species_id, None)
+                continue
+            print(f"  -> {species_id}.jpg ({outcome / 1024:.0f} KB)")
+            cache.put(CACHE_NS, species_id, {"thumburl": thumburl, "size": outcome})
+    cache.save()
+    client.close()
+
+    print(
+        f"\nDone in {time.perf_counter() - t0:.1f}s: {len(downloads)} to download, "
+        f"{up_to_date} already up to date, {len(failures)} skipped."
+    )
+    print(client.report())
     print("\n=== RESULTS JSON (for dataset) ===")
     print(json.dumps(results, indent=2, ensure_ascii=False))
     if failures:
@@ -220,5 +293,3 @@ def main() -> int:
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
-
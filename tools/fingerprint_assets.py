@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Build a deployable copy of the site in `dist/` with content-hashed file names.
+
+Why:
+  The pages load `app.js`, `styles.css` and the `data/*.js` bundles from fixed
+  URLs, so they can only be served with short cache lifetimes (or visitors risk
+  running yesterday's data). Giving every file a page references a name that
+  changes with its content (`data/features-data.<hash>.js`) lets a host serve
+  those files with year-long `immutable` cache headers; only the small HTML
+  pages need revalidating.
+
+Rules:
+  - Everything the site needs at runtime is copied into `dist/` (pages, root
+    JS/CSS, `data/*.js` incl. detail and gallery chunks, `assets/`, `sw.js` if built).
+    Large files are hard-linked where the filesystem allows, so this is cheap.
+  - Every local JS/CSS/image file referenced from a page's `src`/`href` gets a
+    fingerprinted sibling `<stem>.<hash>.<ext>` (the unhashed name stays too, for
+    pages cached before a deploy), and the page is rewritten to point at it.
+    `?v=` cache-busters are dropped: the hash is the version.
+  - `sw.js` (see `build_service_worker.py`) has its precache URLs rewritten the
+    same way, so offline support keeps working in `dist/`, and each page gets a
+    `<meta name="hooke-sw">` tag: `nav.js` only registers the worker on pages
+    that have it, so the repo root (no `sw.js`) never asks for one.
+  - Writes `dist/asset-manifest.json` (original path -> fingerprinted path) and a
+    `dist/_headers` file (Netlify / Cloudflare Pages format) marking the
+    fingerprinted files immutable.
+  - Files in `dist/` that are no longer produced are removed.
+
+Usage:
+  python3 tools/fingerprint_assets.py
+  python3 tools/fingerprint_assets.py --out /tmp/site
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from build_cache import BuildCache, write_if_changed
+
+
+DEFAULT_OUT = "dist"
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LEN = 10
+FINGERPRINT_EXTS = {".js", ".css", ".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif", ".svg"}
+# What the site needs at runtime (repo-relative globs); `assets/` is copied whole.
+SITE_GLOBS = ("*.html", "*.js", "*.css", "data/*.js", "data/feature-details/*.js", "data/gallery/*.js")
+
+SW_FILE = "sw.js"
+SW_META = f'<meta name="hooke-sw" content="./{SW_FILE}" />'
+
+# src="./x" / href="./x" (optionally with ?query / #fragment) in the pages.
+_REF_RE = re.compile(r"""((?:src|href)\s*=\s*["'])\./([^"'?#]+)(\?[^"'#]*)?""")
+_HEAD_END_RE = re.compile(r"(\n[ \t]*)</head>")
+
+
+def fingerprinted_name(rel: str, digest: str) -> str:
+    stem, ext = os.path.splitext(rel)
+    return f"{stem}.{digest[:HASH_LEN]}{ext}"
+
+
+def collect_site(repo_root: Path, out_rel: str) -> list[str]:
+    files: set[str] = set()
+    for pattern in SITE_GLOBS:
+        for p in repo_root.glob(pattern):
+            if p.is_file() and not p.name.startswith("."):
+                files.add(p.relative_to(repo_root).as_posix())
+    for dirpath, dirnames, filenames in os.walk(repo_root / "assets"):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if not name.startswith("."):
+                files.add((Path(dirpath) / name).relative_to(repo_root).as_posix())
+    return sorted(f for f in files if not f.startswith(out_rel + "/"))
+
+
+def link_or_copy(src: Path, dst: Path, link: bool = True) -> bool:
+    """
+    Hard-link (or copy) `src` to `dst` unless it's already there. Returns True if written.
+
+    Fingerprinted files are always real copies: an in-place edit of the source
+    must never change the bytes behind an "immutable" URL.
+    """
+    try:
+        s, d = src.stat(), dst.stat()
+        if (link and os.path.samestat(s, d)) or (s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns):
+            return False
+    except OSError:
+        pass
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        if not link:
+            raise OSError
+        os.link(src, tmp)
+    except OSError:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+    return True
+
+
+def rewrite_page(text: str, mapping: dict[str, str]) -> tuple[str, set[str]]:
+    """Point local references at their fingerprinted names. Returns (text, unresolved paths)."""
+    unresolved: set[str] = set()
+
+    def repl(m: re.Match) -> str:
+        prefix, rel, _query = m.group(1), m.group(2), m.group(3)
+        if os.path.splitext(rel)[1].lower() not in FINGERPRINT_EXTS or rel == "sw.js":
+            return m.group(0)
+        if rel not in mapping:
+            unresolved.add(rel)
+            return m.group(0)
+        return f"{prefix}./{mapping[rel]}"
+
+    return _REF_RE.sub(repl, text), unresolved
+
+
+def add_sw_meta(text: str) -> str:
+    """Announce the service worker to `nav.js`, as the last element of `<head>`."""
+    if 'name="hooke-sw"' in text:
+        return text
+    return _HEAD_END_RE.sub(lambda m: f"{m.group(1)}  {SW_META}{m.group(1)}</head>", text, count=1)
+
+
+def rewrite_sw(text: str, mapping: dict[str, str]) -> str:
+    for rel, hashed in mapping.items():
+        text = text.replace(f'"./{rel}"', f'"./{hashed}"')
+    return text
+
+
+def render_headers(mapping: dict[str, str]) -> str:
+    lines = ["# Auto-generated by tools/fingerprint_assets.py", ""]
+    for hashed in sorted(mapping.values()):
+        lines += [f"/{hashed}", "  Cache-Control: public, max-age=31536000, immutable", ""]
+    lines += ["/*.html", "  Cache-Control: public, max-age=0, must-revalidate", ""]
+    lines += ["/sw.js", "  Cache-Control: no-cache", ""]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=DEFAULT_OUT, help=f"Output directory (default: {DEFAULT_OUT}/)")
+    args = ap.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    out_dir = (repo_root / args.out).resolve()
+    if out_dir == repo_root or repo_root.is_relative_to(out_dir):
+        print(f"ERROR: refusing to write into {out_dir}", file=sys.stderr)
+        return 2
+    out_rel = out_dir.relative_to(repo_root).as_posix() if out_dir.is_relative_to(repo_root) else ""
+
+    cache = BuildCache(repo_root)
+    files = collect_site(repo_root, out_rel)
+    pages = [f for f in files if f.endswith(".html")]
+    has_sw = SW_FILE in files
+
+    # Which files do the pages reference? Those get fingerprinted names.
+    referenced: set[str] = set()
+    for page in pages:
+        for _prefix, rel, _query in _REF_RE.findall((repo_root / page).read_text(encoding="utf-8")):
+            if os.path.splitext(rel)[1].lower() in FINGERPRINT_EXTS and rel != "sw.js":
+                referenced.add(rel)
+    available = set(files)
+    mapping = {
+        rel: fingerprinted_name(rel, cache.file_hash(repo_root / rel)) for rel in sorted(referenced & available)
+    }
+
+    produced: set[str] = set()
+    written = 0
+    unresolved: set[str] = set()
+    for rel in files:
+        src = repo_root / rel
+        if rel in pages:
+            text, missing = rewrite_page(src.read_text(encoding="utf-8"), mapping)
+            unresolved |= missing
+            if has_sw:
+                text = add_sw_meta(text)
+            written += write_if_changed(out_dir / rel, text)
+        elif rel == SW_FILE:
+            written += write_if_changed(out_dir / rel, rewrite_sw(src.read_text(encoding="utf-8"), mapping))
+        else:
+            written += link_or_copy(src, out_dir / rel)
+        produced.add(rel)
+        if rel in mapping:
+            written += link_or_copy(src, out_dir / mapping[rel], link=False)
+            produced.add(mapping[rel])
+
+    written += write_if_changed(out_dir / MANIFEST_NAME, json.dumps(mapping, indent=2, ensure_ascii=False) + "\n")
+    written += write_if_changed(out_dir / "_headers", render_headers(mapping))
+    produced |= {MANIFEST_NAME, "_headers"}
+    cache.save()
+
+    removed = 0
+    for dirpath, _dirnames, filenames in os.walk(out_dir, topdown=False):
+        for name in filenames:
+            p = Path(dirpath) / name
+            if p.relative_to(out_dir).as_posix() not in produced:
+                p.unlink()
+                removed += 1
+        if Path(dirpath) != out_dir and not any(Path(dirpath).iterdir()):
+            Path(dirpath).rmdir()
+
+    for rel in sorted(unresolved):
+        print(f"  !! referenced by a page but missing (left as is): {rel}")
+    if has_sw:
+        sw_mtime = (repo_root / SW_FILE).stat().st_mtime_ns
+        newer = [
+            rel
+            for rel in files
+            if rel != SW_FILE and not rel.startswith("assets/") and (repo_root / rel).stat().st_mtime_ns > sw_mtime
+        ]
+        if newer:
+            print(f"  !! {SW_FILE} is older than {len(newer)} site files (e.g. {newer[0]}): re-run build_service_worker.py")
+    print(
+        f"Built {out_dir} ({len(produced)} files, {len(mapping)} fingerprinted, "
+        f"{written} written, {removed} stale removed"
+        f"{'; service worker enabled' if has_sw else '; no sw.js, offline support off'})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
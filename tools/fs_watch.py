@@ -0,0 +1,89 @@
+"""
+Tiny polling file watcher used by the `--watch` mode of the build tools.
+
+Why:
+  Editors drop photos into `assets/features/<id>/` in bulk after each wilding
+  weekend. Polling keeps this dependency-free (no watchdog/inotify bindings) and
+  works the same on macOS, Linux and network shares; a scan of the asset tree is
+  a few milliseconds of `os.scandir`.
+
+Changes are debounced: we wait until the tree has been quiet for `settle`
+seconds, so a bulk copy triggers one rebuild rather than one per file.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Callable
+
+from asset_catalog import scan_tree
+
+
+Snapshot = dict[str, tuple[int, int]]
+
+
+def snapshot(repo_root: Path, roots: list[str], skip_prefixes: tuple[str, ...] = ()) -> Snapshot:
+    """Map of repo-relative posix path -> (size, mtime_ns) for every file under `roots`."""
+    out: Snapshot = {}
+    for rel in roots:
+        p = repo_root / rel
+        if p.is_file():
+            st = p.stat()
+            out[rel] = (st.st_size, st.st_mtime_ns)
+            continue
+        for folder, e in scan_tree(repo_root, rel, skip_prefixes):
+            out[f"{folder}/{e.name}"] = (e.size, e.mtime_ns)
+    return out
+
+
+def diff(before: Snapshot, after: Snapshot) -> set[str]:
+    changed = {p for p, sig in after.items() if before.get(p) != sig}
+    changed |= before.keys() - after.keys()
+    return changed
+
+
+def watch(
+    repo_root: Path,
+    roots: list[str],
+    on_change: Callable[[set[str]], None],
+    interval: float = 0.5,
+    settle: float = 0.75,
+    skip_prefixes: tuple[str, ...] = (),
+) -> None:
+    """
+    Poll `roots` forever and call `on_change(paths)` with every batch of changed paths.
+
+    If `on_change` raises, its paths are carried over into the next batch, so
+    fixing a bad edit also rebuilds whatever arrived alongside it.
+
+    Runs until interrupted (Ctrl+C).
+    """
+    current = snapshot(repo_root, roots, skip_prefixes)
+    pending: set[str] = set()
+    failed: set[str] = set()  # paths from a batch whose rebuild raised, retried with the next one
+    last_change = 0.0
+    print(f"Watching {', '.join(roots)} (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(interval)
+            nxt = snapshot(repo_root, roots, skip_prefixes)
+            changed = diff(current, nxt)
+            current = nxt
+            now = time.monotonic()
+            if changed:
+                pending |= changed
+                last_change = now
+                continue
+            if pending and now - last_change >= settle:
+                batch, pending, failed = pending | failed, set(), set()
+                t0 = time.perf_counter()
+                try:
+                    on_change(batch)
+                except Exception as exc:  # keep watching after a bad edit (e.g. invalid JSON)
+                    failed = batch
+                    print(f"  !! rebuild failed: {exc} ({len(batch)} paths will be retried with the next change)")
+                    continue
+                print(f"  rebuilt in {(time.perf_counter() - t0) * 1000:.0f} ms ({len(batch)} changed paths)")
+    except KeyboardInterrupt:
+        print("Stopped watching.")
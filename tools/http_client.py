@@ -0,0 +1,455 @@
+"""
+Shared HTTP client for the tools that talk to upstream APIs.
+
+Why:
+  `fetch_commons_covers.py`, `build_content_youtube_dates.py` and
+  `build_content_oembed.py` each grew their own `urllib` calls, retry loops and
+  rate limiting, with no connection reuse, no caching and no way to run them
+  without the live internet. This module gives them one client with:
+
+  - keep-alive connection pooling per host (thread-safe, so worker pools share it);
+  - retries with exponential backoff on 429 / 5xx / network errors, honouring
+    `Retry-After`, and an optional per-host rate limit;
+  - an on-disk response cache (`.build-cache/http/`) that revalidates with
+    `If-None-Match` / `If-Modified-Since` and can serve entries without asking
+    upstream at all while they're fresh (`fresh_for`, or the response's own
+    `Cache-Control: max-age`);
+  - timing metrics per host (requests, cache hits, 304s, bytes, time), see `report()`;
+  - record / replay: `record` saves every response as a fixture file (fresh
+    cache entries are revalidated rather than served, so none are missed),
+    `replay` answers only from fixtures and never opens a socket, so the tools
+    can be tested and benchmarked fully offline.
+
+Configuration comes from the environment so every tool picks it up the same way:
+  HOOKE_HTTP_MODE      live (default) | record | replay
+  HOOKE_HTTP_FIXTURES  fixture directory (default: tests/fixtures/http)
+  HOOKE_HTTP_NO_CACHE  1 to bypass the response cache
+  HOOKE_INSECURE_SSL   1 to skip certificate checks (sandboxed toolchains)
+
+Query parameters named in `REDACT_PARAMS` (API keys) are stripped from cache keys
+and fixture files, so fixtures can be committed and shared.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import ssl
+import threading
+import time
+import urllib.parse
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".build-cache" / "http"
+DEFAULT_FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures" / "http"  # committed, replayed by the tests
+USER_AGENT = "hooke-wilding-webapp/1.0 (offline app builder)"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+REDACT_PARAMS = ("key", "api_key", "access_token")
+MODES = ("live", "record", "replay")
+
+
+class HttpError(Exception):
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class Response:
+    url: str
+    status: int
+    headers: dict[str, str]  # lower-cased names
+    body: bytes
+    source: str = "network"  # network | cache | revalidated | fixture
+
+    def json(self) -> object:
+        return json.loads(self.body.decode("utf-8"))
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("content-type", "")
+
+
+def redact(url: str) -> str:
+    """URL with secret query parameters removed (used for cache keys, fixtures and logs)."""
+    parts = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k not in REDACT_PARAMS]
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(redact(url).encode("utf-8")).hexdigest()[:32]
+
+
+class RateLimiter:
+    """Spaces requests to each host at least `1 / rate` seconds apart, across all threads."""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.next_at: dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            at = max(now, self.next_at.get(host, 0.0))
+            self.next_at[host] = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+
+@dataclass
+class HostStats:
+    requests: int = 0  # round-trips actually sent
+    cache_hits: int = 0  # served from cache without a request
+    not_modified: int = 0  # 304 revalidations
+    fixtures: int = 0
+    retries: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    slowest: float = 0.0
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class HttpClient:
+    """
+    Thread-safe pooled HTTP client. `get()` returns a `Response`; `get_json()`
+    parses it; `download()` streams a body to a file.
+    """
+
+    def __init__(
+        self,
+        mode: str = "live",
+        fixtures_dir: Path = DEFAULT_FIXTURES_DIR,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+        rate: float | None = None,
+        retries: int = 4,
+        timeout: float = 30.0,
+        max_per_host: int = 8,
+        insecure_ssl: bool = False,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"unknown HTTP mode {mode!r} (expected one of {', '.join(MODES)})")
+        self.mode = mode
+        self.fixtures_dir = Path(fixtures_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.timeout = timeout
+        self.max_per_host = max_per_host
+        self.ssl_context = ssl._create_unverified_context() if insecure_ssl else ssl.create_default_context()
+        self.stats: dict[str, HostStats] = defaultdict(HostStats)
+        self._idle: dict[tuple[str, str, int | None], list[http.client.HTTPConnection]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "HttpClient":
+        env = os.environ
+        kwargs.setdefault("mode", env.get("HOOKE_HTTP_MODE", "").strip() or "live")
+        if env.get("HOOKE_HTTP_FIXTURES", "").strip():
+            kwargs.setdefault("fixtures_dir", Path(env["HOOKE_HTTP_FIXTURES"].strip()))
+        if env.get("HOOKE_HTTP_NO_CACHE", "").strip() == "1":
+            kwargs["cache_dir"] = None
+        kwargs.setdefault("insecure_ssl", env.get("HOOKE_INSECURE_SSL", "").strip() == "1")
+        return cls(**kwargs)
+
+    # --- connection pool ---
+
+    def _checkout(self, scheme: str, host: str, port: int | None, reuse: bool = True) -> tuple[http.client.HTTPConnection, bool]:
+        """(connection, whether it is a reused idle one)."""
+        if reuse:
+            with self._lock:
+                idle = self._idle[(scheme, host, port)]
+                if idle:
+                    return idle.pop(), True
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context), False
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _checkin(self, scheme: str, host: str, port: int | None, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle[(scheme, host, port)]
+            if len(idle) < self.max_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+    # --- cache + fixtures ---
+
+    def _cache_paths(self, url: str) -> tuple[Path, Path]:
+        assert self.cache_dir is not None
+        k = _key(url)
+        return self.cache_dir / f"{k}.json", self.cache_dir / f"{k}.body"
+
+    def _cache_load(self, url: str) -> tuple[dict, bytes] | None:
+        if not self.cache_dir:
+            return None
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8")), body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def _cache_store(self, resp: Response) -> None:
+        if not self.cache_dir or resp.status != 200:
+            return
+        if not (resp.headers.get("etag") or resp.headers.get("last-modified") or _max_age(resp.headers) > 0):
+            return  # nothing to revalidate with: not worth keeping
+        meta_path, body_path = self._cache_paths(resp.url)
+        meta = {"url": redact(resp.url), "stored": time.time(), "headers": resp.headers}
+        _atomic_write(body_path, resp.body)
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def _fixture_path(self, url: str) -> Path:
+        host = urllib.parse.urlsplit(url).netloc.replace(":", "_") or "local"
+        return self.fixtures_dir / host / f"{_key(url)}.json"
+
+    def _fixture_load(self, url: str) -> Response:
+        path = self._fixture_path(url)
+        try:
+            rec = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raise HttpError(f"replay: no fixture for {redact(url)} (expected {path})") from None
+        body = path.with_suffix(".body").read_bytes() if rec.get("bodyFile") else rec.get("text", "").encode("utf-8")
+        return Response(url, int(rec["status"]), dict(rec.get("headers") or {}), body, source="fixture")
+
+    def _fixture_save(self, resp: Response) -> None:
+        path = self._fixture_path(resp.url)
+        rec: dict = {"url": redact(resp.url), "status": resp.status, "headers": resp.headers}
+        try:
+            text = resp.body.decode("utf-8")
+            textual = resp.content_type.startswith(("text/", "application/json", "application/javascript"))
+        except UnicodeDecodeError:
+            textual = False
+        if textual:
+            rec["text"] = text
+        else:
+            rec["bodyFile"] = True
+            _atomic_write(path.with_suffix(".body"), resp.body)
+        _atomic_write(path, (json.dumps(rec, indent=1, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    # --- requests ---
+
+    def get(self, url: str, headers: dict[str, str] | None = None, fresh_for: float | None = None) -> Response:
+        """
+        GET `url`, following redirects. Non-2xx/304 answers raise `HttpError`.
+
+        `fresh_for`: seconds a cached response may be reused without revalidating
+        (defaults to the response's `Cache-Control: max-age`).
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        stats = self.stats[host]
+        if self.mode == "replay":
+            resp = self._fixture_load(url)
+            stats.fixtures += 1
+            return self._check(resp)
+
+        cached = self._cache_load(url)
+        if cached and self.mode == "live":
+            # Record mode always asks upstream (conditionally), so every response lands in a fixture.
+            meta, body = cached
+            age = time.time() - float(meta.get("stored") or 0)
+            limit = fresh_for if fresh_for is not None else _max_age(meta.get("headers") or {})
+            if age < limit:
+                stats.cache_hits += 1
+                return Response(url, 200, dict(meta.get("headers") or {}), body, source="cache")
+
+        req_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate", **(headers or {})}
+        if cached:
+            h = cached[0].get("headers") or {}
+            if h.get("etag"):
+                req_headers["If-None-Match"] = h["etag"]
+            if h.get("last-modified"):
+                req_headers["If-Modified-Since"] = h["last-modified"]
+
+        resp = self._request(url, req_headers)
+        if resp.status == 304 and cached:
+            stats.not_modified += 1
+            meta, body = cached
+            merged = {**(meta.get("headers") or {}), **{k: v for k, v in resp.headers.items() if k in ("etag", "cache-control", "last-modified")}}
+            resp = Response(resp.url, 200, merged, body, source="revalidated")
+        self._cache_store(resp)
+        if self.mode == "record":
+            self._fixture_save(resp)
+        return self._check(resp)
+
+    def get_json(self, url: str, headers: dict[str, str] | None = None, fresh_for: float | None = None) -> object:
+        resp = self.get(url, {"Accept": "application/json", **(headers or {})}, fresh_for=fresh_for)
+        try:
+            return resp.json()
+        except ValueError as e:
+            raise HttpError(f"invalid JSON from {redact(resp.url)}: {e}", resp.status) from e
+
+    def download(self, url: str, dest: Path, chunk_size: int = 64 * 1024) -> int:
+        """
+        Stream `url` into `dest` via a temp file + atomic rename. Returns bytes written.
+        Not cached (the file is the cache); recorded / replayed like `get()`.
+        """
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + ".part")
+        if self.mode != "live":
+            resp = self.get(url, fresh_for=0)  # fixtures hold the whole body anyway
+            _atomic_write(dest, resp.body)
+            return len(resp.body)
+        try:
+            with open(tmp, "wb") as f:
+                resp = self._request(url, {"User-Agent": USER_AGENT}, sink=f, chunk_size=chunk_size)
+            self._check(resp)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return dest.stat().st_size
+
+    def _check(self, resp: Response) -> Response:
+        if not 200 <= resp.status < 300:
+            raise HttpError(f"HTTP {resp.status} from {redact(resp.url)}", resp.status)
+        return resp
+
+    def _request(self, url: str, headers: dict[str, str], sink=None, chunk_size: int = 64 * 1024) -> Response:
+        for _hop in range(6):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise HttpError(f"unsupported URL: {redact(url)}")
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+            resp = self._send(parts.scheme, parts.hostname, parts.port, parts.netloc, target, url, headers, sink, chunk_size)
+            if resp.status in REDIRECT_STATUSES and resp.headers.get("location"):
+                url = urllib.parse.urljoin(url, resp.headers["location"])
+                continue
+            return resp
+        raise HttpError(f"too many redirects for {redact(url)}")
+
+    def _send(self, scheme, hostname, port, netloc, target, url, headers, sink, chunk_size) -> Response:
+        stats = self.stats[netloc]
+        attempt, reuse = 0, True
+        while True:
+            delay = min(30.0, 0.5 * 2**attempt)
+            self.limiter.wait(netloc)
+            conn, reused = self._checkout(scheme, hostname, port, reuse)
+            t0 = time.perf_counter()
+            try:
+                conn.request("GET", target, headers=headers)
+                raw = conn.getresponse()
+                resp_headers = {k.lower(): v for k, v in raw.getheaders()}
+                if sink is not None and raw.status == 200:
+                    size = 0
+                    while True:
+                        chunk = raw.read(chunk_size)
+                        if not chunk:
+                            break
+                        sink.write(chunk)
+                        size += len(chunk)
+                    body = b""
+                else:
+                    body = raw.read()
+                    size = len(body)
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if sink is not None:  # start the file over
+                    sink.seek(0)
+                    sink.truncate()
+                if reused:
+                    # The server dropped an idle keep-alive connection: retry at once on a new one.
+                    reuse = False
+                    continue
+                stats.errors += 1
+                if attempt == self.retries:
+                    raise HttpError(f"request to {redact(url)} failed: {e}") from e
+                stats.retries += 1
+                attempt += 1
+                time.sleep(delay)
+                continue
+            elapsed = time.perf_counter() - t0
+            stats.requests += 1
+            stats.bytes += size
+            stats.seconds += elapsed
+            stats.slowest = max(stats.slowest, elapsed)
+            stats.statuses[raw.status] += 1
+            if raw.will_close:
+                conn.close()
+            else:
+                self._checkin(scheme, hostname, port, conn)
+
+            if raw.status in RETRY_STATUSES and attempt < self.retries:
+                stats.retries += 1
+                attempt += 1
+                retry_after = resp_headers.get("retry-after", "")
+                if retry_after.isdigit():
+                    delay = min(60.0, float(retry_after))
+                time.sleep(delay)
+                continue
+            body = _decode(body, resp_headers.pop("content-encoding", ""))
+            resp_headers.pop("content-length", None)
+            return Response(url, raw.status, resp_headers, body if sink is None else b"")
+
+    def report(self) -> str:
+        """One line per host: requests, cache use, bytes and latency."""
+        lines = []
+        for host, s in sorted(self.stats.items()):
+            avg = 1000 * s.seconds / s.requests if s.requests else 0.0
+            statuses = " ".join(f"{code}x{n}" for code, n in sorted(s.statuses.items()))
+            lines.append(
+                f"  {host}: {s.requests} requests ({statuses or 'none'}), {s.cache_hits} cache hits, "
+                f"{s.not_modified} not modified, {s.fixtures} fixtures, {s.retries} retries, "
+                f"{s.bytes / 1024:.0f} KB, avg {avg:.0f} ms, slowest {1000 * s.slowest:.0f} ms"
+            )
+        return "\n".join(lines) or "  (no HTTP traffic)"
+
+
+def _decode(body: bytes, encoding: str) -> bytes:
+    encoding = encoding.strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _max_age(headers: dict[str, str]) -> float:
+    cc = headers.get("cache-control", "")
+    if "no-store" in cc or "no-cache" in cc:
+        return 0.0
+    for part in cc.split(","):
+        name, _, value = part.strip().partition("=")
+        if name == "max-age" and value.isdigit():
+            return float(value)
+    expires = headers.get("expires")
+    if expires:
+        try:
+            return parsedate_to_datetime(expires).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
@@ -0,0 +1,180 @@
+"""
+Exact and near-duplicate detection for repo images.
+
+Why:
+  Photos get added twice: a phone export next to its AirDrop copy
+  (`IMG_0308.jpeg` / `IMG_0308 (1).jpeg`), or the same shot re-saved smaller.
+  The builders only deduped by URL, so every copy shipped as its own tile.
+
+Two images are duplicates when:
+  - their bytes are identical (same sha256, which the build cache already has), or
+  - their perceptual hashes (64-bit dHash of a 9x8 greyscale thumbnail) differ in
+    at most `PHASH_DISTANCE` bits and their aspect ratios match, which catches
+    re-encodes and resizes but not crops or neighbouring shots of a burst.
+
+Each group collapses to one canonical image: the largest in pixels, then one
+whose name isn't a copy (`name (1)`, `name 2`, `name copy`), then the shortest
+path. Perceptual hashes are cached in the build cache by content hash and
+computed on a process pool; without Pillow only exact duplicates are found.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # optional: exact duplicates only without it
+    Image = None
+
+
+PHASH_DISTANCE = 4
+# Pigeonhole: hashes within PHASH_DISTANCE bits agree exactly on at least one of
+# PHASH_DISTANCE + 1 bands, so candidates only need comparing within a band bucket.
+_BANDS = PHASH_DISTANCE + 1
+_BAND_BITS = -(-64 // _BANDS)
+HASH_EXTS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+_COPY_NAME_RE = re.compile(r"(?: \(\d+\)| copy(?: \d+)?| \d+)$", re.I)
+
+
+def dhash(path: str) -> dict:
+    """{"phash": 16 hex digits, "width", "height"} for one image ({} if it can't be decoded)."""
+    with Image.open(path) as im:
+        im.draft("L", (64, 64))
+        im = ImageOps.exif_transpose(im)
+        width, height = im.size
+        small = im.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+    px = small.tobytes()
+    bits = 0
+    for y in range(8):
+        row = px[y * 9 : y * 9 + 9]
+        for x in range(8):
+            bits = (bits << 1) | (row[x] > row[x + 1])
+    return {"phash": f"{bits:016x}", "width": width, "height": height}
+
+
+def _dhash_job(job: tuple[str, str]) -> tuple[str, dict]:
+    digest, path = job
+    try:
+        return digest, dhash(path)
+    except (OSError, ValueError):
+        return digest, {}
+
+
+def is_copy_name(rel: str) -> bool:
+    stem = os.path.splitext(rel.rsplit("/", 1)[-1])[0]
+    return bool(_COPY_NAME_RE.search(stem))
+
+
+class ImageDuplicates:
+    """
+    Duplicate groups among repo images, with hashes cached in `.build-cache/`.
+
+    `canonical(rels)` maps every path to the one that represents its group
+    (itself when it has no duplicates); `report()` summarises what was dropped.
+    """
+
+    NAMESPACE = "image-hashes"
+
+    def __init__(self, repo_root: Path, cache: BuildCache, jobs: int | None = None):
+        self.repo_root = repo_root
+        self.cache = cache
+        self.jobs = jobs or os.cpu_count() or 1
+        self.perceptual = Image is not None
+
+    def _stat(self, rel: str) -> tuple[str, int] | None:
+        """(content hash, size in bytes), or None for a missing file."""
+        try:
+            st = (self.repo_root / rel).stat()
+        except OSError:
+            return None
+        return self.cache.content_hash(rel, st.st_size, st.st_mtime_ns), st.st_size
+
+    def _hashable(self, rel: str) -> bool:
+        return self.perceptual and os.path.splitext(rel)[1].lower() in HASH_EXTS
+
+    def _phashes(self, digests: dict[str, str]) -> dict[str, dict]:
+        """Perceptual hash per path (computing uncached ones in parallel)."""
+        jobs: dict[str, str] = {}
+        for rel, digest in digests.items():
+            if self._hashable(rel) and digest not in jobs and not isinstance(self.cache.content_get(self.NAMESPACE, digest), dict):
+                jobs[digest] = str(self.repo_root / rel)
+        if len(jobs) > 1 and self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(jobs))) as pool:
+                results = list(pool.map(_dhash_job, jobs.items(), chunksize=8))
+        else:
+            results = [_dhash_job(job) for job in jobs.items()]
+        for digest, value in results:
+            self.cache.content_put(self.NAMESPACE, digest, value)
+        out: dict[str, dict] = {}
+        for rel, digest in digests.items():
+            hit = self.cache.content_get(self.NAMESPACE, digest) if self._hashable(rel) else None
+            if isinstance(hit, dict) and hit.get("phash"):
+                out[rel] = hit
+        return out
+
+    def canonical(self, rels: list[str]) -> dict[str, str]:
+        """Map each path in `rels` to its group's canonical path."""
+        info = {rel: st for rel in dict.fromkeys(rels) if (st := self._stat(rel))}
+        parent = {rel: rel for rel in info}
+
+        def find(rel: str) -> str:
+            while parent[rel] != rel:
+                parent[rel] = parent[parent[rel]]
+                rel = parent[rel]
+            return rel
+
+        def union(a: str, b: str) -> None:
+            parent[find(a)] = find(b)
+
+        by_digest: dict[str, str] = {}
+        for rel, (digest, _size) in info.items():
+            if digest in by_digest:
+                union(rel, by_digest[digest])
+            else:
+                by_digest[digest] = rel
+
+        phashes = self._phashes({rel: digest for rel, (digest, _size) in info.items()})
+        buckets: dict[tuple[int, int], list[str]] = {}
+        for rel, ph in phashes.items():
+            bits = int(ph["phash"], 16)
+            for band in range(_BANDS):
+                key = (band, (bits >> (band * _BAND_BITS)) & ((1 << _BAND_BITS) - 1))
+                buckets.setdefault(key, []).append(rel)
+        for members in buckets.values():
+            for i, a in enumerate(members):
+                pa = phashes[a]
+                for b in members[i + 1 :]:
+                    pb = phashes[b]
+                    if find(a) == find(b):
+                        continue
+                    if bin(int(pa["phash"], 16) ^ int(pb["phash"], 16)).count("1") > PHASH_DISTANCE:
+                        continue
+                    if abs(pa["width"] * pb["height"] - pb["width"] * pa["height"]) > 0.01 * pa["width"] * pb["height"]:
+                        continue
+                    union(a, b)
+
+        groups: dict[str, list[str]] = {}
+        for rel in info:
+            groups.setdefault(find(rel), []).append(rel)
+
+        def rank(rel: str) -> tuple:
+            ph = phashes.get(rel) or {}
+            return (-(ph.get("width", 0) * ph.get("height", 0)), is_copy_name(rel), len(rel), rel)
+
+        out: dict[str, str] = {}
+        for members in groups.values():
+            best = min(members, key=rank)
+            for rel in members:
+                out[rel] = best
+        return out
+
+    def report(self, canonical: dict[str, str]) -> tuple[int, int]:
+        """(duplicates dropped, bytes they would have shipped)."""
+        dropped = [rel for rel, canon in canonical.items() if rel != canon]
+        return len(dropped), sum(st[1] for rel in dropped if (st := self._stat(rel)))
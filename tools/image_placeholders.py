@@ -0,0 +1,129 @@
+"""
+Tiny image placeholders: a dominant colour plus a ~16px preview, per repo image.
+
+Why:
+  Cards, gallery tiles and species cards showed empty boxes until their large
+  images arrived. With a placeholder in the data, the page can paint the image's
+  colours immediately (as the `<img>` background, under the real image) for a
+  couple of hundred bytes per image.
+
+Each placeholder is `{"color": "#rrggbb", "preview": "data:image/webp;base64,..."}`.
+The preview is at most `PREVIEW_SIZE` px on its long side; browsers smooth it
+when it is stretched to the box, which reads as a blur. SVGs, GIFs and images
+with transparency get no placeholder (the background would show through).
+
+Results are cached in the build cache keyed by content hash, so an image is only
+decoded again when its bytes change; `prepare()` computes the missing ones on a
+process pool. Needs Pillow; without it every lookup returns None and the pages
+simply keep their plain boxes.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # optional: no placeholders without it
+    Image = None
+
+
+PREVIEW_SIZE = 16
+SOURCE_EXTS = {".png", ".jpg", ".jpeg", ".webp"}
+
+
+def compute_placeholder(path: str) -> dict:
+    """Placeholder for one image file ({} when it shouldn't have one)."""
+    with Image.open(path) as im:
+        # JPEG can decode straight at 1/8 scale: enough for a 16px preview, and far cheaper.
+        im.draft("RGB", (PREVIEW_SIZE * 8, PREVIEW_SIZE * 8))
+        im = ImageOps.exif_transpose(im)
+        if im.mode in ("RGBA", "LA", "PA") or (im.mode == "P" and "transparency" in im.info):
+            alpha = im.convert("RGBA").getchannel("A")
+            if alpha.getextrema()[0] < 255:
+                return {}
+        im = im.convert("RGB")
+        im.thumbnail((PREVIEW_SIZE, PREVIEW_SIZE), Image.Resampling.LANCZOS)
+
+    # Dominant colour: the most common of a few median-cut clusters (an average would turn green + blue into grey).
+    quantized = im.quantize(colors=4, method=Image.Quantize.MEDIANCUT)
+    palette = quantized.getpalette()
+    _count, index = max(quantized.getcolors())
+    r, g, b = palette[index * 3 : index * 3 + 3]
+
+    buf = io.BytesIO()
+    im.save(buf, "WEBP", quality=40, method=6)
+    return {
+        "color": f"#{r:02x}{g:02x}{b:02x}",
+        "preview": "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii"),
+    }
+
+
+def _compute_job(job: tuple[str, str]) -> tuple[str, dict]:
+    digest, path = job
+    try:
+        return digest, compute_placeholder(path)
+    except (OSError, ValueError):
+        return digest, {}
+
+
+class ImagePlaceholders:
+    """
+    Placeholders for repo images, cached in `.build-cache/` by content hash.
+
+    Call `prepare(rels)` with every path a build needs (computes the uncached
+    ones in parallel), then `get(rel)` per image.
+    """
+
+    NAMESPACE = "placeholders"
+
+    def __init__(self, repo_root: Path, cache: BuildCache, jobs: int | None = None):
+        self.repo_root = repo_root
+        self.cache = cache
+        self.jobs = jobs or os.cpu_count() or 1
+        self.available = Image is not None
+
+    def _digest(self, rel: str) -> str | None:
+        if os.path.splitext(rel)[1].lower() not in SOURCE_EXTS:
+            return None
+        try:
+            st = (self.repo_root / rel).stat()
+        except OSError:
+            return None
+        return self.cache.content_hash(rel, st.st_size, st.st_mtime_ns)
+
+    def prepare(self, rels: list[str]) -> int:
+        """Compute placeholders missing from the cache. Returns how many were computed."""
+        if not self.available:
+            return 0
+        jobs: dict[str, str] = {}
+        for rel in rels:
+            digest = self._digest(rel)
+            if digest and digest not in jobs and not isinstance(self.cache.content_get(self.NAMESPACE, digest), dict):
+                jobs[digest] = str(self.repo_root / rel)
+        if len(jobs) > 1 and self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(jobs))) as pool:
+                results = list(pool.map(_compute_job, jobs.items(), chunksize=8))
+        else:
+            results = [_compute_job(job) for job in jobs.items()]
+        for digest, value in results:
+            self.cache.content_put(self.NAMESPACE, digest, value)
+        return len(results)
+
+    def get(self, rel: str) -> dict | None:
+        if not self.available:
+            return None
+        digest = self._digest(rel)
+        if not digest:
+            return None
+        hit = self.cache.content_get(self.NAMESPACE, digest)
+        if not isinstance(hit, dict):
+            _digest, hit = _compute_job((digest, str(self.repo_root / rel)))
+            self.cache.content_put(self.NAMESPACE, digest, hit)
+        return hit or None
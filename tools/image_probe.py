@@ -0,0 +1,225 @@
+"""
+Read image dimensions from file headers, without decoding any pixels.
+
+Why:
+  The bundles need intrinsic width/height for every image so the front end can
+  reserve the right aspect-ratio box before the image loads (no layout shift).
+  Opening 100+ multi-megabyte photos with an image library just to learn their
+  size is far too slow; the size is in the first few hundred bytes of the file
+  (or, for JPEG, in the first few segments).
+
+Supported: PNG (IHDR), JPEG (SOFn + EXIF orientation), WebP (VP8 / VP8L / VP8X,
+plus its EXIF chunk), GIF (logical screen) and SVG (`width`/`height` or
+`viewBox`). Reported sizes are *display* sizes: EXIF orientations 5–8 swap
+width and height, as browsers do.
+
+Results are cached in the build cache keyed by the file's content hash, so a
+file is only probed again when its bytes change.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from pathlib import Path
+from typing import BinaryIO
+
+from build_cache import BuildCache
+
+
+# JPEG start-of-frame markers (C4 = DHT, C8 = JPG extension, CC = DAC are not frames).
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# Markers without a length field.
+_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD9)}
+
+_SVG_TAG_RE = re.compile(rb"<svg\b[^>]*>", re.S | re.I)
+_SVG_ATTR_RE = re.compile(rb"""\b(width|height|viewBox)\s*=\s*["']([^"']*)["']""", re.I)
+_SVG_LENGTH_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$")
+
+
+def _exif_orientation(tiff: bytes) -> int:
+    """Orientation tag (0x0112) from a TIFF-structured EXIF block; 1 if absent."""
+    if len(tiff) < 8 or tiff[:2] not in (b"II", b"MM"):
+        return 1
+    bo = "<" if tiff[:2] == b"II" else ">"
+    ifd = struct.unpack(bo + "I", tiff[4:8])[0]
+    if ifd + 2 > len(tiff):
+        return 1
+    count = struct.unpack(bo + "H", tiff[ifd : ifd + 2])[0]
+    for i in range(count):
+        off = ifd + 2 + i * 12
+        if off + 12 > len(tiff):
+            break
+        tag, typ = struct.unpack(bo + "HH", tiff[off : off + 4])
+        if tag == 0x0112 and typ == 3:  # SHORT
+            value = struct.unpack(bo + "H", tiff[off + 8 : off + 10])[0]
+            return value if 1 <= value <= 8 else 1
+    return 1
+
+
+def _probe_png(f: BinaryIO, head: bytes) -> tuple[int, int, int] | None:
+    if len(head) < 24 or head[12:16] != b"IHDR":
+        return None
+    w, h = struct.unpack(">II", head[16:24])
+    return w, h, 1
+
+
+def _probe_gif(f: BinaryIO, head: bytes) -> tuple[int, int, int] | None:
+    if len(head) < 10:
+        return None
+    w, h = struct.unpack("<HH", head[6:10])
+    return w, h, 1
+
+
+def _probe_jpeg(f: BinaryIO, head: bytes) -> tuple[int, int, int] | None:
+    f.seek(2)
+    orientation = 1
+    while True:
+        b = f.read(1)
+        while b and b != b"\xff":  # skip garbage between segments
+            b = f.read(1)
+        while b == b"\xff":  # fill bytes
+            b = f.read(1)
+        if not b:
+            return None
+        marker = b[0]
+        if marker in _STANDALONE_MARKERS:
+            continue
+        if marker in (0xD9, 0xDA):  # EOI / SOS before any frame header
+            return None
+        raw = f.read(2)
+        if len(raw) < 2:
+            return None
+        length = struct.unpack(">H", raw)[0] - 2
+        if marker in _SOF_MARKERS:
+            seg = f.read(5)
+            if len(seg) < 5:
+                return None
+            h, w = struct.unpack(">HH", seg[1:5])
+            return w, h, orientation
+        if marker == 0xE1 and orientation == 1:
+            seg = f.read(length)
+            if seg[:6] == b"Exif\x00\x00":
+                orientation = _exif_orientation(seg[6:])
+            continue
+        f.seek(length, 1)
+
+
+def _probe_webp(f: BinaryIO, head: bytes) -> tuple[int, int, int] | None:
+    if len(head) < 30:
+        return None
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        if head[23:26] != b"\x9d\x01\x2a":
+            return None
+        w, h = struct.unpack("<HH", head[26:30])
+        return w & 0x3FFF, h & 0x3FFF, 1
+    if chunk == b"VP8L":
+        if head[20] != 0x2F:
+            return None
+        bits = struct.unpack("<I", head[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, 1
+    if chunk == b"VP8X":
+        w = int.from_bytes(head[24:27], "little") + 1
+        h = int.from_bytes(head[27:30], "little") + 1
+        orientation = 1
+        if head[20] & 0x08:  # EXIF flag: walk the chunk list to find it
+            f.seek(12)
+            while True:
+                hdr = f.read(8)
+                if len(hdr) < 8:
+                    break
+                name, size = hdr[:4], struct.unpack("<I", hdr[4:])[0]
+                if name == b"EXIF":
+                    data = f.read(size)
+                    orientation = _exif_orientation(data[6:] if data[:6] == b"Exif\x00\x00" else data)
+                    break
+                f.seek(size + (size & 1), 1)
+        return w, h, orientation
+    return None
+
+
+def _svg_length(value: bytes) -> float | None:
+    m = _SVG_LENGTH_RE.match(value.decode("ascii", "ignore"))
+    return float(m.group(1)) if m else None
+
+
+def _probe_svg(f: BinaryIO, head: bytes) -> tuple[int, int, int] | None:
+    data = head + f.read(64 * 1024 - len(head))
+    m = _SVG_TAG_RE.search(data)
+    if not m:
+        return None
+    attrs = {k.decode("ascii").lower(): v for k, v in _SVG_ATTR_RE.findall(m.group(0))}
+    w = _svg_length(attrs.get("width", b""))
+    h = _svg_length(attrs.get("height", b""))
+    if not (w and h):
+        # Percentages/ems (or nothing) — fall back to the viewBox for the aspect ratio.
+        parts = attrs.get("viewbox", b"").replace(b",", b" ").split()
+        if len(parts) != 4:
+            return None
+        try:
+            w, h = float(parts[2]), float(parts[3])
+        except ValueError:
+            return None
+    return round(w), round(h), 1
+
+
+def read_header(f: BinaryIO) -> tuple[int, int, int] | None:
+    """(stored width, stored height, EXIF orientation) from an open binary file, or None."""
+    head = f.read(32)
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return _probe_png(f, head)
+    if head.startswith(b"\xff\xd8"):
+        return _probe_jpeg(f, head)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _probe_webp(f, head)
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return _probe_gif(f, head)
+    if b"<svg" in head or head.lstrip().startswith((b"<?xml", b"<!--", b"<!DOCTYPE", b"\xef\xbb\xbf")):
+        return _probe_svg(f, head)
+    return None
+
+
+def probe(path: Path) -> tuple[int, int] | None:
+    """Display (width, height) of an image file, or None if unknown/unsupported."""
+    try:
+        with open(path, "rb") as f:
+            info = read_header(f)
+    except (OSError, struct.error, IndexError):
+        return None
+    if not info:
+        return None
+    w, h, orientation = info
+    if w <= 0 or h <= 0:
+        return None
+    return (h, w) if orientation in (5, 6, 7, 8) else (w, h)
+
+
+class ImageDimensions:
+    """
+    Display dimensions for repo images, cached in `.build-cache/` by content hash.
+
+    `get(rel)` takes a repo-relative path; pass `size`/`mtime_ns` when the file
+    was already stat-ed (e.g. by the asset catalog) to skip another stat.
+    """
+
+    NAMESPACE = "dims"
+
+    def __init__(self, repo_root: Path, cache: BuildCache):
+        self.repo_root = repo_root
+        self.cache = cache
+
+    def get(self, rel: str, size: int | None = None, mtime_ns: int | None = None) -> tuple[int, int] | None:
+        if size is None or mtime_ns is None:
+            try:
+                st = (self.repo_root / rel).stat()
+            except OSError:
+                return None
+            size, mtime_ns = st.st_size, st.st_mtime_ns
+        digest = self.cache.content_hash(rel, size, mtime_ns)
+        hit = self.cache.content_get(self.NAMESPACE, digest)
+        if not isinstance(hit, list):
+            dims = probe(self.repo_root / rel)
+            hit = list(dims) if dims else []
+            self.cache.content_put(self.NAMESPACE, digest, hit)
+        return (hit[0], hit[1]) if len(hit) == 2 else None
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Write precompressed `.br` / `.gz` siblings for the site's text assets.
+
+Why:
+  The data bundles, `app.js`, `styles.css` and the pages are plain text and
+  shrink 3-6x when compressed, but compressing them on every request costs CPU
+  on every hit (and plain static hosts don't do it at all). Compressing once at
+  build time, at the maximum level, means `tools/serve.py` or any host that
+  understands precompressed siblings (nginx `gzip_static`/`brotli_static`,
+  Caddy `precompressed`, ...) sends the smallest bytes with no runtime cost.
+
+Rules:
+  - Inputs: pages, root JS/CSS, `data/*.js` / `data/*.json` (incl. detail and gallery chunks),
+    `sw.js`, `asset-manifest.json` and SVGs under `assets/`. Files under 1 KB are
+    skipped (the headers would eat the saving).
+  - `.gz` is gzip level 9, `.br` brotli quality 11. Brotli needs the optional
+    `brotli` module (`pip install brotli`); without it only `.gz` is written.
+    Output is deterministic (no timestamps), so unchanged inputs give
+    byte-identical siblings.
+  - A sibling is only kept if it is actually smaller than the original.
+  - Files whose content hash (build cache) hasn't changed since the last run,
+    and whose siblings are still in place, are skipped; the rest are compressed
+    on a process pool.
+  - Siblings whose original has gone away (or is no longer an input) are removed.
+
+Usage:
+  python3 tools/precompress_assets.py
+  python3 tools/precompress_assets.py --root dist      # after fingerprint_assets.py
+  python3 tools/precompress_assets.py --formats gz --jobs 2 --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # optional: gzip-only without it
+    brotli = None
+
+
+CACHE_NS = "precompress"
+MIN_SIZE = 1024
+SUFFIXES = {"gz": ".gz", "br": ".br"}
+DEFAULT_FORMATS = ("br", "gz")
+INPUT_GLOBS = (
+    "*.html",
+    "*.js",
+    "*.css",
+    "*.json",
+    "data/*.js",
+    "data/*.json",
+    "data/feature-details/*.js",
+    "data/gallery/*.js",
+    "assets/**/*.svg",
+)
+
+
+def collect_inputs(root: Path) -> list[Path]:
+    files: set[Path] = set()
+    for pattern in INPUT_GLOBS:
+        for p in root.glob(pattern):
+            if p.is_file() and not p.name.startswith(".") and p.stat().st_size >= MIN_SIZE:
+                files.add(p)
+    return sorted(files)
+
+
+def compress(data: bytes, fmt: str) -> bytes:
+    if fmt == "gz":
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+
+
+def _compress_one(job: tuple[str, tuple[str, ...]]) -> tuple[str, dict[str, int]]:
+    """Worker: write the siblings for one file. Returns (path, {fmt: size or 0 if dropped})."""
+    path, formats = job
+    data = Path(path).read_bytes()
+    sizes: dict[str, int] = {}
+    for fmt in formats:
+        out = Path(path + SUFFIXES[fmt])
+        packed = compress(data, fmt)
+        if len(packed) >= len(data):
+            out.unlink(missing_ok=True)
+            sizes[fmt] = 0
+            continue
+        tmp = out.with_name(out.name + ".tmp")
+        tmp.write_bytes(packed)
+        os.replace(tmp, out)
+        sizes[fmt] = len(packed)
+    return path, sizes
+
+
+def _key(repo_root: Path, p: Path) -> str:
+    return p.relative_to(repo_root).as_posix() if p.is_relative_to(repo_root) else str(p)
+
+
+def _belongs_elsewhere(path: Path, root: Path) -> bool:
+    """True for a cached file that still exists but isn't one of `root`'s candidates."""
+    if not path.is_file():
+        return False
+    try:
+        rel = path.relative_to(root)
+    except ValueError:
+        return True
+    return not any(rel.match(pattern) for pattern in INPUT_GLOBS)
+
+
+def _is_fresh(path: Path, digest: str, formats: tuple[str, ...], rec: object) -> bool:
+    if not isinstance(rec, dict) or rec.get("hash") != digest or rec.get("formats") != list(formats):
+        return False
+    for fmt in formats:
+        size = (rec.get("sizes") or {}).get(fmt, 0)
+        sibling = Path(str(path) + SUFFIXES[fmt])
+        if size and not (sibling.is_file() and sibling.stat().st_size == size):
+            return False
+    return True
+
+
+def _touch_siblings(path: Path, formats: tuple[str, ...]) -> None:
+    """Keep siblings at least as new as their original (servers treat older ones as stale)."""
+    mtime_ns = path.stat().st_mtime_ns
+    for fmt in formats:
+        sibling = Path(str(path) + SUFFIXES[fmt])
+        if sibling.is_file() and sibling.stat().st_mtime_ns < mtime_ns:
+            os.utime(sibling, ns=(mtime_ns, mtime_ns))
+
+
+def _prune(root: Path, inputs: set[Path], formats: tuple[str, ...]) -> int:
+    """Remove siblings of files that are gone, too small, or whose format is no longer written."""
+    removed = 0
+    for pattern in INPUT_GLOBS:
+        for suffix in SUFFIXES.values():
+            for p in root.glob(pattern + suffix):
+                original = p.with_name(p.name[: -len(suffix)])
+                fmt = suffix.lstrip(".")
+                if original not in inputs or fmt not in formats:
+                    p.unlink()
+                    removed += 1
+    return removed
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:.1f} KB" if n else "-"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", default=".", help="Directory to compress, relative to the repo root (default: repo root)")
+    ap.add_argument("--formats", default=",".join(DEFAULT_FORMATS), help="Comma-separated formats (br, gz)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    ap.add_argument("--force", action="store_true", help="Recompress every file")
+    args = ap.parse_args()
+
+    requested = tuple(f.strip().lower() for f in args.formats.split(",") if f.strip())
+    unknown = [f for f in requested if f not in SUFFIXES]
+    if not requested or unknown:
+        print(f"ERROR: bad --formats ({', '.join(unknown) or 'none given'})", file=sys.stderr)
+        return 2
+    formats = requested
+    if "br" in formats and brotli is None:
+        formats = tuple(f for f in formats if f != "br")
+        print("Note: brotli module not installed (pip install brotli); writing .gz only.")
+        if not formats:
+            print("ERROR: no usable formats", file=sys.stderr)
+            return 2
+
+    repo_root = Path(__file__).resolve().parent.parent
+    root = (repo_root / args.root).resolve()
+    if not root.is_dir():
+        print(f"ERROR: not a directory: {root}", file=sys.stderr)
+        return 2
+
+    cache = BuildCache(repo_root)
+    inputs = collect_inputs(root)
+    results: dict[Path, dict[str, int]] = {}
+    jobs = []
+    for p in inputs:
+        key = _key(repo_root, p)
+        digest = cache.file_hash(p)
+        rec = cache.get(CACHE_NS, key)
+        if not args.force and _is_fresh(p, digest, formats, rec):
+            results[p] = dict(rec["sizes"])  # type: ignore[index]
+            _touch_siblings(p, formats)
+            continue
+        jobs.append((str(p), formats))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as pool:
+            for path, sizes in pool.map(_compress_one, jobs, chunksize=4):
+                results[Path(path)] = sizes
+    for p, sizes in results.items():
+        cache.put(CACHE_NS, _key(repo_root, p), {"hash": cache.file_hash(p), "formats": list(formats), "sizes": sizes})
+    # Forget files that are gone or no longer inputs; records for other roots (e.g. dist/) stay.
+    scanned = {_key(repo_root, p) for p in inputs}
+    bucket = cache.entries.get(CACHE_NS) or {}
+    cache.prune(CACHE_NS, {k for k in bucket if k in scanned or _belongs_elsewhere(repo_root / k, root)})
+    cache.save()
+    removed = _prune(root, set(inputs), formats)
+
+    # Size report, biggest originals first.
+    fresh = {Path(j[0]) for j in jobs}
+    header = f"  {'file':<48} {'original':>10} " + " ".join(f"{('.' + f):>10}" for f in formats) + "  saved"
+    print(header)
+    total_in, total_best = 0, 0
+    totals = dict.fromkeys(formats, 0)
+    for p in sorted(results, key=lambda q: -q.stat().st_size):
+        size = p.stat().st_size
+        sizes = results[p]
+        best = min([size] + [s for s in sizes.values() if s])
+        total_in += size
+        total_best += best
+        for f in formats:
+            totals[f] += sizes.get(f) or size
+        rel = p.relative_to(root).as_posix()
+        mark = "*" if p in fresh else " "
+        cols = " ".join(f"{_kb(sizes.get(f, 0)):>10}" for f in formats)
+        print(f"{mark} {rel:<48} {_kb(size):>10} {cols}  {100 * (1 - best / size):4.0f}%")
+    cols = " ".join(f"{_kb(totals[f]):>10}" for f in formats)
+    saved = 100 * (1 - total_best / total_in) if total_in else 0
+    print(f"  {'TOTAL':<48} {_kb(total_in):>10} {cols}  {saved:4.0f}%")
+    print(
+        f"Precompressed {len(results)} files in {root} ({len(jobs)} compressed (*), "
+        f"{len(results) - len(jobs)} up to date, {removed} stale siblings removed)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Render info-board PDFs to page images and extract their text.
+
+Why:
+  Each board PDF under `assets/features/<id>/` used to be exported by hand to
+  `page-001.png` (which `build_features_data.py` always uses as the feature's
+  headline image) and `text.txt`, and the text pasted into `data/features.json`.
+  This script does all of that for every board in one run.
+
+Rules:
+  - One board per feature folder: `assets/features/<id>/*.pdf`. A folder with
+    several PDFs uses the first by name (the others are reported).
+  - Pages are written as `page-001.png`, `page-002.png`, ... at `--dpi`, capped
+    at `--max-width` pixels wide (the defaults match the existing 1600px renders).
+    Page images left over from a longer previous version are removed.
+  - Text is extracted per page, trailing spaces stripped, and written to
+    `text.txt` (pages separated by a blank line).
+  - `data/features.json` gets the feature's `text`, `sourcePdf` and one `pages`
+    entry per page (size + a 400-character `textPreview`); a folder without a
+    feature gets a minimal new entry. Curated fields are left alone.
+  - Boards are rendered in parallel on a process pool. Results are cached by the
+    PDF's sha256 and the render settings (`.build-cache/`), so unchanged boards
+    are never rendered again (`--force` re-renders).
+
+Backends (local only, no services): PyMuPDF (`pip install pymupdf`), or
+poppler's `pdftoppm` / `pdftotext` if they're on PATH. Capping the width of a
+poppler render needs Pillow.
+
+Usage:
+  python3 tools/render_feature_pdfs.py
+  python3 tools/render_feature_pdfs.py --dpi 300 --max-width 2400 --only rats,hibernaculum
+  python3 tools/build_features_data.py   # then rebuild the bundle
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache, signature, write_if_changed
+
+
+FEATURES_DIR = "assets/features"
+FEATURES_JSON = "data/features.json"
+CACHE_NS = "feature-pdfs"
+DEFAULT_DPI = 200
+DEFAULT_MAX_WIDTH = 1600
+PREVIEW_CHARS = 400
+_PAGE_RE = re.compile(r"^page-(\d{3,})\.png$")
+
+
+def _pymupdf():
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf  # older PyMuPDF releases
+        except ImportError:
+            return None
+    return pymupdf
+
+
+def pick_backend(requested: str) -> str | None:
+    """'pymupdf' or 'poppler' (whichever is installed, PyMuPDF first), or None."""
+    if requested in ("auto", "pymupdf") and _pymupdf() is not None:
+        return "pymupdf"
+    if requested in ("auto", "poppler") and shutil.which("pdftoppm") and shutil.which("pdftotext"):
+        return "poppler"
+    return None
+
+
+def clean_text(text: str) -> str:
+    return "\n".join(line.rstrip() for line in text.splitlines()).strip()
+
+
+def text_preview(text: str) -> str:
+    return text if len(text) <= PREVIEW_CHARS else text[:PREVIEW_CHARS] + "…"
+
+
+def _render_pymupdf(pdf: Path, folder: Path, dpi: int, max_width: int) -> tuple[list[list[int]], list[str]]:
+    pymupdf = _pymupdf()
+    sizes, texts = [], []
+    with pymupdf.open(pdf) as doc:
+        for i, page in enumerate(doc, start=1):
+            zoom = dpi / 72
+            if max_width:
+                zoom = min(zoom, max_width / page.rect.width)
+            pix = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+            out = folder / f"page-{i:03d}.png"
+            tmp = out.with_name(out.name + ".tmp")
+            pix.save(str(tmp), output="png")
+            os.replace(tmp, out)
+            sizes.append([pix.width, pix.height])
+            texts.append(clean_text(page.get_text()))
+    return sizes, texts
+
+
+def _render_poppler(pdf: Path, folder: Path, dpi: int, max_width: int) -> tuple[list[list[int]], list[str]]:
+    sizes = []
+    with tempfile.TemporaryDirectory(dir=folder) as tmpdir:
+        subprocess.run(["pdftoppm", "-png", "-r", str(dpi), str(pdf), f"{tmpdir}/p"], check=True, capture_output=True)
+        # pdftoppm pads the page number to the page count's width: p-1.png or p-01.png.
+        rendered = sorted(Path(tmpdir).glob("p-*.png"), key=lambda p: int(p.stem.rsplit("-", 1)[1]))
+        for i, src in enumerate(rendered, start=1):
+            sizes.append(_fit_width(src, max_width))
+            os.replace(src, folder / f"page-{i:03d}.png")
+    raw = subprocess.run(["pdftotext", "-enc", "UTF-8", str(pdf), "-"], check=True, capture_output=True).stdout
+    texts = [clean_text(t) for t in raw.decode("utf-8").split("\f")][: len(sizes)]
+    return sizes, texts + [""] * (len(sizes) - len(texts))
+
+
+def _fit_width(path: Path, max_width: int) -> list[int]:
+    """Downscale a PNG in place to at most `max_width` pixels wide (needs Pillow). Returns its size."""
+    try:
+        from PIL import Image
+    except ImportError:
+        from image_probe import probe
+
+        return list(probe(path) or (0, 0))
+    with Image.open(path) as im:
+        if not max_width or im.width <= max_width:
+            return [im.width, im.height]
+        im = im.resize((max_width, round(im.height * max_width / im.width)), Image.Resampling.LANCZOS)
+        im.save(path, format="PNG")
+        return [im.width, im.height]
+
+
+def render_board(job: tuple[str, str, str, int, int]) -> tuple[str, list[list[int]], list[str]]:
+    """Worker: render one PDF's pages + text into its feature folder. Returns (feature id, page sizes, page texts)."""
+    backend, pdf_abs, fid, dpi, max_width = job
+    pdf = Path(pdf_abs)
+    folder = pdf.parent
+    render = _render_pymupdf if backend == "pymupdf" else _render_poppler
+    sizes, texts = render(pdf, folder, dpi, max_width)
+    for p in folder.iterdir():
+        m = _PAGE_RE.match(p.name)
+        if m and int(m.group(1)) > len(sizes):
+            p.unlink()
+    write_if_changed(folder / "text.txt", "\n\n".join(t for t in texts if t))
+    return fid, sizes, texts
+
+
+def find_boards(repo_root: Path) -> tuple[dict[str, Path], list[Path]]:
+    """({feature id: board PDF}, extra PDFs that were ignored)."""
+    boards: dict[str, Path] = {}
+    extra: list[Path] = []
+    root = repo_root / FEATURES_DIR
+    if not root.is_dir():
+        return boards, extra
+    for folder in sorted(p for p in root.iterdir() if p.is_dir()):
+        pdfs = sorted(p for p in folder.iterdir() if p.suffix.lower() == ".pdf" and not p.name.startswith("."))
+        if pdfs:
+            boards[folder.name] = pdfs[0]
+            extra += pdfs[1:]
+    return boards, extra
+
+
+def _is_current(folder: Path, rec: object, pdf_sha: str, opts: str) -> bool:
+    if not isinstance(rec, dict) or rec.get("sha") != pdf_sha or rec.get("opts") != opts:
+        return False
+    pages = rec.get("pages") or []
+    return bool(pages) and (folder / "text.txt").is_file() and all(
+        (folder / f"page-{i:03d}.png").is_file() for i in range(1, len(pages) + 1)
+    )
+
+
+def apply_to_features(source: dict, fid: str, pdf_name: str, sizes: list[list[int]], texts: list[str]) -> bool:
+    """Write one board's results into the parsed `features.json`. Returns True if anything changed."""
+    features = source.setdefault("features", [])
+    feature = next((f for f in features if isinstance(f, dict) and f.get("id") == fid), None)
+    if feature is None:
+        feature = {
+            "id": fid,
+            "title": fid.replace("-", " ").replace("_", " ").title(),
+            "sourcePdf": pdf_name,
+            "thumb": f"{FEATURES_DIR}/{fid}/page-001.png",
+            "pages": [],
+            "story": "",
+            "text": "",
+            "tags": [],
+        }
+        features.append(feature)
+    before = json.dumps(feature, sort_keys=True)
+    feature["sourcePdf"] = pdf_name
+    feature["text"] = "\n\n".join(t for t in texts if t)
+    old_pages = feature.get("pages") if isinstance(feature.get("pages"), list) else []
+    pages = []
+    for i, (wh, text) in enumerate(zip(sizes, texts), start=1):
+        page = dict(old_pages[i - 1]) if i <= len(old_pages) and isinstance(old_pages[i - 1], dict) else {}
+        page.update(
+            {
+                "pageNumber": i,
+                "image": f"{FEATURES_DIR}/{fid}/page-{i:03d}.png",
+                "width": wh[0],
+                "height": wh[1],
+                "textPreview": text_preview(text),
+            }
+        )
+        pages.append(page)
+    feature["pages"] = pages
+    return json.dumps(feature, sort_keys=True) != before
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="Render resolution")
+    ap.add_argument("--max-width", type=int, default=DEFAULT_MAX_WIDTH, help="Cap page images at this width (0 = no cap)")
+    ap.add_argument("--backend", choices=("auto", "pymupdf", "poppler"), default="auto")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    ap.add_argument("--only", default="", help="Comma-separated feature ids (default: all)")
+    ap.add_argument("--force", action="store_true", help="Re-render boards even if unchanged")
+    ap.add_argument("--no-json", action="store_true", help="Don't update data/features.json")
+    args = ap.parse_args()
+
+    backend = pick_backend(args.backend)
+    if backend is None:
+        print("ERROR: no PDF renderer found (pip install pymupdf, or install poppler-utils)", file=sys.stderr)
+        return 2
+    if args.dpi <= 0 or args.max_width < 0:
+        print("ERROR: --dpi must be positive and --max-width non-negative", file=sys.stderr)
+        return 2
+
+    repo_root = Path(__file__).resolve().parent.parent
+    cache = BuildCache(repo_root)
+    boards, extra = find_boards(repo_root)
+    for p in extra:
+        print(f"  !! ignoring {p.relative_to(repo_root)} (one board PDF per feature folder)")
+    only = {s.strip() for s in args.only.split(",") if s.strip()}
+    if only - boards.keys():
+        print(f"ERROR: no board PDF for: {', '.join(sorted(only - boards.keys()))}", file=sys.stderr)
+        return 2
+
+    opts = signature([args.dpi, args.max_width])
+    results: dict[str, tuple[list[list[int]], list[str]]] = {}
+    jobs = []
+    up_to_date = excluded = 0
+    for fid, pdf in boards.items():
+        sha = cache.file_hash(pdf)
+        rec = cache.get(CACHE_NS, fid)
+        skipped = bool(only) and fid not in only
+        current = not skipped and not args.force and _is_current(pdf.parent, rec, sha, opts)
+        if skipped or current:
+            if isinstance(rec, dict) and rec.get("sha") == sha:
+                results[fid] = (rec["pages"], rec["texts"])
+            up_to_date += current
+            excluded += skipped
+            continue
+        jobs.append((backend, str(pdf), fid, args.dpi, args.max_width))
+
+    t0 = time.perf_counter()
+    if jobs:
+        print(f"Rendering {len(jobs)} of {len(boards)} boards with {backend} at {args.dpi} dpi...")
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as pool:
+            for fid, sizes, texts in pool.map(render_board, jobs):
+                pdf = boards[fid]
+                print(f"  -> {fid}: {len(sizes)} page(s), {sum(len(t) for t in texts)} chars of text")
+                cache.put(CACHE_NS, fid, {"sha": cache.file_hash(pdf), "opts": opts, "pages": sizes, "texts": texts})
+                results[fid] = (sizes, texts)
+    cache.prune(CACHE_NS, set(boards))
+    cache.save()
+
+    updated = 0
+    if not args.no_json:
+        src = repo_root / FEATURES_JSON
+        source = json.loads(src.read_text(encoding="utf-8"))
+        for fid, (sizes, texts) in sorted(results.items()):
+            updated += apply_to_features(source, fid, boards[fid].name, sizes, texts)
+        if updated:
+            write_if_changed(src, json.dumps(source, indent=2, ensure_ascii=False))
+
+    print(
+        f"Done in {time.perf_counter() - t0:.1f}s: {len(jobs)} rendered, {up_to_date} up to date, "
+        f"{f'{excluded} not selected (--only), ' if excluded else ''}{updated} feature(s) updated in {FEATURES_JSON}."
+    )
+    if updated:
+        print("Run tools/build_features_data.py to rebuild the bundle.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""
+Prebuilt full-text search index for the static bundles.
+
+Why:
+  The Explore page used to rebuild and lower-case a haystack (title + full board
+  text + tags + PDF name) for every feature on every keystroke. Tokenizing once at
+  build time and shipping an inverted index turns a query into a few binary
+  searches over a sorted term list, however long the texts get.
+
+Format (`build_index()` output, consumed by `app.js`):
+  {
+    "fields":   ["title", "tags", "sourcePdf", "text"],
+    "weights":  [8, 5, 2, 1],            # score per occurrence, per field
+    "docs":     ["feature-id", ...],     # doc number -> id
+    "terms":    ["abbey", "acorn", ...], # sorted, so prefixes are a contiguous range
+    "postings": [[doc, score, doc, score, ...], ...]  # parallel to `terms`
+  }
+
+A term's score in a document is the sum over fields of weight * min(count, TF_CAP),
+so a word repeated all over a long board text can't drown out a title match.
+
+Tokenization must stay in sync with `searchTokens()` in `app.js` and
+`field-guide.js` (`tests/test_search_index.py` checks it): NFKD with the
+combining diacritical marks (U+0300-U+036F) removed, lower-cased, apostrophes
+dropped, split on anything that isn't a-z / 0-9.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Callable
+
+
+TF_CAP = 3
+FEATURE_FIELDS = (("title", 8), ("tags", 5), ("sourcePdf", 2), ("text", 1))
+
+_APOSTROPHES_RE = re.compile(r"['’]")
+_COMBINING_RE = re.compile("[\u0300-\u036f]")  # the same range the JS strips
+_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    stripped = _COMBINING_RE.sub("", unicodedata.normalize("NFKD", text)).lower()
+    return [t for t in _SPLIT_RE.split(_APOSTROPHES_RE.sub("", stripped)) if t]
+
+
+def _field_text(value: object) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        return " ".join(v for v in value if isinstance(v, str))
+    return ""
+
+
+def build_index(
+    docs: list[dict],
+    fields: tuple[tuple[str, int], ...] = FEATURE_FIELDS,
+    doc_id: Callable[[dict], str] = lambda d: d["id"],
+) -> dict:
+    """Build the inverted index for `docs` (dicts with string / string-list fields)."""
+    ids: list[str] = []
+    postings: dict[str, list[int]] = {}
+    for n, doc in enumerate(docs):
+        ids.append(doc_id(doc))
+        scores: Counter[str] = Counter()
+        for name, weight in fields:
+            for term, count in Counter(tokenize(_field_text(doc.get(name)))).items():
+                scores[term] += weight * min(count, TF_CAP)
+        for term, score in scores.items():
+            postings.setdefault(term, []).extend((n, score))
+    terms = sorted(postings)
+    return {
+        "fields": [name for name, _w in fields],
+        "weights": [w for _name, w in fields],
+        "docs": ids,
+        "terms": terms,
+        "postings": [postings[t] for t in terms],
+    }
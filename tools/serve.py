@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Serve the site locally (or on the farm's box during open days).
+
+Why:
+  `python3 -m http.server` is fine for a quick look, but it has no compression,
+  no ETags / conditional requests, no Range support (PDFs and big images are
+  re-sent in full) and a new thread per connection. Kiosk tablets on the farm
+  Wi-Fi reload the same pages all day, so this server:
+
+  - serves precompressed `.br` / `.gz` siblings (see `precompress_assets.py`)
+    when the client accepts them, and gzips other text files on the fly
+    (cached in memory);
+  - sends strong ETags (content hash) and Last-Modified, and answers
+    If-None-Match / If-Modified-Since with 304;
+  - supports HEAD and single byte ranges (incl. If-Range);
+  - keeps connections alive (HTTP/1.1): idle ones wait in a selector and only
+    get a thread from the bounded pool while a request is in flight, so
+    tablets holding connections open can't pin every worker;
+  - logs one line per request with status, bytes sent and latency.
+
+Cache headers:
+  fingerprinted files listed in `asset-manifest.json` (when serving the output
+  of `fingerprint_assets.py`) are `immutable` for a year; HTML and `sw.js` always revalidate; everything else
+  may be reused for a few minutes and is then revalidated via its ETag.
+
+Usage:
+  python3 tools/serve.py                       # repo root on http://localhost:8000/
+  python3 tools/serve.py --root dist --bind 0.0.0.0 --port 8080 --workers 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import email.utils
+import functools
+import gzip
+import hashlib
+import json
+import mimetypes
+import re
+import queue
+import selectors
+import socket
+import socketserver
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 32
+IDLE_TIMEOUT = 15  # seconds a kept-alive connection may sit idle (in the selector, not on a worker)
+REQUEST_TIMEOUT = 10  # seconds a worker waits on a client that stalls mid-request
+DYNAMIC_GZIP_MAX = 4 * 1024 * 1024  # don't gzip bigger text files on the fly
+
+TEXT_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml", "application/xml")
+EXTRA_TYPES = {
+    ".js": "text/javascript",
+    ".mjs": "text/javascript",
+    ".json": "application/json",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".svg": "image/svg+xml",
+    ".webmanifest": "application/manifest+json",
+}
+# Sibling suffix per content-coding, in order of preference.
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+MANIFEST_NAME = "asset-manifest.json"  # written by fingerprint_assets.py
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def content_type(path: Path) -> str:
+    ctype = EXTRA_TYPES.get(path.suffix.lower()) or mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return f"{ctype}; charset=utf-8" if ctype.startswith(TEXT_TYPES) and "charset" not in ctype else ctype
+
+
+def load_immutable(root: Path) -> frozenset[str]:
+    """Fingerprinted paths from `asset-manifest.json`, if the served dir has one."""
+    try:
+        mapping = json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return frozenset()
+    return frozenset(v for v in mapping.values() if isinstance(v, str)) if isinstance(mapping, dict) else frozenset()
+
+
+def cache_control(rel: str, immutable: frozenset[str]) -> str:
+    if rel in immutable:
+        return "public, max-age=31536000, immutable"
+    if rel.endswith(".html") or rel == "sw.js":
+        return "no-cache"
+    return "public, max-age=300"
+
+
+@functools.lru_cache(maxsize=4096)
+def _etag(path: str, size: int, mtime_ns: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:24]
+
+
+@functools.lru_cache(maxsize=256)
+def _gzipped(path: str, size: int, mtime_ns: int) -> bytes:
+    with open(path, "rb") as f:
+        return gzip.compress(f.read(), compresslevel=6, mtime=0)
+
+
+def accepted_codings(header: str) -> set[str]:
+    out = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q=") and q[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        if name:
+            out.add(name.strip().lower())
+    return out
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None | bool:
+    """
+    Parse a single `bytes=` range. Returns (start, end) inclusive, None to ignore
+    the header (serve the whole file), or False if it can't be satisfied.
+    """
+    m = _RANGE_RE.match(header.strip())
+    if not m or (not m.group(1) and not m.group(2)):
+        return None  # malformed or multi-range: ignoring Range is always allowed
+    if m.group(1):
+        start = int(m.group(1))
+        end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+    else:
+        start, end = max(0, size - int(m.group(2))), size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server_version = "HookeServe/1.0"
+    timeout = REQUEST_TIMEOUT
+    root: Path = Path(".")
+    immutable: frozenset[str] = frozenset()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 (stdlib signature)
+        pass  # replaced by the one-line access log in `_log`
+
+    def _log(self, status: int, sent: int, coding: str = "") -> None:
+        ms = (time.perf_counter() - self._t0) * 1000
+        extra = f" [{coding}]" if coding else ""
+        print(f"{self.client_address[0]} {self.command} {self.path} {status} {sent}B {ms:.1f}ms{extra}", flush=True)
+
+    def _resolve(self) -> tuple[Path, str] | None:
+        rel = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path).lstrip("/")
+        if rel == "" or rel.endswith("/"):
+            rel += "index.html"
+        path = (self.root / rel).resolve()
+        if not path.is_relative_to(self.root) or any(part.startswith(".") for part in Path(rel).parts):
+            return None
+        if path.is_dir():
+            path, rel = path / "index.html", rel.rstrip("/") + "/index.html"
+        return (path, rel) if path.is_file() else None
+
+    def _error(self, status: HTTPStatus) -> None:
+        body = f"{status.value} {status.phrase}\n".encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        self._log(status.value, len(body))
+
+    def do_HEAD(self) -> None:  # noqa: N802 (stdlib naming)
+        self.do_GET()
+
+    def do_GET(self) -> None:  # noqa: N802 (stdlib naming)
+        self._t0 = time.perf_counter()
+        found = self._resolve()
+        if not found:
+            self._error(HTTPStatus.NOT_FOUND)
+            return
+        path, rel = found
+        st = path.stat()
+        etag = _etag(str(path), st.st_size, st.st_mtime_ns)
+        ctype = content_type(path)
+
+        # Pick a representation: precompressed sibling, on-the-fly gzip, or identity.
+        coding, body_path, body_bytes = "", path, None
+        want_range = "Range" in self.headers
+        if not want_range:
+            accepts = accepted_codings(self.headers.get("Accept-Encoding", ""))
+            for name, suffix in PRECOMPRESSED:
+                sibling = path.with_name(path.name + suffix)
+                if name in accepts and sibling.is_file() and sibling.stat().st_mtime_ns >= st.st_mtime_ns:
+                    coding, body_path = name, sibling
+                    break
+            if not coding and "gzip" in accepts and ctype.startswith(TEXT_TYPES) and st.st_size <= DYNAMIC_GZIP_MAX:
+                coding, body_bytes = "gzip", _gzipped(str(path), st.st_size, st.st_mtime_ns)
+        tag = f'"{etag}-{coding}"' if coding else f'"{etag}"'
+
+        if self._not_modified(tag, st.st_mtime):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._common_headers(tag, st.st_mtime, rel)
+            self.end_headers()
+            self._log(304, 0, coding)
+            return
+
+        size = len(body_bytes) if body_bytes is not None else body_path.stat().st_size
+        start, end, status = 0, size - 1, HTTPStatus.OK
+        if want_range and self._range_applies(tag, st.st_mtime):
+            rng = parse_range(self.headers["Range"], size)
+            if rng is False:
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                self._log(416, 0)
+                return
+            if rng:
+                start, end = rng
+                status = HTTPStatus.PARTIAL_CONTENT
+
+        length = max(0, end - start + 1)
+        self.send_response(status)
+        self._common_headers(tag, st.st_mtime, rel)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(length))
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+
+        sent = 0
+        if self.command != "HEAD" and length:
+            if body_bytes is not None:
+                self.wfile.write(body_bytes[start : end + 1])
+                sent = length
+            else:
+                self.wfile.flush()
+                with open(body_path, "rb") as f:
+                    sent = self.connection.sendfile(f, offset=start, count=length)
+        self._log(status.value, sent, coding)
+
+    def _common_headers(self, tag: str, mtime: float, rel: str) -> None:
+        self.send_header("ETag", tag)
+        self.send_header("Last-Modified", email.utils.formatdate(mtime, usegmt=True))
+        self.send_header("Cache-Control", cache_control(rel, self.immutable))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Vary", "Accept-Encoding")
+
+    def _not_modified(self, tag: str, mtime: float) -> bool:
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            return inm.strip() == "*" or tag in [t.strip() for t in inm.split(",")]
+        ims = self.headers.get("If-Modified-Since")
+        if ims:
+            try:
+                return int(mtime) <= email.utils.parsedate_to_datetime(ims).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _range_applies(self, tag: str, mtime: float) -> bool:
+        cond = self.headers.get("If-Range")
+        if not cond:
+            return True
+        if cond.startswith('"'):
+            return cond.strip() == tag
+        try:
+            return int(mtime) <= email.utils.parsedate_to_datetime(cond).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer that parks kept-alive connections in a selector and hands one to
+    the bounded thread pool only while it has a request to read, so idle clients
+    cost a file descriptor rather than a worker.
+    """
+
+    def __init__(self, addr: tuple[str, int], handler: type, workers: int):
+        super().__init__(addr, handler)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serve")
+        self.idle = selectors.DefaultSelector()
+        self._parked: queue.SimpleQueue = queue.SimpleQueue()  # handlers to (re-)register, from any thread
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.idle.register(self._wake_r, selectors.EVENT_READ)
+        self._closing = False
+        self._poller = threading.Thread(target=self._poll, name="serve-idle", daemon=True)
+        self._poller.start()
+
+    def process_request(self, request, client_address) -> None:  # type: ignore[override]
+        # Drive the handler one request at a time instead of BaseRequestHandler's own
+        # handle() loop, which would keep the connection on one thread until it closes.
+        handler = self.RequestHandlerClass.__new__(self.RequestHandlerClass)
+        handler.request, handler.client_address, handler.server = request, client_address, self
+        handler.setup()
+        self._park(handler)
+
+    def _park(self, handler) -> None:
+        self._parked.put(handler)
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # the wake-up pipe is full, so the poller is about to run anyway
+
+    def _poll(self) -> None:
+        next_sweep = time.monotonic() + 1
+        while not self._closing:
+            for key, _ in self.idle.select(timeout=1.0):
+                if key.fileobj is self._wake_r:
+                    try:
+                        while self._wake_r.recv(4096):
+                            pass
+                    except OSError:
+                        pass
+                    continue
+                self.idle.unregister(key.fileobj)
+                self.pool.submit(self._work, key.data[0])
+            while True:
+                try:
+                    handler = self._parked.get_nowait()
+                except queue.Empty:
+                    break
+                self.idle.register(handler.request, selectors.EVENT_READ, (handler, time.monotonic()))
+            now = time.monotonic()
+            if now >= next_sweep:
+                next_sweep = now + 1
+                for key in list(self.idle.get_map().values()):
+                    if key.data and now - key.data[1] > IDLE_TIMEOUT:
+                        self.idle.unregister(key.fileobj)
+                        self._close(key.data[0])
+
+    def _work(self, handler) -> None:
+        try:
+            while True:
+                handler.close_connection = True
+                handler.handle_one_request()
+                if handler.close_connection or self._closing:
+                    break
+                if not _has_buffered_input(handler):
+                    self._park(handler)
+                    return
+        except Exception:
+            self.handle_error(handler.request, handler.client_address)
+        self._close(handler)
+
+    def _close(self, handler) -> None:
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    def server_close(self) -> None:
+        self._closing = True
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass
+        self._poller.join(timeout=2)
+        for key in list(self.idle.get_map().values()):
+            if key.data:
+                self._close(key.data[0])
+        while not self._parked.empty():
+            self._close(self._parked.get_nowait())
+        self.idle.close()
+        self._wake_r.close()
+        self._wake_w.close()
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _has_buffered_input(handler) -> bool:
+    """Whether the next request is already in the handler's read buffer (pipelined), without blocking."""
+    sock = handler.connection
+    sock.settimeout(0)
+    try:
+        return bool(handler.rfile.peek(1))
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(handler.timeout)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", default=".", help="Directory to serve, relative to the repo root (default: repo root)")
+    ap.add_argument("--bind", default="127.0.0.1", help="Address to listen on (0.0.0.0 for the whole network)")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Max requests handled at once (idle keep-alive connections don't count)")
+    args = ap.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    root = (repo_root / args.root).resolve()
+    if not root.is_dir():
+        print(f"ERROR: not a directory: {root}", file=sys.stderr)
+        return 2
+
+    handler = type("Handler", (SiteHandler,), {"root": root, "immutable": load_immutable(root)})
+    socketserver.TCPServer.allow_reuse_address = True
+    server = PooledHTTPServer((args.bind, args.port), handler, max(1, args.workers))
+    host = "localhost" if args.bind in ("127.0.0.1", "0.0.0.0") else args.bind
+    print(f"Serving {root} on http://{host}:{args.port}/ ({args.workers} workers, Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Stopped.")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())